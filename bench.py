@@ -0,0 +1,488 @@
+"""
+Banco de pruebas del compilador con programas sintéticos.
+
+ProgramGenerator escribe programas válidos para la gramática de parser.py
+(directivas, globales, funciones con parámetros y punteros, if/else, while,
+for, switch, break, return, llamadas, &&/||, ++/--) con tamaño ajustable:
+número de funciones, anidamiento de sentencias, profundidad de expresiones,
+declaraciones por ámbito y casos por switch. Los bucles están acotados y las
+llamadas solo van a funciones anteriores, así que también se pueden ejecutar.
+
+measure() separa las fases, tomando el mejor de varios intentos:
+    lex        tokenizar la entrada completa (tokens/s)
+    parse      el autómata LR solo, con acciones vacías, sobre tokens ya leídos
+    semantic   acciones semánticas (tabla de símbolos, tipos) sin el 3AC
+    codegen    tiempo dentro del generador de 3AC (Codegenerator)
+    total      CompilationSession.compile de principio a fin
+y el pico de memoria de una compilación completa (tracemalloc).
+
+Uso:
+    python bench.py                          suite small/medium/large
+    python bench.py --preset large --engine dfa --json base.json
+    python bench.py --compare base.json      marca regresiones (sale con 1)
+    python bench.py --functions 20 --depth 4 --print   muestra el programa
+"""
+import copy
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from code_gen import Codegenerator
+from dfa_lexer import make_lexer
+from session import CompilationSession
+
+FORMAT = 1
+# Tamaños de la suite por defecto
+PRESETS = {
+    'small':  dict(functions=4, depth=2, expr_depth=2, declarations=3, fanout=3, statements=3),
+    'medium': dict(functions=16, depth=3, expr_depth=3, declarations=4, fanout=4, statements=4),
+    'large':  dict(functions=48, depth=3, expr_depth=4, declarations=6, fanout=8, statements=5),
+}
+# Largo máximo de las cadenas de llamadas y vueltas máximas de cada bucle: con
+# bucles anidados, el tiempo de ejecución crece exponencialmente con ambos
+CALL_DEPTH = 1
+LOOP_LIMIT = 4
+# Métricas comparadas con la línea base; True: más es mejor
+METRICS = {'lex': False, 'parse': False, 'semantic': False, 'codegen': False,
+           'total': False, 'tokens_per_sec': True, 'peak_memory': False}
+
+
+class ProgramGenerator:
+    """Programas aleatorios (reproducibles por semilla) que compilan sin errores."""
+    def __init__(self, functions=8, depth=3, expr_depth=3, declarations=4, fanout=4,
+                 statements=4, seed=0):
+        self.functions = functions
+        self.depth = depth                  # anidamiento de sentencias
+        self.expr_depth = expr_depth
+        self.declarations = declarations    # declaraciones al inicio de cada ámbito
+        self.fanout = fanout                # casos por switch
+        self.statements = statements        # sentencias por bloque
+        self.seed = seed
+
+    def generate(self):
+        self.rng = random.Random(self.seed)
+        self.count = 0
+        self.lines = ['#include <stdio.h>', '#define LIMITE 10']
+        self.defined = []                   # (nombre, parámetros, nivel) de funciones ya escritas
+        self.callable = []                  # las de nivel < CALL_DEPTH
+        self.level = 0                      # nivel de la función en curso
+        self.scopes = [{}]                  # nombre -> tipo ('int', 'float', 'int*', 'char')
+        self.counters = set()               # contadores de bucle: no se reasignan
+        self.lines.append(self._declarations(max(2, self.declarations), 0))
+        self.lines.append('int *gp = &g0;')
+        for i in range(self.functions):
+            self._function(f"f{i}")
+        for _ in range(max(1, self.functions // 4)):
+            self.lines.append(self._call(self.rng.choice(self.callable)) + ';' if self.callable else 'g0 = 1;')
+        del self.rng
+        return '\n'.join(self.lines) + '\n'
+
+    # --- Nombres ---
+    def _new(self, kind):
+        name = f"{'g' if len(self.scopes) == 1 else 'v'}{self.count}"
+        self.count += 1
+        self.scopes[-1][name] = kind
+        return name
+
+    def _visible(self, kind):
+        names = {}
+        for scope in self.scopes:
+            names.update(scope)
+        return [n for n, k in names.items() if k == kind]
+
+    def _targets(self, kind):
+        return [n for n in self._visible(kind) if n not in self.counters]
+
+    def _counter(self):
+        # Local de la función: ni el cuerpo ni las funciones llamadas lo cambian
+        names = [n for scope in self.scopes[1:] for n, k in scope.items()
+                 if k == 'int' and n not in self.counters]
+        counter = self.rng.choice(names)
+        self.counters.add(counter)
+        return counter
+
+    # --- Expresiones ---
+    def _expr(self, depth, kind='int'):
+        rng = self.rng
+        r = rng.random()
+        if depth <= 0 or r < 0.25:
+            return self._leaf(kind)
+        if r < 0.35:
+            return rng.choice(('-', '!')) + '(' + self._expr(depth - 1, kind) + ')'
+        if r < 0.42 and self.callable and kind == 'int':
+            return self._call(rng.choice(self.callable), depth - 1)
+        if r < 0.5:
+            return '(' + self._expr(depth - 1, kind) + ')'
+        op = rng.choice(('+', '-', '*', '/', '<', '>', '<=', '>=', '==', '!=', '&&', '||'))
+        if op == '/':
+            return f"{self._expr(depth - 1, kind)} / {rng.randint(1, 9)}"
+        return f"{self._expr(depth - 1, kind)} {op} {self._expr(depth - 1, kind)}"
+
+    def _leaf(self, kind):
+        rng = self.rng
+        r = rng.random()
+        names = self._visible('int') + (self._visible('float') if kind == 'float' else [])
+        pointers = self._visible('int*')
+        if r < 0.3 or not names:
+            return str(rng.randint(0, 99)) if kind == 'int' or r < 0.15 else f"{rng.randint(0, 99)}.5"
+        if r < 0.38 and pointers:
+            return '*' + rng.choice(pointers)
+        if r < 0.44:
+            name = rng.choice(self._targets('int') or ['g0'])
+            return name + rng.choice(('++', '--'))
+        return rng.choice(names)
+
+    def _call(self, function, depth=1):
+        name, params, level = function
+        self.level = max(self.level, level + 1)
+        args = [('&' + self.rng.choice(self._visible('int'))) if kind == 'int*'
+                else self._expr(depth, 'int') for kind in params]
+        return f"{name}({', '.join(args)})"
+
+    # --- Declaraciones y sentencias ---
+    def _declarations(self, count, indent):
+        rng = self.rng
+        pad = '    ' * indent
+        out = []
+        # Los nombres se registran al final de la declaración: los
+        # inicializadores solo ven lo declarado antes
+        values = [self._expr(1) if rng.random() < 0.5 else None for _ in range(count)]
+        ints = [name if value is None else f"{name} = {value}"
+                for name, value in zip([self._new('int') for _ in values], values)]
+        out.append(f"{pad}int {', '.join(ints)};")
+        r = rng.random()
+        if r < 0.3:
+            value = self._expr(1, 'float')
+            out.append(f"{pad}float {self._new('float')} = {value};")
+        elif r < 0.5:
+            out.append(f"{pad}char {self._new('char')} = '{rng.choice('abcxyz')}';")
+        elif r < 0.6:
+            name = self._new('char*')
+            out.append(f'{pad}char *{name} = "texto";')
+        if rng.random() < 0.4:
+            target = rng.choice(self._visible('int'))
+            out.append(f"{pad}int *{self._new('int*')} = &{target};")
+        return '\n'.join(out)
+
+    def _function(self, name):
+        rng = self.rng
+        params = [rng.choice(('int', 'int', 'int', 'int*')) for _ in range(rng.randint(0, 3))]
+        self.scopes.append({})
+        names = [self._new(kind) for kind in params]
+        header = ', '.join(f"int *{n}" if kind == 'int*' else f"int {n}" for n, kind in zip(names, params))
+        self.lines.append(f"int {name}({header}) {{")
+        self.lines.append(self._declarations(self.declarations, 1))
+        for _ in range(self.statements):
+            self.lines.append(self._statement(1, False))
+        self.lines.append(f"    return {self._expr(self.expr_depth)};")
+        self.lines.append('}')
+        self.scopes.pop()
+        function = (name, params, self.level)
+        self.defined.append(function)
+        if self.level < CALL_DEPTH:
+            self.callable.append(function)
+        self.level = 0
+
+    def _block(self, indent, breakable):
+        """Cuerpo entre llaves con su propio ámbito."""
+        pad = '    ' * indent
+        self.scopes.append({})
+        body = [self._declarations(max(1, self.declarations // 2), indent + 1)]
+        for _ in range(self.rng.randint(1, self.statements)):
+            body.append(self._statement(indent + 1, breakable))
+        self.scopes.pop()
+        return '{\n' + '\n'.join(body) + f"\n{pad}}}"
+
+    def _statement(self, indent, breakable):
+        rng = self.rng
+        pad = '    ' * indent
+        nested = indent <= self.depth
+        r = rng.random() if nested else rng.random() * 0.45
+        if r < 0.3:
+            target = rng.choice(self._targets('int'))
+            return f"{pad}{target} = {self._expr(self.expr_depth)};"
+        if r < 0.35:
+            target = self._targets('float')
+            if target:
+                return f"{pad}{rng.choice(target)} = {self._expr(self.expr_depth, 'float')};"
+            return f"{pad}{rng.choice(self._targets('int'))}++;"
+        if r < 0.4:
+            if self.callable:
+                return f"{pad}{self._call(rng.choice(self.callable), self.expr_depth - 1)};"
+            return f"{pad}{rng.choice(self._targets('int'))}--;"
+        if r < 0.45:
+            return f"{pad}break;" if breakable else f"{pad}return {self._expr(2)};"
+        if r < 0.6:
+            text = f"{pad}if ({self._expr(self.expr_depth)}) {self._block(indent, breakable)}"
+            if rng.random() < 0.5:
+                text += f" else {self._block(indent, breakable)}"
+            return text
+        if r < 0.7:
+            counter = self._counter()
+            condition = f"{counter} < {rng.randint(1, LOOP_LIMIT)} && ({self._expr(2)})"
+            body = self._block(indent, True)
+            self.counters.discard(counter)
+            return (f"{pad}{counter} = 0;\n{pad}while ({condition}) {{\n"
+                    f"{pad}    {counter}++;\n{pad}    {body}\n{pad}}}")
+        if r < 0.8:
+            counter = self._counter()
+            body = self._block(indent, True)
+            self.counters.discard(counter)
+            return f"{pad}for ({counter} = 0; {counter} < {rng.randint(1, LOOP_LIMIT)}; {counter}++) {body}"
+        if r < 0.9:
+            lines = [f"{pad}switch ({self._expr(2)}) {{"]
+            for case in range(self.fanout):
+                lines.append(f"{pad}case {case}:")
+                for _ in range(rng.randint(1, 2)):
+                    lines.append(self._statement(indent + 1, True))
+                if rng.random() < 0.8:
+                    lines.append(f"{pad}    break;")
+            lines.append(f"{pad}default:")
+            lines.append(self._statement(indent + 1, True))
+            lines.append(f"{pad}}}")
+            return '\n'.join(lines)
+        return pad + self._block(indent, breakable)
+
+
+# --- Medición ---
+class _TokenReplay:
+    """Lexer que devuelve tokens ya leídos: el parser se mide sin tokenizar."""
+    def __init__(self, tokens):
+        remaining = iter(tokens)
+        self.token = lambda: next(remaining, None)
+        self.lineno = 1
+
+
+class _TimedCodegenerator(Codegenerator):
+    """Codegenerator que acumula el tiempo pasado dentro de sus métodos."""
+    def __init__(self):
+        super().__init__()
+        self.seconds = 0.0
+        self.calls = 0
+        self._inside = False
+
+def _timed(method):
+    def wrapper(self, *args, **kwargs):
+        if self._inside:        # llamada anidada (emit_label -> emit): ya se mide
+            return method(self, *args, **kwargs)
+        self._inside = True
+        self.calls += 1
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self._inside = False
+    return wrapper
+
+for _name in ('emit', 'new_temp', 'new_label', 'emit_jump', 'emit_label', 'backpatch',
+              'condition', 'materialize'):
+    setattr(_TimedCodegenerator, _name, _timed(getattr(Codegenerator, _name)))
+
+
+def _no_action(p):
+    pass
+
+def _syntax_only(parser):
+    """Copia del parser con todas las acciones vacías."""
+    bare = copy.copy(parser)
+    bare.productions = []
+    for production in parser.productions:
+        production = copy.copy(production)
+        if production.callable is not None:
+            production.callable = _no_action
+        bare.productions.append(production)
+    return bare
+
+
+def _tokenize(source, engine):
+    lexer = make_lexer(engine)
+    lexer.input(source)
+    tokens = []
+    token = lexer.token
+    while True:
+        tok = token()
+        if tok is None:
+            return tokens
+        tokens.append(tok)
+
+def _best(fn, repeat):
+    """(mejor tiempo, último valor) de `repeat` ejecuciones, sin el recolector de ciclos."""
+    best = float('inf')
+    value = None
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            value = fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if enabled:
+            gc.enable()
+    return best, value
+
+def measure(source, engine='ply', repeat=3):
+    """Tiempos por fase (segundos), tokens/s, pico de memoria y tamaño del resultado."""
+    session = CompilationSession(engine=engine)
+    lex, tokens = _best(lambda: _tokenize(source, engine), repeat)
+
+    bare = _syntax_only(session.parser)
+    bare.errorfunc = session.parser.errorfunc
+    parse, _ = _best(lambda: bare.parse(None, lexer=_TokenReplay(tokens)), repeat)
+
+    def front(timed):
+        session.reset()
+        if timed:
+            session.gen = _TimedCodegenerator()
+        replay = _TokenReplay(tokens)
+        session._attach(replay)
+        session.parser.parse(None, lexer=replay)
+        if session.diagnostics.has_errors():
+            raise ValueError(f"El programa no compila: {list(session.diagnostics)[0]}")
+        return session.gen
+    plain, _ = _best(lambda: front(False), repeat)
+    # El cronómetro añade su propio coste: se toma la fracción del tiempo que
+    # pasa en el generador (mediana de los intentos) y se aplica al tiempo sin medir
+    fractions = []
+    for _ in range(repeat):
+        timed, gen = _best(lambda: front(True), 1)
+        fractions.append(gen.seconds / timed)
+    codegen = sorted(fractions)[len(fractions) // 2] * plain
+    semantic = max(plain - parse - codegen, 0.0)
+
+    total, result = _best(lambda: session.compile(source), repeat)
+    tracemalloc.start()
+    session.compile(source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'bytes': len(source), 'lines': source.count('\n'), 'tokens': len(tokens),
+        'quads': len(result.code),
+        'lex': lex, 'parse': parse, 'semantic': semantic, 'codegen': codegen, 'total': total,
+        'tokens_per_sec': len(tokens) / lex if lex else 0.0,
+        'peak_memory': peak,
+    }
+
+
+def run_suite(cases, engine='ply', repeat=3, seed=0):
+    """Mide cada caso {nombre: parámetros del generador}; devuelve el informe (dict)."""
+    report = {
+        'format': FORMAT,
+        'python': platform.python_version(),
+        'engine': engine,
+        'repeat': repeat,
+        'seed': seed,
+        'cases': {},
+    }
+    for name, params in cases.items():
+        source = ProgramGenerator(seed=seed, **params).generate()
+        entry = {'params': params}
+        entry.update(measure(source, engine, repeat))
+        report['cases'][name] = entry
+    return report
+
+
+def compare(report, baseline, threshold=0.10):
+    """
+    Compara con una línea base. Devuelve [(caso, métrica, base, actual, cambio,
+    regresión)]; cambio es relativo (+0.2 = 20 % peor). Los tiempos por debajo
+    de 1 ms se ignoran: el ruido los domina.
+    """
+    rows = []
+    for name, entry in report['cases'].items():
+        base = baseline.get('cases', {}).get(name)
+        if base is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = base.get(metric), entry.get(metric)
+            if not old or new is None:
+                continue
+            change = (old / new - 1) if higher_is_better else (new / old - 1)
+            noisy = metric not in ('tokens_per_sec', 'peak_memory') and max(old, new) < 1e-3
+            rows.append((name, metric, old, new, change, change > threshold and not noisy))
+    return rows
+
+
+def _format(metric, value):
+    if metric == 'peak_memory':
+        return f"{value / 1024:,.0f} KiB"
+    if metric == 'tokens_per_sec':
+        return f"{value:,.0f}/s"
+    return f"{value * 1000:.2f} ms"
+
+def print_report(report):
+    print(f"motor {report['engine']}, mejor de {report['repeat']}, Python {report['python']}")
+    print(f"{'caso':<8} {'tokens':>8} {'quads':>8} {'lex':>9} {'parse':>9} {'semántica':>10} "
+          f"{'codegen':>9} {'total':>9} {'tokens/s':>11} {'memoria':>10}")
+    for name, e in report['cases'].items():
+        print(f"{name:<8} {e['tokens']:>8} {e['quads']:>8} {e['lex'] * 1000:>7.1f}ms "
+              f"{e['parse'] * 1000:>7.1f}ms {e['semantic'] * 1000:>8.1f}ms {e['codegen'] * 1000:>7.1f}ms "
+              f"{e['total'] * 1000:>7.1f}ms {e['tokens_per_sec']:>11,.0f} "
+              f"{e['peak_memory'] / 1024:>7,.0f}KiB")
+
+def print_comparison(rows, threshold):
+    regressions = [row for row in rows if row[5]]
+    for name, metric, old, new, change, bad in rows:
+        mark = 'REGRESIÓN' if bad else ''
+        print(f"{name:<8} {metric:<15} {_format(metric, old):>14} -> {_format(metric, new):>14} "
+              f"{change * 100:+7.1f}% {mark}")
+    print(f"{len(regressions)} regresiones (umbral {threshold * 100:.0f} %)")
+    return regressions
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+
+    def option(flag, default=None, kind=str):
+        if flag in args:
+            i = args.index(flag)
+            value = args[i + 1]
+            del args[i:i + 2]
+            return kind(value)
+        return default
+
+    engine = option('--engine', 'ply')
+    repeat = option('--repeat', 3, int)
+    seed = option('--seed', 0, int)
+    output = option('--json')
+    baseline_path = option('--compare')
+    threshold = option('--threshold', 0.10, float)
+    preset = option('--preset')
+    custom = {}
+    for flag, key in (('--functions', 'functions'), ('--depth', 'depth'),
+                      ('--expr-depth', 'expr_depth'), ('--declarations', 'declarations'),
+                      ('--fanout', 'fanout'), ('--statements', 'statements')):
+        value = option(flag, None, int)
+        if value is not None:
+            custom[key] = value
+    show = '--print' in args
+
+    if custom:
+        params = dict(PRESETS[preset or 'medium'], **custom)
+        cases = {'custom': params}
+    elif preset:
+        cases = {preset: PRESETS[preset]}
+    else:
+        cases = PRESETS
+    if show:
+        for params in cases.values():
+            print(ProgramGenerator(seed=seed, **params).generate())
+        sys.exit(0)
+
+    report = run_suite(cases, engine, repeat, seed)
+    print_report(report)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Resultados en {output}")
+    if baseline_path:
+        with open(baseline_path, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\nFrente a {baseline_path}:")
+        if print_comparison(compare(report, baseline, threshold), threshold):
+            sys.exit(1)
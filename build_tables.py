@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Genera y verifica las tablas precompiladas del modo de arranque rápido.
+
+    python build_tables.py build     # regenera lextab.py, parsetab.pickle y parser.out
+    python build_tables.py check     # verifica que coinciden con la gramática
+    python build_tables.py startup   # mide el arranque en frío de ambos modos
+
+En producción se exporta COMPILER_FAST_STARTUP=1: lexer.py y parser.py cargan
+estos artefactos sin validar la gramática ni escribir archivos. La validación
+se traslada a `check`, que debe ejecutarse tras cualquier cambio de gramática.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+import lexer as lexer_module
+import parser as parser_module
+from lexer import TABLES_DIR
+from parser import PARSETAB_PICKLE
+
+LEXTAB = 'lextab'
+PARSER_OUT = os.path.join(TABLES_DIR, 'parser.out')
+
+
+def build():
+    lextab_path = os.path.join(TABLES_DIR, LEXTAB + '.py')
+    for path in (lextab_path, PARSETAB_PICKLE):
+        if os.path.exists(path):
+            os.remove(path)
+    lex.lex(module=lexer_module, optimize=True, lextab=LEXTAB, outputdir=TABLES_DIR)
+    # parser.out (la descripción de los estados) se escribe junto con las tablas
+    yacc.yacc(module=parser_module, debug=True, debugfile=PARSER_OUT,
+              picklefile=PARSETAB_PICKLE)
+    print(f"Escrito {lextab_path}")
+    print(f"Escrito {PARSETAB_PICKLE}")
+    print(f"Escrito {PARSER_OUT}")
+
+
+def check():
+    """Devuelve True si los artefactos corresponden a la gramática actual."""
+    ok = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lex.lex(module=lexer_module, optimize=True, lextab=LEXTAB + '_check', outputdir=tmp)
+        sys.modules.pop(LEXTAB + '_check', None)
+        with open(os.path.join(tmp, LEXTAB + '_check.py')) as f:
+            fresh = f.read().replace(LEXTAB + '_check', LEXTAB)
+    try:
+        with open(os.path.join(TABLES_DIR, LEXTAB + '.py')) as f:
+            shipped = f.read()
+    except OSError:
+        shipped = None
+    if shipped != fresh:
+        print("lextab.py está desactualizado")
+        ok = False
+
+    pinfo = yacc.ParserReflect(vars(parser_module))
+    pinfo.get_all()
+    try:
+        signature = yacc.LRTable().read_pickle(PARSETAB_PICKLE)
+    except (ImportError, yacc.VersionError):
+        signature = None
+    if signature != pinfo.signature():
+        print("parsetab.pickle está desactualizado")
+        ok = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        yacc.yacc(module=parser_module, tabmodule='parsetab_check', write_tables=False,
+                  debug=True, debugfile='parser.out', outputdir=tmp,
+                  errorlog=yacc.NullLogger())
+        with open(os.path.join(tmp, 'parser.out')) as f:
+            fresh = f.read()
+    try:
+        with open(PARSER_OUT) as f:
+            shipped = f.read()
+    except OSError:
+        shipped = None
+    if shipped != fresh:
+        print("parser.out está desactualizado")
+        ok = False
+
+    print("Tablas al día" if ok else "Ejecute 'python build_tables.py build'")
+    return ok
+
+
+def startup(runs=10):
+    """Mide el tiempo de `import parser` en un intérprete nuevo."""
+    results = {}
+    for label, fast in (('normal', '0'), ('fast', '1')):
+        env = dict(os.environ, COMPILER_FAST_STARTUP=fast)
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', 'import parser'], cwd=TABLES_DIR,
+                           env=env, check=True, stdout=subprocess.DEVNULL)
+            times.append(time.perf_counter() - start)
+        times.sort()
+        results[label] = times
+        print(f"{label:<7} min {times[0] * 1000:7.1f} ms   mediana {times[len(times) // 2] * 1000:7.1f} ms")
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        times.append(time.perf_counter() - start)
+    print(f"{'python':<7} min {min(times) * 1000:7.1f} ms   (intérprete vacío)")
+    return results
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'build':
+        build()
+    elif command == 'check':
+        sys.exit(0 if check() else 1)
+    elif command == 'startup':
+        startup(int(sys.argv[2]) if len(sys.argv) > 2 else 10)
+    else:
+        print(__doc__)
+        sys.exit(2)
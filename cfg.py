@@ -0,0 +1,196 @@
+"""
+Grafo de flujo de control sobre la lista de cuádruplos.
+
+Instrucciones de control (el destino va en el campo resultado):
+    ('label',   None, None, 'L1')       L1:
+    ('goto',    None, None, 'L1')       goto L1
+    ('if',      x,    None, 'L1')       if x goto L1
+    ('iffalse', x,    None, 'L1')       ifFalse x goto L1
+    ('if<',     a,    b,    'L1')       if a < b goto L1   (igual con <=, >, >=, ==, !=)
+    ('func',    f,    n,    None)       inicio de la función f con n parámetros
+    ('return',  x,    None, None)       return x
+    ('endfunc', f,    None, None)       fin de la función f
+El código fuera de las funciones (sentencias globales) forma unidades '<global>'.
+
+Un bloque básico empieza en una etiqueta, al inicio de la función o tras un
+salto/return, y termina antes del siguiente de esos puntos. Los bloques
+guardan rangos [start, end) de índices, no copias de las instrucciones.
+"""
+from optimizer import constant_value
+
+LABEL = 'label'
+GOTO = 'goto'
+FUNC = 'func'
+ENDFUNC = 'endfunc'
+RETURN = 'return'
+RELATIONAL_JUMPS = {'if<', 'if<=', 'if>', 'if>=', 'if==', 'if!='}
+COND_JUMPS = {'if', 'iffalse'} | RELATIONAL_JUMPS
+JUMPS = COND_JUMPS | {GOTO}
+# Instrucciones que no escriben su campo resultado
+NO_RESULT = JUMPS | {LABEL, FUNC, ENDFUNC, RETURN, 'param'}
+
+
+def operand_name(operand):
+    """Variable o temporal que lee un operando ('*p' y '&p' -> 'p'), o None."""
+    if not isinstance(operand, str) or not operand or constant_value(operand) is not None:
+        return None
+    if operand[0] in '*&':
+        return operand[1:]
+    return operand
+
+def reads(quad):
+    """Nombres que lee la instrucción."""
+    op, arg1, arg2, res = quad
+    if op in (LABEL, GOTO, FUNC, ENDFUNC):
+        return ()
+    names = []
+    if op != 'call':        # en una llamada arg1 es el nombre de la función
+        name = operand_name(arg1)
+        if name is not None:
+            names.append(name)
+    name = operand_name(arg2)
+    if name is not None:
+        names.append(name)
+    if op not in NO_RESULT and isinstance(res, str) and res[:1] == '*':
+        names.append(res[1:])  # *p = x lee el puntero p
+    return names
+
+def writes(quad):
+    """Nombre que escribe la instrucción, o None (saltos, escrituras en memoria...)."""
+    op, _, _, res = quad
+    if op in NO_RESULT or not isinstance(res, str) or res[:1] == '*':
+        return None
+    return res
+
+
+def split_functions(code):
+    """
+    Divide el código en [(nombre, inicio, fin)]: cada función va de su 'func'
+    a su 'endfunc' inclusive; los tramos entre funciones se llaman '<global>'.
+    """
+    units = []
+    name, start = '<global>', 0
+    for i, quad in enumerate(code):
+        op = quad[0]
+        if op == FUNC:
+            if i > start:
+                units.append((name, start, i))
+            name, start = quad[1], i
+        elif op == ENDFUNC and name != '<global>':
+            units.append((name, start, i + 1))
+            name, start = '<global>', i + 1
+    if len(code) > start or not units:
+        units.append((name, start, len(code)))
+    return units
+
+
+class BasicBlock:
+    __slots__ = ('index', 'start', 'end', 'label', 'succ', 'pred')
+
+    def __init__(self, index, start, end, label=None):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.label = label
+        self.succ = []
+        self.pred = []
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __repr__(self):
+        return f"B{self.index}[{self.start}:{self.end}]"
+
+
+class ControlFlowGraph:
+    """CFG de code[start:stop]; blocks[0] es la entrada."""
+    def __init__(self, code, start=0, stop=None):
+        self.code = code
+        self.start = start
+        self.stop = len(code) if stop is None else stop
+        self.blocks = []
+        self.label_block = {}   # etiqueta -> índice de bloque
+        self._build()
+
+    def _build(self):
+        code, blocks = self.code, self.blocks
+        leader = self.start
+        for i in range(self.start, self.stop):
+            op = code[i][0]
+            if op == LABEL and i > leader:
+                blocks.append(BasicBlock(len(blocks), leader, i))
+                leader = i
+            if op in JUMPS or op == RETURN:
+                blocks.append(BasicBlock(len(blocks), leader, i + 1))
+                leader = i + 1
+        if leader < self.stop or not blocks:
+            blocks.append(BasicBlock(len(blocks), leader, self.stop))
+        for block in blocks:
+            if len(block) and code[block.start][0] == LABEL:
+                block.label = code[block.start][3]
+                self.label_block[block.label] = block.index
+
+        for block in blocks:
+            last = code[block.end - 1] if len(block) else None
+            op = last[0] if last else None
+            if op in JUMPS:
+                target = self.label_block.get(last[3])
+                if target is not None:
+                    self._edge(block.index, target)
+            if op != GOTO and op != RETURN and block.index + 1 < len(blocks):
+                self._edge(block.index, block.index + 1)
+
+    def _edge(self, a, b):
+        if b not in self.blocks[a].succ:
+            self.blocks[a].succ.append(b)
+            self.blocks[b].pred.append(a)
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def instructions(self, block):
+        return self.code[block.start:block.end]
+
+    def postorder(self):
+        """Bloques alcanzables desde la entrada, en postorden (iterativo)."""
+        seen = [False] * len(self.blocks)
+        order = []
+        stack = [(0, 0)]
+        seen[0] = True
+        while stack:
+            b, k = stack[-1]
+            succ = self.blocks[b].succ
+            if k < len(succ):
+                stack[-1] = (b, k + 1)
+                s = succ[k]
+                if not seen[s]:
+                    seen[s] = True
+                    stack.append((s, 0))
+            else:
+                stack.pop()
+                order.append(b)
+        return order
+
+    def reverse_postorder(self):
+        return self.postorder()[::-1]
+
+    def to_dot(self):
+        """Representación Graphviz del grafo."""
+        lines = ['digraph cfg {', '  node [shape=box, fontname=monospace];']
+        for block in self.blocks:
+            body = '\\l'.join(' '.join(str(x) for x in quad if x is not None)
+                              for quad in self.instructions(block))
+            lines.append(f'  B{block.index} [label="B{block.index}\\l{body}\\l"];')
+            for s in block.succ:
+                lines.append(f'  B{block.index} -> B{s};')
+        lines.append('}')
+        return '\n'.join(lines)
+
+
+def build_cfgs(code):
+    """Un ControlFlowGraph por función: {nombre: cfg}."""
+    return {name: ControlFlowGraph(code, start, stop)
+            for name, start, stop in split_functions(code)}
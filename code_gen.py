@@ -1,13 +1,63 @@
+from quad_store import QuadStore, Temp
+from source_map import QuadSpans
+from type_system import BOOLEAN
+
+# Salto condicional con la condición contraria
+NEGATE = {
+    'if': 'iffalse', 'iffalse': 'if',
+    'if<': 'if>=', 'if>=': 'if<', 'if>': 'if<=', 'if<=': 'if>',
+    'if==': 'if!=', 'if!=': 'if==',
+}
+
+
+def format_quad(quad):
+    """Texto de un cuádruplo, como lo muestra print_code()."""
+    op, arg1, arg2, res = quad
+    if op == '=':
+        return f"{res} = {arg1}"
+    if op == 'label':
+        return f"{res}:"
+    if op == 'goto':
+        return f"    goto {res}"
+    if op in NEGATE:
+        cond = arg1 if arg2 is None else f"{arg1} {op[2:]} {arg2}"
+        return f"    {'ifFalse' if op == 'iffalse' else 'if'} {cond} goto {res}"
+    if op in ('func', 'endfunc'):
+        return f"{op} {arg1}"
+    if op == 'formal':
+        return f"    formal {res}"
+    if op == 'param':
+        return f"    param {arg1}"
+    if op == 'call':
+        return f"{res} = call {arg1}, {arg2}"
+    if op == 'return':
+        return "    return" if arg1 is None else f"    return {arg1}"
+    if arg2 is None:
+        return f"{res} = {op}{arg1}"
+    return f"{res} = {arg1} {op} {arg2}"
+
+
 class Codegenerator:
     def __init__(self):
         self.code = [] #Lista para guardar las instrucciones
         self.temp_count = 0 #Contador para variables temporales
-    
+        self.label_count = 0 #Contador para etiquetas
+        self.breaks = [] #Saltos pendientes de cada bucle/switch abierto
+        self.switches = [] #Casos de cada switch abierto
+        self.globals = [] #Variables declaradas en el ámbito global
+        self.externals = [] #(nombre, firma supuesta, línea) de llamadas a funciones no declaradas
+        self.spans = None #Tramo de fuente de cada instrucción (solo con track_spans)
+
     def new_temp(self):
-        temp_name = f"t{self.temp_count}"
+        temp_name = Temp(f"t{self.temp_count}") # str marcado como temporal
         self.temp_count += 1
         return temp_name
-    
+
+    def new_label(self):
+        label = f"L{self.label_count}"
+        self.label_count += 1
+        return label
+
     def emit(self, op, arg1, arg2, result):
         """
         Genera una instrucción de 3 direcciones (Cuádruplo).
@@ -17,13 +67,143 @@ class Codegenerator:
         instruction = (op, arg1, arg2, result)
         self.code.append(instruction)
 
+    def track_spans(self):
+        """
+        A partir de aquí cada instrucción anota en `spans` el tramo de fuente
+        de la producción que la emitió (gen.span, lo fija source_map.py). El
+        emit de la clase no cambia: sin tramos no se paga nada por instrucción.
+        """
+        self.span = (-1, -1)
+        self.spans = QuadSpans()
+        emit = self.emit
+        add = self.spans.append
+
+        def emit_with_span(op, arg1, arg2, result):
+            emit(op, arg1, arg2, result)
+            add(self.span)
+        self.emit = emit_with_span
+
+    def _delete(self, start, stop=None):
+        """del code[start:stop], y lo mismo en los tramos si se anotan."""
+        if stop is None:
+            stop = len(self.code)
+        del self.code[start:stop]
+        if self.spans is not None:
+            self.spans.delete(start, stop)
+
+    def next_quad(self):
+        """Índice que tendrá la próxima instrucción."""
+        return len(self.code)
+
+    # --- Saltos y backpatching ---
+    def emit_jump(self, op='goto', arg1=None, arg2=None):
+        """Emite un salto sin destino y devuelve su índice (un 'hueco')."""
+        self.emit(op, arg1, arg2, None)
+        return len(self.code) - 1
+
+    def emit_label(self, holes=()):
+        """Emite una etiqueta nueva aquí y le dirige los saltos de `holes`."""
+        label = self.new_label()
+        self.emit('label', None, None, label)
+        self.backpatch(holes, label)
+        return label
+
+    def backpatch(self, holes, label):
+        for i in holes:
+            op, arg1, arg2, _ = self.code[i]
+            self.code[i] = (op, arg1, arg2, label)
+
+    def condition(self, info, fall=None):
+        """
+        Código de saltos para la expresión `info`. Devuelve (true, false): los
+        huecos que saltan cuando es cierta y cuando es falsa. Con fall='true'
+        (o 'false') ese caso sigue a la instrucción siguiente sin saltar.
+
+        Las comparaciones, ! y && / || ya dejaron su valor en un temporal; si
+        ese código es lo último emitido se retira y se sustituye por saltos
+        (cortocircuito, sin materializar el booleano).
+        """
+        code = self.code
+        cond = info.get('cond')
+        span = None
+        if cond is not None and cond['end'] == len(code):
+            if 'rel' in cond and self.spans is not None:
+                # Los saltos sustituyen a la comparación: heredan su tramo
+                span = self.spans[cond['start']]
+            self._delete(cond['start'])
+            if 'rel' in cond:
+                op, arg1, arg2 = cond['rel']
+                jump = 'iffalse' if op == '!' else 'if' + op
+            else:
+                return self._fall_through(list(cond['true']), list(cond['false']), fall)
+        else:
+            jump, arg1, arg2 = 'if', info['place'], None
+        if span is not None:
+            outer, self.span = self.span, span
+        if fall == 'true':
+            holes = [], [self.emit_jump(NEGATE[jump], arg1, arg2)]
+        elif fall == 'false':
+            holes = [self.emit_jump(jump, arg1, arg2)], []
+        else:
+            holes = [self.emit_jump(jump, arg1, arg2)], [self.emit_jump()]
+        if span is not None:
+            self.span = outer
+        return holes
+
+    def _fall_through(self, true, false, fall):
+        """Quita el salto final cuando su destino es la instrucción siguiente."""
+        code = self.code
+        last = len(code) - 1
+        if fall is None or last < 0 or code[last][0] != 'goto':
+            return true, false
+        if fall == 'false' and last in false:
+            self._delete(last)
+            false.remove(last)
+        elif fall == 'true' and last in true:
+            self._delete(last)
+            true.remove(last)
+        elif fall == 'true' and last in false and last - 1 in true and code[last - 1][0] in NEGATE:
+            # if c goto T; goto F  ->  ifFalse c goto F
+            self._delete(last)
+            false.remove(last)
+            true.remove(last - 1)
+            op, arg1, arg2, _ = code[last - 1]
+            code[last - 1] = (NEGATE[op], arg1, arg2, None)
+            false.append(last - 1)
+        return true, false
+
+    def materialize(self, true, false):
+        """
+        Convierte código de saltos en un valor booleano. Devuelve el atributo
+        de la expresión, que recuerda cómo deshacerlo (ver condition).
+        """
+        start = len(self.code)
+        temp = self.new_temp()
+        self.emit_label(true)
+        self.emit('=', 'true', None, temp)
+        done = self.emit_jump()
+        self.emit_label(false)
+        self.emit('=', 'false', None, temp)
+        self.emit_label([done])
+        return {'type': BOOLEAN, 'place': temp,
+                'cond': {'start': start, 'end': len(self.code), 'true': true, 'false': false}}
+
     def print_code(self):
         """Imprime el código generado en formato legible."""
         print("\n--- CODIGO INTERMEDIO GENERADO (3AC) ---")
-        for op, arg1, arg2, res in self.code:
-            if op == '=':
-                print(f"{res} = {arg1}")
-            else:
-                print(f"{res} = {arg1} {op} {arg2}")
+        for quad in self.code:
+            print(format_quad(quad))
         print("--- FIN DEL CODIGO INTERMEDIO ---\n")
-        
\ No newline at end of file
+
+
+class ColumnarCodegenerator(Codegenerator):
+    """
+    Misma interfaz que Codegenerator, pero `code` es un QuadStore columnar
+    (ver quad_store.py). Pensado para salidas de millones de instrucciones.
+    """
+    def __init__(self):
+        super().__init__()
+        self.code = QuadStore()
+
+    def emit(self, op, arg1, arg2, result):
+        self.code.emit(op, arg1, arg2, result)
@@ -0,0 +1,272 @@
+"""
+Caché persistente de compilaciones en disco.
+
+Cada unidad se guarda como un archivo `<clave>.unit` con el CompilationResult
+(cuádruplos, diagnósticos, informes) serializado con pickle. La clave es el
+hash de:
+
+    - el texto fuente,
+    - las opciones de la sesión que cambian la salida (IR, -O, asignación de
+      temporales, AST, traza, preprocesador, include_path, defines),
+    - la huella del compilador: el contenido de los módulos del front end,
+      del generador y de parsetab.pickle, así que cambiar la gramática o una
+      acción semántica invalida toda la caché.
+
+Las cabeceras se conocen solo después de preprocesar, por lo que la entrada
+guarda la lista (ruta, hash) de las que incluyó; un acierto exige que todas
+sigan teniendo el mismo contenido (el hash se recalcula solo si cambian su
+mtime o su tamaño, ver preprocessor.HeaderCache). También guarda las rutas
+que el preprocesador probó sin encontrar nada: si una aparece (la cabecera
+que faltaba, o una que ahora se encuentra antes en include_path), la
+entrada ya no vale.
+
+Las escrituras van a un archivo temporal y se publican con os.replace, de
+modo que varios procesos pueden compilar sobre el mismo directorio: un
+lector ve la entrada completa o no la ve. Cada acierto renueva el mtime de
+la entrada y, al superar max_bytes, se borran las de mtime más antiguo (LRU).
+
+    session = CompilationSession(cache=CompileCache('.cache'))
+    result = session.compile_file('main.c')     # result.cached es True si vino de disco
+"""
+import hashlib
+import os
+import pickle
+import threading
+import time
+
+from lexer import TABLES_DIR
+from preprocessor import header_cache
+
+FORMAT = 2
+DEFAULT_MAX_BYTES = 256 << 20
+SUFFIX = '.unit'
+STALE_TMP_SECONDS = 3600        # temporales de escritores que murieron a medias
+
+# Módulos cuyo contenido determina el código generado
+COMPILER_FILES = (
+    'lexer.py', 'lextab.py', 'dfa_lexer.py', 'preprocessor.py', 'parser.py',
+    'parsetab.pickle', 'symbol_table.py', 'type_system.py', 'code_gen.py', 'quad_store.py',
+    'syntax_tree.py', 'optimizer.py', 'cfg.py', 'dataflow.py', 'regalloc.py',
+    'diagnostics.py', 'session.py', 'source_map.py',
+)
+
+_fingerprint = None
+
+def compiler_fingerprint():
+    """Hash de los archivos del compilador (se calcula una vez por proceso)."""
+    global _fingerprint
+    if _fingerprint is None:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{FORMAT}".encode())
+        for name in COMPILER_FILES:
+            try:
+                with open(os.path.join(TABLES_DIR, name), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                data = b''
+            h.update(f"|{name}|{len(data)}|".encode())
+            h.update(data)
+        _fingerprint = h.hexdigest()
+    return _fingerprint
+
+
+class CompileCache:
+    """Directorio de resultados de compilación con límite de tamaño y estadísticas."""
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0             # entradas ilegibles (se tratan como fallos)
+        self._size = None           # bytes estimados en disco (None: sin medir)
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, source, options):
+        """Clave de una unidad: hash del texto, de las opciones y del compilador."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(compiler_fingerprint().encode())
+        h.update(repr(options).encode('utf-8', 'surrogatepass'))
+        h.update(b'\0')
+        h.update(source.encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def load(self, key, name):
+        """CompilationResult guardado para `key`, o None si no hay uno válido."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+                IndexError, TypeError, ValueError):
+            self.errors += 1
+            self.misses += 1
+            return None
+        if (not isinstance(entry, dict) or entry.get('format') != FORMAT
+                or not self._headers_unchanged(entry['includes'])
+                or any(os.path.exists(path) for path in entry['probes'])):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)          # marca de uso para el LRU
+        except OSError:
+            pass
+        self.hits += 1
+        result = entry['result']
+        result.name = name
+        result.cached = True
+        return result
+
+    def _headers_unchanged(self, includes):
+        try:
+            return all(header_cache.digest(path) == digest for path, digest in includes)
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    def store(self, key, result):
+        """Guarda `result` de forma atómica (no se guarda el perfil)."""
+        try:
+            includes = [(path, header_cache.digest(path)) for path in result.includes]
+        except (OSError, UnicodeDecodeError):
+            return
+        profile, result.profile = result.profile, None
+        try:
+            data = pickle.dumps({'format': FORMAT, 'includes': includes,
+                                 'probes': sorted(set(result.probes)), 'result': result},
+                                pickle.HIGHEST_PROTOCOL)
+        finally:
+            result.profile = profile
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self.stores += 1
+        if self._size is None:
+            self._size = self.disk_usage()[1]
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    # --- Mantenimiento ---
+    def _entries(self):
+        """[(mtime, tamaño, ruta)] de las entradas; borra temporales abandonados."""
+        entries = []
+        now = time.time()
+        try:
+            scan = os.scandir(self.directory)
+        except OSError:
+            return entries
+        with scan:
+            for item in scan:
+                try:
+                    info = item.stat()
+                except OSError:
+                    continue
+                if item.name.endswith(SUFFIX):
+                    entries.append((info.st_mtime, info.st_size, item.path))
+                elif item.name.endswith('.tmp') and now - info.st_mtime > STALE_TMP_SECONDS:
+                    try:
+                        os.remove(item.path)
+                    except OSError:
+                        pass
+        return entries
+
+    def disk_usage(self):
+        """(entradas, bytes) en el directorio."""
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def evict(self, target=None):
+        """Borra las entradas usadas hace más tiempo hasta quedar por debajo de `target`."""
+        if target is None:
+            target = self.max_bytes * 9 // 10
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue            # otro proceso ya la borró
+            total -= size
+            self.evictions += 1
+        self._size = total
+
+    def clear(self):
+        self.evict(0)
+
+    def stats(self):
+        entries, size = self.disk_usage()
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'stores': self.stores, 'evictions': self.evictions, 'errors': self.errors,
+                'entries': entries, 'bytes': size, 'max_bytes': self.max_bytes}
+
+    def __repr__(self):
+        return (f"CompileCache({self.directory!r}, {self.hits} aciertos, {self.misses} fallos, "
+                f"{self.stores} escrituras, {self.evictions} desalojos)")
+
+
+if __name__ == '__main__':
+    # Uso: python compile_cache.py directorio [--clear]   estado (o vaciado) de una caché
+    #      python compile_cache.py                        compilación fría, caliente y con 5 % de cambios
+    import shutil
+    import sys
+    import tempfile
+    from session import CompilationSession
+
+    args = sys.argv[1:]
+    if args:
+        cache = CompileCache(args[0])
+        if '--clear' in args:
+            cache.clear()
+        entries, size = cache.disk_usage()
+        print(f"{cache.directory}: {entries} entradas, {size:,} bytes (límite {cache.max_bytes:,})")
+        sys.exit(0)
+
+    from bench import ProgramGenerator
+    units = 200
+    folder = tempfile.mkdtemp()
+    try:
+        sources = [ProgramGenerator(functions=6, depth=2, seed=seed).generate() for seed in range(units)]
+
+        def build(label, cache):
+            session = CompilationSession(opt_level=2, cache=cache)
+            start = time.perf_counter()
+            results = [session.compile(source, f"u{i}.c") for i, source in enumerate(sources)]
+            elapsed = time.perf_counter() - start
+            cached = sum(result.cached for result in results)
+            print(f"{label:<22} {elapsed:7.3f} s  {cached:>4}/{units} de la caché")
+            return results
+
+        reference = build('sin caché', None)
+        cache = CompileCache(os.path.join(folder, 'cache'))
+        build('fría', cache)
+        warm = build('caliente', cache)
+        assert all(a.code == b.code for a, b in zip(reference, warm))
+        for i in range(0, units, 20):
+            sources[i] += "\nint extra;\n"
+        build('5 % modificadas', cache)
+        print(cache)
+        entries, size = cache.disk_usage()
+        print(f"{entries} entradas, {size / 1024:,.0f} KiB")
+    finally:
+        shutil.rmtree(folder)
@@ -0,0 +1,134 @@
+"""
+Cliente ligero del daemon de compilación (compile_daemon.py).
+
+Solo usa la biblioteca estándar: no importa el lexer ni el parser, así que
+arrancarlo cuesta lo mismo que arrancar el intérprete. El protocolo es una
+línea JSON por petición y por respuesta sobre un socket Unix:
+
+    {"id": 1, "op": "compile", "path": "/abs/main.c", "options": {"opt_level": 2}}
+    {"id": 1, "ok": true, "name": "/abs/main.c", "code": "...", "diagnostics": [...], "cached": false}
+
+Otras operaciones: "ping", "stats" y "shutdown".
+"""
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET = os.environ.get('COMPILER_SOCKET') or f"/tmp/compiladores-{os.getuid()}.sock"
+
+
+class DaemonError(Exception):
+    """El daemon no responde o devolvió un error de protocolo."""
+
+
+class CompileClient:
+    """Conexión al daemon; admite varias peticiones seguidas por la misma conexión."""
+    def __init__(self, socket_path=DEFAULT_SOCKET, timeout=None):
+        self.socket_path = socket_path
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(socket_path)
+        except OSError as e:
+            self.sock.close()
+            raise DaemonError(f"No hay daemon en {socket_path}: {e}") from None
+        self.reader = self.sock.makefile('rb')
+        self._next_id = 0
+
+    def request(self, op, **fields):
+        self._next_id += 1
+        message = dict(fields, id=self._next_id, op=op)
+        self.sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        line = self.reader.readline()
+        if not line:
+            raise DaemonError("El daemon cerró la conexión")
+        reply = json.loads(line)
+        if 'error' in reply:
+            raise DaemonError(reply['error'])
+        return reply
+
+    def compile(self, path=None, source=None, name=None, **options):
+        """Compila un archivo (ruta vista por el daemon) o un texto; devuelve la respuesta."""
+        fields = {'options': options}
+        if path is not None:
+            fields['path'] = os.path.abspath(path)
+        else:
+            fields['source'] = source
+            fields['name'] = name or '<string>'
+        return self.request('compile', **fields)
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv):
+    # Uso: python compile_client.py [-O2] [-P] [-Idir] [-DNOMBRE=valor] [-o salida] archivo.c ...
+    #      python compile_client.py --ping | --stats | --shutdown
+    # Opciones comunes: --socket=ruta
+    socket_path = DEFAULT_SOCKET
+    options = {}
+    output = None
+    paths = []
+    ops = []
+    args = list(argv)
+    while args:
+        arg = args.pop(0)
+        if arg.startswith('--socket='):
+            socket_path = arg.partition('=')[2]
+        elif arg in ('--ping', '--stats', '--shutdown'):
+            ops.append(arg[2:])
+        elif arg == '-o':
+            output = args.pop(0)
+        elif arg.startswith('-O'):
+            options['opt_level'] = int(arg[2:] or 1)
+        elif arg == '-P':
+            options['preprocess'] = True
+        elif arg.startswith('-I'):
+            options['preprocess'] = True
+            options.setdefault('include_path', []).append(os.path.abspath(arg[2:]))
+        elif arg.startswith('-D'):
+            name, _, text = arg[2:].partition('=')
+            options['preprocess'] = True
+            options.setdefault('defines', {})[name] = text or '1'
+        else:
+            paths.append(arg)
+
+    failed = False
+    try:
+        with CompileClient(socket_path) as client:
+            for op in ops:
+                print(json.dumps(client.request(op), indent=2, ensure_ascii=False))
+            listings = []
+            for path in paths:
+                reply = client.compile(path, **options)
+                for diag in reply['diagnostics']:
+                    where = f" line {diag['line']}" if diag['line'] is not None else ''
+                    if diag.get('column') is not None:
+                        where += f", column {diag['column']}"
+                    print(f"{path}:{where} {diag['severity']} [{diag['code']}] {diag['message']}",
+                          file=sys.stderr)
+                failed = failed or not reply['ok']
+                listings.append(reply['code'])
+    except DaemonError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if paths:
+        text = '\n'.join(listings)
+        if output:
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            sys.stdout.write(text)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
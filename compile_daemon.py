@@ -0,0 +1,259 @@
+"""
+Daemon de compilación: mantiene el lexer y el parser cargados y atiende
+peticiones por un socket Unix (protocolo en compile_client.py).
+
+El front end es asyncio: cada conexión puede enviar varias peticiones
+seguidas y cada una se despacha a un pool de procesos. Cada trabajador
+importa el compilador una sola vez (en el inicializador del pool) y guarda
+una CompilationSession por combinación de opciones; la sesión se reinicia en
+cada compilación, así que las unidades no comparten estado. Con --cache los
+trabajadores comparten además la caché de resultados en disco.
+
+    python compile_daemon.py [--socket=ruta] [--workers=N] [--cache=dir]
+    python compile_client.py -O2 main.c
+"""
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from compile_client import DEFAULT_SOCKET
+from optimizer import LEVELS
+
+MAX_REQUEST = 64 << 20          # bytes por línea (el texto fuente puede ir en la petición)
+MAX_SESSIONS = 16               # sesiones por trabajador (una por juego de opciones)
+
+# Opciones de CompilationSession que un cliente puede elegir, con su validación
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+OPTIONS = {
+    'engine': (lambda v: v in ('ply', 'dfa'), "'ply' o 'dfa'"),
+    'opt_level': (lambda v: _is_int(v) and v in LEVELS, f"un nivel de {sorted(LEVELS)}"),
+    'recycle_temps': (lambda v: isinstance(v, bool), "true o false"),
+    'registers': (lambda v: v is None or (_is_int(v) and v >= 1), "null o un entero >= 1"),
+    'preprocess': (lambda v: isinstance(v, bool), "true o false"),
+    'include_path': (lambda v: isinstance(v, list) and all(isinstance(p, str) for p in v),
+                     "una lista de rutas"),
+    'defines': (lambda v: isinstance(v, dict) and all(isinstance(t, str) for t in v.values()),
+                "un objeto {nombre: texto}"),
+}
+
+def check_options(options):
+    """Mensaje de error si las opciones no son válidas, o None."""
+    if not isinstance(options, dict):
+        return "Las opciones deben ser un objeto JSON"
+    unknown = set(options) - set(OPTIONS)
+    if unknown:
+        return f"Opciones desconocidas: {', '.join(sorted(unknown))}"
+    for name, value in options.items():
+        valid, expected = OPTIONS[name]
+        if not valid(value):
+            return f"Valor no válido para '{name}': {value!r} (se espera {expected})"
+    return None
+
+
+# --- Lado del trabajador ---
+_sessions = {}
+_cache = None
+
+def _init_worker(cache_dir):
+    global _cache
+    import session      # carga las tablas del lexer y del parser una vez por proceso
+    from compile_cache import CompileCache
+    _cache = CompileCache(cache_dir) if cache_dir else None
+    _session({})
+
+def _session(options):
+    from session import CompilationSession
+    key = json.dumps(options, sort_keys=True)
+    current = _sessions.get(key)
+    if current is None:
+        if len(_sessions) >= MAX_SESSIONS:
+            del _sessions[next(iter(_sessions))]
+        current = _sessions[key] = CompilationSession(cache=_cache, **options)
+    return current
+
+def _compile_request(request):
+    """Compila la unidad de la petición y devuelve la respuesta ya serializable."""
+    from code_gen import format_quad
+    from diagnostics import DiagnosticSink
+    from session import CompilationResult
+
+    options = request.get('options') or {}
+    session = _session(options)
+    if 'path' in request:
+        try:
+            result = session.compile_file(request['path'])
+        except (OSError, UnicodeDecodeError) as e:
+            diagnostics = DiagnosticSink()
+            diagnostics.error('I001', "%s", str(e))
+            result = CompilationResult(request['path'], [], list(diagnostics), ok=False)
+    else:
+        result = session.compile(request.get('source', ''), request.get('name', '<string>'))
+    return {'ok': result.ok, 'name': result.name,
+            'code': ''.join(format_quad(quad) + '\n' for quad in result.code),
+            'diagnostics': [diag.to_dict() for diag in result.diagnostics],
+            'includes': result.includes, 'cached': result.cached}
+
+def _ready():
+    return os.getpid()
+
+
+# --- Front end asyncio ---
+class CompileDaemon:
+    def __init__(self, socket_path=DEFAULT_SOCKET, workers=None, cache_dir=None):
+        self.socket_path = socket_path
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_dir = cache_dir
+        self.pool = None
+        self.started = None
+        self.requests = 0
+        self.compiles = 0
+        self.cache_hits = 0
+        self.failures = 0           # peticiones con respuesta de error (protocolo, opciones, trabajador)
+        self._stop = None
+        self._clients = set()       # tareas de las conexiones abiertas
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                   initargs=(self.cache_dir,))
+
+    def _claim_socket(self):
+        """Borra un socket abandonado; falla si otro daemon sigue escuchando."""
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.remove(self.socket_path)
+        else:
+            raise RuntimeError(f"Ya hay un daemon escuchando en {self.socket_path}")
+        finally:
+            probe.close()
+
+    async def serve(self):
+        loop = asyncio.get_running_loop()
+        self._claim_socket()
+        self._stop = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._stop.set)
+        self.pool = self._new_pool()
+        # Arranca los trabajadores antes de aceptar peticiones
+        await asyncio.gather(*(loop.run_in_executor(self.pool, _ready) for _ in range(self.workers)))
+        server = await asyncio.start_unix_server(self._handle, path=self.socket_path,
+                                                 limit=MAX_REQUEST)
+        os.chmod(self.socket_path, 0o600)
+        self.started = time.time()
+        print(f"Daemon escuchando en {self.socket_path} ({self.workers} trabajadores)", flush=True)
+        try:
+            async with server:
+                await self._stop.wait()
+                # Cierra las conexiones abiertas (también la que pidió el apagado)
+                # antes de que el servidor termine
+                for task in self._clients:
+                    task.cancel()
+                await asyncio.gather(*self._clients, return_exceptions=True)
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    async def _handle(self, reader, writer):
+        pending = set()
+        client = asyncio.current_task()
+        self._clients.add(client)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:      # línea mayor que MAX_REQUEST
+                    self.failures += 1
+                    writer.write(b'{"error": "Peticion demasiado grande"}\n')
+                    break
+                if not line:
+                    break
+                task = asyncio.create_task(self._respond(line, writer))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+            await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # CancelledError: el daemon se está apagando
+            for task in pending:
+                task.cancel()
+        finally:
+            self._clients.discard(client)
+            writer.close()
+
+    async def _respond(self, line, writer):
+        self.requests += 1
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError
+        except ValueError:
+            request = {}
+            reply = {'error': "Petición JSON inválida"}
+        else:
+            reply = await self._dispatch(request)
+        if 'error' in reply:
+            self.failures += 1
+        reply['id'] = request.get('id')
+        writer.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b'\n')
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        if request.get('op') == 'shutdown':
+            self._stop.set()
+
+    async def _dispatch(self, request):
+        op = request.get('op')
+        if op == 'compile':
+            error = check_options(request.get('options') or {})
+            if error is not None:
+                return {'error': error}
+            loop = asyncio.get_running_loop()
+            try:
+                reply = await loop.run_in_executor(self.pool, _compile_request, request)
+            except BrokenProcessPool:
+                self.pool = self._new_pool()
+                return {'error': "Un trabajador terminó inesperadamente; pool reiniciado"}
+            except Exception as e:
+                # La excepción del trabajador llega aquí; la conexión sigue abierta
+                return {'error': f"Error al compilar: {type(e).__name__}: {e}"}
+            if 'error' not in reply:
+                self.compiles += 1
+                self.cache_hits += reply['cached']
+            return reply
+        if op == 'ping':
+            return {'pong': True, 'pid': os.getpid()}
+        if op == 'stats':
+            return {'requests': self.requests, 'compiles': self.compiles,
+                    'cache_hits': self.cache_hits, 'failures': self.failures,
+                    'workers': self.workers, 'uptime': time.time() - self.started}
+        if op == 'shutdown':
+            return {'stopping': True}
+        return {'error': f"Operación desconocida: {op!r}"}
+
+
+if __name__ == '__main__':
+    import sys
+
+    socket_path, workers, cache_dir = DEFAULT_SOCKET, None, None
+    for arg in sys.argv[1:]:
+        name, _, value = arg.partition('=')
+        if name == '--socket':
+            socket_path = value
+        elif name == '--workers':
+            workers = int(value)
+        elif name == '--cache':
+            cache_dir = value
+    asyncio.run(CompileDaemon(socket_path, workers, cache_dir).serve())
@@ -0,0 +1,352 @@
+"""
+Análisis de flujo de datos sobre el CFG (cfg.py) con conjuntos como bitsets.
+
+Cada conjunto es un entero de Python: el bit i indica si el elemento i del
+universo está presente. Unión, intersección y diferencia son |, & y & ~, que
+operan palabra a palabra en C, en lugar de recorrer sets de cadenas.
+
+El resolvedor es genérico (transferencia gen/kill, unión o intersección,
+hacia delante o hacia atrás) y usa una lista de trabajo en postorden inverso
+(un montículo ordenado por posición) para converger en pocas vueltas. Sobre él:
+    liveness               variables vivas a la entrada/salida de cada bloque
+    reaching_definitions   definiciones (índices de instrucción) que alcanzan
+    available_expressions  expresiones (op, a, b) ya calculadas en todo camino
+"""
+import heapq
+
+from cfg import ControlFlowGraph, operand_name, reads, writes
+from optimizer import COMMUTATIVE, is_pure
+from quad_store import Temp
+
+
+class Universe:
+    """Asigna un bit a cada elemento."""
+    def __init__(self, items=()):
+        self.items = []
+        self.index = {}
+        for item in items:
+            self.bit(item)
+
+    def bit(self, item):
+        i = self.index.get(item)
+        if i is None:
+            i = self.index[item] = len(self.items)
+            self.items.append(item)
+        return i
+
+    def mask(self, items):
+        m = 0
+        for item in items:
+            m |= 1 << self.bit(item)
+        return m
+
+    def bits(self, indices):
+        """Bitset con los bits indicados; coste lineal en el tamaño del universo."""
+        if not indices:
+            return 0
+        raw = bytearray((len(self.items) + 7) >> 3)
+        for i in indices:
+            raw[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(raw, 'little')
+
+    def members(self, bits):
+        """Elementos presentes en el bitset."""
+        items = self.items
+        out = []
+        while bits:
+            low = bits & -bits
+            out.append(items[low.bit_length() - 1])
+            bits ^= low
+        return out
+
+    @property
+    def full(self):
+        return (1 << len(self.items)) - 1
+
+    def __len__(self):
+        return len(self.items)
+
+
+class DataflowResult:
+    """Conjuntos IN/OUT por bloque (bitsets) y estadísticas del resolvedor."""
+    def __init__(self, cfg, universe, IN, OUT, visits):
+        self.cfg = cfg
+        self.universe = universe
+        self.IN = IN
+        self.OUT = OUT
+        self.visits = visits    # bloques procesados por la lista de trabajo
+
+    def live_in(self, block):
+        return set(self.universe.members(self.IN[block]))
+
+    def live_out(self, block):
+        return set(self.universe.members(self.OUT[block]))
+
+
+def solve(cfg, gen, kill, forward=True, meet='union', boundary=0, init=0):
+    """
+    Resuelve out = gen | (in & ~kill) (hacia delante; al revés si forward es
+    False) por lista de trabajo. `meet` es 'union' o 'intersection';
+    `boundary` es el valor en la entrada (o en las salidas, hacia atrás).
+    Devuelve (IN, OUT) como listas de bitsets indexadas por bloque.
+    """
+    n = len(cfg.blocks)
+    blocks = cfg.blocks
+    IN = [init] * n
+    OUT = [init] * n
+    order = cfg.reverse_postorder() if forward else cfg.postorder()
+    # Bloques inalcanzables: también se procesan, al final
+    reached = set(order)
+    order += [b for b in range(n) if b not in reached]
+    # La lista de trabajo saca siempre el bloque más temprano en ese orden
+    rank = [0] * n
+    for position, b in enumerate(order):
+        rank[b] = position
+    worklist = list(range(n))
+    queued = [True] * n
+    union = meet == 'union'
+    visits = 0
+    if forward:
+        src, dst, edges_in, edges_out = IN, OUT, 'pred', 'succ'
+    else:
+        src, dst, edges_in, edges_out = OUT, IN, 'succ', 'pred'
+    while worklist:
+        b = order[heapq.heappop(worklist)]
+        queued[b] = False
+        visits += 1
+        inputs = getattr(blocks[b], edges_in)
+        if (forward and b == 0) or not inputs:
+            value = boundary
+        elif union:
+            value = 0
+            for p in inputs:
+                value |= dst[p]
+        else:
+            value = -1
+            for p in inputs:
+                value &= dst[p]
+        src[b] = value
+        new = gen[b] | (value & ~kill[b])
+        if new != dst[b]:
+            dst[b] = new
+            for s in getattr(blocks[b], edges_out):
+                if not queued[s]:
+                    queued[s] = True
+                    heapq.heappush(worklist, rank[s])
+    return IN, OUT, visits
+
+
+# --- Análisis ---
+def _address_taken(cfg):
+    names = set()
+    for quad in cfg.code[cfg.start:cfg.stop]:
+        for operand in quad[1:3]:
+            if isinstance(operand, str) and operand[:1] == '&':
+                names.add(operand[1:])
+    return names
+
+def liveness(cfg):
+    """Variables y temporales vivos. Leer *p mantiene vivas las variables con & tomado."""
+    code = cfg.code
+    universe = Universe()
+    bit = universe.bit
+    aliased = {bit(name) for name in _address_taken(cfg)}
+    # Conjuntos de índices por bloque: en bloques enormes, operar con enteros
+    # gigantes en cada instrucción sería cuadrático
+    blocks_use, blocks_def = [], []
+    for block in cfg.blocks:
+        u, d = set(), set()
+        for i in range(block.start, block.end):
+            quad = code[i]
+            for name in reads(quad):
+                b = bit(name)
+                if b not in d:
+                    u.add(b)
+            if aliased and any(isinstance(x, str) and x[:1] == '*' for x in quad[1:]):
+                u |= aliased - d
+            name = writes(quad)
+            if name is not None:
+                d.add(bit(name))
+        blocks_use.append(u)
+        blocks_def.append(d)
+    use = [universe.bits(u) for u in blocks_use]
+    define = [universe.bits(d) for d in blocks_def]
+    IN, OUT, visits = solve(cfg, use, define, forward=False)
+    return DataflowResult(cfg, universe, IN, OUT, visits)
+
+
+def reaching_definitions(cfg):
+    """Definiciones que alcanzan cada bloque; el universo son índices de instrucción."""
+    code = cfg.code
+    universe = Universe()
+    defs_of = {}            # nombre -> índices de sus definiciones
+    for i in range(cfg.start, cfg.stop):
+        name = writes(code[i])
+        if name is not None:
+            defs_of.setdefault(name, []).append(universe.bit(i))
+    defs_of = {name: universe.bits(indices) for name, indices in defs_of.items()}
+    gen, kill = [], []
+    for block in cfg.blocks:
+        last = {}           # nombre -> última definición en el bloque
+        for i in range(block.start, block.end):
+            name = writes(code[i])
+            if name is not None:
+                last[name] = universe.index[i]
+        g = universe.bits(last.values())
+        k = 0
+        for name in last:
+            k |= defs_of[name]
+        gen.append(g)
+        kill.append(k & ~g)
+    IN, OUT, visits = solve(cfg, gen, kill)
+    return DataflowResult(cfg, universe, IN, OUT, visits)
+
+
+def expression_key(quad):
+    """Clave normalizada (op, a, b) de una operación pura, o None."""
+    op, arg1, arg2, _ = quad
+    if op == '=' or not is_pure(quad):
+        return None
+    if op in COMMUTATIVE and arg2 is not None and str(arg2) < str(arg1):
+        return (op, arg2, arg1)
+    return (op, arg1, arg2)
+
+def available_expressions(cfg):
+    """Expresiones calculadas en todo camino hasta el bloque y no invalidadas."""
+    code = cfg.code
+    universe = Universe()
+    uses_name = {}          # nombre -> bitset de expresiones que lo leen
+    memory = 0              # expresiones que leen *p
+    for i in range(cfg.start, cfg.stop):
+        key = expression_key(code[i])
+        if key is not None and key not in universe.index:
+            bit = 1 << universe.bit(key)
+            for operand in key[1:]:
+                name = operand_name(operand)
+                if name is not None:
+                    uses_name[name] = uses_name.get(name, 0) | bit
+                if isinstance(operand, str) and operand[:1] == '*':
+                    memory |= bit
+    gen, kill = [], []
+    for block in cfg.blocks:
+        g = k = 0
+        for i in range(block.start, block.end):
+            quad = code[i]
+            key = expression_key(quad)
+            name = writes(quad)
+            if key is not None:
+                g |= 1 << universe.index[key]
+            if name is not None:
+                dead = uses_name.get(name, 0)
+                if not isinstance(name, Temp):
+                    dead |= memory
+                g &= ~dead
+                k |= dead
+            elif quad[0] == 'call' or (isinstance(quad[3], str) and quad[3][:1] == '*'):
+                # Una llamada o una escritura en memoria puede cambiar cualquier variable
+                dead = memory
+                for other, bits in uses_name.items():
+                    if not isinstance(other, Temp):
+                        dead |= bits
+                g &= ~dead
+                k |= dead
+        gen.append(g)
+        kill.append(k & ~g)
+    full = universe.full
+    IN, OUT, visits = solve(cfg, gen, kill, meet='intersection', boundary=0, init=full)
+    return DataflowResult(cfg, universe, IN, OUT, visits)
+
+
+if __name__ == '__main__':
+    # Escalado: funciones sintéticas con miles de bloques, bitsets frente a sets de cadenas
+    import random
+    import sys
+    import time
+
+    def synthetic_function(blocks, variables=64, seed=0):
+        """Función estructurada: secuencias, if/else y bucles anidados (hasta 3 niveles)."""
+        rng = random.Random(seed)
+        names = [f"v{i}" for i in range(variables)]
+        code = [('func', 'f', 0, None)]
+        counter = {'temp': 0, 'label': 0, 'blocks': 0}
+
+        def label():
+            counter['label'] += 1
+            return f"L{counter['label']}"
+
+        def straight():
+            counter['blocks'] += 1
+            for _ in range(4):
+                t = Temp(f"t{counter['temp']}")
+                counter['temp'] += 1
+                code.append((rng.choice('+-*'), rng.choice(names), rng.choice(names), t))
+                code.append(('=', t, None, rng.choice(names)))
+
+        def region(depth):
+            kind = rng.random() if depth < 3 else 0
+            if kind < 0.4:
+                straight()
+            elif kind < 0.7:        # if / else
+                other, end = label(), label()
+                code.append(('if<', rng.choice(names), rng.choice(names), other))
+                region(depth + 1)
+                code.append(('goto', None, None, end))
+                code.append(('label', None, None, other))
+                region(depth + 1)
+                code.append(('label', None, None, end))
+            else:                   # while
+                top, end = label(), label()
+                code.append(('label', None, None, top))
+                code.append(('if>=', rng.choice(names), rng.choice(names), end))
+                for _ in range(rng.randint(1, 3)):
+                    region(depth + 1)
+                code.append(('goto', None, None, top))
+                code.append(('label', None, None, end))
+
+        while counter['blocks'] < blocks:
+            region(0)
+        code.append(('return', names[0], None, None))
+        return code
+
+    def naive_liveness(cfg):
+        use, define = [], []
+        for block in cfg.blocks:
+            u, d = set(), set()
+            for quad in cfg.instructions(block):
+                u |= set(reads(quad)) - d
+                name = writes(quad)
+                if name is not None:
+                    d.add(name)
+            use.append(u)
+            define.append(d)
+        IN = [set() for _ in cfg.blocks]
+        OUT = [set() for _ in cfg.blocks]
+        changed = True
+        while changed:
+            changed = False
+            for block in reversed(cfg.blocks):
+                b = block.index
+                out = set().union(*(IN[s] for s in block.succ)) if block.succ else set()
+                new = use[b] | (out - define[b])
+                if new != IN[b] or out != OUT[b]:
+                    IN[b], OUT[b], changed = new, out, True
+        return IN
+
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 2000, 4000, 8000]
+    print(f"{'bloques':>8} {'CFG':>8} {'vivas':>8} {'alcanz.':>8} {'disp.':>8} {'sets':>8}   (ms)")
+    for n in sizes:
+        code = synthetic_function(n)
+        t0 = time.perf_counter()
+        cfg = ControlFlowGraph(code)
+        t1 = time.perf_counter()
+        live = liveness(cfg)
+        t2 = time.perf_counter()
+        reaching_definitions(cfg)
+        t3 = time.perf_counter()
+        available_expressions(cfg)
+        t4 = time.perf_counter()
+        naive = naive_liveness(cfg)
+        t5 = time.perf_counter()
+        assert all(live.live_in(b) == naive[b] for b in range(len(cfg)))
+        print(f"{len(cfg):>8} {(t1 - t0) * 1000:8.1f} {(t2 - t1) * 1000:8.1f} {(t3 - t2) * 1000:8.1f} "
+              f"{(t4 - t3) * 1000:8.1f} {(t5 - t4) * 1000:8.1f}")
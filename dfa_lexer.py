@@ -0,0 +1,361 @@
+"""
+Motor léxico alternativo: un autómata construido a mano que guarda los tokens
+en arreglos paralelos (código de tipo, inicio, fin, línea) en lugar de crear
+un LexToken por token. Es compatible token a token con el lexer PLY de
+lexer.py (mismo orden de reglas, mismos números de línea, mismos errores).
+
+El estado inicial del autómata despacha por clase de carácter; los cuerpos
+largos (identificadores, números, cadenas, comentarios) se recorren con
+expresiones ancladas para que el bucle en Python solo se ejecute una vez por
+token. Los valores literales se decodifican bajo demanda.
+"""
+import re
+import sys
+from array import array
+
+from ply.lex import LexToken
+
+from diagnostics import DiagnosticSink
+
+import lexer as ply_lexer
+
+TOKEN_NAMES = ply_lexer.tokens
+TOKEN_CODES = {name: code for code, name in enumerate(TOKEN_NAMES)}
+
+_ID = TOKEN_CODES['ID']
+_INT = TOKEN_CODES['INT_LITERAL']
+_FLOAT = TOKEN_CODES['FLOAT_LITERAL']
+_STRING = TOKEN_CODES['STRING_LITERAL']
+_CHAR = TOKEN_CODES['CHAR_LITERAL']
+_DIVIDE = TOKEN_CODES['DIVIDE']
+
+KEYWORDS = {word: TOKEN_CODES[name] for word, name in ply_lexer.reserved.items()}
+DIRECTIVES = (('#include', TOKEN_CODES['INCLUDE']), ('#define', TOKEN_CODES['DEFINE']))
+
+# Operadores de dos caracteres (tienen prioridad, como en el orden de PLY)
+DOUBLE = {
+    '<=': 'LE', '>=': 'GE', '==': 'EQ', '!=': 'NE',
+    '&&': 'AND', '||': 'OR', '++': 'PLUSPLUS', '--': 'MINUSMINUS',
+}
+DOUBLE = {text: TOKEN_CODES[name] for text, name in DOUBLE.items()}
+SINGLE = {
+    '+': 'PLUS', '-': 'MINUS', '*': 'TIMES', '/': 'DIVIDE', '=': 'ASSIGN',
+    '(': 'LPAREN', ')': 'RPAREN', '{': 'LBRACE', '}': 'RBRACE',
+    '[': 'LBRACKET', ']': 'RBRACKET', ';': 'SEMICOLON', ',': 'COMMA',
+    '<': 'LT', '>': 'GT', '!': 'NOT', '&': 'AMPERSAND', ':': 'COLON', '.': 'DOT',
+}
+SINGLE = {text: TOKEN_CODES[name] for text, name in SINGLE.items()}
+
+# Clases de carácter del estado inicial
+C_OTHER, C_SPACE, C_NEWLINE, C_ALPHA, C_DIGIT, C_PUNCT, C_SLASH, C_HASH, C_DQUOTE, C_SQUOTE = range(10)
+CHAR_CLASS = {' ': C_SPACE, '\t': C_SPACE, '\n': C_NEWLINE, '/': C_SLASH,
+              '#': C_HASH, '"': C_DQUOTE, "'": C_SQUOTE}
+for _c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_':
+    CHAR_CLASS[_c] = C_ALPHA
+for _c in '0123456789':
+    CHAR_CLASS[_c] = C_DIGIT
+for _c in SINGLE:
+    CHAR_CLASS.setdefault(_c, C_PUNCT)
+CHAR_CLASS['|'] = C_PUNCT
+
+_ID_RE = re.compile(r'[a-zA-Z0-9_]*')
+_NUMBER_RE = re.compile(r'\d+(\.\d+)?')
+_NEWLINES_RE = re.compile(r'\n+')
+_STRING_RE = re.compile(r'"([^\\"]|\\.)*"')
+_CHAR_RE = re.compile(r"'([^'\\\n]|\\.)'")
+_STRING_PREFIX_RE = re.compile(r'"([^\\"]|\\.)*\\?')
+
+
+class TokenArray:
+    """Flujo de tokens en arreglos paralelos; 13 bytes por token."""
+    def __init__(self, source):
+        self.source = source
+        self.types = array('B')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.lines = array('i')
+        self.end = 0
+        self.line_start = 0     # posición donde empieza la línea en que acabó el escaneo
+
+    def __len__(self):
+        return len(self.types)
+
+    def type_name(self, i):
+        return TOKEN_NAMES[self.types[i]]
+
+    def text(self, i):
+        return self.source[self.starts[i]:self.ends[i]]
+
+    def value(self, i):
+        """Valor del token i, decodificado igual que en lexer.py."""
+        code = self.types[i]
+        text = self.source[self.starts[i]:self.ends[i]]
+        if code == _INT:
+            return int(text)
+        if code == _FLOAT:
+            return float(text)
+        if code == _STRING or code == _CHAR:
+            return text[1:-1]
+        if code == _ID:
+            return sys.intern(text)     # la tabla de símbolos interna los nombres
+        return text
+
+    def token(self, i):
+        """Materializa el token i como LexToken (para el parser de PLY)."""
+        tok = LexToken()
+        tok.type = TOKEN_NAMES[self.types[i]]
+        tok.value = self.value(i)
+        tok.lineno = self.lines[i]
+        tok.lexpos = self.starts[i]
+        return tok
+
+    def __iter__(self):
+        for i in range(len(self.types)):
+            yield self.token(i)
+
+    def nbytes(self):
+        return sum(a.itemsize * len(a) for a in (self.types, self.starts, self.ends, self.lines))
+
+
+def scan(data, diagnostics=None, lineno=1, final=True, start=0, stop=None, line_start=None):
+    """
+    Tokeniza `data[start:stop]` y devuelve (TokenArray, línea final). Las
+    posiciones de los tokens son absolutas dentro de `data`. `line_start` es
+    la posición donde empieza la línea de `start` (negativa si empezó en un
+    fragmento anterior); con ella los errores llevan columna sin reescanear.
+
+    Con `final=False` el texto es un fragmento de una entrada mayor: el
+    escaneo se detiene antes del primer token que podría continuar en el
+    fragmento siguiente, y `stream.end` indica desde dónde reanudar.
+    Sin `diagnostics` los errores léxicos se descartan.
+    """
+    if diagnostics is None:
+        diagnostics = DiagnosticSink()
+    stream = TokenArray(data)
+    types = stream.types.append
+    starts = stream.starts.append
+    ends = stream.ends.append
+    lines = stream.lines.append
+    char_class = CHAR_CLASS.get
+    keywords = KEYWORDS.get
+    line = lineno
+    if line_start is None:
+        line_start = data.rfind('\n', 0, start) + 1
+    i = start
+    n = len(data) if stop is None else stop
+
+    while i < n:
+        c = data[i]
+        k = char_class(c, C_OTHER)
+
+        if k == C_ALPHA:
+            j = _ID_RE.match(data, i + 1, n).end()
+            if j == n and not final:
+                break
+            types(keywords(data[i:j], _ID))
+        elif k == C_SPACE:
+            i += 1
+            continue
+        elif k == C_PUNCT:
+            if i + 1 == n and not final:
+                break
+            j = i + 2
+            code = DOUBLE.get(data[i:j]) if j <= n else None
+            if code is None:
+                j = i + 1
+                code = SINGLE.get(c)
+                if code is None:        # '|' suelto
+                    _illegal(diagnostics, c, line, i - line_start + 1)
+                    i += 1
+                    continue
+            types(code)
+        elif k == C_NEWLINE:
+            j = _NEWLINES_RE.match(data, i, n).end()
+            line += j - i
+            i = line_start = j
+            continue
+        elif k == C_DIGIT:
+            m = _NUMBER_RE.match(data, i, n)
+            j = m.end()
+            if j + 1 >= n and not final:
+                break
+            types(_FLOAT if m.group(1) else _INT)
+        elif k == C_SLASH:
+            if i + 1 == n and not final:
+                break
+            nxt = data[i + 1:i + 2] if i + 1 < n else ''
+            if nxt == '/':
+                j = data.find('\n', i, n)
+                if j < 0 and not final:
+                    break
+                i = n if j < 0 else j
+                continue
+            if nxt == '*':
+                j = data.find('*/', i + 2, n)
+                if j >= 0:
+                    newlines = data.count('\n', i, j)
+                    if newlines:
+                        line += newlines
+                        line_start = data.rfind('\n', i, j) + 1
+                    i = j + 2
+                    continue
+                if not final:
+                    break
+            j = i + 1
+            types(_DIVIDE)
+        elif k == C_HASH:
+            for text, code in DIRECTIVES:
+                if data.startswith(text, i, n):
+                    j = i + len(text)
+                    types(code)
+                    break
+            else:
+                if not final and any(text.startswith(data[i:n]) for text, _ in DIRECTIVES):
+                    break
+                _illegal(diagnostics, c, line, i - line_start + 1)
+                i += 1
+                continue
+        elif k == C_DQUOTE or k == C_SQUOTE:
+            m = (_STRING_RE if k == C_DQUOTE else _CHAR_RE).match(data, i, n)
+            if m is None:
+                # Solo se espera al siguiente fragmento si el literal pudo cortarse
+                if not final and (n - i < 4 if k == C_SQUOTE else
+                                  _STRING_PREFIX_RE.match(data, i, n).end() == n):
+                    break
+                _illegal(diagnostics, c, line, i - line_start + 1)
+                i += 1
+                continue
+            j = m.end()
+            types(_STRING if k == C_DQUOTE else _CHAR)
+        else:
+            # \d también acepta dígitos Unicode, igual que la regla de PLY
+            m = _NUMBER_RE.match(data, i, n)
+            if m is None:
+                _illegal(diagnostics, c, line, i - line_start + 1)
+                i += 1
+                continue
+            j = m.end()
+            if j + 1 >= n and not final:
+                break
+            types(_FLOAT if m.group(1) else _INT)
+
+        starts(i)
+        ends(j)
+        lines(line)
+        i = j
+
+    stream.end = i
+    stream.line_start = line_start
+    return stream, line
+
+
+def _illegal(diagnostics, char, line, column):
+    diagnostics.error('L001', "Caracter ilegal '%s'", char, line=line, column=column)
+
+
+class ArrayLexer:
+    """
+    Adaptador con la interfaz de un lexer PLY (input/token/clone) para usar
+    el motor DFA con parser.parse(). Los atributos que las acciones
+    semánticas leen (diagnostics, symbol_table, gen) se asignan igual que en
+    el lexer de PLY; hasta entonces los errores léxicos van a un sumidero propio.
+    """
+    def __init__(self):
+        self.diagnostics = DiagnosticSink()
+        self.lineno = 1
+        self.lexpos = 0
+        self.stream = None
+        self._next = 0
+        self._stop = 0
+
+    def input(self, data):
+        self.stream, self._end_line = scan(data, self.diagnostics, self.lineno)
+        self._next = 0
+        self._stop = len(self.stream)
+        self._end_pos = len(data)
+
+    def input_tokens(self, stream, start, stop, end_line, end_pos):
+        """Alimenta al parser con los tokens [start, stop) de un TokenArray ya escaneado."""
+        self.stream = stream
+        self._next = start
+        self._stop = stop
+        self._end_line = end_line
+        self._end_pos = end_pos
+        self.lineno = stream.lines[start] if start < stop else end_line
+
+    def token(self):
+        stream = self.stream
+        i = self._next
+        if i >= self._stop:
+            self.lineno = self._end_line
+            self.lexpos = self._end_pos
+            return None
+        self._next = i + 1
+        tok = stream.token(i)
+        tok.lexer = self
+        self.lineno = tok.lineno
+        self.lexpos = stream.ends[i]
+        return tok
+
+    def clone(self):
+        twin = ArrayLexer()
+        twin.__dict__.update(self.__dict__)
+        twin.stream = None
+        twin._next = twin._stop = 0
+        return twin
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
+
+
+ENGINES = ('ply', 'dfa')
+
+def make_lexer(engine='ply'):
+    """Devuelve un lexer nuevo del motor indicado ('ply' o 'dfa')."""
+    if engine == 'ply':
+        return ply_lexer.lexer.clone()
+    if engine == 'dfa':
+        return ArrayLexer()
+    raise ValueError(f"Motor léxico desconocido: {engine!r}")
+
+
+if __name__ == '__main__':
+    # Benchmark: tokens/s y bytes por token frente al lexer de PLY
+    import sys
+    import time
+    import tracemalloc
+    from test_codigo_profesor import codigo_profesor
+
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    source = codigo_profesor * scale
+
+    def run_ply():
+        lex = ply_lexer.lexer.clone()
+        lex.input(source)
+        return list(lex)
+
+    def run_dfa():
+        return scan(source)[0]
+
+    reference = [(t.type, t.value, t.lineno, t.lexpos) for t in run_ply()]
+    candidate = [(t.type, t.value, t.lineno, t.lexpos) for t in run_dfa()]
+    print(f"Compatibles token a token: {reference == candidate} ({len(reference)} tokens)")
+
+    for label, fn in (('ply', run_ply), ('dfa', run_dfa)):
+        best = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        result = fn()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        print(f"{label}: {len(reference) / best:12,.0f} tokens/s   {size / len(reference):6.1f} bytes/token")
@@ -0,0 +1,164 @@
+import json
+import sys
+
+# Niveles de severidad (de menor a mayor)
+TRACE = 0
+INFO = 1
+WARNING = 2
+ERROR = 3
+
+SEVERITY_NAMES = {TRACE: 'trace', INFO: 'info', WARNING: 'warning', ERROR: 'error'}
+
+# Códigos de diagnóstico conocidos
+CODES = {
+    'L001': 'Caracter ilegal',
+    'P001': 'Error de sintaxis',
+    'P002': 'Error de sintaxis al final del archivo',
+    'D001': 'Archivo incluido no encontrado',
+    'D002': 'Directiva de preprocesador mal formada',
+    'D003': 'Macro redefinida',
+    'D004': 'Número de argumentos de macro incorrecto',
+    'D005': 'Llamada a macro sin cerrar',
+    'S000': 'Error semántico',
+    'S001': 'Símbolo ya declarado en el ámbito actual',
+    'S002': 'Variable no declarada',
+    'S003': 'Asignación de tipos incompatibles',
+    'S004': 'No se puede cerrar el ámbito global',
+    'S005': 'break fuera de un bucle o switch',
+    'S006': 'Número de argumentos incorrecto',
+    'S007': 'Tipo de argumento incompatible',
+    'S008': 'Función no declarada',
+    'S009': 'Operandos de tipos incompatibles',
+    'S010': 'Llamada a algo que no es una función',
+    'I001': 'Error interno del compilador',
+    'T000': 'Traza de las acciones semánticas',
+}
+
+
+class Diagnostic:
+    """
+    Un mensaje del compilador. El texto se guarda como plantilla + argumentos
+    y solo se formatea cuando alguien lo consulta.
+    """
+    __slots__ = ('severity', 'code', 'line', 'column', 'template', 'args')
+
+    def __init__(self, severity, code, template, args=(), line=None, column=None):
+        self.severity = severity
+        self.code = code
+        self.template = template
+        self.args = args
+        self.line = line
+        self.column = column
+
+    @property
+    def message(self):
+        return self.template % self.args if self.args else self.template
+
+    def to_dict(self):
+        return {
+            'severity': SEVERITY_NAMES[self.severity],
+            'code': self.code,
+            'line': self.line,
+            'column': self.column,
+            'message': self.message,
+        }
+
+    def __str__(self):
+        where = f" line {self.line}" if self.line is not None else ''
+        if self.column is not None:
+            where += f", column {self.column}"
+        if self.severity == TRACE:
+            return self.message
+        return f"{SEVERITY_NAMES[self.severity].capitalize()} [{self.code}]{where}: {self.message}"
+
+    def __repr__(self):
+        return f"Diagnostic({SEVERITY_NAMES[self.severity]}, {self.code!r}, {self.message!r}, line={self.line})"
+
+
+class DiagnosticSink:
+    """
+    Buffer de diagnósticos. Con `tracing=False` los mensajes de traza se
+    descartan antes de formatearse, así que llamar a `trace()` cuesta apenas
+    una llamada a método. Con `echo=True` cada diagnóstico también se imprime
+    (comportamiento de consola de los scripts de prueba).
+    """
+    def __init__(self, tracing=False, echo=False, stream=None):
+        self.tracing = tracing
+        self.echo = echo
+        self.stream = stream
+        self.items = []
+
+    def report(self, severity, code, template, *args, line=None, column=None):
+        diag = Diagnostic(severity, code, template, args, line, column)
+        self.items.append(diag)
+        if self.echo:
+            print(diag, file=self.stream or sys.stdout)
+        return diag
+
+    def trace(self, template, *args, line=None):
+        if self.tracing:
+            self.report(TRACE, 'T000', template, *args, line=line)
+
+    def info(self, code, template, *args, line=None, column=None):
+        return self.report(INFO, code, template, *args, line=line, column=column)
+
+    def warning(self, code, template, *args, line=None, column=None):
+        return self.report(WARNING, code, template, *args, line=line, column=column)
+
+    def error(self, code, template, *args, line=None, column=None):
+        return self.report(ERROR, code, template, *args, line=line, column=column)
+
+    def clear(self):
+        self.items.clear()
+
+    # --- Consultas ---
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def filter(self, min_severity=TRACE, code=None):
+        return [d for d in self.items
+                if d.severity >= min_severity and (code is None or d.code == code)]
+
+    def errors(self):
+        return self.filter(ERROR)
+
+    def has_errors(self):
+        return any(d.severity >= ERROR for d in self.items)
+
+    # --- Exportación ---
+    def to_jsonl(self):
+        return ''.join(json.dumps(d.to_dict(), ensure_ascii=False) + '\n' for d in self.items)
+
+    def write_jsonl(self, fp):
+        for d in self.items:
+            fp.write(json.dumps(d.to_dict(), ensure_ascii=False))
+            fp.write('\n')
+
+
+if __name__ == '__main__':
+    # Benchmark: código del profesor x1000 con la salida antigua (print a
+    # /dev/null) frente al buffer sin traza.
+    import contextlib
+    import os
+    import time
+    from session import CompilationSession
+    from test_codigo_profesor import codigo_profesor
+
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    source = codigo_profesor * scale
+
+    def run(tracing, echo):
+        session = CompilationSession(tracing=tracing, echo=echo)
+        start = time.perf_counter()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = session.compile(source)
+        return time.perf_counter() - start, len(result.diagnostics)
+
+    for label, tracing, echo in (('print (trace + echo)', True, True),
+                                 ('buffer (trace)', True, False),
+                                 ('buffer (no trace)', False, False)):
+        elapsed, count = run(tracing, echo)
+        print(f"{label:<22} {elapsed:8.3f} s  {count:>8} diagnostics")
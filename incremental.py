@@ -0,0 +1,410 @@
+"""
+Compilación incremental para la integración con el editor.
+
+El archivo se divide en unidades de nivel superior (definiciones de función,
+declaraciones, directivas y sentencias sueltas). Cada unidad se identifica
+por el hash de su texto y guarda en caché sus cuádruplos, diagnósticos y los
+símbolos que exporta al ámbito global. Tras una edición solo se vuelven a
+analizar las unidades cuyo texto cambió, o cuyas dependencias globales
+(nombres que consultó o declaró en el ámbito global) tienen ahora otro tipo.
+
+El léxico también es incremental: se reutilizan los tokens anteriores a la
+primera diferencia y, cuando el escaneo se resincroniza en el inicio de una
+unidad, los posteriores al último cambio.
+
+Cada unidad se analiza por separado, así que la recuperación de errores de
+sintaxis de PLY empezaría de nuevo en cada una y no cruzaría sus límites
+como en una compilación completa. Si alguna unidad tiene un error de
+sintaxis (RESYNC_CODES) se compila el documento entero; un búfer a medio
+editar cuesta lo mismo que una compilación normal.
+"""
+import hashlib
+from array import array
+
+from dfa_lexer import TOKEN_CODES, TokenArray, scan
+from diagnostics import Diagnostic, DiagnosticSink
+from cfg import JUMPS, LABEL
+from quad_store import Temp
+from session import CompilationResult, CompilationSession
+from source_map import SourceMap
+from symbol_table import ChainedSymbolTable, SemanticError, Symbol
+
+# Instrucciones cuyo campo resultado es una etiqueta
+LABEL_OPS = JUMPS | {LABEL}
+
+# Diagnósticos tras los que una unidad analizada sola puede no coincidir con
+# la compilación completa (recuperación de errores de sintaxis)
+RESYNC_CODES = frozenset(('P001', 'P002', 'I001'))
+
+_INCLUDE = TOKEN_CODES['INCLUDE']
+_DEFINE = TOKEN_CODES['DEFINE']
+_SEMICOLON = TOKEN_CODES['SEMICOLON']
+_ELSE = TOKEN_CODES['ELSE']
+_LT = TOKEN_CODES['LT']
+_GT = TOKEN_CODES['GT']
+_DOT = TOKEN_CODES['DOT']
+_RBRACE = TOKEN_CODES['RBRACE']
+_OPEN = {TOKEN_CODES['LBRACE'], TOKEN_CODES['LPAREN'], TOKEN_CODES['LBRACKET']}
+_CLOSE = {TOKEN_CODES['RBRACE'], TOKEN_CODES['RPAREN'], TOKEN_CODES['RBRACKET']}
+
+
+def split_units(types):
+    """Divide la secuencia de tokens en rangos [inicio, fin) de nivel superior."""
+    units = []
+    n = len(types)
+    i = 0
+    while i < n:
+        start = i
+        t = types[i]
+        if t == _DEFINE:
+            i = min(i + 3, n)
+        elif t == _INCLUDE:
+            i += 1
+            if i < n and types[i] == _LT:
+                while i < n and types[i] != _GT and i - start < 6:
+                    i += 1
+                i = min(i + 1, n)
+            else:
+                i = min(i + 1, n)
+                if i + 1 < n and types[i] == _DOT:
+                    i += 2
+        else:
+            depth = 0
+            while i < n:
+                t = types[i]
+                i += 1
+                if t in _OPEN:
+                    depth += 1
+                elif t in _CLOSE:
+                    depth = max(depth - 1, 0)
+                    if depth == 0 and t == _RBRACE and not (i < n and types[i] == _ELSE):
+                        break
+                elif t == _SEMICOLON and depth == 0 and not (i < n and types[i] == _ELSE):
+                    break
+        units.append((start, i))
+    return units
+
+
+class TrackingSymbolTable(ChainedSymbolTable):
+    """Tabla de símbolos que anota cómo cada unidad usa el ámbito global."""
+    def start_unit(self):
+        self.deps = {}          # nombre -> tipo global observado (None = ausente)
+        self.exports = []       # [(nombre, tipo, línea)] añadidos al ámbito global
+        self._exported = set()
+
+    def lookup(self, name):
+        try:
+            symbol = super().lookup(name)
+        except SemanticError:
+            if name not in self._exported:
+                self.deps.setdefault(name, None)
+            raise
+        if symbol.depth == 0 and name not in self._exported:
+            self.deps.setdefault(name, symbol.type)
+        return symbol
+
+    def add(self, symbol):
+        is_global = self.depth == 0
+        if is_global and symbol.name not in self._exported:
+            existing = self.table.get(symbol.name)
+            self.deps.setdefault(symbol.name, existing.type if existing else None)
+        super().add(symbol)
+        if is_global:
+            self.exports.append((symbol.name, symbol.type, symbol.line))
+            self._exported.add(symbol.name)
+
+    def add_global(self, symbol):
+        if symbol.name not in self._exported:
+            existing = self.global_lookup(symbol.name)
+            self.deps.setdefault(symbol.name, existing.type if existing else None)
+        super().add_global(symbol)
+        self.exports.append((symbol.name, symbol.type, symbol.line))
+        self._exported.add(symbol.name)
+
+    def global_type(self, name):
+        symbol = self.global_lookup(name)
+        return symbol.type if symbol else None
+
+
+class _UnitResult:
+    """
+    Resultado en caché de una unidad, con líneas, posiciones y temporales
+    relativos a la unidad.
+    """
+    __slots__ = ('deps', 'exports', 'code', 'globals', 'temp_start', 'temp_count',
+                 'label_start', 'label_count', 'diagnostics', 'externals', 'spans', 'resync')
+
+    def __init__(self, deps, exports, code, globals, temp_start, temp_count,
+                 label_start, label_count, diagnostics, externals=(), spans=None):
+        self.deps = deps
+        self.exports = exports
+        self.code = code
+        self.globals = globals
+        self.temp_start = temp_start
+        self.temp_count = temp_count
+        self.label_start = label_start
+        self.label_count = label_count
+        self.diagnostics = diagnostics
+        self.externals = externals
+        self.spans = spans      # [(inicio, fin)] desde el inicio de la unidad (con spans)
+        self.resync = any(diag[1] in RESYNC_CODES for diag in diagnostics)
+
+
+class IncrementalCompiler:
+    """
+    Recompila un mismo documento tras cada edición reutilizando el trabajo de
+    las unidades que no cambiaron. `update(source)` devuelve un
+    CompilationResult equivalente al de CompilationSession.compile(), también
+    con errores de sintaxis (entonces se compila entero). Con spans=True trae
+    además el tramo de cada cuádruplo, como CompilationSession(spans=True).
+    """
+    def __init__(self, tracing=False, spans=False):
+        self.spans = spans
+        self.session = CompilationSession(tracing=tracing, engine='dfa', spans=spans)
+        self.cache = {}
+        self.source = None
+        self.stream = None
+        self.units = []
+        self.end_line = 1
+        self.lex_errors = []
+        self.stats = {}
+
+    # --- Léxico incremental ---
+    def _relex(self, source):
+        old, old_stream = self.source, self.stream
+        if old is None or self.lex_errors:
+            return self._full_scan(source)
+
+        prefix = _common_prefix(old, source)
+        suffix = _common_suffix(old, source, min(len(old), len(source)) - prefix)
+        delta = len(source) - len(old)
+
+        # Reanudar en la última unidad que empieza antes del primer cambio
+        starts = old_stream.starts
+        restart_tok, restart, line = 0, 0, 1
+        for first, _ in self.units:
+            if starts[first] >= prefix:
+                break
+            restart_tok, restart, line = first, starts[first], old_stream.lines[first]
+
+        # Resincronizar en la primera unidad que cae dentro del sufijo común
+        sync_tok = None
+        for first, _ in self.units:
+            if first > restart_tok and starts[first] >= len(old) - suffix:
+                sync_tok = first
+                break
+
+        sink = DiagnosticSink()
+        if sync_tok is not None:
+            stop = starts[sync_tok] + delta
+            middle, mid_line = scan(source, sink, line, final=False, start=restart, stop=stop)
+            if middle.end != stop:
+                sync_tok = None
+        if sync_tok is None:
+            middle, mid_line = scan(source, sink, line, start=restart)
+
+        stream = TokenArray(source)
+        stream.types = old_stream.types[:restart_tok] + middle.types
+        stream.starts = old_stream.starts[:restart_tok] + middle.starts
+        stream.ends = old_stream.ends[:restart_tok] + middle.ends
+        stream.lines = old_stream.lines[:restart_tok] + middle.lines
+        end_line = mid_line
+        if sync_tok is not None:
+            line_delta = mid_line - old_stream.lines[sync_tok]
+            stream.types += old_stream.types[sync_tok:]
+            stream.starts += array('i', [p + delta for p in old_stream.starts[sync_tok:]])
+            stream.ends += array('i', [p + delta for p in old_stream.ends[sync_tok:]])
+            stream.lines += array('i', [l + line_delta for l in old_stream.lines[sync_tok:]])
+            end_line = self.end_line + line_delta
+        stream.end = len(source)
+        self.stats['tokens_relexed'] = len(middle)
+        return stream, end_line, list(sink)
+
+    def _full_scan(self, source):
+        sink = DiagnosticSink()
+        stream, end_line = scan(source, sink)
+        self.stats['tokens_relexed'] = len(stream)
+        return stream, end_line, list(sink)
+
+    # --- Compilación ---
+    def update(self, source, name='<editor>'):
+        session = self.session
+        session.reset()
+        table = TrackingSymbolTable()
+        table.diagnostics = session.diagnostics
+        session.symbol_table = table
+        session.source_map = SourceMap(source, name)
+        session._attach(session.lexer)
+        diagnostics, gen, lexer = session.diagnostics, session.gen, session.lexer
+
+        stream, end_line, lex_errors = self._relex(source)
+        self.source, self.stream, self.end_line, self.lex_errors = source, stream, end_line, lex_errors
+        self.units = split_units(stream.types)
+        for diag in lex_errors:
+            diagnostics.items.append(diag)
+
+        reused = analyzed = 0
+        resync = False
+        cache = {}
+        for index, (first, stop) in enumerate(self.units):
+            unit_line = stream.lines[first]
+            last = index == len(self.units) - 1
+            text = source[stream.starts[first]:len(source) if last else stream.ends[stop - 1]]
+            key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            candidates = self.cache.get(key, [])
+            entry = next((e for e in candidates if _deps_hold(e.deps, table)), None)
+            if entry is not None:
+                self._replay(entry, first, unit_line, table)
+                reused += 1
+            else:
+                entry = self._analyze(stream, first, stop, unit_line,
+                                      end_line if last else stream.lines[stop - 1],
+                                      len(source) if last else stream.ends[stop - 1])
+                analyzed += 1
+            cache.setdefault(key, [])
+            if entry not in cache[key]:
+                cache[key].append(entry)
+            table.reset_to_global()
+            if entry.resync:
+                resync = True
+                break
+        self.stats.update(units=len(self.units), reused=reused, analyzed=analyzed,
+                          fallback=resync)
+        if resync:
+            # Se conservan las entradas de las unidades que no se llegaron a ver
+            self.cache = {**self.cache, **cache}
+            return session.compile(source, name)
+        # Solo sobreviven las entradas de la revisión actual
+        self.cache = cache
+        symbols = [(symbol.name, symbol.type, symbol.line) for symbol in table.global_symbols()]
+        return CompilationResult(name, list(gen.code), list(diagnostics),
+                                 not diagnostics.has_errors(), globals=list(gen.globals),
+                                 symbols=symbols, externals=list(gen.externals),
+                                 spans=gen.spans, source_map=session.source_map if self.spans else None)
+
+    def _analyze(self, stream, first, stop, unit_line, end_line, end_pos):
+        session = self.session
+        table, gen, diagnostics = session.symbol_table, session.gen, session.diagnostics
+        code_mark, temp_mark, diag_mark = len(gen.code), gen.temp_count, len(diagnostics.items)
+        label_mark, globals_mark, ext_mark = gen.label_count, len(gen.globals), len(gen.externals)
+        table.start_unit()
+        session.lexer.input_tokens(stream, first, stop, end_line, end_pos)
+        try:
+            session.parser.parse(None, lexer=session.lexer)
+        except Exception as e:
+            diagnostics.error('I001', "%s", str(e), line=session.lexer.lineno)
+        relative = []
+        for d in diagnostics.items[diag_mark:]:
+            line = None if d.line is None else d.line - unit_line
+            column = d.column
+            if line == 0 and column is not None:
+                # En la primera línea la columna depende de dónde empieza la unidad
+                column -= self._unit_column(first)
+            relative.append((d.severity, d.code, d.template, d.args, line, column))
+        exports = [(name, type, _relative(line, unit_line)) for name, type, line in table.exports]
+        externals = [(name, signature, _relative(line, unit_line))
+                     for name, signature, line in gen.externals[ext_mark:]]
+        spans = None
+        if gen.spans is not None:
+            base = stream.starts[first]
+            spans = [(start - base, end - base) if start >= 0 else (start, end)
+                     for start, end in zip(gen.spans.starts[code_mark:], gen.spans.ends[code_mark:])]
+        return _UnitResult(dict(table.deps), exports, gen.code[code_mark:],
+                           gen.globals[globals_mark:], temp_mark, gen.temp_count - temp_mark,
+                           label_mark, gen.label_count - label_mark, relative, externals, spans)
+
+    def _unit_column(self, first):
+        """Columna (desde 0) del primer token de la unidad."""
+        return self.session.source_map.column(self.stream.lines[first], self.stream.starts[first]) - 1
+
+    def _replay(self, entry, first, unit_line, table):
+        session = self.session
+        gen, diagnostics = session.gen, session.diagnostics
+        for name, type, line in entry.exports:
+            table.define_global(Symbol(name, type, _absolute(line, unit_line)))
+        shift = gen.temp_count - entry.temp_start
+        label_shift = gen.label_count - entry.label_start
+        if shift or label_shift:
+            gen.code.extend(renumber(entry.code, shift, label_shift))
+        else:
+            gen.code.extend(entry.code)
+        gen.temp_count += entry.temp_count
+        gen.label_count += entry.label_count
+        gen.globals.extend(entry.globals)
+        gen.externals.extend((name, signature, _absolute(line, unit_line))
+                             for name, signature, line in entry.externals)
+        if gen.spans is not None:
+            base = self.stream.starts[first]
+            for start, end in entry.spans:
+                gen.spans.append((start + base, end + base) if start >= 0 else (start, end))
+        for severity, code, template, args, line, column in entry.diagnostics:
+            if severity == 0 and not diagnostics.tracing:
+                continue
+            if line == 0 and column is not None:
+                column += self._unit_column(first)
+            diagnostics.items.append(Diagnostic(severity, code, template, args,
+                                                None if line is None else line + unit_line, column))
+
+
+def renumber(code, temp_shift, label_shift):
+    """Cuádruplos de `code` con los temporales y las etiquetas desplazados."""
+    for op, arg1, arg2, res in code:
+        arg1, arg2, res = (Temp(f"t{int(x[1:]) + temp_shift}") if isinstance(x, Temp) else x
+                           for x in (arg1, arg2, res))
+        if label_shift and op in LABEL_OPS and res is not None:
+            res = f"L{int(res[1:]) + label_shift}"
+        yield op, arg1, arg2, res
+
+def _relative(line, unit_line):
+    return None if line is None else line - unit_line
+
+def _absolute(line, unit_line):
+    return None if line is None else line + unit_line
+
+def _deps_hold(deps, table):
+    return all(table.global_type(name) == type for name, type in deps.items())
+
+def _common_prefix(a, b):
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _common_suffix(a, b, limit):
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:len(a) - lo] == b[len(b) - mid:len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+if __name__ == '__main__':
+    # Simula una edición de una línea en un archivo grande
+    import time
+    from test_codigo_profesor import codigo_profesor
+
+    functions = [codigo_profesor.replace('evaluar', f'evaluar{i}').replace('fibonaci', f'fib{i}')
+                 for i in range(200)]
+    source = ''.join(functions)
+    print(f"{source.count(chr(10))} líneas")
+
+    compiler = IncrementalCompiler()
+    start = time.perf_counter()
+    first = compiler.update(source)
+    print(f"inicial:     {time.perf_counter() - start:.3f} s  {compiler.stats}")
+
+    edited = source.replace('a=b;', 'a=b+1;', 1)
+    start = time.perf_counter()
+    result = compiler.update(edited)
+    print(f"tras editar: {time.perf_counter() - start:.3f} s  {compiler.stats}")
+
+    full = CompilationSession(engine='dfa').compile(edited)
+    print("Equivalente a compilación completa:", full.code == result.code and
+          [(d.code, d.line) for d in full.diagnostics] == [(d.code, d.line) for d in result.diagnostics])
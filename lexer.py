@@ -1,4 +1,12 @@
+import os
 import ply.lex as lex
+from diagnostics import DiagnosticSink
+
+# Modo de arranque rápido (producción): las tablas se cargan de los artefactos
+# precompilados (lextab.py, parsetab.pickle), sin validar la gramática ni
+# escribir archivos. Los artefactos se regeneran con build_tables.py.
+FAST_STARTUP = os.environ.get('COMPILER_FAST_STARTUP') == '1'
+TABLES_DIR = os.path.dirname(os.path.abspath(__file__))
 
 tokens = (
   'ID', 'INT_LITERAL', 'FLOAT_LITERAL', 'STRING_LITERAL', 'CHAR_LITERAL',
@@ -132,7 +140,17 @@ def t_newline(t):
     t.lexer.lineno += len(t.value)
 
 def t_error(t):
-    print(f"Caracter ilegal '{t.value[0]}'")
+    source_map = getattr(t.lexer, 'source_map', None)
+    column = source_map.column(t.lexer.lineno, t.lexpos) if source_map is not None else None
+    t.lexer.diagnostics.error('L001', "Caracter ilegal '%s'", t.value[0], line=t.lexer.lineno,
+                              column=column)
     t.lexer.skip(1)
 
-lexer = lex.lex()
\ No newline at end of file
+if FAST_STARTUP:
+    if not os.path.exists(os.path.join(TABLES_DIR, 'lextab.py')):
+        raise RuntimeError("lextab.py no existe; ejecute 'python build_tables.py build'")
+    lexer = lex.lex(optimize=True, lextab='lextab')
+else:
+    lexer = lex.lex()
+# Sumidero por defecto: traza completa impresa en consola, como en los scripts de prueba
+lexer.diagnostics = DiagnosticSink(tracing=True, echo=True)
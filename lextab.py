@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AMPERSAND', 'AND', 'ASSIGN', 'BOOLEAN', 'BREAK', 'CASE', 'CHAR', 'CHAR_LITERAL', 'COLON', 'COMMA', 'DEFAULT', 'DEFINE', 'DIVIDE', 'DOT', 'ELSE', 'EQ', 'FALSE', 'FLOAT', 'FLOAT_LITERAL', 'FOR', 'GE', 'GT', 'ID', 'IF', 'INCLUDE', 'INT', 'INT_LITERAL', 'LBRACE', 'LBRACKET', 'LE', 'LPAREN', 'LT', 'MINUS', 'MINUSMINUS', 'NE', 'NOT', 'OR', 'PLUS', 'PLUSPLUS', 'RBRACE', 'RBRACKET', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING_LITERAL', 'SWITCH', 'TIMES', 'TRUE', 'VOID', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_COMMENT_SINGLE>//.*)|(?P<t_COMMENT_MULTI>/\\*[\\s\\S]*?\\*/)|(?P<t_INCLUDE>\\#include)|(?P<t_DEFINE>\\#define)|(?P<t_FLOAT_LITERAL>\\d+\\.\\d+)|(?P<t_INT_LITERAL>\\d+)|(?P<t_STRING_LITERAL>"([^\\\\"]|\\\\.)*")|(?P<t_CHAR_LITERAL>\'([^\'\\\\\\n]|\\\\.)\')|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_newline>\\n+)|(?P<t_OR>\\|\\|)|(?P<t_PLUSPLUS>\\+\\+)|(?P<t_AND>&&)|(?P<t_DOT>\\.)|(?P<t_EQ>==)|(?P<t_GE>>=)|(?P<t_LBRACE>\\{)|(?P<t_LBRACKET>\\[)|(?P<t_LE><=)|(?P<t_LPAREN>\\()|(?P<t_MINUSMINUS>--)|(?P<t_NE>!=)|(?P<t_PLUS>\\+)|(?P<t_RBRACE>\\})|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_AMPERSAND>&)|(?P<t_ASSIGN>=)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_NOT>!)|(?P<t_SEMICOLON>;)', [None, ('t_COMMENT_SINGLE', 'COMMENT_SINGLE'), ('t_COMMENT_MULTI', 'COMMENT_MULTI'), ('t_INCLUDE', 'INCLUDE'), ('t_DEFINE', 'DEFINE'), ('t_FLOAT_LITERAL', 'FLOAT_LITERAL'), ('t_INT_LITERAL', 'INT_LITERAL'), ('t_STRING_LITERAL', 'STRING_LITERAL'), None, ('t_CHAR_LITERAL', 'CHAR_LITERAL'), None, ('t_ID', 'ID'), ('t_newline', 'newline'), (None, 'OR'), (None, 'PLUSPLUS'), (None, 'AND'), (None, 'DOT'), (None, 'EQ'), (None, 'GE'), (None, 'LBRACE'), (None, 'LBRACKET'), (None, 'LE'), (None, 'LPAREN'), (None, 'MINUSMINUS'), (None, 'NE'), (None, 'PLUS'), (None, 'RBRACE'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'AMPERSAND'), (None, 'ASSIGN'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GT'), (None, 'LT'), (None, 'MINUS'), (None, 'NOT'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,395 @@
+"""
+Optimizador local del código de tres direcciones.
+
+Pases (cada uno recibe y devuelve una lista de cuádruplos):
+    fold         plegado y propagación de constantes dentro del bloque
+    simplify     simplificación algebraica (x+0, 0+x, x-0, x*1, 1*x, x/1)
+    copy_prop    propagación de copias; fusiona `t = a op b; v = t` en `v = a op b`
+    cse          eliminación de subexpresiones comunes locales
+    dead_temps   elimina instrucciones cuyo temporal nunca se usa
+
+Los pases son locales: cualquier operador que no sea una operación pura
+(saltos, etiquetas, llamadas...) cierra el bloque y descarta lo aprendido.
+Los temporales se reconocen por su tipo (quad_store.Temp), nunca por el
+nombre, así que una variable del usuario llamada 't1' no se confunde.
+
+Niveles:  -O0 nada,  -O1 una pasada de todo salvo CSE,  -O2 todo hasta punto fijo.
+"""
+import time
+
+from quad_store import QuadStore, Temp
+
+BINARY_OPS = {'+', '-', '*', '/', '<', '>', '<=', '>=', '==', '!=', '&&', '||'}
+UNARY_OPS = {'-', '!'}
+COMMUTATIVE = {'+', '*', '==', '!=', '&&', '||'}
+
+LEVELS = {
+    0: [],
+    1: ['fold', 'simplify', 'copy_prop', 'dead_temps'],
+    2: ['fold', 'simplify', 'copy_prop', 'cse', 'copy_prop', 'dead_temps'],
+}
+MAX_ROUNDS = 4
+
+
+# --- Operandos ---
+def constant_value(operand):
+    """Valor de un operando literal (int, float o bool), o None si no es constante."""
+    if not isinstance(operand, str) or isinstance(operand, Temp) or not operand:
+        return None
+    if operand == 'true':
+        return True
+    if operand == 'false':
+        return False
+    c = operand[0]
+    if c.isdigit() or (c == '-' and operand[1:2].isdigit()):
+        try:
+            return int(operand)
+        except ValueError:
+            return float(operand)
+    return None
+
+def format_constant(value):
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    return str(value)
+
+def is_pure(quad):
+    op, arg1, arg2, _ = quad
+    if op == '=':
+        return True
+    if arg2 is None:
+        return op in UNARY_OPS
+    return op in BINARY_OPS
+
+def is_variable(operand):
+    """Nombre que puede cambiar de valor (variable o temporal)."""
+    return isinstance(operand, str) and constant_value(operand) is None and operand[:1] != '&'
+
+def _is_memory(operand):
+    return isinstance(operand, str) and operand[:1] == '*'
+
+
+def evaluate(op, a, b=None):
+    """Evalúa una operación sobre constantes; None si no se puede plegar."""
+    numeric = lambda v: type(v) in (int, float)
+    if b is None:
+        if op == '-' and numeric(a):
+            return -a
+        if op == '!':
+            return not a
+        return None
+    if op in ('&&', '||'):
+        return (bool(a) and bool(b)) if op == '&&' else (bool(a) or bool(b))
+    if op in ('==', '!=') and type(a) is bool and type(b) is bool:
+        return (a == b) if op == '==' else (a != b)
+    if not (numeric(a) and numeric(b)):
+        return None
+    if op == '+':
+        return a + b
+    if op == '-':
+        return a - b
+    if op == '*':
+        return a * b
+    if op == '/':
+        if b == 0:
+            return None     # se deja para el tiempo de ejecución
+        if type(a) is int and type(b) is int:
+            q = abs(a) // abs(b)       # división entera de C: trunca hacia cero
+            return q if (a < 0) == (b < 0) else -q
+        return a / b
+    if op == '<':
+        return a < b
+    if op == '>':
+        return a > b
+    if op == '<=':
+        return a <= b
+    if op == '>=':
+        return a >= b
+    if op == '==':
+        return a == b
+    return a != b
+
+
+# --- Pases ---
+def fold(code):
+    """Plegado de constantes, propagando los valores conocidos dentro del bloque."""
+    out = []
+    known = {}      # nombre -> literal
+    for quad in code:
+        if not is_pure(quad):
+            known.clear()
+            out.append(quad)
+            continue
+        op, arg1, arg2, res = quad
+        arg1 = known.get(arg1, arg1)
+        arg2 = known.get(arg2, arg2)
+        if op == '=':
+            value = constant_value(arg1)
+        else:
+            a, b = constant_value(arg1), constant_value(arg2)
+            value = None
+            if a is not None and (arg2 is None or b is not None):
+                value = evaluate(op, a, b if arg2 is not None else None)
+            if value is not None:
+                op, arg1, arg2 = '=', format_constant(value), None
+        known.pop(res, None)
+        if value is not None and not _is_memory(res):
+            known[res] = arg1
+        out.append((op, arg1, arg2, res))
+    return out
+
+
+def simplify(code):
+    """Identidades algebraicas que no cambian el valor."""
+    out = []
+    for quad in code:
+        op, arg1, arg2, res = quad
+        if arg2 is not None and is_pure(quad):
+            a, b = constant_value(arg1), constant_value(arg2)
+            copy = None
+            if op == '+':
+                copy = arg1 if b == 0 and b is not False else arg2 if a == 0 and a is not False else None
+            elif op == '-':
+                copy = arg1 if b == 0 and b is not False else None
+            elif op == '*':
+                copy = arg1 if b == 1 and b is not True else arg2 if a == 1 and a is not True else None
+            elif op == '/':
+                copy = arg1 if b == 1 and b is not True else None
+            if copy is not None:
+                quad = ('=', copy, None, res)
+        out.append(quad)
+    return out
+
+
+def copy_prop(code):
+    """
+    Fusión de `t = a op b; v = t` en `v = a op b` cuando t solo se usa ahí, y
+    después propagación de copias hacia delante (`x = y`: los usos de x pasan a y).
+    """
+    # Hacia atrás: el destino de la copia recibe el resultado directamente
+    uses = _temp_uses(code)
+    defs = {}
+    for quad in code:
+        if isinstance(quad[3], Temp):
+            defs[quad[3]] = defs.get(quad[3], 0) + 1
+    merged = []
+    for quad in code:
+        op, arg1, arg2, res = quad
+        if (op == '=' and isinstance(arg1, Temp) and uses.get(arg1) == 1 and defs.get(arg1) == 1
+                and merged and merged[-1][3] == arg1 and is_pure(merged[-1])):
+            prev = merged.pop()
+            quad = (prev[0], prev[1], prev[2], res)
+        merged.append(quad)
+
+    # Hacia delante
+    out = []
+    copies = {}         # destino -> origen
+    sources = {}        # origen -> {destinos}
+    memory = set()      # orígenes de la forma *p
+    def kill(name):
+        origin = copies.pop(name, None)
+        if origin is not None:
+            sources[origin].discard(name)
+        for dest in sources.pop(name, ()):
+            del copies[dest]
+    for quad in merged:
+        if not is_pure(quad):
+            copies.clear()
+            sources.clear()
+            memory.clear()
+            out.append(quad)
+            continue
+        op, arg1, arg2, res = quad
+        arg1 = copies.get(arg1, arg1)
+        arg2 = copies.get(arg2, arg2)
+        if op == '=' and arg1 == res:
+            continue        # x = x
+        kill(res)
+        if memory and not isinstance(res, Temp):
+            # Una escritura en una variable puede cambiar lo que lee *p
+            for name in memory:
+                kill(name)
+            memory.clear()
+        if op == '=' and is_variable(res) and not _is_memory(res) and isinstance(arg1, str):
+            copies[res] = arg1
+            sources.setdefault(arg1, set()).add(res)
+            if _is_memory(arg1):
+                memory.add(arg1)
+        out.append((op, arg1, arg2, res))
+    return out
+
+
+def cse(code):
+    """Reutiliza el resultado de una expresión ya calculada en el bloque."""
+    out = []
+    available = {}      # (op, a, b) -> nombre que guarda el valor
+    depends = {}        # nombre -> claves que lo leen o lo usan como depósito
+    memory = set()      # claves que leen *p
+    def kill(key):
+        available.pop(key, None)
+        memory.discard(key)
+    for quad in code:
+        if not is_pure(quad):
+            available.clear()
+            depends.clear()
+            memory.clear()
+            out.append(quad)
+            continue
+        op, arg1, arg2, res = quad
+        key = None
+        if op != '=':
+            if op in COMMUTATIVE and arg2 is not None and str(arg2) < str(arg1):
+                key = (op, arg2, arg1)
+            else:
+                key = (op, arg1, arg2)
+            holder = available.get(key)
+            if holder is not None:
+                quad = ('=', holder, None, res)
+        for stale in depends.pop(res, ()):
+            kill(stale)
+        if memory and not isinstance(res, Temp):
+            for stale in list(memory):
+                kill(stale)
+        if key is not None and quad[0] != '=' and res not in (arg1, arg2) and not _is_memory(res):
+            available[key] = res
+            for name in (res, arg1, arg2):
+                if is_variable(name):
+                    depends.setdefault(name, []).append(key)
+            if _is_memory(arg1) or _is_memory(arg2):
+                memory.add(key)
+        out.append(quad)
+    return out
+
+
+def dead_temps(code):
+    """Elimina las operaciones puras cuyo temporal nunca se lee."""
+    uses = _temp_uses(code)
+    alive = [True] * len(code)
+    defs = {}
+    for i, quad in enumerate(code):
+        if isinstance(quad[3], Temp):
+            defs.setdefault(quad[3], []).append(i)
+    work = [t for t in defs if not uses.get(t)]
+    while work:
+        temp = work.pop()
+        for i in defs[temp]:
+            if not alive[i] or not is_pure(code[i]):
+                continue
+            alive[i] = False
+            for operand in code[i][1:3]:
+                if isinstance(operand, Temp):
+                    uses[operand] -= 1
+                    if uses[operand] == 0 and operand in defs:
+                        work.append(operand)
+    return [quad for quad, keep in zip(code, alive) if keep]
+
+
+def _temp_uses(code):
+    uses = {}
+    for _, arg1, arg2, _ in code:
+        if isinstance(arg1, Temp):
+            uses[arg1] = uses.get(arg1, 0) + 1
+        if isinstance(arg2, Temp):
+            uses[arg2] = uses.get(arg2, 0) + 1
+    return uses
+
+
+PASSES = {'fold': fold, 'simplify': simplify, 'copy_prop': copy_prop,
+          'cse': cse, 'dead_temps': dead_temps}
+
+
+# --- Pipeline ---
+class PassStats:
+    """Acumulado de un pase: ejecuciones, instrucciones eliminadas y tiempo."""
+    __slots__ = ('name', 'runs', 'before', 'after', 'seconds')
+
+    def __init__(self, name):
+        self.name = name
+        self.runs = 0
+        self.before = 0     # instrucciones antes de la primera ejecución
+        self.after = 0      # instrucciones tras la última ejecución
+        self.seconds = 0.0
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class OptimizationReport:
+    def __init__(self, level, size_in):
+        self.level = level
+        self.size_in = size_in
+        self.size_out = size_in
+        self.rounds = 0
+        self.passes = {}    # nombre -> PassStats, en orden de primera ejecución
+
+    def __str__(self):
+        lines = [f"-O{self.level}: {self.size_in} -> {self.size_out} instrucciones "
+                 f"({self.rounds} rondas)"]
+        for s in self.passes.values():
+            lines.append(f"  {s.name:<11} x{s.runs}  {s.before:>8} -> {s.after:<8} "
+                         f"{s.seconds * 1000:8.2f} ms")
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {'level': self.level, 'size_in': self.size_in, 'size_out': self.size_out,
+                'rounds': self.rounds, 'passes': [s.to_dict() for s in self.passes.values()]}
+
+
+def optimize(code, level=1):
+    """
+    Aplica los pases del nivel indicado y devuelve (código, OptimizationReport).
+    Acepta una lista de tuplas o un QuadStore y devuelve el mismo tipo.
+    """
+    if level not in LEVELS:
+        raise ValueError(f"Nivel de optimización desconocido: {level!r}")
+    columnar = isinstance(code, QuadStore)
+    current = list(code)
+    report = OptimizationReport(level, len(current))
+    rounds = MAX_ROUNDS if level >= 2 else 1
+    for _ in range(rounds if LEVELS[level] else 0):
+        previous = current
+        for name in LEVELS[level]:
+            stats = report.passes.get(name)
+            if stats is None:
+                stats = report.passes[name] = PassStats(name)
+                stats.before = len(current)
+            start = time.perf_counter()
+            current = PASSES[name](current)
+            stats.seconds += time.perf_counter() - start
+            stats.runs += 1
+            stats.after = len(current)
+        report.rounds += 1
+        if current == previous:
+            break
+    report.size_out = len(current)
+    if columnar:
+        store = QuadStore()
+        store.extend(current)
+        current = store
+    return current, report
+
+
+if __name__ == '__main__':
+    # Uso: python optimizer.py [-O0|-O1|-O2] [archivo.c]
+    import sys
+    from code_gen import Codegenerator
+    from session import CompilationSession
+    from test_codigo_profesor import codigo_profesor
+
+    args = sys.argv[1:]
+    level = 2
+    for arg in list(args):
+        if arg.startswith('-O'):
+            level = int(arg[2:] or 1)
+            args.remove(arg)
+    session = CompilationSession(engine='dfa')
+    result = session.compile_file(args[0]) if args else session.compile(codigo_profesor * 200)
+    code, report = optimize(result.code, level)
+    print(report)
+    print(f"Reducción: {len(result.code) / max(len(code), 1):.2f}x")
+    if not args:
+        gen = Codegenerator()
+        gen.code = optimize(CompilationSession().compile(codigo_profesor).code, level)[0]
+        gen.print_code()
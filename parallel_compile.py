@@ -0,0 +1,393 @@
+"""
+Análisis semántico y generación de código en paralelo, por cuerpo de función.
+
+En una compilación normal las acciones semánticas y gen.emit se ejecutan
+dentro del análisis LR, en un solo núcleo. Aquí el texto se tokeniza una vez
+y se divide en unidades de nivel superior (split_units de incremental.py):
+
+1. El proceso principal recorre las unidades en orden. Las declaraciones y
+   sentencias globales se analizan por completo; de cada definición de
+   función solo se analiza la cabecera (con un cuerpo vacío), lo que
+   registra su firma. Lo que cada unidad añade al ámbito global se anota con
+   su número de unidad: ese es el entorno global congelado.
+2. Los cuerpos de función se reparten en tramos contiguos entre un pool de
+   procesos. Cada trabajador recibe el texto y los arreglos de tokens de su
+   tramo (sin volver a tokenizar) y analiza cada función con los globales
+   de las unidades anteriores a ella, es decir, el mismo ámbito global que
+   vería la compilación secuencial (una función no ve lo que se declara
+   después). Los tramos se envían en cuanto el proceso
+   principal pasa su última unidad, así que el paso 1 y el 2 se solapan.
+3. Cada unidad numera sus temporales y etiquetas desde 0. Los resultados se
+   juntan en el orden del texto, cada tramo en cuanto termina, y se
+   desplazan con la suma de las unidades anteriores (incremental.renumber),
+   de modo que el código, los diagnósticos, los símbolos y las referencias
+   externas son idénticos a los de CompilationSession(engine='dfa').
+
+Si alguna unidad tiene un error de sintaxis (la recuperación de errores de
+PLY puede cruzar el límite de una unidad), o hay pocas funciones, se compila
+de forma secuencial. Las columnas de los diagnósticos de los trabajadores se
+calculan en el proceso principal, que es el que tiene el mapa de fuente.
+
+    with ParallelCompiler(workers=8) as compiler:
+        result = compiler.compile_file('generado.c')
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from dfa_lexer import KEYWORDS, TOKEN_CODES, TokenArray, scan
+from diagnostics import Diagnostic
+from incremental import RESYNC_CODES, TrackingSymbolTable, renumber, split_units
+from optimizer import optimize
+from regalloc import allocate
+from session import CompilationResult, CompilationSession
+from source_map import SourceMap
+from symbol_table import ChainedSymbolTable, Symbol
+
+_TYPES = {KEYWORDS[word] for word in ('int', 'float', 'char', 'boolean', 'void')}
+_ID = TOKEN_CODES['ID']
+_LPAREN = TOKEN_CODES['LPAREN']
+_LBRACE = TOKEN_CODES['LBRACE']
+_RBRACE = TOKEN_CODES['RBRACE']
+
+MIN_FUNCTIONS = 8               # con menos funciones no compensa repartir
+CHUNKS_PER_WORKER = 4           # tramos por trabajador, para equilibrar la carga
+
+
+def is_function(types, first, stop):
+    """True si la unidad [first, stop) es una definición de función (type ID '(' ... '}')."""
+    return stop - first >= 5 and types[first] in _TYPES and types[first + 1] == _ID \
+        and types[first + 2] == _LPAREN and types[stop - 1] == _RBRACE
+
+
+class _UnitCode:
+    """Resultado de una unidad con temporales y etiquetas numerados desde 0."""
+    __slots__ = ('code', 'temps', 'labels', 'diagnostics', 'externals', 'globals')
+
+    def __init__(self, code, temps, labels, diagnostics, externals, globals=()):
+        self.code = code
+        self.temps = temps
+        self.labels = labels
+        self.diagnostics = diagnostics
+        self.externals = externals
+        self.globals = globals
+
+
+class _HeaderLexer:
+    """Cabecera de una función seguida de su '}' final: solo se registra la firma."""
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self._next = 0
+        self.lineno = tokens[0].lineno
+        self.lexpos = tokens[0].lexpos
+
+    def token(self):
+        if self._next >= len(self.tokens):
+            return None
+        tok = self.tokens[self._next]
+        self._next += 1
+        tok.lexer = self
+        self.lineno = tok.lineno
+        self.lexpos = tok.lexpos
+        return tok
+
+
+class _Window:
+    """Tramo del texto que se indexa con posiciones del texto completo (TokenArray.value)."""
+    __slots__ = ('text', 'base')
+
+    def __init__(self, text, base):
+        self.text = text
+        self.base = base
+
+    def __getitem__(self, key):
+        return self.text[key.start - self.base:key.stop - self.base]
+
+
+class _DeferredColumns:
+    """
+    Mapa de fuente de los trabajadores: la 'columna' que devuelve es la
+    posición del token, y el proceso principal la convierte con el mapa de
+    verdad al juntar los resultados.
+    """
+    def column(self, line, offset):
+        return offset
+
+
+# --- Lado del trabajador ---
+_worker_session = None
+
+def _init_worker():
+    global _worker_session
+    _worker_session = CompilationSession(engine='dfa')
+
+def _analyze_bodies(text, base, tokens, units, env):
+    """
+    Analiza las funciones de un tramo del texto, que empieza en la posición
+    `base`. `tokens` son los arreglos (tipos, inicios, fines, líneas) del
+    tramo; `units`, (número de unidad, primer token, fin) con índices en
+    esos arreglos; `env`, los globales (número de unidad, nombre, tipo) de
+    las unidades que no están en el tramo, en orden. Devuelve un _UnitCode
+    por función.
+    """
+    if _worker_session is None:
+        _init_worker()
+    session = _worker_session
+    session.reset()
+    table = ChainedSymbolTable(session.diagnostics)
+    session.symbol_table = table
+    session.source_map = _DeferredColumns()
+    session._attach(session.lexer)
+    gen, diagnostics, lexer = session.gen, session.diagnostics, session.lexer
+    stream = TokenArray(_Window(text, base))
+    stream.types, stream.starts, stream.ends, stream.lines = tokens
+    results = []
+    pending = 0
+    for index, first, stop in units:
+        while pending < len(env) and env[pending][0] < index:
+            _, name, type = env[pending]
+            table.define_global(Symbol(name, type))
+            pending += 1
+        code_mark, diag_mark, ext_mark = len(gen.code), len(diagnostics.items), len(gen.externals)
+        gen.temp_count = gen.label_count = 0
+        lexer.input_tokens(stream, first, stop, stream.lines[stop - 1], stream.ends[stop - 1])
+        try:
+            session.parser.parse(None, lexer=lexer)
+        except Exception as e:
+            diagnostics.error('I001', "%s", str(e), line=lexer.lineno)
+        table.reset_to_global()
+        results.append(_UnitCode(gen.code[code_mark:], gen.temp_count, gen.label_count,
+                                 diagnostics.items[diag_mark:], gen.externals[ext_mark:]))
+    return results
+
+
+# --- Proceso principal ---
+class ParallelCompiler:
+    """
+    Compila con los cuerpos de función repartidos en `workers` procesos.
+    compile() devuelve el mismo CompilationResult que
+    CompilationSession(engine='dfa', opt_level=..., ...).compile().
+    Con workers=1 los tramos se analizan en el propio proceso.
+    """
+    def __init__(self, workers=None, opt_level=0, recycle_temps=False, registers=None,
+                 min_functions=MIN_FUNCTIONS):
+        self.workers = workers or os.cpu_count() or 1
+        self.opt_level = opt_level
+        self.recycle_temps = recycle_temps
+        self.registers = registers
+        self.min_functions = min_functions
+        self.session = CompilationSession(engine='dfa', opt_level=opt_level,
+                                          recycle_temps=recycle_temps, registers=registers)
+        self.pool = None
+        self.stats = {}
+
+    def _submit(self, *args):
+        if self.workers == 1:
+            return _Done(_analyze_bodies(*args))
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker)
+        return self.pool.submit(_analyze_bodies, *args)
+
+    def _chunks(self, stream, units, functions):
+        """Reparte las funciones en tramos contiguos de tamaño de texto parecido."""
+        count = min(len(functions), self.workers * CHUNKS_PER_WORKER)
+        sizes = [stream.ends[units[k][1] - 1] - stream.starts[units[k][0]] for k in functions]
+        target = sum(sizes) / count
+        chunks, current, size = [], [], 0
+        for k, unit_size in zip(functions, sizes):
+            current.append(k)
+            size += unit_size
+            if size >= target * (len(chunks) + 1) and len(chunks) < count - 1:
+                chunks.append(current)
+                current = []
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def compile(self, source, name='<string>'):
+        session = self.session
+        session.reset()
+        table = TrackingSymbolTable()
+        table.diagnostics = session.diagnostics
+        session.symbol_table = table
+        session.source_map = SourceMap(source, name)
+        session._attach(session.lexer)
+        gen, diagnostics, lexer = session.gen, session.diagnostics, session.lexer
+
+        stream, end_line = scan(source, diagnostics)
+        lexical = list(diagnostics.items)
+        units = split_units(stream.types)
+        functions = [k for k, (first, stop) in enumerate(units)
+                     if is_function(stream.types, first, stop)]
+        self.stats = {'units': len(units), 'functions': len(functions), 'chunks': 0}
+        if len(functions) < self.min_functions:
+            return session.compile(source, name)
+
+        chunks = self._chunks(stream, units, functions)
+        self.stats['chunks'] = len(chunks)
+        ends = {chunk[-1]: chunk for chunk in chunks}
+        in_chunks = set(functions)
+        env = []                # (unidad, nombre, tipo) de lo que no analizan los trabajadores
+        own = {}                # unidad -> _UnitCode de las analizadas aquí
+        futures = []
+        for index, (first, stop) in enumerate(units):
+            last = index == len(units) - 1
+            table.start_unit()
+            code_mark, diag_mark = len(gen.code), len(diagnostics.items)
+            ext_mark, globals_mark = len(gen.externals), len(gen.globals)
+            gen.temp_count = gen.label_count = 0
+            if index in in_chunks:
+                # Solo la firma: cabecera hasta '{' y el '}' final
+                brace = stream.types.index(_LBRACE, first, stop)
+                header = _HeaderLexer([stream.token(i) for i in range(first, brace + 1)] +
+                                      [stream.token(stop - 1)])
+                session._attach(header)
+                self._parse(header)
+                session._attach(lexer)
+                del gen.code[code_mark:]
+                del diagnostics.items[diag_mark:]
+            else:
+                lexer.input_tokens(stream, first, stop,
+                                   end_line if last else stream.lines[stop - 1],
+                                   len(source) if last else stream.ends[stop - 1])
+                self._parse(lexer)
+                own[index] = _UnitCode(gen.code[code_mark:], gen.temp_count, gen.label_count,
+                                       diagnostics.items[diag_mark:], gen.externals[ext_mark:],
+                                       gen.globals[globals_mark:])
+                del gen.code[code_mark:]
+            table.reset_to_global()
+            for symbol_name, symbol_type, _ in table.exports:
+                env.append((index, symbol_name, symbol_type))
+            chunk = ends.get(index)
+            if chunk is not None:
+                futures.append((chunk, self._dispatch(source, stream, units, chunk, env)))
+
+        return self._merge(source, name, units, lexical, own, iter(futures))
+
+    def _parse(self, lexer):
+        try:
+            self.session.parser.parse(None, lexer=lexer)
+        except Exception as e:
+            self.session.diagnostics.error('I001', "%s", str(e), line=lexer.lineno)
+
+    def _dispatch(self, source, stream, units, chunk, env):
+        start, stop = units[chunk[0]][0], units[chunk[-1]][1]
+        base = stream.starts[start]
+        text = source[base:stream.ends[stop - 1]]
+        tokens = tuple(column[start:stop] for column in
+                       (stream.types, stream.starts, stream.ends, stream.lines))
+        members = [(k, units[k][0] - start, units[k][1] - start) for k in chunk]
+        # Los globales de las propias funciones del tramo los registra su análisis
+        inside = set(chunk)
+        visible = [entry for entry in env if entry[0] not in inside]
+        return self._submit(text, base, tokens, members, visible)
+
+    def _merge(self, source, name, units, lexical, own, futures):
+        """
+        Junta las unidades en orden con la numeración global de temporales y
+        etiquetas. Los tramos se recogen en orden a medida que hacen falta,
+        así que se renumera un tramo mientras los siguientes siguen en marcha.
+        """
+        session = self.session
+        source_map = session.source_map
+        code, diagnostics, externals, globals = [], list(lexical), [], []
+        temps = labels = 0
+        done = {}
+        for index in range(len(units)):
+            unit = own.get(index)
+            if unit is None:
+                if index not in done:
+                    chunk, future = next(futures)
+                    done = dict(zip(chunk, future.result()))
+                unit = done[index]
+            if any(d.code in RESYNC_CODES for d in unit.diagnostics):
+                self.stats['fallback'] = True
+                return session.compile(source, name)
+            code.extend(renumber(unit.code, temps, labels) if temps or labels else unit.code)
+            temps += unit.temps
+            labels += unit.labels
+            if index in own:
+                diagnostics.extend(unit.diagnostics)
+            else:
+                for d in unit.diagnostics:
+                    column = None if d.column is None else source_map.column(d.line, d.column)
+                    diagnostics.append(Diagnostic(d.severity, d.code, d.template, d.args,
+                                                  d.line, column))
+            externals.extend(unit.externals)
+            globals.extend(unit.globals)
+        session.gen.temp_count, session.gen.label_count = temps, labels
+
+        report = allocation = None
+        if self.opt_level:
+            code, report = optimize(code, self.opt_level)
+        if self.recycle_temps or self.registers is not None:
+            code, allocation = allocate(code, self.registers)
+        symbols = [(symbol.name, symbol.type, symbol.line)
+                   for symbol in session.symbol_table.global_symbols()]
+        ok = not any(d.severity >= 3 for d in diagnostics)
+        return CompilationResult(name, code, diagnostics, ok, None, report, allocation, globals,
+                                 None, (), symbols, externals)
+
+    def compile_file(self, path):
+        with open(path, encoding='utf-8') as f:
+            return self.compile(f.read(), name=path)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Done:
+    """Resultado ya calculado con la interfaz de un Future (workers=1)."""
+    def __init__(self, value):
+        self.value = value
+
+    def result(self):
+        return self.value
+
+
+if __name__ == '__main__':
+    # Uso: python parallel_compile.py [-jN] [-O2] [archivo.c ...]
+    # Sin archivos compara con la compilación secuencial un programa sintético
+    # con muchas funciones
+    import sys
+    import time
+    from bench import ProgramGenerator
+
+    args = sys.argv[1:]
+    jobs = [int(arg[2:]) for arg in args if arg.startswith('-j')]
+    levels = [int(arg[2:] or 1) for arg in args if arg.startswith('-O')]
+    paths = [arg for arg in args if not arg.startswith('-')]
+    level = levels[-1] if levels else 0
+    with ParallelCompiler(jobs[-1] if jobs else None, opt_level=level) as compiler:
+        if paths:
+            for path in paths:
+                result = compiler.compile_file(path)
+                print(result, compiler.stats)
+                for diag in result.diagnostics:
+                    print(f"  {diag}")
+            sys.exit()
+
+        source = ProgramGenerator(functions=400, depth=3, expr_depth=3, seed=1).generate()
+        print(f"{source.count(chr(10))} líneas, {compiler.workers} trabajadores "
+              f"({os.cpu_count()} núcleos)")
+        compiler.compile(source)        # arranca el pool
+        start = time.perf_counter()
+        parallel = compiler.compile(source)
+        t_parallel = time.perf_counter() - start
+        sequential_session = CompilationSession(engine='dfa', opt_level=level)
+        start = time.perf_counter()
+        sequential = sequential_session.compile(source)
+        t_sequential = time.perf_counter() - start
+        key = lambda result: [(d.code, d.line, d.column, d.message) for d in result.diagnostics]
+        print(f"secuencial: {t_sequential:.3f} s")
+        print(f"paralelo:   {t_parallel:.3f} s  {compiler.stats}")
+        print("Equivalente a compilación secuencial:", parallel.code == sequential.code and
+              key(parallel) == key(sequential) and parallel.symbols == sequential.symbols and
+              parallel.externals == sequential.externals and parallel.globals == sequential.globals)
@@ -1,24 +1,39 @@
+import os
 import ply.yacc as yacc
 from lexer import tokens
 from lexer import lexer
-from symbol_table import ScopedSymbolTable, Symbol, SemanticError
+from lexer import FAST_STARTUP, TABLES_DIR
+from symbol_table import ChainedSymbolTable, Symbol, SemanticError
 from code_gen import Codegenerator
+from source_map import symbol_span
+from type_system import (BASIC_TYPES, BOOLEAN, CHAR, ERROR, FLOAT, INT, STRING, FunctionType,
+                         compatible, function_type, pointer_to, promote)
 
 #--- Table Symbols with Scopes ---
-symbol_table = ScopedSymbolTable()
+symbol_table = ChainedSymbolTable(lexer.diagnostics)
 #--- Code Generator ---
 gen = Codegenerator()
+# Las acciones semánticas leen la tabla y el generador desde el lexer en uso,
+# de modo que cada CompilationSession puede aportar los suyos (ver session.py).
+lexer.symbol_table = symbol_table
+lexer.gen = gen
+lexer.source_map = None     # source_map.SourceMap del texto, para las columnas
 
 # --- PRECEDENCIA DE OPERADORES ---
 precedence = (
+    ('left', 'OR'),
+    ('left', 'AND'),
+    ('left', 'EQ', 'NE'),
+    ('left', 'LT', 'GT', 'LE', 'GE'),
     ('left', 'PLUS', 'MINUS'),
     ('left', 'TIMES', 'DIVIDE'),
+    ('right', 'NOT'),
 )
 
 #--- Grammar Rules and Semantic Actions ---
 def p_program(p):
     '''program : declarations_and_functions'''
-    print("Analysis sintactic and semantic completed successfully.")
+    p.lexer.diagnostics.trace("Analysis sintactic and semantic completed successfully.")
 
 def p_declarations_and_functions(p):
     '''declarations_and_functions : declarations_and_functions declaration_or_function
@@ -41,21 +56,52 @@ def p_preprocessor(p):
                     | INCLUDE LT ID GT
                     | DEFINE ID INT_LITERAL
                     | DEFINE ID FLOAT_LITERAL'''
-    print(f"Directiva de preprocesador: {p[1]}")
+    p.lexer.diagnostics.trace("Directiva de preprocesador: %s", p[1], line=p.lineno(1))
 
 # Funciones
 def p_function_definition(p):
-    '''function_definition : type ID LPAREN parameter_list RPAREN compound_statement
-                           | type ID LPAREN RPAREN compound_statement'''
+    '''function_definition : type ID LPAREN function_scope parameter_list RPAREN function_start compound_statement
+                           | type ID LPAREN function_scope RPAREN function_start compound_statement'''
     func_name = p[2]
     func_type = p[1]
-    print(f"Definición de función: {func_name} de tipo {func_type}")
-    symbol_table.pop_scope()  # Salir del ámbito de la función
+    p.lexer.diagnostics.trace("Definición de función: %s de tipo %s", func_name, func_type, line=p.lineno(2))
+    p.lexer.symbol_table.pop_scope()  # Salir del ámbito del cuerpo
+    p.lexer.symbol_table.pop_scope()  # y del de los parámetros
+    # Retorno implícito al final del cuerpo
+    p.lexer.gen.emit('return', None, None, None)
+    p.lexer.gen.emit('endfunc', func_name, None, None)
+
+def p_function_scope(p):
+    '''function_scope :'''
+    # Los parámetros van en un ámbito propio, no en el global
+    p.lexer.symbol_table.push_scope()
+
+def p_function_start(p):
+    '''function_start :'''
+    # Marcador antes del cuerpo: p[-1] es ')', y el nombre está antes de '(', function_scope y los parámetros
+    name_pos = -4 if p[-3] == '(' else -5
+    func_type, func_name = p[name_pos - 1], p[name_pos]
+    params = [] if p[-3] == '(' else p[-2]
+    marker_span(p, name_pos - 1, -1)    # func y formal: la cabecera, del tipo a ')'
+    # La firma se registra antes del cuerpo para admitir llamadas recursivas
+    try:
+        signature = function_type(func_type, [param_type for _, param_type in params])
+        p.lexer.symbol_table.add_global(Symbol(func_name, signature, p.stack[name_pos].lineno))
+    except SemanticError as e:
+        p.lexer.diagnostics.error(e.code, "%s", str(e), line=p.lexer.lineno)
+    gen = p.lexer.gen
+    gen.emit('func', func_name, len(params), None)
+    # Cada parámetro recibe el argumento de su posición
+    for i, (param, _) in enumerate(params):
+        gen.emit('formal', i, None, param)
 
 def p_parameter_list(p):
     '''parameter_list : parameter_list COMMA parameter
                       | parameter'''
-    pass
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[0] = p[1] + [p[3]]
 
 def p_parameter(p):
     '''parameter : type pointer_declarator ID
@@ -65,13 +111,15 @@ def p_parameter(p):
         param_name = p[2]
     else:
         param_name = p[3]
-        param_type = p[1] + p[2]  # tipo + asteriscos
+        param_type = pointer_to(p[1], p[2])  # tipo + nivel de puntero
     
     try:
         symbol = Symbol(param_name, param_type)
-        symbol_table.add(symbol)
+        p.lexer.symbol_table.add(symbol)
     except SemanticError as e:
-        print(f"Error: {e}")
+        p.lexer.diagnostics.error(e.code, "%s", str(e), line=p.lineno(len(p) - 1),
+                                  column=column(p, len(p) - 1))
+    p[0] = (param_name, param_type)
 
 def p_compound_statement(p):
     '''compound_statement : LBRACE scope_enter statements RBRACE'''
@@ -98,20 +146,21 @@ def p_statement(p):
 def p_expression_statement(p):
     '''expression_statement : expression SEMICOLON
                             | SEMICOLON'''
+    # Un ++/-- suelto ya se generó; el valor de la expresión se descarta
     pass
 
 # --- Management of scopes ---
 def p_block(p):
     '''block : LBRACE scope_enter statements RBRACE'''
     # SEMANTIC ACTION: Exit scope
-    symbol_table.pop_scope()
-    print("--- Exited scope ---")
+    p.lexer.symbol_table.pop_scope()
+    p.lexer.diagnostics.trace("--- Exited scope ---")
 
 def p_scope_enter(p):
     '''scope_enter :''' # Empty production to semantic action
 		# SEMANTIC ACTION: Enter new scope
-    symbol_table.push_scope()
-    print("--- Entered new scope ---")
+    p.lexer.symbol_table.push_scope()
+    p.lexer.diagnostics.trace("--- Entered new scope ---")
     
 #--- Declarations ---
 def p_declaration(p):
@@ -120,29 +169,101 @@ def p_declaration(p):
     var_list = p[2] # Es una lista de nombres ['x', 'y']
     
     # Registramos cada variable en la tabla de símbolos
-    for var_name, pointer_level, init_value in var_list:
-        actual_type = var_type + pointer_level
+    for var_name, pointer_level, init_value, line, place in var_list:
+        actual_type = pointer_to(var_type, pointer_level) if pointer_level else var_type
+        if init_value is not None and not compatible(actual_type, init_value['type']):
+            assignment_error(p, actual_type, init_value['type'], var_name, 3)
         try:
-            symbol = Symbol(var_name, actual_type)
-            symbol_table.add(symbol)
+            symbol = Symbol(var_name, actual_type, line, place)
+            p.lexer.symbol_table.add(symbol)
+            if symbol.depth == 0:
+                p.lexer.gen.globals.append(var_name)
         except SemanticError as e:
-            print(f"Error: {e}")
+            p.lexer.diagnostics.error(e.code, "%s", str(e), line=p.lineno(3), column=column(p, 3))
 
 # Estructuras de control
+# Los marcadores (producciones vacías) se reducen en medio de una regla y
+# emiten las etiquetas y saltos que van entre sus partes. Los saltos se
+# emiten sin destino y se completan después (backpatching).
 def p_if_statement(p):
-    '''if_statement : IF LPAREN expression RPAREN statement
-                    | IF LPAREN expression RPAREN statement ELSE statement'''
-    print("Estructura IF detectada")
+    '''if_statement : IF LPAREN expression RPAREN condition_marker statement
+                    | IF LPAREN expression RPAREN condition_marker statement ELSE else_marker statement'''
+    gen = p.lexer.gen
+    if len(p) == 7:
+        gen.emit_label(p[5])        # falso: salta al final
+    else:
+        gen.emit_label(p[8])        # fin de la rama cierta: salta al final
+    p.lexer.diagnostics.trace("Estructura IF detectada", line=p.lineno(1))
+
+def p_condition_marker(p):
+    '''condition_marker :'''
+    # p[-2] es la condición: se convierte en saltos; la rama cierta sigue aquí
+    gen = p.lexer.gen
+    marker_span(p, -2)
+    true, false = gen.condition(p[-2], fall='true')
+    if true:
+        gen.emit_label(true)
+    p[0] = false
+
+def p_else_marker(p):
+    '''else_marker :'''
+    # Fin de la rama cierta: saltar el else. p[-3] son los saltos de la condición falsa
+    gen = p.lexer.gen
+    marker_span(p, -1)
+    end = gen.emit_jump()
+    gen.emit_label(p[-3])
+    p[0] = [end]
 
 def p_while_statement(p):
-    '''while_statement : WHILE LPAREN expression RPAREN statement
-                       | WHILE LPAREN expression RPAREN compound_statement'''
-    print("Estructura WHILE detectada")
+    '''while_statement : WHILE loop_start LPAREN expression RPAREN condition_marker statement
+                       | WHILE loop_start LPAREN expression RPAREN condition_marker compound_statement'''
+    # compound_statement no cierra su ámbito (lo hace quien lo usa, como en
+    # function_definition); un bloque ya lo cerró en p_block.
+    if p.slice[7].type == 'compound_statement':
+        p.lexer.symbol_table.pop_scope()
+    gen = p.lexer.gen
+    gen.emit('goto', None, None, p[2])
+    gen.emit_label(p[6] + gen.breaks.pop())
+    p.lexer.diagnostics.trace("Estructura WHILE detectada", line=p.lineno(1))
+
+def p_loop_start(p):
+    '''loop_start :'''
+    # Inicio de un bucle: etiqueta de vuelta y lista para sus break
+    gen = p.lexer.gen
+    marker_span(p, -4 if p[-1] == ';' else -1)      # FOR ( init ; o WHILE
+    p[0] = gen.emit_label()
+    gen.breaks.append([])
 
 def p_for_statement(p):
-    '''for_statement : FOR LPAREN for_init SEMICOLON expression_opt SEMICOLON for_update RPAREN statement
-                     | FOR LPAREN for_init SEMICOLON expression_opt SEMICOLON for_update RPAREN compound_statement'''
-    print("Estructura FOR detectada")
+    '''for_statement : FOR LPAREN for_init SEMICOLON loop_start expression_opt SEMICOLON for_condition for_update RPAREN for_body statement
+                     | FOR LPAREN for_init SEMICOLON loop_start expression_opt SEMICOLON for_condition for_update RPAREN for_body compound_statement'''
+    if p.slice[12].type == 'compound_statement':
+        p.lexer.symbol_table.pop_scope()
+    gen = p.lexer.gen
+    true, false, update = p[8]
+    gen.emit('goto', None, None, update)
+    gen.emit_label(false + gen.breaks.pop())
+    p.lexer.diagnostics.trace("Estructura FOR detectada", line=p.lineno(1))
+
+def p_for_condition(p):
+    '''for_condition :'''
+    # Orden: cond (cierta -> cuerpo), actualización, goto cond, cuerpo, goto actualización
+    gen = p.lexer.gen
+    marker_span(p, -2)
+    if p[-2] is None:
+        true, false = [gen.emit_jump()], []     # for(;;)
+    else:
+        true, false = gen.condition(p[-2])
+    p[0] = (true, false, gen.emit_label())
+
+def p_for_body(p):
+    '''for_body :'''
+    # Tras la actualización se vuelve a evaluar la condición (p[-6] es la etiqueta inicial)
+    gen = p.lexer.gen
+    marker_span(p, -2)              # la actualización
+    true, false, update = p[-3]
+    gen.emit('goto', None, None, p[-6])
+    gen.emit_label(true)
 
 def p_for_init(p):
     '''for_init : assignment_expr
@@ -160,12 +281,12 @@ def p_assignment_expr(p):
     var_name = p[1]
     expr_info = p[3]
     try:
-        symbol = symbol_table.lookup(var_name)
-        if symbol.type == 'int' and expr_info['type'] == 'float':
-            print(f"Error Semántico: No se puede asignar FLOAT a la variable INT '{var_name}'")
-        gen.emit('=', expr_info['place'], None, var_name)
+        symbol = p.lexer.symbol_table.lookup(var_name)
+        if not compatible(symbol.type, expr_info['type']):
+            assignment_error(p, symbol.type, expr_info['type'], var_name, 1)
+        p.lexer.gen.emit('=', expr_info['place'], None, symbol.place)
     except SemanticError as e:
-        print(e)
+        p.lexer.diagnostics.error(e.code, "%s", str(e), line=p.lineno(1), column=column(p, 1))
     p[0] = expr_info
 
 def p_unary_expr(p):
@@ -173,7 +294,10 @@ def p_unary_expr(p):
                   | ID MINUSMINUS
                   | PLUSPLUS ID
                   | MINUSMINUS ID'''
-    p[0] = {'type': 'int', 'place': p[1] if p[1] in ['++', '--'] else p[2]}
+    name, op = (p[2], p[1]) if p[1] in ['++', '--'] else (p[1], p[2])
+    name = place_of(p, name)
+    p.lexer.gen.emit(op[0], name, '1', name)
+    p[0] = {'type': INT, 'place': name}
 
 def p_expression_opt(p):
     '''expression_opt : expression
@@ -184,8 +308,35 @@ def p_expression_opt(p):
         p[0] = None
 
 def p_switch_statement(p):
-    '''switch_statement : SWITCH LPAREN expression RPAREN LBRACE case_list RBRACE'''
-    print("Estructura SWITCH detectada")
+    '''switch_statement : SWITCH LPAREN expression RPAREN switch_start LBRACE case_list RBRACE'''
+    # Los casos se comprueban al final, cuando ya se conocen sus etiquetas
+    gen = p.lexer.gen
+    place, dispatch = p[5]
+    cases = gen.switches.pop()
+    end = gen.emit_jump()
+    gen.emit_label([dispatch])
+    default = None
+    for value, label in cases:
+        if value is None:
+            default = label
+        else:
+            gen.emit('if==', place, str(value), label)
+    exits = [end] + gen.breaks.pop()
+    if default is not None:
+        gen.emit('goto', None, None, default)
+    else:
+        exits.append(gen.emit_jump())
+    gen.emit_label(exits)
+    p.lexer.diagnostics.trace("Estructura SWITCH detectada", line=p.lineno(1))
+
+def p_switch_start(p):
+    '''switch_start :'''
+    # p[-2] es la expresión del switch; se salta a la tabla de casos
+    gen = p.lexer.gen
+    marker_span(p, -2)
+    gen.breaks.append([])
+    gen.switches.append([])     # (valor, etiqueta) de cada caso
+    p[0] = (p[-2]['place'], gen.emit_jump())
 
 def p_case_list(p):
     '''case_list : case_list case_clause
@@ -194,18 +345,35 @@ def p_case_list(p):
     pass
 
 def p_case_clause(p):
-    '''case_clause : CASE INT_LITERAL COLON statements
-                   | DEFAULT COLON statements'''
+    '''case_clause : CASE INT_LITERAL COLON case_start statements
+                   | DEFAULT COLON case_start statements'''
     pass
 
+def p_case_start(p):
+    '''case_start :'''
+    # Registra la etiqueta del caso en el switch abierto más interno
+    gen = p.lexer.gen
+    value = p[-2] if isinstance(p[-2], int) else None   # None: default
+    marker_span(p, -2 if value is None else -3, -1)
+    label = gen.emit_label()
+    if gen.switches:
+        gen.switches[-1].append((value, label))
+
 def p_return_statement(p):
     '''return_statement : RETURN expression SEMICOLON
                         | RETURN SEMICOLON'''
-    print("Sentencia RETURN detectada")
+    p.lexer.gen.emit('return', p[2]['place'] if len(p) == 4 else None, None, None)
+    p.lexer.diagnostics.trace("Sentencia RETURN detectada", line=p.lineno(1))
 
 def p_break_statement(p):
     '''break_statement : BREAK SEMICOLON'''
-    print("Sentencia BREAK detectada")
+    gen = p.lexer.gen
+    if gen.breaks:
+        gen.breaks[-1].append(gen.emit_jump())
+    else:
+        p.lexer.diagnostics.error('S005', "break fuera de un bucle o switch", line=p.lineno(1),
+                                  column=column(p, 1))
+    p.lexer.diagnostics.trace("Sentencia BREAK detectada", line=p.lineno(1))
 
 def p_type(p):
     '''type : INT
@@ -213,15 +381,16 @@ def p_type(p):
             | CHAR
             | BOOLEAN
             | VOID'''
-    p[0] = p[1] # 'int', 'float', 'char', 'boolean' o 'void'
+    p[0] = BASIC_TYPES[p[1]] # tipo internado de 'int', 'float', 'char', 'boolean' o 'void'
     
 def p_pointer_declarator(p):
     '''pointer_declarator : TIMES pointer_declarator
                           | TIMES'''
+    # Número de asteriscos
     if len(p) == 2:
-        p[0] = '*'
+        p[0] = 1
     else:
-        p[0] = '*' + p[2]
+        p[0] = 1 + p[2]
     
 def p_ID_list(p):
     '''ID_list : ID_list COMMA declarator
@@ -236,14 +405,17 @@ def p_declarator(p):
                   | pointer_declarator ID
                   | ID ASSIGN expression
                   | ID'''
+    # (nombre, nivel de puntero, inicializador, línea, nombre en el 3AC)
     if len(p) == 2:  # Solo ID
-        p[0] = (p[1], '', None)
+        p[0] = (p[1], 0, None, p.lineno(1), local_place(p, p[1]))
     elif len(p) == 3:  # pointer + ID
-        p[0] = (p[2], p[1], None)
+        p[0] = (p[2], p[1], None, p.lineno(2), local_place(p, p[2]))
     elif len(p) == 4:  # ID = expr
-        p[0] = (p[1], '', p[3])
+        p[0] = (p[1], 0, p[3], p.lineno(1), local_place(p, p[1]))
+        p.lexer.gen.emit('=', p[3]['place'], None, p[0][4])
     else:  # pointer + ID = expr
-        p[0] = (p[2], p[1], p[4])
+        p[0] = (p[2], p[1], p[4], p.lineno(2), local_place(p, p[2]))
+        p.lexer.gen.emit('=', p[4]['place'], None, p[0][4])
 
 # --- Assignments & Expressions ---
 def p_assignment(p):
@@ -254,17 +426,17 @@ def p_assignment(p):
 
     try:
         # 1. Verificación Semántica: ¿Existe la variable?
-        symbol = symbol_table.lookup(var_name)
+        symbol = p.lexer.symbol_table.lookup(var_name)
         
         # 2. Verificación de Tipos
-        if symbol.type == 'int' and expr_info['type'] == 'float':
-            print(f"Error Semántico: No se puede asignar FLOAT a la variable INT '{var_name}'")
+        if not compatible(symbol.type, expr_info['type']):
+            assignment_error(p, symbol.type, expr_info['type'], var_name, 1)
         
         # 3. Generación de Código: var = temporal
-        gen.emit('=', expr_info['place'], None, var_name)
+        p.lexer.gen.emit('=', expr_info['place'], None, symbol.place)
         
     except SemanticError as e:
-        print(e)
+        p.lexer.diagnostics.error(e.code, "%s", str(e), line=p.lineno(1), column=column(p, 1))
 
 # --- EXPRESIONES (Operaciones Aritméticas) ---
 def p_expression_binop(p):
@@ -277,27 +449,59 @@ def p_expression_binop(p):
                   | expression LE expression
                   | expression GE expression
                   | expression EQ expression
-                  | expression NE expression
-                  | expression AND expression
-                  | expression OR expression'''
+                  | expression NE expression'''
     
     left = p[1]  # Diccionario del operando izquierdo
     op = p[2]    # Operador (+, -, *, /, <, >, etc.)
     right = p[3] # Diccionario del operando derecho
 
     # A. Lógica de Tipos (Semántica)
-    result_type = 'int'
-    if op in ['<', '>', '<=', '>=', '==', '!=', '&&', '||']:
-        result_type = 'boolean'  # Las comparaciones devuelven boolean
-    elif left['type'] == 'float' or right['type'] == 'float':
-        result_type = 'float'
+    if op in RELATIONAL:
+        result_type = BOOLEAN  # Las comparaciones devuelven boolean
+    else:
+        result_type = promote(op, left['type'], right['type'])
+        if result_type is ERROR and left['type'] is not ERROR and right['type'] is not ERROR:
+            p.lexer.diagnostics.error('S009', "Operandos de tipos incompatibles para '%s': %s y %s",
+                                      op, left['type'], right['type'], line=p.lineno(2),
+                                      column=column(p, 2))
     
     # B. Generación de Código
+    gen = p.lexer.gen
     temp = gen.new_temp() # Pedimos un temporal (ej: t1)
+    start = gen.next_quad()
     gen.emit(op, left['place'], right['place'], temp) # Emitimos t1 = op1 + op2
 
     # C. Propagar resultado hacia arriba
     p[0] = {'type': result_type, 'place': temp}
+    if result_type is BOOLEAN:
+        # En una condición, gen.condition() cambia esta instrucción por un salto
+        p[0]['cond'] = {'start': start, 'end': start + 1, 'rel': (op, left['place'], right['place'])}
+
+def p_expression_logical(p):
+    '''expression : expression AND logical_marker expression
+                  | expression OR logical_marker expression'''
+    # Cortocircuito: el operando derecho solo se evalúa si hace falta
+    gen = p.lexer.gen
+    true, false = gen.condition(p[4])
+    if p[2] == '&&':
+        false = p[3] + false
+    else:
+        true = p[3] + true
+    p[0] = gen.materialize(true, false)
+
+def p_logical_marker(p):
+    '''logical_marker :'''
+    # p[-2] es el operando izquierdo, p[-1] el operador
+    gen = p.lexer.gen
+    marker_span(p, -2)
+    if p[-1] == '&&':
+        true, false = gen.condition(p[-2], fall='true')
+        gen.emit_label(true)        # cierto: evaluar el derecho
+        p[0] = false                # falso: toda la expresión es falsa
+    else:
+        true, false = gen.condition(p[-2], fall='false')
+        gen.emit_label(false)
+        p[0] = true
 
 def p_expression_unary(p):
     '''expression : MINUS expression
@@ -310,26 +514,54 @@ def p_expression_unary(p):
                   | ID MINUSMINUS'''
     if len(p) == 3:
         if p[1] == '-':
-            temp = gen.new_temp()
-            gen.emit('-', p[2]['place'], None, temp)
+            temp = p.lexer.gen.new_temp()
+            p.lexer.gen.emit('-', p[2]['place'], None, temp)
             p[0] = {'type': p[2]['type'], 'place': temp}
         elif p[1] == '!':
-            temp = gen.new_temp()
-            gen.emit('!', p[2]['place'], None, temp)
-            p[0] = {'type': 'boolean', 'place': temp}
+            gen = p.lexer.gen
+            if 'cond' in p[2]:
+                true, false = gen.condition(p[2])
+                p[0] = gen.materialize(false, true)
+            else:
+                temp = gen.new_temp()
+                start = gen.next_quad()
+                gen.emit('!', p[2]['place'], None, temp)
+                p[0] = {'type': BOOLEAN, 'place': temp,
+                        'cond': {'start': start, 'end': start + 1, 'rel': ('!', p[2]['place'], None)}}
         elif p[1] == '&':
-            p[0] = {'type': 'pointer', 'place': '&' + p[2]}
+            try:
+                symbol = p.lexer.symbol_table.lookup(p[2])
+                p[0] = {'type': symbol.type.pointer(), 'place': '&' + symbol.place}
+            except SemanticError as e:
+                p.lexer.diagnostics.error(e.code, "%s", str(e), line=p.lineno(1), column=column(p, 1))
+                p[0] = {'type': ERROR, 'place': 'ERROR'}
         elif p[1] == '*':
             try:
-                symbol = symbol_table.lookup(p[2])
-                p[0] = {'type': 'int', 'place': '*' + p[2]}
+                symbol = p.lexer.symbol_table.lookup(p[2])
+                target = symbol.type.target
+                if target is None:
+                    if symbol.type is not ERROR:
+                        p.lexer.diagnostics.error('S009', "No se puede desreferenciar '%s' de tipo %s",
+                                                  p[2], symbol.type, line=p.lineno(1),
+                                                  column=column(p, 1))
+                    target = ERROR
+                p[0] = {'type': target, 'place': '*' + symbol.place}
             except SemanticError as e:
-                print(e)
-                p[0] = {'type': 'error', 'place': 'ERROR'}
+                p.lexer.diagnostics.error(e.code, "%s", str(e), line=p.lineno(1), column=column(p, 1))
+                p[0] = {'type': ERROR, 'place': 'ERROR'}
         elif p[1] in ['++', '--']:
-            p[0] = {'type': 'int', 'place': p[2]}
+            # Preincremento: se actualiza y se usa la variable
+            name = place_of(p, p[2])
+            p.lexer.gen.emit(p[1][0], name, '1', name)
+            p[0] = {'type': INT, 'place': name}
         else:  # p[2] es ++ o --
-            p[0] = {'type': 'int', 'place': p[1]}
+            # Postincremento: el valor anterior queda en un temporal
+            gen = p.lexer.gen
+            name = place_of(p, p[1])
+            temp = gen.new_temp()
+            gen.emit('=', name, None, temp)
+            gen.emit(p[2][0], name, '1', name)
+            p[0] = {'type': INT, 'place': temp}
 
 def p_expression_group(p):
     '''expression : LPAREN expression RPAREN'''
@@ -348,51 +580,176 @@ def p_factor_num(p):
               | TRUE
               | FALSE'''
     if isinstance(p[1], int):
-        p[0] = {'type': 'int', 'place': str(p[1])}
+        p[0] = {'type': INT, 'place': str(p[1])}
     elif isinstance(p[1], float):
-        p[0] = {'type': 'float', 'place': str(p[1])}
+        p[0] = {'type': FLOAT, 'place': str(p[1])}
     elif p[1] == 'true' or p[1] == 'false':
-        p[0] = {'type': 'boolean', 'place': p[1]}
+        p[0] = {'type': BOOLEAN, 'place': p[1]}
+    elif p.slice[1].type == 'CHAR_LITERAL':
+        # Entre comillas, para no confundir el literal con una variable
+        p[0] = {'type': CHAR, 'place': f"'{p[1]}'"}
     else:
-        p[0] = {'type': 'char', 'place': str(p[1])}
+        p[0] = {'type': STRING, 'place': f'"{p[1]}"'}
 
 def p_factor_id(p):
     '''factor : ID'''
     var_name = p[1]
     try:
-        symbol = symbol_table.lookup(var_name)
-        p[0] = {'type': symbol.type, 'place': var_name}
+        symbol = p.lexer.symbol_table.lookup(var_name)
+        p[0] = {'type': symbol.type, 'place': symbol.place}
     except SemanticError as e:
-        print(e)
+        p.lexer.diagnostics.error(e.code, "%s", str(e), line=p.lineno(1), column=column(p, 1))
         # Retornamos un valor dummy para que no falle el compilador
-        p[0] = {'type': 'error', 'place': 'ERROR'}
+        p[0] = {'type': ERROR, 'place': 'ERROR'}
 
 def p_factor_function_call(p):
     '''factor : ID LPAREN argument_list RPAREN
               | ID LPAREN RPAREN'''
     func_name = p[1]
-    print(f"Llamada a función: {func_name}")
-    p[0] = {'type': 'int', 'place': func_name}  # Asumimos retorno int por defecto
+    p.lexer.diagnostics.trace("Llamada a función: %s", func_name, line=p.lineno(1))
+    # Los argumentos ya están evaluados: param de cada uno y la llamada
+    args = p[3] if len(p) == 5 else []
+    result_type = check_call(p, func_name, args)
+    gen = p.lexer.gen
+    for arg in args:
+        gen.emit('param', arg['place'], None, None)
+    temp = gen.new_temp()
+    gen.emit('call', func_name, len(args), temp)
+    p[0] = {'type': result_type, 'place': temp}
 
 def p_argument_list(p):
     '''argument_list : argument_list COMMA expression
                      | expression'''
-    pass
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[0] = p[1] + [p[3]]
 
 # --- Empty rule to lists of statements ---
 def p_empty(p):
     '''empty :'''
     pass
 
-def p_error(p):
+# --- Comprobaciones de tipos compartidas por varias acciones ---
+RELATIONAL = frozenset(('<', '>', '<=', '>=', '==', '!='))
+
+def column(p, n):
+    """Columna (desde 1) del token n de la producción; None sin mapa de fuente o en una cabecera."""
+    source_map = p.lexer.source_map
+    tok = p.slice[n]
+    if source_map is None or getattr(tok, 'endlexpos', None) == -1:
+        return None
+    return source_map.column(tok.lineno, tok.lexpos)
+
+def local_place(p, name):
+    """
+    Nombre en el 3AC de una variable que se declara en el ámbito actual. Si
+    oculta a otra visible (global o de un bloque externo) lleva la
+    profundidad del ámbito, 'b.2': el '.' no cabe en un identificador del
+    fuente, así que no choca con ninguna otra variable, y los bloques
+    hermanos pueden compartir el nombre porque no viven a la vez.
+    """
+    table = p.lexer.symbol_table
+    try:
+        table.lookup(name)
+    except SemanticError:
+        return name
+    return f"{name}.{table.depth}"
+
+def place_of(p, name):
+    """Nombre en el 3AC de la variable visible `name` (el propio nombre si no existe)."""
+    try:
+        return p.lexer.symbol_table.lookup(name).place
+    except SemanticError:
+        return name
+
+def marker_span(p, first, last=None):
+    """
+    Con tramos (spans=True), las instrucciones que emite un marcador apuntan a
+    los símbolos p[first]..p[last] de la regla que lo contiene (índices
+    negativos) en lugar de a su tramo vacío.
+    """
+    gen = p.lexer.gen
+    if gen.spans is None:
+        return
+    start, end = symbol_span(p.stack[first])
+    if last is not None:
+        end = symbol_span(p.stack[last])[1]
+    if start >= 0 and end >= start:
+        gen.span = (start, end)
+
+def assignment_error(p, target, source, name, index):
+    p.lexer.diagnostics.error('S003', "No se puede asignar %s a la variable %s '%s'",
+                              source.upper(), target.upper(), name, line=p.lineno(index),
+                              column=column(p, index))
+
+def check_call(p, func_name, args):
+    """Comprueba una llamada contra la firma registrada; devuelve el tipo de retorno."""
+    diagnostics = p.lexer.diagnostics
+    try:
+        signature = p.lexer.symbol_table.lookup(func_name).type
+    except SemanticError:
+        # Como en C89, una función sin declarar se supone 'int f()'; queda como
+        # referencia externa, con los tipos de los argumentos, para el enlazado
+        diagnostics.warning('S008', "Función '%s' no declarada; se supone que devuelve int",
+                            func_name, line=p.lineno(1), column=column(p, 1))
+        p.lexer.gen.externals.append((func_name, function_type(INT, [arg['type'] for arg in args]),
+                                      p.lineno(1)))
+        return INT
+    if not isinstance(signature, FunctionType):
+        if signature is not ERROR:
+            diagnostics.error('S010', "'%s' no es una función", func_name, line=p.lineno(1),
+                              column=column(p, 1))
+        return ERROR
+    params = signature.params
+    if len(args) != len(params):
+        diagnostics.error('S006', "La función '%s' espera %d argumentos y recibe %d",
+                          func_name, len(params), len(args), line=p.lineno(1), column=column(p, 1))
+    else:
+        for i, (param_type, arg) in enumerate(zip(params, args), 1):
+            if not compatible(param_type, arg['type']):
+                diagnostics.error('S007', "Argumento %d de '%s': no se puede pasar %s como %s",
+                                  i, func_name, arg['type'].upper(), param_type.upper(),
+                                  line=p.lineno(1), column=column(p, 1))
+    return signature.result
+
+def report_syntax_error(lexer, p):
+    """Registra un error de sintaxis en el sumidero de diagnósticos del lexer."""
     if p:
-        print(f"Sintaxis error in '{p.value}' at line {p.lineno}")
+        source_map = getattr(lexer, 'source_map', None)
+        col = None
+        if source_map is not None and getattr(p, 'endlexpos', None) != -1:
+            col = source_map.column(p.lineno, p.lexpos)
+        lexer.diagnostics.error('P001', "Sintaxis error in '%s'", p.value, line=p.lineno,
+                                column=col)
     else:
-        print("Syntax error at EOF")
+        lexer.diagnostics.error('P002', "Syntax error at EOF", line=lexer.lineno)
+
+def p_error(p):
+    # Al final del archivo no hay token; se usa el lexer por defecto.
+    # Las sesiones sustituyen errorfunc para apuntar a su propio lexer.
+    report_syntax_error(p.lexer if p else lexer, p)
 
 
 #--- Build the parser ---
-parser = yacc.yacc()
+PARSETAB_PICKLE = os.path.join(TABLES_DIR, 'parsetab.pickle')
+
+if FAST_STARTUP:
+    # Tablas congeladas: sin comprobar la firma, sin validar y sin parser.out
+    if not os.path.exists(PARSETAB_PICKLE):
+        raise RuntimeError("parsetab.pickle no existe; ejecute 'python build_tables.py build'")
+    _tables = yacc.LRTable()
+    _tables.read_pickle(PARSETAB_PICKLE)
+    _tables.bind_callables(globals())
+    parser = yacc.LRParser(_tables, p_error)
+else:
+    parser = yacc.yacc()
+
+# Sin reducción por defecto en reglas vacías (marcadores): al recuperarse de un
+# error de sintaxis, PLY volvería a reducirlas tras cada pop y nunca terminaría
+for _state, _action in list(parser.defaulted_states.items()):
+    if parser.productions[-_action].len == 0:
+        del parser.defaulted_states[_state]
 
 # --- Función Principal para Probar ---
 if __name__ == '__main__':
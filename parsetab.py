@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftPLUSMINUSleftTIMESDIVIDEAMPERSAND AND ASSIGN BOOLEAN BREAK CASE CHAR CHAR_LITERAL COLON COMMA DEFAULT DEFINE DIVIDE DOT ELSE EQ FALSE FLOAT FLOAT_LITERAL FOR GE GT ID IF INCLUDE INT INT_LITERAL LBRACE LBRACKET LE LPAREN LT MINUS MINUSMINUS NE NOT OR PLUS PLUSPLUS RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING_LITERAL SWITCH TIMES TRUE VOID WHILEprogram : declarations_and_functionsdeclarations_and_functions : declarations_and_functions declaration_or_function\n                                  | declaration_or_function\n                                  | emptydeclaration_or_function : preprocessor\n                                | function_definition\n                                | declaration\n                                | statementpreprocessor : INCLUDE ID DOT ID\n                    | INCLUDE ID\n                    | INCLUDE LT ID DOT ID GT\n                    | INCLUDE LT ID GT\n                    | DEFINE ID INT_LITERAL\n                    | DEFINE ID FLOAT_LITERALfunction_definition : type ID LPAREN parameter_list RPAREN compound_statement\n                           | type ID LPAREN RPAREN compound_statementparameter_list : parameter_list COMMA parameter\n                      | parameterparameter : type pointer_declarator ID\n                 | type IDcompound_statement : LBRACE scope_enter statements RBRACEstatements : statements statement\n                  | emptystatement : declaration\n                 | assignment\n                 | block\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | switch_statement\n                 | return_statement\n                 | break_statement\n                 | expression_statementexpression_statement : expression SEMICOLON\n                            | SEMICOLONblock : LBRACE scope_enter statements RBRACEscope_enter :declaration : type ID_list SEMICOLONif_statement : IF LPAREN expression RPAREN statement\n                    | IF LPAREN expression RPAREN statement ELSE statementwhile_statement : WHILE LPAREN expression RPAREN statement\n                       | WHILE LPAREN expression RPAREN compound_statementfor_statement : FOR LPAREN for_init SEMICOLON expression_opt SEMICOLON for_update RPAREN statement\n                     | FOR LPAREN for_init SEMICOLON expression_opt SEMICOLON for_update RPAREN compound_statementfor_init : assignment_expr\n                | emptyfor_update : assignment_expr\n                  | unary_expr\n                  | emptyassignment_expr : ID ASSIGN expressionunary_expr : ID PLUSPLUS\n                  | ID MINUSMINUS\n                  | PLUSPLUS ID\n                  | MINUSMINUS IDexpression_opt : expression\n                      | emptyswitch_statement : SWITCH LPAREN expression RPAREN LBRACE case_list RBRACEcase_list : case_list case_clause\n                 | case_clause\n                 | emptycase_clause : CASE INT_LITERAL COLON statements\n                   | DEFAULT COLON statementsreturn_statement : RETURN expression SEMICOLON\n                        | RETURN SEMICOLONbreak_statement : BREAK SEMICOLONtype : INT\n            | FLOAT\n            | CHAR\n            | BOOLEAN\n            | VOIDpointer_declarator : TIMES pointer_declarator\n                          | TIMESID_list : ID_list COMMA declarator\n               | declaratordeclarator : pointer_declarator ID ASSIGN expression\n                  | pointer_declarator ID\n                  | ID ASSIGN expression\n                  | IDassignment : ID ASSIGN expression SEMICOLONexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | expression LT expression\n                  | expression GT expression\n                  | expression LE expression\n                  | expression GE expression\n                  | expression EQ expression\n                  | expression NE expression\n                  | expression AND expression\n                  | expression OR expressionexpression : MINUS expression\n                  | NOT expression\n                  | AMPERSAND ID\n                  | TIMES ID\n                  | PLUSPLUS ID\n                  | MINUSMINUS ID\n                  | ID PLUSPLUS\n                  | ID MINUSMINUSexpression : LPAREN expression RPARENexpression : factorfactor : INT_LITERAL\n              | FLOAT_LITERAL\n              | CHAR_LITERAL\n              | STRING_LITERAL\n              | TRUE\n              | FALSEfactor : IDfactor : ID LPAREN argument_list RPAREN\n              | ID LPAREN RPARENargument_list : argument_list COMMA expression\n                     | expressionempty :'
+_lr_signature = 'leftORleftANDleftEQNEleftLTGTLEGEleftPLUSMINUSleftTIMESDIVIDErightNOTAMPERSAND AND ASSIGN BOOLEAN BREAK CASE CHAR CHAR_LITERAL COLON COMMA DEFAULT DEFINE DIVIDE DOT ELSE EQ FALSE FLOAT FLOAT_LITERAL FOR GE GT ID IF INCLUDE INT INT_LITERAL LBRACE LBRACKET LE LPAREN LT MINUS MINUSMINUS NE NOT OR PLUS PLUSPLUS RBRACE RBRACKET RETURN RPAREN SEMICOLON STRING_LITERAL SWITCH TIMES TRUE VOID WHILEprogram : declarations_and_functionsdeclarations_and_functions : declarations_and_functions declaration_or_function\n                                  | declaration_or_function\n                                  | emptydeclaration_or_function : preprocessor\n                                | function_definition\n                                | declaration\n                                | statementpreprocessor : INCLUDE ID DOT ID\n                    | INCLUDE ID\n                    | INCLUDE LT ID DOT ID GT\n                    | INCLUDE LT ID GT\n                    | DEFINE ID INT_LITERAL\n                    | DEFINE ID FLOAT_LITERALfunction_definition : type ID LPAREN function_scope parameter_list RPAREN function_start compound_statement\n                           | type ID LPAREN function_scope RPAREN function_start compound_statementfunction_scope :function_start :parameter_list : parameter_list COMMA parameter\n                      | parameterparameter : type pointer_declarator ID\n                 | type IDcompound_statement : LBRACE scope_enter statements RBRACEstatements : statements statement\n                  | emptystatement : declaration\n                 | assignment\n                 | block\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | switch_statement\n                 | return_statement\n                 | break_statement\n                 | expression_statementexpression_statement : expression SEMICOLON\n                            | SEMICOLONblock : LBRACE scope_enter statements RBRACEscope_enter :declaration : type ID_list SEMICOLONif_statement : IF LPAREN expression RPAREN condition_marker statement\n                    | IF LPAREN expression RPAREN condition_marker statement ELSE else_marker statementcondition_marker :else_marker :while_statement : WHILE loop_start LPAREN expression RPAREN condition_marker statement\n                       | WHILE loop_start LPAREN expression RPAREN condition_marker compound_statementloop_start :for_statement : FOR LPAREN for_init SEMICOLON loop_start expression_opt SEMICOLON for_condition for_update RPAREN for_body statement\n                     | FOR LPAREN for_init SEMICOLON loop_start expression_opt SEMICOLON for_condition for_update RPAREN for_body compound_statementfor_condition :for_body :for_init : assignment_expr\n                | emptyfor_update : assignment_expr\n                  | unary_expr\n                  | emptyassignment_expr : ID ASSIGN expressionunary_expr : ID PLUSPLUS\n                  | ID MINUSMINUS\n                  | PLUSPLUS ID\n                  | MINUSMINUS IDexpression_opt : expression\n                      | emptyswitch_statement : SWITCH LPAREN expression RPAREN switch_start LBRACE case_list RBRACEswitch_start :case_list : case_list case_clause\n                 | case_clause\n                 | emptycase_clause : CASE INT_LITERAL COLON case_start statements\n                   | DEFAULT COLON case_start statementscase_start :return_statement : RETURN expression SEMICOLON\n                        | RETURN SEMICOLONbreak_statement : BREAK SEMICOLONtype : INT\n            | FLOAT\n            | CHAR\n            | BOOLEAN\n            | VOIDpointer_declarator : TIMES pointer_declarator\n                          | TIMESID_list : ID_list COMMA declarator\n               | declaratordeclarator : pointer_declarator ID ASSIGN expression\n                  | pointer_declarator ID\n                  | ID ASSIGN expression\n                  | IDassignment : ID ASSIGN expression SEMICOLONexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | expression LT expression\n                  | expression GT expression\n                  | expression LE expression\n                  | expression GE expression\n                  | expression EQ expression\n                  | expression NE expressionexpression : expression AND logical_marker expression\n                  | expression OR logical_marker expressionlogical_marker :expression : MINUS expression\n                  | NOT expression\n                  | AMPERSAND ID\n                  | TIMES ID\n                  | PLUSPLUS ID\n                  | MINUSMINUS ID\n                  | ID PLUSPLUS\n                  | ID MINUSMINUSexpression : LPAREN expression RPARENexpression : factorfactor : INT_LITERAL\n              | FLOAT_LITERAL\n              | CHAR_LITERAL\n              | STRING_LITERAL\n              | TRUE\n              | FALSEfactor : IDfactor : ID LPAREN argument_list RPAREN\n              | ID LPAREN RPARENargument_list : argument_list COMMA expression\n                     | expressionempty :'
     
-_lr_action_items = {'INCLUDE':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,50,51,65,84,85,98,99,102,128,129,131,132,143,145,158,161,162,163,170,172,184,193,197,198,206,207,],[9,9,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-2,-10,-34,-64,-65,-13,-14,-38,-63,-9,-12,-79,-36,-24,-16,-39,-41,-42,-11,-15,-40,-57,-21,-21,-43,-44,]),'DEFINE':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,50,51,65,84,85,98,99,102,128,129,131,132,143,145,158,161,162,163,170,172,184,193,197,198,206,207,],[11,11,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-2,-10,-34,-64,-65,-13,-14,-38,-63,-9,-12,-79,-36,-24,-16,-39,-41,-42,-11,-15,-40,-57,-21,-21,-43,-44,]),'INT':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,143,144,145,147,148,157,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[26,26,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,26,-38,26,-23,-63,-9,-12,-79,-36,-22,-24,26,26,26,-16,-37,-39,-41,-42,-37,-11,-15,-113,26,-113,26,-40,26,-57,-113,-21,-21,26,-113,26,-43,-44,26,]),'FLOAT':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,143,144,145,147,148,157,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[27,27,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,27,-38,27,-23,-63,-9,-12,-79,-36,-22,-24,27,27,27,-16,-37,-39,-41,-42,-37,-11,-15,-113,27,-113,27,-40,27,-57,-113,-21,-21,27,-113,27,-43,-44,27,]),'CHAR':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,143,144,145,147,148,157,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[28,28,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,28,-38,28,-23,-63,-9,-12,-79,-36,-22,-24,28,28,28,-16,-37,-39,-41,-42,-37,-11,-15,-113,28,-113,28,-40,28,-57,-113,-21,-21,28,-113,28,-43,-44,28,]),'BOOLEAN':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,143,144,145,147,148,157,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[29,29,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,29,-38,29,-23,-63,-9,-12,-79,-36,-22,-24,29,29,29,-16,-37,-39,-41,-42,-37,-11,-15,-113,29,-113,29,-40,29,-57,-113,-21,-21,29,-113,29,-43,-44,29,]),'VOID':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,143,144,145,147,148,157,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[30,30,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,30,-38,30,-23,-63,-9,-12,-79,-36,-22,-24,30,30,30,-16,-37,-39,-41,-42,-37,-11,-15,-113,30,-113,30,-40,30,-57,-113,-21,-21,30,-113,30,-43,-44,30,]),'ID':([0,2,3,4,5,6,7,8,9,11,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,37,39,40,41,42,43,44,50,51,52,53,56,61,62,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,84,85,92,98,99,101,102,103,105,119,120,128,129,130,131,132,134,135,142,143,144,145,146,147,148,149,150,154,158,159,161,162,163,164,170,172,174,175,176,177,183,184,185,191,192,193,196,197,198,199,204,205,206,207,208,],[10,10,-3,-4,-5,-6,-7,-8,51,57,58,64,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-66,-67,-68,-69,-70,-37,64,64,87,64,89,90,91,-2,-10,93,64,64,104,-72,-34,64,64,64,64,64,64,64,64,64,64,64,64,-113,64,64,126,64,-64,-65,129,-13,-14,64,-38,141,-71,10,-23,-63,-9,152,-12,-79,64,155,64,-36,-22,-24,141,10,10,64,64,171,-16,-37,-39,-41,-42,-37,-11,-15,-113,10,-113,190,10,-40,10,202,203,-57,-113,-21,-21,10,-113,10,-43,-44,10,]),'LBRACE':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,137,143,144,145,147,148,151,156,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[32,32,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,-38,32,-23,-63,-9,-12,-79,159,-36,-22,-24,32,164,169,159,-16,-37,-39,-41,-42,-37,-11,-15,-113,32,-113,32,-40,32,-57,-113,-21,-21,164,-113,32,-43,-44,32,]),'IF':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,143,144,145,147,148,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[33,33,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,-38,33,-23,-63,-9,-12,-79,-36,-22,-24,33,33,-16,-37,-39,-41,-42,-37,-11,-15,-113,33,-113,33,-40,33,-57,-113,-21,-21,33,-113,33,-43,-44,33,]),'WHILE':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,143,144,145,147,148,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[34,34,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,-38,34,-23,-63,-9,-12,-79,-36,-22,-24,34,34,-16,-37,-39,-41,-42,-37,-11,-15,-113,34,-113,34,-40,34,-57,-113,-21,-21,34,-113,34,-43,-44,34,]),'FOR':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,143,144,145,147,148,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[35,35,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,-38,35,-23,-63,-9,-12,-79,-36,-22,-24,35,35,-16,-37,-39,-41,-42,-37,-11,-15,-113,35,-113,35,-40,35,-57,-113,-21,-21,35,-113,35,-43,-44,35,]),'SWITCH':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,143,144,145,147,148,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[36,36,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,-38,36,-23,-63,-9,-12,-79,-36,-22,-24,36,36,-16,-37,-39,-41,-42,-37,-11,-15,-113,36,-113,36,-40,36,-57,-113,-21,-21,36,-113,36,-43,-44,36,]),'RETURN':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,143,144,145,147,148,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[37,37,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,-38,37,-23,-63,-9,-12,-79,-36,-22,-24,37,37,-16,-37,-39,-41,-42,-37,-11,-15,-113,37,-113,37,-40,37,-57,-113,-21,-21,37,-113,37,-43,-44,37,]),'BREAK':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,143,144,145,147,148,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[38,38,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-2,-10,-34,-113,-64,-65,-13,-14,-38,38,-23,-63,-9,-12,-79,-36,-22,-24,38,38,-16,-37,-39,-41,-42,-37,-11,-15,-113,38,-113,38,-40,38,-57,-113,-21,-21,38,-113,38,-43,-44,38,]),'SEMICOLON':([0,2,3,4,5,6,7,8,10,12,13,16,17,18,19,20,21,22,23,24,25,31,32,37,38,45,46,47,48,49,50,51,54,55,58,59,60,64,65,78,81,83,84,85,86,87,88,89,90,91,94,96,98,99,102,104,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,128,129,131,132,133,139,140,141,143,144,145,147,148,149,158,159,160,161,162,163,164,165,166,167,168,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[16,16,-3,-4,-5,-6,-7,-8,-108,-102,-103,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,65,-37,84,85,-101,-104,-105,-106,-107,-2,-10,-98,-99,-78,102,-74,-108,-34,-113,-113,128,-64,-65,-92,-95,-93,-94,-96,-97,132,-110,-13,-14,-38,-76,-100,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,16,-23,149,-45,-46,-63,-9,-12,-79,-109,-77,-73,-78,-36,-22,-24,16,16,-113,-16,-37,-75,-39,-41,-42,-37,177,-55,-56,-50,-11,-15,-113,16,-113,16,-40,16,-57,-113,-21,-21,16,-113,16,-43,-44,16,]),'MINUS':([0,2,3,4,5,6,7,8,10,12,13,15,16,17,18,19,20,21,22,23,24,25,31,32,37,39,41,45,46,47,48,49,50,51,53,54,55,56,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,87,88,89,90,91,94,96,97,98,99,101,102,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,127,128,129,131,132,133,134,139,142,143,144,145,147,148,149,150,153,158,159,160,161,162,163,164,166,168,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[39,39,-3,-4,-5,-6,-7,-8,-108,-102,-103,39,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,67,-37,39,39,39,-101,-104,-105,-106,-107,-2,-10,39,-98,-99,39,67,-108,-34,39,39,39,39,39,39,39,39,39,39,39,39,-113,39,39,39,67,-64,-65,-92,-95,67,-94,-96,-97,67,-110,67,-13,-14,39,-38,-100,-80,-81,-82,-83,67,67,67,67,67,67,67,67,39,-23,67,67,67,-63,-9,-12,-79,-109,39,67,39,-36,-22,-24,39,39,39,39,67,-16,-37,67,-39,-41,-42,-37,67,67,-11,-15,-113,39,-113,39,-40,39,-57,-113,-21,-21,39,-113,39,-43,-44,39,]),'NOT':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[41,41,-3,-4,-5,-6,-7,-8,41,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,41,41,41,-2,-10,41,41,-34,41,41,41,41,41,41,41,41,41,41,41,41,-113,41,41,41,-64,-65,-13,-14,41,-38,41,-23,-63,-9,-12,-79,41,41,-36,-22,-24,41,41,41,41,-16,-37,-39,-41,-42,-37,-11,-15,-113,41,-113,41,-40,41,-57,-113,-21,-21,41,-113,41,-43,-44,41,]),'AMPERSAND':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[42,42,-3,-4,-5,-6,-7,-8,42,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,42,42,42,-2,-10,42,42,-34,42,42,42,42,42,42,42,42,42,42,42,42,-113,42,42,42,-64,-65,-13,-14,42,-38,42,-23,-63,-9,-12,-79,42,42,-36,-22,-24,42,42,42,42,-16,-37,-39,-41,-42,-37,-11,-15,-113,42,-113,42,-40,42,-57,-113,-21,-21,42,-113,42,-43,-44,42,]),'TIMES':([0,2,3,4,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,37,39,41,45,46,47,48,49,50,51,53,54,55,56,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,87,88,89,90,91,94,96,97,98,99,101,102,103,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,127,128,129,131,132,133,134,135,139,142,143,144,145,146,147,148,149,150,153,158,159,160,161,162,163,164,166,168,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[40,40,-3,-4,-5,-6,-7,-8,-108,-102,-103,62,40,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-66,-67,-68,-69,-70,68,-37,40,40,40,-101,-104,-105,-106,-107,-2,-10,40,-98,-99,40,62,68,-108,-34,40,40,40,40,40,40,40,40,40,40,40,40,-113,40,40,40,68,-64,-65,68,-95,68,-94,-96,-97,68,-110,68,-13,-14,40,-38,62,-100,68,68,-82,-83,68,68,68,68,68,68,68,68,40,-23,68,68,68,-63,-9,-12,-79,-109,40,62,68,40,-36,-22,-24,62,40,40,40,40,68,-16,-37,68,-39,-41,-42,-37,68,68,-11,-15,-113,40,-113,40,-40,40,-57,-113,-21,-21,40,-113,40,-43,-44,40,]),'PLUSPLUS':([0,2,3,4,5,6,7,8,10,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,177,183,184,185,190,193,196,197,198,199,204,205,206,207,208,],[43,43,-3,-4,-5,-6,-7,-8,54,43,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,43,43,43,-2,-10,43,43,54,-34,43,43,43,43,43,43,43,43,43,43,43,43,-113,43,43,43,-64,-65,-13,-14,43,-38,43,-23,-63,-9,-12,-79,43,43,-36,-22,-24,43,43,43,43,-16,-37,-39,-41,-42,-37,-11,-15,-113,43,-113,191,43,-40,43,200,-57,-113,-21,-21,43,-113,43,-43,-44,43,]),'MINUSMINUS':([0,2,3,4,5,6,7,8,10,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,177,183,184,185,190,193,196,197,198,199,204,205,206,207,208,],[44,44,-3,-4,-5,-6,-7,-8,55,44,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,44,44,44,-2,-10,44,44,55,-34,44,44,44,44,44,44,44,44,44,44,44,44,-113,44,44,44,-64,-65,-13,-14,44,-38,44,-23,-63,-9,-12,-79,44,44,-36,-22,-24,44,44,44,44,-16,-37,-39,-41,-42,-37,-11,-15,-113,44,-113,192,44,-40,44,201,-57,-113,-21,-21,44,-113,44,-43,-44,44,]),'LPAREN':([0,2,3,4,5,6,7,8,10,15,16,17,18,19,20,21,22,23,24,25,32,33,34,35,36,37,39,41,50,51,53,56,58,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[15,15,-3,-4,-5,-6,-7,-8,56,15,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,79,80,81,82,15,15,15,-2,-10,15,15,100,56,-34,15,15,15,15,15,15,15,15,15,15,15,15,-113,15,15,15,-64,-65,-13,-14,15,-38,15,-23,-63,-9,-12,-79,15,15,-36,-22,-24,15,15,15,15,-16,-37,-39,-41,-42,-37,-11,-15,-113,15,-113,15,-40,15,-57,-113,-21,-21,15,-113,15,-43,-44,15,]),'INT_LITERAL':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,57,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,181,183,184,185,193,196,197,198,199,204,205,206,207,208,],[12,12,-3,-4,-5,-6,-7,-8,12,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,12,12,12,-2,-10,12,12,98,-34,12,12,12,12,12,12,12,12,12,12,12,12,-113,12,12,12,-64,-65,-13,-14,12,-38,12,-23,-63,-9,-12,-79,12,12,-36,-22,-24,12,12,12,12,-16,-37,-39,-41,-42,-37,-11,-15,-113,12,-113,195,12,-40,12,-57,-113,-21,-21,12,-113,12,-43,-44,12,]),'FLOAT_LITERAL':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,57,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[13,13,-3,-4,-5,-6,-7,-8,13,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,13,13,13,-2,-10,13,13,99,-34,13,13,13,13,13,13,13,13,13,13,13,13,-113,13,13,13,-64,-65,-13,-14,13,-38,13,-23,-63,-9,-12,-79,13,13,-36,-22,-24,13,13,13,13,-16,-37,-39,-41,-42,-37,-11,-15,-113,13,-113,13,-40,13,-57,-113,-21,-21,13,-113,13,-43,-44,13,]),'CHAR_LITERAL':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[46,46,-3,-4,-5,-6,-7,-8,46,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,46,46,46,-2,-10,46,46,-34,46,46,46,46,46,46,46,46,46,46,46,46,-113,46,46,46,-64,-65,-13,-14,46,-38,46,-23,-63,-9,-12,-79,46,46,-36,-22,-24,46,46,46,46,-16,-37,-39,-41,-42,-37,-11,-15,-113,46,-113,46,-40,46,-57,-113,-21,-21,46,-113,46,-43,-44,46,]),'STRING_LITERAL':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[47,47,-3,-4,-5,-6,-7,-8,47,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,47,47,47,-2,-10,47,47,-34,47,47,47,47,47,47,47,47,47,47,47,47,-113,47,47,47,-64,-65,-13,-14,47,-38,47,-23,-63,-9,-12,-79,47,47,-36,-22,-24,47,47,47,47,-16,-37,-39,-41,-42,-37,-11,-15,-113,47,-113,47,-40,47,-57,-113,-21,-21,47,-113,47,-43,-44,47,]),'TRUE':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[48,48,-3,-4,-5,-6,-7,-8,48,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,48,48,48,-2,-10,48,48,-34,48,48,48,48,48,48,48,48,48,48,48,48,-113,48,48,48,-64,-65,-13,-14,48,-38,48,-23,-63,-9,-12,-79,48,48,-36,-22,-24,48,48,48,48,-16,-37,-39,-41,-42,-37,-11,-15,-113,48,-113,48,-40,48,-57,-113,-21,-21,48,-113,48,-43,-44,48,]),'FALSE':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,119,120,128,129,131,132,134,142,143,144,145,147,148,149,150,158,159,161,162,163,164,170,172,174,175,176,183,184,185,193,196,197,198,199,204,205,206,207,208,],[49,49,-3,-4,-5,-6,-7,-8,49,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,49,49,49,-2,-10,49,49,-34,49,49,49,49,49,49,49,49,49,49,49,49,-113,49,49,49,-64,-65,-13,-14,49,-38,49,-23,-63,-9,-12,-79,49,49,-36,-22,-24,49,49,49,49,-16,-37,-39,-41,-42,-37,-11,-15,-113,49,-113,49,-40,49,-57,-113,-21,-21,49,-113,49,-43,-44,49,]),'$end':([0,1,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,50,51,65,84,85,98,99,102,128,129,131,132,143,145,158,161,162,163,170,172,184,193,197,198,206,207,],[-113,0,-1,-3,-4,-5,-6,-7,-8,-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-2,-10,-34,-64,-65,-13,-14,-38,-63,-9,-12,-79,-36,-24,-16,-39,-41,-42,-11,-15,-40,-57,-21,-21,-43,-44,]),'LT':([9,10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[52,-108,-102,-103,70,-101,-104,-105,-106,-107,-98,-99,70,-108,70,-92,-95,70,-94,-96,-97,70,-110,70,-100,-80,-81,-82,-83,70,70,70,70,70,70,70,70,70,70,70,-109,70,70,70,70,70,]),'ASSIGN':([10,58,104,126,141,190,],[53,101,142,150,101,150,]),'PLUS':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[-108,-102,-103,66,-101,-104,-105,-106,-107,-98,-99,66,-108,66,-92,-95,66,-94,-96,-97,66,-110,66,-100,-80,-81,-82,-83,66,66,66,66,66,66,66,66,66,66,66,-109,66,66,66,66,66,]),'DIVIDE':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[-108,-102,-103,69,-101,-104,-105,-106,-107,-98,-99,69,-108,69,69,-95,69,-94,-96,-97,69,-110,69,-100,69,69,-82,-83,69,69,69,69,69,69,69,69,69,69,69,-109,69,69,69,69,69,]),'GT':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,93,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,152,153,160,166,168,],[-108,-102,-103,71,-101,-104,-105,-106,-107,-98,-99,71,-108,71,-92,-95,71,-94,-96,-97,131,71,-110,71,-100,-80,-81,-82,-83,71,71,71,71,71,71,71,71,71,71,71,-109,71,170,71,71,71,71,]),'LE':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[-108,-102,-103,72,-101,-104,-105,-106,-107,-98,-99,72,-108,72,-92,-95,72,-94,-96,-97,72,-110,72,-100,-80,-81,-82,-83,72,72,72,72,72,72,72,72,72,72,72,-109,72,72,72,72,72,]),'GE':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[-108,-102,-103,73,-101,-104,-105,-106,-107,-98,-99,73,-108,73,-92,-95,73,-94,-96,-97,73,-110,73,-100,-80,-81,-82,-83,73,73,73,73,73,73,73,73,73,73,73,-109,73,73,73,73,73,]),'EQ':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[-108,-102,-103,74,-101,-104,-105,-106,-107,-98,-99,74,-108,74,-92,-95,74,-94,-96,-97,74,-110,74,-100,-80,-81,-82,-83,74,74,74,74,74,74,74,74,74,74,74,-109,74,74,74,74,74,]),'NE':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[-108,-102,-103,75,-101,-104,-105,-106,-107,-98,-99,75,-108,75,-92,-95,75,-94,-96,-97,75,-110,75,-100,-80,-81,-82,-83,75,75,75,75,75,75,75,75,75,75,75,-109,75,75,75,75,75,]),'AND':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[-108,-102,-103,76,-101,-104,-105,-106,-107,-98,-99,76,-108,76,-92,-95,76,-94,-96,-97,76,-110,76,-100,-80,-81,-82,-83,76,76,76,76,76,76,76,76,76,76,76,-109,76,76,76,76,76,]),'OR':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,139,153,160,166,168,],[-108,-102,-103,77,-101,-104,-105,-106,-107,-98,-99,77,-108,77,-92,-95,77,-94,-96,-97,77,-110,77,-100,-80,-81,-82,-83,77,77,77,77,77,77,77,77,77,77,77,-109,77,77,77,77,77,]),'RPAREN':([12,13,45,46,47,48,49,54,55,56,63,64,86,87,88,89,90,91,95,96,97,100,106,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,133,136,138,153,155,168,171,173,177,186,187,188,189,200,201,202,203,],[-102,-103,-101,-104,-105,-106,-107,-98,-99,96,106,-108,-92,-95,-93,-94,-96,-97,133,-110,-112,137,-100,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,147,148,151,-109,156,-18,-111,-20,-50,-19,-17,-113,199,-47,-48,-49,-51,-52,-53,-54,]),'COMMA':([12,13,45,46,47,48,49,54,55,58,59,60,64,86,87,88,89,90,91,95,96,97,104,106,107,108,109,110,111,112,113,114,115,116,117,118,133,136,138,139,140,141,153,155,160,171,173,],[-102,-103,-101,-104,-105,-106,-107,-98,-99,-78,103,-74,-108,-92,-95,-93,-94,-96,-97,134,-110,-112,-76,-100,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-109,157,-18,-77,-73,-78,-111,-20,-75,-19,-17,]),'RBRACE':([16,17,18,19,20,21,22,23,24,25,32,65,78,84,85,102,119,120,128,132,143,144,145,159,161,162,163,164,169,174,176,178,179,180,183,184,185,193,194,196,198,204,205,206,207,208,],[-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-37,-34,-113,-64,-65,-38,143,-23,-63,-79,-36,-22,-24,-37,-39,-41,-42,-37,-113,-113,-113,193,-59,-60,197,-40,198,-57,-58,-113,-21,-113,-62,-43,-44,-61,]),'ELSE':([16,17,18,19,20,21,22,23,24,25,65,84,85,102,128,132,143,145,161,162,163,184,193,198,206,207,],[-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-64,-65,-38,-63,-79,-36,-24,175,-41,-42,-40,-57,-21,-43,-44,]),'CASE':([16,17,18,19,20,21,22,23,24,25,65,84,85,102,120,128,132,143,144,145,161,162,163,169,178,179,180,184,193,194,196,198,204,205,206,207,208,],[-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-64,-65,-38,-23,-63,-79,-36,-22,-24,-39,-41,-42,181,181,-59,-60,-40,-57,-58,-113,-21,-113,-62,-43,-44,-61,]),'DEFAULT':([16,17,18,19,20,21,22,23,24,25,65,84,85,102,120,128,132,143,144,145,161,162,163,169,178,179,180,184,193,194,196,198,204,205,206,207,208,],[-35,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-64,-65,-38,-23,-63,-79,-36,-22,-24,-39,-41,-42,182,182,-59,-60,-40,-57,-58,-113,-21,-113,-62,-43,-44,-61,]),'DOT':([51,93,],[92,130,]),'COLON':([182,195,],[196,204,]),}
+_lr_action_items = {'INCLUDE':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,50,51,65,84,85,98,99,102,128,129,131,132,142,144,163,169,178,181,182,190,195,200,211,212,222,223,],[9,9,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-2,-10,-36,-73,-74,-13,-14,-40,-72,-9,-12,-88,-38,-26,-11,-41,-16,-45,-46,-15,-64,-42,-23,-23,-48,-49,]),'DEFINE':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,50,51,65,84,85,98,99,102,128,129,131,132,142,144,163,169,178,181,182,190,195,200,211,212,222,223,],[11,11,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-2,-10,-36,-73,-74,-13,-14,-40,-72,-9,-12,-88,-38,-26,-11,-41,-16,-45,-46,-15,-64,-42,-23,-23,-48,-49,]),'INT':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,135,142,143,144,146,158,159,163,167,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[26,26,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-17,-40,26,-25,-72,-9,-12,-88,26,-38,-24,-26,-43,26,-43,-11,26,-41,26,-16,-39,-44,-45,-46,-39,-15,-123,26,-123,-64,-71,26,-42,26,-71,-123,-23,-23,-51,-123,26,26,26,-48,-49,]),'FLOAT':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,135,142,143,144,146,158,159,163,167,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[27,27,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-17,-40,27,-25,-72,-9,-12,-88,27,-38,-24,-26,-43,27,-43,-11,27,-41,27,-16,-39,-44,-45,-46,-39,-15,-123,27,-123,-64,-71,27,-42,27,-71,-123,-23,-23,-51,-123,27,27,27,-48,-49,]),'CHAR':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,135,142,143,144,146,158,159,163,167,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[28,28,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-17,-40,28,-25,-72,-9,-12,-88,28,-38,-24,-26,-43,28,-43,-11,28,-41,28,-16,-39,-44,-45,-46,-39,-15,-123,28,-123,-64,-71,28,-42,28,-71,-123,-23,-23,-51,-123,28,28,28,-48,-49,]),'BOOLEAN':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,135,142,143,144,146,158,159,163,167,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[29,29,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-17,-40,29,-25,-72,-9,-12,-88,29,-38,-24,-26,-43,29,-43,-11,29,-41,29,-16,-39,-44,-45,-46,-39,-15,-123,29,-123,-64,-71,29,-42,29,-71,-123,-23,-23,-51,-123,29,29,29,-48,-49,]),'VOID':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,100,102,119,120,128,129,131,132,135,142,143,144,146,158,159,163,167,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[30,30,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-17,-40,30,-25,-72,-9,-12,-88,30,-38,-24,-26,-43,30,-43,-11,30,-41,30,-16,-39,-44,-45,-46,-39,-15,-123,30,-123,-64,-71,30,-42,30,-71,-123,-23,-23,-51,-123,30,30,30,-48,-49,]),'ID':([0,2,3,4,5,6,7,8,9,11,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,37,39,40,41,42,43,44,50,51,52,53,56,61,62,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,84,85,92,98,99,101,102,103,105,117,118,119,120,122,128,129,130,131,132,134,139,142,143,144,145,146,148,149,153,158,159,160,163,164,169,170,178,179,180,181,182,183,184,190,191,192,193,194,195,198,199,200,201,207,208,209,210,211,212,213,218,219,220,221,222,223,],[10,10,-3,-4,-5,-6,-7,-8,51,57,58,64,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-75,-76,-77,-78,-79,-39,64,64,87,64,89,90,91,-2,-10,93,64,64,104,-81,-36,64,64,64,64,64,64,64,64,64,64,-101,-101,-123,64,126,64,-73,-74,129,-13,-14,64,-40,138,-80,64,64,10,-25,64,-72,-9,151,-12,-88,64,64,-38,-24,-26,138,-43,-47,64,165,10,-43,64,-11,175,-41,10,-16,-39,-44,-45,-46,-39,-50,-15,-123,10,-123,206,-64,-71,10,-42,10,216,217,-71,-123,-23,-23,-51,-123,10,10,10,-48,-49,]),'LBRACE':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,142,143,144,146,150,155,158,159,162,163,166,168,169,170,176,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[32,32,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-40,32,-25,-72,-9,-12,-88,-38,-24,-26,-43,-65,-18,32,-43,174,-11,-18,179,-41,183,179,-16,-39,-44,-45,-46,-39,-15,-123,32,-123,-64,-71,32,-42,32,-71,-123,-23,-23,-51,-123,32,183,32,-48,-49,]),'IF':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,142,143,144,146,158,159,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[33,33,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-40,33,-25,-72,-9,-12,-88,-38,-24,-26,-43,33,-43,-11,-41,33,-16,-39,-44,-45,-46,-39,-15,-123,33,-123,-64,-71,33,-42,33,-71,-123,-23,-23,-51,-123,33,33,33,-48,-49,]),'WHILE':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,142,143,144,146,158,159,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[34,34,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-40,34,-25,-72,-9,-12,-88,-38,-24,-26,-43,34,-43,-11,-41,34,-16,-39,-44,-45,-46,-39,-15,-123,34,-123,-64,-71,34,-42,34,-71,-123,-23,-23,-51,-123,34,34,34,-48,-49,]),'FOR':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,142,143,144,146,158,159,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[35,35,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-40,35,-25,-72,-9,-12,-88,-38,-24,-26,-43,35,-43,-11,-41,35,-16,-39,-44,-45,-46,-39,-15,-123,35,-123,-64,-71,35,-42,35,-71,-123,-23,-23,-51,-123,35,35,35,-48,-49,]),'SWITCH':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,142,143,144,146,158,159,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[36,36,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-40,36,-25,-72,-9,-12,-88,-38,-24,-26,-43,36,-43,-11,-41,36,-16,-39,-44,-45,-46,-39,-15,-123,36,-123,-64,-71,36,-42,36,-71,-123,-23,-23,-51,-123,36,36,36,-48,-49,]),'RETURN':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,142,143,144,146,158,159,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[37,37,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-40,37,-25,-72,-9,-12,-88,-38,-24,-26,-43,37,-43,-11,-41,37,-16,-39,-44,-45,-46,-39,-15,-123,37,-123,-64,-71,37,-42,37,-71,-123,-23,-23,-51,-123,37,37,37,-48,-49,]),'BREAK':([0,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,32,50,51,65,78,84,85,98,99,102,119,120,128,129,131,132,142,143,144,146,158,159,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[38,38,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-2,-10,-36,-123,-73,-74,-13,-14,-40,38,-25,-72,-9,-12,-88,-38,-24,-26,-43,38,-43,-11,-41,38,-16,-39,-44,-45,-46,-39,-15,-123,38,-123,-64,-71,38,-42,38,-71,-123,-23,-23,-51,-123,38,38,38,-48,-49,]),'SEMICOLON':([0,2,3,4,5,6,7,8,10,12,13,16,17,18,19,20,21,22,23,24,25,31,32,37,38,45,46,47,48,49,50,51,54,55,58,59,60,64,65,78,81,83,84,85,86,87,88,89,90,91,94,96,98,99,102,104,106,107,108,109,110,111,112,113,114,115,116,119,120,123,124,125,128,129,131,132,133,136,137,138,140,141,142,143,144,146,148,157,158,159,160,161,163,169,170,171,172,173,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[16,16,-3,-4,-5,-6,-7,-8,-118,-112,-113,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,65,-39,84,85,-111,-114,-115,-116,-117,-2,-10,-108,-109,-87,102,-83,-118,-36,-123,-123,128,-73,-74,-102,-105,-103,-104,-106,-107,132,-120,-13,-14,-40,-85,-110,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,16,-25,148,-52,-53,-72,-9,-12,-88,-119,-86,-82,-87,-99,-100,-38,-24,-26,-43,-47,-84,16,-43,-123,-57,-11,-41,16,184,-62,-63,-16,-39,-44,-45,-46,-39,-15,-123,16,-123,-64,-71,16,-42,16,-71,-123,-23,-23,-51,-123,16,16,16,-48,-49,]),'MINUS':([0,2,3,4,5,6,7,8,10,12,13,15,16,17,18,19,20,21,22,23,24,25,31,32,37,39,41,45,46,47,48,49,50,51,53,54,55,56,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,84,85,86,87,88,89,90,91,94,96,97,98,99,101,102,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,127,128,129,131,132,133,134,136,139,140,141,142,143,144,146,147,148,149,152,157,158,159,160,161,163,169,170,172,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[39,39,-3,-4,-5,-6,-7,-8,-118,-112,-113,39,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,67,-39,39,39,39,-111,-114,-115,-116,-117,-2,-10,39,-108,-109,39,67,-118,-36,39,39,39,39,39,39,39,39,39,39,-101,-101,-123,39,39,67,-73,-74,-102,-105,-103,-104,-106,-107,67,-120,67,-13,-14,39,-40,-110,-89,-90,-91,-92,67,67,67,67,67,67,39,39,39,-25,67,39,67,-72,-9,-12,-88,-119,39,67,39,67,67,-38,-24,-26,-43,67,-47,39,67,67,39,-43,39,67,-11,-41,39,67,-16,-39,-44,-45,-46,-39,-15,-123,39,-123,-64,-71,39,-42,39,-71,-123,-23,-23,-51,-123,39,39,39,-48,-49,]),'NOT':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[41,41,-3,-4,-5,-6,-7,-8,41,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,41,41,41,-2,-10,41,41,-36,41,41,41,41,41,41,41,41,41,41,-101,-101,-123,41,41,-73,-74,-13,-14,41,-40,41,41,41,-25,41,-72,-9,-12,-88,41,41,-38,-24,-26,-43,-47,41,41,-43,41,-11,-41,41,-16,-39,-44,-45,-46,-39,-15,-123,41,-123,-64,-71,41,-42,41,-71,-123,-23,-23,-51,-123,41,41,41,-48,-49,]),'AMPERSAND':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[42,42,-3,-4,-5,-6,-7,-8,42,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,42,42,42,-2,-10,42,42,-36,42,42,42,42,42,42,42,42,42,42,-101,-101,-123,42,42,-73,-74,-13,-14,42,-40,42,42,42,-25,42,-72,-9,-12,-88,42,42,-38,-24,-26,-43,-47,42,42,-43,42,-11,-41,42,-16,-39,-44,-45,-46,-39,-15,-123,42,-123,-64,-71,42,-42,42,-71,-123,-23,-23,-51,-123,42,42,42,-48,-49,]),'TIMES':([0,2,3,4,5,6,7,8,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,37,39,41,45,46,47,48,49,50,51,53,54,55,56,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,84,85,86,87,88,89,90,91,94,96,97,98,99,101,102,103,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,127,128,129,131,132,133,134,136,139,140,141,142,143,144,145,146,147,148,149,152,153,157,158,159,160,161,163,169,170,172,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[40,40,-3,-4,-5,-6,-7,-8,-118,-112,-113,62,40,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-75,-76,-77,-78,-79,68,-39,40,40,40,-111,-114,-115,-116,-117,-2,-10,40,-108,-109,40,62,68,-118,-36,40,40,40,40,40,40,40,40,40,40,-101,-101,-123,40,40,68,-73,-74,68,-105,-103,-104,-106,-107,68,-120,68,-13,-14,40,-40,62,-110,68,68,-91,-92,68,68,68,68,68,68,40,40,40,-25,68,40,68,-72,-9,-12,-88,-119,40,68,40,68,68,-38,-24,-26,62,-43,68,-47,40,68,62,68,40,-43,40,68,-11,-41,40,68,-16,-39,-44,-45,-46,-39,-15,-123,40,-123,-64,-71,40,-42,40,-71,-123,-23,-23,-51,-123,40,40,40,-48,-49,]),'PLUSPLUS':([0,2,3,4,5,6,7,8,10,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,184,190,191,192,193,194,195,198,199,200,201,206,209,210,211,212,213,218,219,220,221,222,223,],[43,43,-3,-4,-5,-6,-7,-8,54,43,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,43,43,43,-2,-10,43,43,54,-36,43,43,43,43,43,43,43,43,43,43,-101,-101,-123,43,43,-73,-74,-13,-14,43,-40,43,43,43,-25,43,-72,-9,-12,-88,43,43,-38,-24,-26,-43,-47,43,43,-43,43,-11,-41,43,-16,-39,-44,-45,-46,-39,-50,-15,-123,43,-123,207,-64,-71,43,-42,43,214,-71,-123,-23,-23,-51,-123,43,43,43,-48,-49,]),'MINUSMINUS':([0,2,3,4,5,6,7,8,10,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,184,190,191,192,193,194,195,198,199,200,201,206,209,210,211,212,213,218,219,220,221,222,223,],[44,44,-3,-4,-5,-6,-7,-8,55,44,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,44,44,44,-2,-10,44,44,55,-36,44,44,44,44,44,44,44,44,44,44,-101,-101,-123,44,44,-73,-74,-13,-14,44,-40,44,44,44,-25,44,-72,-9,-12,-88,44,44,-38,-24,-26,-43,-47,44,44,-43,44,-11,-41,44,-16,-39,-44,-45,-46,-39,-50,-15,-123,44,-123,208,-64,-71,44,-42,44,215,-71,-123,-23,-23,-51,-123,44,44,44,-48,-49,]),'LPAREN':([0,2,3,4,5,6,7,8,10,15,16,17,18,19,20,21,22,23,24,25,32,33,34,35,36,37,39,41,50,51,53,56,58,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[15,15,-3,-4,-5,-6,-7,-8,56,15,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,79,-47,81,82,15,15,15,-2,-10,15,15,100,56,-36,15,15,15,15,15,15,15,15,15,15,-101,-101,-123,15,122,15,-73,-74,-13,-14,15,-40,15,15,15,-25,15,-72,-9,-12,-88,15,15,-38,-24,-26,-43,-47,15,15,-43,15,-11,-41,15,-16,-39,-44,-45,-46,-39,-15,-123,15,-123,-64,-71,15,-42,15,-71,-123,-23,-23,-51,-123,15,15,15,-48,-49,]),'INT_LITERAL':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,57,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,188,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[12,12,-3,-4,-5,-6,-7,-8,12,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,12,12,12,-2,-10,12,12,98,-36,12,12,12,12,12,12,12,12,12,12,-101,-101,-123,12,12,-73,-74,-13,-14,12,-40,12,12,12,-25,12,-72,-9,-12,-88,12,12,-38,-24,-26,-43,-47,12,12,-43,12,-11,-41,12,-16,-39,-44,-45,-46,-39,197,-15,-123,12,-123,-64,-71,12,-42,12,-71,-123,-23,-23,-51,-123,12,12,12,-48,-49,]),'FLOAT_LITERAL':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,57,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[13,13,-3,-4,-5,-6,-7,-8,13,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,13,13,13,-2,-10,13,13,99,-36,13,13,13,13,13,13,13,13,13,13,-101,-101,-123,13,13,-73,-74,-13,-14,13,-40,13,13,13,-25,13,-72,-9,-12,-88,13,13,-38,-24,-26,-43,-47,13,13,-43,13,-11,-41,13,-16,-39,-44,-45,-46,-39,-15,-123,13,-123,-64,-71,13,-42,13,-71,-123,-23,-23,-51,-123,13,13,13,-48,-49,]),'CHAR_LITERAL':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[46,46,-3,-4,-5,-6,-7,-8,46,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,46,46,46,-2,-10,46,46,-36,46,46,46,46,46,46,46,46,46,46,-101,-101,-123,46,46,-73,-74,-13,-14,46,-40,46,46,46,-25,46,-72,-9,-12,-88,46,46,-38,-24,-26,-43,-47,46,46,-43,46,-11,-41,46,-16,-39,-44,-45,-46,-39,-15,-123,46,-123,-64,-71,46,-42,46,-71,-123,-23,-23,-51,-123,46,46,46,-48,-49,]),'STRING_LITERAL':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[47,47,-3,-4,-5,-6,-7,-8,47,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,47,47,47,-2,-10,47,47,-36,47,47,47,47,47,47,47,47,47,47,-101,-101,-123,47,47,-73,-74,-13,-14,47,-40,47,47,47,-25,47,-72,-9,-12,-88,47,47,-38,-24,-26,-43,-47,47,47,-43,47,-11,-41,47,-16,-39,-44,-45,-46,-39,-15,-123,47,-123,-64,-71,47,-42,47,-71,-123,-23,-23,-51,-123,47,47,47,-48,-49,]),'TRUE':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[48,48,-3,-4,-5,-6,-7,-8,48,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,48,48,48,-2,-10,48,48,-36,48,48,48,48,48,48,48,48,48,48,-101,-101,-123,48,48,-73,-74,-13,-14,48,-40,48,48,48,-25,48,-72,-9,-12,-88,48,48,-38,-24,-26,-43,-47,48,48,-43,48,-11,-41,48,-16,-39,-44,-45,-46,-39,-15,-123,48,-123,-64,-71,48,-42,48,-71,-123,-23,-23,-51,-123,48,48,48,-48,-49,]),'FALSE':([0,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,32,37,39,41,50,51,53,56,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,85,98,99,101,102,117,118,119,120,122,128,129,131,132,134,139,142,143,144,146,148,149,158,159,160,163,169,170,178,179,180,181,182,183,190,191,192,193,195,198,199,200,201,209,210,211,212,213,218,219,220,221,222,223,],[49,49,-3,-4,-5,-6,-7,-8,49,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,49,49,49,-2,-10,49,49,-36,49,49,49,49,49,49,49,49,49,49,-101,-101,-123,49,49,-73,-74,-13,-14,49,-40,49,49,49,-25,49,-72,-9,-12,-88,49,49,-38,-24,-26,-43,-47,49,49,-43,49,-11,-41,49,-16,-39,-44,-45,-46,-39,-15,-123,49,-123,-64,-71,49,-42,49,-71,-123,-23,-23,-51,-123,49,49,49,-48,-49,]),'$end':([0,1,2,3,4,5,6,7,8,16,17,18,19,20,21,22,23,24,25,50,51,65,84,85,98,99,102,128,129,131,132,142,144,163,169,178,181,182,190,195,200,211,212,222,223,],[-123,0,-1,-3,-4,-5,-6,-7,-8,-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-2,-10,-36,-73,-74,-13,-14,-40,-72,-9,-12,-88,-38,-26,-11,-41,-16,-45,-46,-15,-64,-42,-23,-23,-48,-49,]),'LT':([9,10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[52,-118,-112,-113,70,-111,-114,-115,-116,-117,-108,-109,70,-118,70,-102,-105,-103,-104,-106,-107,70,-120,70,-110,-89,-90,-91,-92,-93,-94,-95,-96,70,70,70,70,-119,70,70,70,70,70,70,70,70,]),'ASSIGN':([10,58,104,126,138,206,],[53,101,139,149,101,149,]),'PLUS':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[-118,-112,-113,66,-111,-114,-115,-116,-117,-108,-109,66,-118,66,-102,-105,-103,-104,-106,-107,66,-120,66,-110,-89,-90,-91,-92,66,66,66,66,66,66,66,66,-119,66,66,66,66,66,66,66,66,]),'DIVIDE':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[-118,-112,-113,69,-111,-114,-115,-116,-117,-108,-109,69,-118,69,69,-105,-103,-104,-106,-107,69,-120,69,-110,69,69,-91,-92,69,69,69,69,69,69,69,69,-119,69,69,69,69,69,69,69,69,]),'GT':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,93,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,151,152,157,161,172,],[-118,-112,-113,71,-111,-114,-115,-116,-117,-108,-109,71,-118,71,-102,-105,-103,-104,-106,-107,131,71,-120,71,-110,-89,-90,-91,-92,-93,-94,-95,-96,71,71,71,71,-119,71,71,71,71,163,71,71,71,71,]),'LE':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[-118,-112,-113,72,-111,-114,-115,-116,-117,-108,-109,72,-118,72,-102,-105,-103,-104,-106,-107,72,-120,72,-110,-89,-90,-91,-92,-93,-94,-95,-96,72,72,72,72,-119,72,72,72,72,72,72,72,72,]),'GE':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[-118,-112,-113,73,-111,-114,-115,-116,-117,-108,-109,73,-118,73,-102,-105,-103,-104,-106,-107,73,-120,73,-110,-89,-90,-91,-92,-93,-94,-95,-96,73,73,73,73,-119,73,73,73,73,73,73,73,73,]),'EQ':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[-118,-112,-113,74,-111,-114,-115,-116,-117,-108,-109,74,-118,74,-102,-105,-103,-104,-106,-107,74,-120,74,-110,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,74,74,-119,74,74,74,74,74,74,74,74,]),'NE':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[-118,-112,-113,75,-111,-114,-115,-116,-117,-108,-109,75,-118,75,-102,-105,-103,-104,-106,-107,75,-120,75,-110,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,75,75,-119,75,75,75,75,75,75,75,75,]),'AND':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[-118,-112,-113,76,-111,-114,-115,-116,-117,-108,-109,76,-118,76,-102,-105,-103,-104,-106,-107,76,-120,76,-110,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,76,76,-119,76,-99,76,76,76,76,76,76,]),'OR':([10,12,13,31,45,46,47,48,49,54,55,63,64,83,86,87,88,89,90,91,94,96,97,106,107,108,109,110,111,112,113,114,115,116,121,127,133,136,140,141,147,152,157,161,172,],[-118,-112,-113,77,-111,-114,-115,-116,-117,-108,-109,77,-118,77,-102,-105,-103,-104,-106,-107,77,-120,77,-110,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,77,77,-119,77,-99,-100,77,77,77,77,77,]),'RPAREN':([12,13,45,46,47,48,49,54,55,56,63,64,86,87,88,89,90,91,95,96,97,100,106,107,108,109,110,111,112,113,114,115,116,121,127,133,135,140,141,147,152,154,156,161,165,175,177,184,194,202,203,204,205,214,215,216,217,],[-112,-113,-111,-114,-115,-116,-117,-108,-109,96,106,-118,-102,-105,-103,-104,-106,-107,133,-120,-122,-17,-110,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,146,150,-119,155,-99,-100,159,-121,166,-20,-57,-22,-21,-19,-50,-123,213,-54,-55,-56,-58,-59,-60,-61,]),'COMMA':([12,13,45,46,47,48,49,54,55,58,59,60,64,86,87,88,89,90,91,95,96,97,104,106,107,108,109,110,111,112,113,114,115,116,133,136,137,138,140,141,152,154,156,157,165,175,177,],[-112,-113,-111,-114,-115,-116,-117,-108,-109,-87,103,-83,-118,-102,-105,-103,-104,-106,-107,134,-120,-122,-85,-110,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-119,-86,-82,-87,-99,-100,-121,167,-20,-84,-22,-21,-19,]),'RBRACE':([16,17,18,19,20,21,22,23,24,25,32,65,78,84,85,102,119,120,128,132,142,143,144,169,174,179,181,182,183,185,186,187,191,193,195,196,198,199,200,201,209,210,212,218,219,221,222,223,],[-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-39,-36,-123,-73,-74,-40,142,-25,-72,-88,-38,-24,-26,-41,-123,-39,-45,-46,-39,195,-67,-68,-123,-123,-64,-66,-71,211,-42,212,-71,-123,-23,-123,-70,-69,-48,-49,]),'ELSE':([16,17,18,19,20,21,22,23,24,25,65,84,85,102,128,132,142,144,169,181,182,195,200,212,222,223,],[-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-73,-74,-40,-72,-88,-38,-26,180,-45,-46,-64,-42,-23,-48,-49,]),'CASE':([16,17,18,19,20,21,22,23,24,25,65,84,85,102,120,128,132,142,143,144,169,174,181,182,185,186,187,195,196,198,200,209,210,212,218,219,221,222,223,],[-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-73,-74,-40,-25,-72,-88,-38,-24,-26,-41,188,-45,-46,188,-67,-68,-64,-66,-71,-42,-71,-123,-23,-123,-70,-69,-48,-49,]),'DEFAULT':([16,17,18,19,20,21,22,23,24,25,65,84,85,102,120,128,132,142,143,144,169,174,181,182,185,186,187,195,196,198,200,209,210,212,218,219,221,222,223,],[-37,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-73,-74,-40,-25,-72,-88,-38,-24,-26,-41,189,-45,-46,189,-67,-68,-64,-66,-71,-42,-71,-123,-23,-123,-70,-69,-48,-49,]),'DOT':([51,93,],[92,130,]),'COLON':([189,197,],[198,209,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'declarations_and_functions':([0,],[2,]),'declaration_or_function':([0,2,],[3,50,]),'empty':([0,78,81,149,169,174,176,177,196,204,],[4,120,125,167,180,120,120,189,120,120,]),'preprocessor':([0,2,],[5,5,]),'function_definition':([0,2,],[6,6,]),'declaration':([0,2,119,147,148,175,183,185,199,205,208,],[7,7,145,145,145,145,145,145,145,145,145,]),'statement':([0,2,119,147,148,175,183,185,199,205,208,],[8,8,144,161,162,184,144,144,206,144,144,]),'type':([0,2,100,119,147,148,157,175,183,185,199,205,208,],[14,14,135,146,146,146,135,146,146,146,146,146,146,]),'assignment':([0,2,119,147,148,175,183,185,199,205,208,],[17,17,17,17,17,17,17,17,17,17,17,]),'block':([0,2,119,147,148,175,183,185,199,205,208,],[18,18,18,18,18,18,18,18,18,18,18,]),'if_statement':([0,2,119,147,148,175,183,185,199,205,208,],[19,19,19,19,19,19,19,19,19,19,19,]),'while_statement':([0,2,119,147,148,175,183,185,199,205,208,],[20,20,20,20,20,20,20,20,20,20,20,]),'for_statement':([0,2,119,147,148,175,183,185,199,205,208,],[21,21,21,21,21,21,21,21,21,21,21,]),'switch_statement':([0,2,119,147,148,175,183,185,199,205,208,],[22,22,22,22,22,22,22,22,22,22,22,]),'return_statement':([0,2,119,147,148,175,183,185,199,205,208,],[23,23,23,23,23,23,23,23,23,23,23,]),'break_statement':([0,2,119,147,148,175,183,185,199,205,208,],[24,24,24,24,24,24,24,24,24,24,24,]),'expression_statement':([0,2,119,147,148,175,183,185,199,205,208,],[25,25,25,25,25,25,25,25,25,25,25,]),'expression':([0,2,15,37,39,41,53,56,66,67,68,69,70,71,72,73,74,75,76,77,79,80,82,101,119,134,142,147,148,149,150,175,183,185,199,205,208,],[31,31,63,83,86,88,94,97,107,108,109,110,111,112,113,114,115,116,117,118,121,122,127,139,31,153,160,31,31,166,168,31,31,31,31,31,31,]),'factor':([0,2,15,37,39,41,53,56,66,67,68,69,70,71,72,73,74,75,76,77,79,80,82,101,119,134,142,147,148,149,150,175,183,185,199,205,208,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'ID_list':([14,146,],[59,59,]),'declarator':([14,103,146,],[60,140,60,]),'pointer_declarator':([14,62,103,135,146,],[61,105,61,154,61,]),'scope_enter':([32,159,164,],[78,174,176,]),'argument_list':([56,],[95,]),'statements':([78,174,176,196,204,],[119,183,185,205,208,]),'for_init':([81,],[123,]),'assignment_expr':([81,177,],[124,187,]),'parameter_list':([100,],[136,]),'parameter':([100,157,],[138,173,]),'compound_statement':([137,148,156,199,],[158,163,172,207,]),'expression_opt':([149,],[165,]),'case_list':([169,],[178,]),'case_clause':([169,178,],[179,194,]),'for_update':([177,],[186,]),'unary_expr':([177,],[188,]),}
+_lr_goto_items = {'program':([0,],[1,]),'declarations_and_functions':([0,],[2,]),'declaration_or_function':([0,2,],[3,50,]),'empty':([0,78,81,160,174,191,193,194,210,218,],[4,120,125,173,187,120,120,205,120,120,]),'preprocessor':([0,2,],[5,5,]),'function_definition':([0,2,],[6,6,]),'declaration':([0,2,119,158,170,192,199,201,219,220,221,],[7,7,144,144,144,144,144,144,144,144,144,]),'statement':([0,2,119,158,170,192,199,201,219,220,221,],[8,8,143,169,181,200,143,143,143,222,143,]),'type':([0,2,119,135,158,167,170,192,199,201,219,220,221,],[14,14,145,153,145,153,145,145,145,145,145,145,145,]),'assignment':([0,2,119,158,170,192,199,201,219,220,221,],[17,17,17,17,17,17,17,17,17,17,17,]),'block':([0,2,119,158,170,192,199,201,219,220,221,],[18,18,18,18,18,18,18,18,18,18,18,]),'if_statement':([0,2,119,158,170,192,199,201,219,220,221,],[19,19,19,19,19,19,19,19,19,19,19,]),'while_statement':([0,2,119,158,170,192,199,201,219,220,221,],[20,20,20,20,20,20,20,20,20,20,20,]),'for_statement':([0,2,119,158,170,192,199,201,219,220,221,],[21,21,21,21,21,21,21,21,21,21,21,]),'switch_statement':([0,2,119,158,170,192,199,201,219,220,221,],[22,22,22,22,22,22,22,22,22,22,22,]),'return_statement':([0,2,119,158,170,192,199,201,219,220,221,],[23,23,23,23,23,23,23,23,23,23,23,]),'break_statement':([0,2,119,158,170,192,199,201,219,220,221,],[24,24,24,24,24,24,24,24,24,24,24,]),'expression_statement':([0,2,119,158,170,192,199,201,219,220,221,],[25,25,25,25,25,25,25,25,25,25,25,]),'expression':([0,2,15,37,39,41,53,56,66,67,68,69,70,71,72,73,74,75,79,82,101,117,118,119,122,134,139,149,158,160,170,192,199,201,219,220,221,],[31,31,63,83,86,88,94,97,107,108,109,110,111,112,113,114,115,116,121,127,136,140,141,31,147,152,157,161,31,172,31,31,31,31,31,31,31,]),'factor':([0,2,15,37,39,41,53,56,66,67,68,69,70,71,72,73,74,75,79,82,101,117,118,119,122,134,139,149,158,160,170,192,199,201,219,220,221,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'ID_list':([14,145,],[59,59,]),'declarator':([14,103,145,],[60,137,60,]),'pointer_declarator':([14,62,103,145,153,],[61,105,61,61,164,]),'scope_enter':([32,179,183,],[78,191,193,]),'loop_start':([34,148,],[80,160,]),'argument_list':([56,],[95,]),'logical_marker':([76,77,],[117,118,]),'statements':([78,191,193,210,218,],[119,199,201,219,221,]),'for_init':([81,],[123,]),'assignment_expr':([81,194,],[124,203,]),'function_scope':([100,],[135,]),'parameter_list':([135,],[154,]),'parameter':([135,167,],[156,177,]),'condition_marker':([146,159,],[158,170,]),'switch_start':([150,],[162,]),'function_start':([155,166,],[168,176,]),'expression_opt':([160,],[171,]),'compound_statement':([168,170,176,220,],[178,182,190,223,]),'case_list':([174,],[185,]),'case_clause':([174,185,],[186,196,]),'else_marker':([180,],[192,]),'for_condition':([184,],[194,]),'for_update':([194,],[202,]),'unary_expr':([194,],[204,]),'case_start':([198,209,],[210,218,]),'for_body':([213,],[220,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,117 +27,127 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> declarations_and_functions','program',1,'p_program','parser.py',20),
-  ('declarations_and_functions -> declarations_and_functions declaration_or_function','declarations_and_functions',2,'p_declarations_and_functions','parser.py',24),
-  ('declarations_and_functions -> declaration_or_function','declarations_and_functions',1,'p_declarations_and_functions','parser.py',25),
-  ('declarations_and_functions -> empty','declarations_and_functions',1,'p_declarations_and_functions','parser.py',26),
-  ('declaration_or_function -> preprocessor','declaration_or_function',1,'p_declaration_or_function','parser.py',30),
-  ('declaration_or_function -> function_definition','declaration_or_function',1,'p_declaration_or_function','parser.py',31),
-  ('declaration_or_function -> declaration','declaration_or_function',1,'p_declaration_or_function','parser.py',32),
-  ('declaration_or_function -> statement','declaration_or_function',1,'p_declaration_or_function','parser.py',33),
-  ('preprocessor -> INCLUDE ID DOT ID','preprocessor',4,'p_preprocessor','parser.py',38),
-  ('preprocessor -> INCLUDE ID','preprocessor',2,'p_preprocessor','parser.py',39),
-  ('preprocessor -> INCLUDE LT ID DOT ID GT','preprocessor',6,'p_preprocessor','parser.py',40),
-  ('preprocessor -> INCLUDE LT ID GT','preprocessor',4,'p_preprocessor','parser.py',41),
-  ('preprocessor -> DEFINE ID INT_LITERAL','preprocessor',3,'p_preprocessor','parser.py',42),
-  ('preprocessor -> DEFINE ID FLOAT_LITERAL','preprocessor',3,'p_preprocessor','parser.py',43),
-  ('function_definition -> type ID LPAREN parameter_list RPAREN compound_statement','function_definition',6,'p_function_definition','parser.py',48),
-  ('function_definition -> type ID LPAREN RPAREN compound_statement','function_definition',5,'p_function_definition','parser.py',49),
-  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','parser.py',56),
-  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','parser.py',57),
-  ('parameter -> type pointer_declarator ID','parameter',3,'p_parameter','parser.py',61),
-  ('parameter -> type ID','parameter',2,'p_parameter','parser.py',62),
-  ('compound_statement -> LBRACE scope_enter statements RBRACE','compound_statement',4,'p_compound_statement','parser.py',77),
-  ('statements -> statements statement','statements',2,'p_statements','parser.py',81),
-  ('statements -> empty','statements',1,'p_statements','parser.py',82),
-  ('statement -> declaration','statement',1,'p_statement','parser.py',86),
-  ('statement -> assignment','statement',1,'p_statement','parser.py',87),
-  ('statement -> block','statement',1,'p_statement','parser.py',88),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',89),
-  ('statement -> while_statement','statement',1,'p_statement','parser.py',90),
-  ('statement -> for_statement','statement',1,'p_statement','parser.py',91),
-  ('statement -> switch_statement','statement',1,'p_statement','parser.py',92),
-  ('statement -> return_statement','statement',1,'p_statement','parser.py',93),
-  ('statement -> break_statement','statement',1,'p_statement','parser.py',94),
-  ('statement -> expression_statement','statement',1,'p_statement','parser.py',95),
-  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser.py',99),
-  ('expression_statement -> SEMICOLON','expression_statement',1,'p_expression_statement','parser.py',100),
-  ('block -> LBRACE scope_enter statements RBRACE','block',4,'p_block','parser.py',105),
-  ('scope_enter -> <empty>','scope_enter',0,'p_scope_enter','parser.py',111),
-  ('declaration -> type ID_list SEMICOLON','declaration',3,'p_declaration','parser.py',118),
-  ('if_statement -> IF LPAREN expression RPAREN statement','if_statement',5,'p_if_statement','parser.py',133),
-  ('if_statement -> IF LPAREN expression RPAREN statement ELSE statement','if_statement',7,'p_if_statement','parser.py',134),
-  ('while_statement -> WHILE LPAREN expression RPAREN statement','while_statement',5,'p_while_statement','parser.py',138),
-  ('while_statement -> WHILE LPAREN expression RPAREN compound_statement','while_statement',5,'p_while_statement','parser.py',139),
-  ('for_statement -> FOR LPAREN for_init SEMICOLON expression_opt SEMICOLON for_update RPAREN statement','for_statement',9,'p_for_statement','parser.py',143),
-  ('for_statement -> FOR LPAREN for_init SEMICOLON expression_opt SEMICOLON for_update RPAREN compound_statement','for_statement',9,'p_for_statement','parser.py',144),
-  ('for_init -> assignment_expr','for_init',1,'p_for_init','parser.py',148),
-  ('for_init -> empty','for_init',1,'p_for_init','parser.py',149),
-  ('for_update -> assignment_expr','for_update',1,'p_for_update','parser.py',153),
-  ('for_update -> unary_expr','for_update',1,'p_for_update','parser.py',154),
-  ('for_update -> empty','for_update',1,'p_for_update','parser.py',155),
-  ('assignment_expr -> ID ASSIGN expression','assignment_expr',3,'p_assignment_expr','parser.py',159),
-  ('unary_expr -> ID PLUSPLUS','unary_expr',2,'p_unary_expr','parser.py',172),
-  ('unary_expr -> ID MINUSMINUS','unary_expr',2,'p_unary_expr','parser.py',173),
-  ('unary_expr -> PLUSPLUS ID','unary_expr',2,'p_unary_expr','parser.py',174),
-  ('unary_expr -> MINUSMINUS ID','unary_expr',2,'p_unary_expr','parser.py',175),
-  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','parser.py',179),
-  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','parser.py',180),
-  ('switch_statement -> SWITCH LPAREN expression RPAREN LBRACE case_list RBRACE','switch_statement',7,'p_switch_statement','parser.py',187),
-  ('case_list -> case_list case_clause','case_list',2,'p_case_list','parser.py',191),
-  ('case_list -> case_clause','case_list',1,'p_case_list','parser.py',192),
-  ('case_list -> empty','case_list',1,'p_case_list','parser.py',193),
-  ('case_clause -> CASE INT_LITERAL COLON statements','case_clause',4,'p_case_clause','parser.py',197),
-  ('case_clause -> DEFAULT COLON statements','case_clause',3,'p_case_clause','parser.py',198),
-  ('return_statement -> RETURN expression SEMICOLON','return_statement',3,'p_return_statement','parser.py',202),
-  ('return_statement -> RETURN SEMICOLON','return_statement',2,'p_return_statement','parser.py',203),
-  ('break_statement -> BREAK SEMICOLON','break_statement',2,'p_break_statement','parser.py',207),
-  ('type -> INT','type',1,'p_type','parser.py',211),
-  ('type -> FLOAT','type',1,'p_type','parser.py',212),
-  ('type -> CHAR','type',1,'p_type','parser.py',213),
-  ('type -> BOOLEAN','type',1,'p_type','parser.py',214),
-  ('type -> VOID','type',1,'p_type','parser.py',215),
-  ('pointer_declarator -> TIMES pointer_declarator','pointer_declarator',2,'p_pointer_declarator','parser.py',219),
-  ('pointer_declarator -> TIMES','pointer_declarator',1,'p_pointer_declarator','parser.py',220),
-  ('ID_list -> ID_list COMMA declarator','ID_list',3,'p_ID_list','parser.py',227),
-  ('ID_list -> declarator','ID_list',1,'p_ID_list','parser.py',228),
-  ('declarator -> pointer_declarator ID ASSIGN expression','declarator',4,'p_declarator','parser.py',235),
-  ('declarator -> pointer_declarator ID','declarator',2,'p_declarator','parser.py',236),
-  ('declarator -> ID ASSIGN expression','declarator',3,'p_declarator','parser.py',237),
-  ('declarator -> ID','declarator',1,'p_declarator','parser.py',238),
-  ('assignment -> ID ASSIGN expression SEMICOLON','assignment',4,'p_assignment','parser.py',250),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','parser.py',271),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','parser.py',272),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','parser.py',273),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','parser.py',274),
-  ('expression -> expression LT expression','expression',3,'p_expression_binop','parser.py',275),
-  ('expression -> expression GT expression','expression',3,'p_expression_binop','parser.py',276),
-  ('expression -> expression LE expression','expression',3,'p_expression_binop','parser.py',277),
-  ('expression -> expression GE expression','expression',3,'p_expression_binop','parser.py',278),
-  ('expression -> expression EQ expression','expression',3,'p_expression_binop','parser.py',279),
-  ('expression -> expression NE expression','expression',3,'p_expression_binop','parser.py',280),
-  ('expression -> expression AND expression','expression',3,'p_expression_binop','parser.py',281),
-  ('expression -> expression OR expression','expression',3,'p_expression_binop','parser.py',282),
-  ('expression -> MINUS expression','expression',2,'p_expression_unary','parser.py',303),
-  ('expression -> NOT expression','expression',2,'p_expression_unary','parser.py',304),
-  ('expression -> AMPERSAND ID','expression',2,'p_expression_unary','parser.py',305),
-  ('expression -> TIMES ID','expression',2,'p_expression_unary','parser.py',306),
-  ('expression -> PLUSPLUS ID','expression',2,'p_expression_unary','parser.py',307),
-  ('expression -> MINUSMINUS ID','expression',2,'p_expression_unary','parser.py',308),
-  ('expression -> ID PLUSPLUS','expression',2,'p_expression_unary','parser.py',309),
-  ('expression -> ID MINUSMINUS','expression',2,'p_expression_unary','parser.py',310),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',335),
-  ('expression -> factor','expression',1,'p_expression_factor','parser.py',339),
-  ('factor -> INT_LITERAL','factor',1,'p_factor_num','parser.py',344),
-  ('factor -> FLOAT_LITERAL','factor',1,'p_factor_num','parser.py',345),
-  ('factor -> CHAR_LITERAL','factor',1,'p_factor_num','parser.py',346),
-  ('factor -> STRING_LITERAL','factor',1,'p_factor_num','parser.py',347),
-  ('factor -> TRUE','factor',1,'p_factor_num','parser.py',348),
-  ('factor -> FALSE','factor',1,'p_factor_num','parser.py',349),
-  ('factor -> ID','factor',1,'p_factor_id','parser.py',360),
-  ('factor -> ID LPAREN argument_list RPAREN','factor',4,'p_factor_function_call','parser.py',371),
-  ('factor -> ID LPAREN RPAREN','factor',3,'p_factor_function_call','parser.py',372),
-  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','parser.py',378),
-  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',379),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',384),
+  ('program -> declarations_and_functions','program',1,'p_program','parser.py',35),
+  ('declarations_and_functions -> declarations_and_functions declaration_or_function','declarations_and_functions',2,'p_declarations_and_functions','parser.py',39),
+  ('declarations_and_functions -> declaration_or_function','declarations_and_functions',1,'p_declarations_and_functions','parser.py',40),
+  ('declarations_and_functions -> empty','declarations_and_functions',1,'p_declarations_and_functions','parser.py',41),
+  ('declaration_or_function -> preprocessor','declaration_or_function',1,'p_declaration_or_function','parser.py',45),
+  ('declaration_or_function -> function_definition','declaration_or_function',1,'p_declaration_or_function','parser.py',46),
+  ('declaration_or_function -> declaration','declaration_or_function',1,'p_declaration_or_function','parser.py',47),
+  ('declaration_or_function -> statement','declaration_or_function',1,'p_declaration_or_function','parser.py',48),
+  ('preprocessor -> INCLUDE ID DOT ID','preprocessor',4,'p_preprocessor','parser.py',53),
+  ('preprocessor -> INCLUDE ID','preprocessor',2,'p_preprocessor','parser.py',54),
+  ('preprocessor -> INCLUDE LT ID DOT ID GT','preprocessor',6,'p_preprocessor','parser.py',55),
+  ('preprocessor -> INCLUDE LT ID GT','preprocessor',4,'p_preprocessor','parser.py',56),
+  ('preprocessor -> DEFINE ID INT_LITERAL','preprocessor',3,'p_preprocessor','parser.py',57),
+  ('preprocessor -> DEFINE ID FLOAT_LITERAL','preprocessor',3,'p_preprocessor','parser.py',58),
+  ('function_definition -> type ID LPAREN function_scope parameter_list RPAREN function_start compound_statement','function_definition',8,'p_function_definition','parser.py',63),
+  ('function_definition -> type ID LPAREN function_scope RPAREN function_start compound_statement','function_definition',7,'p_function_definition','parser.py',64),
+  ('function_scope -> <empty>','function_scope',0,'p_function_scope','parser.py',75),
+  ('function_start -> <empty>','function_start',0,'p_function_start','parser.py',80),
+  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','parser.py',99),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','parser.py',100),
+  ('parameter -> type pointer_declarator ID','parameter',3,'p_parameter','parser.py',107),
+  ('parameter -> type ID','parameter',2,'p_parameter','parser.py',108),
+  ('compound_statement -> LBRACE scope_enter statements RBRACE','compound_statement',4,'p_compound_statement','parser.py',125),
+  ('statements -> statements statement','statements',2,'p_statements','parser.py',129),
+  ('statements -> empty','statements',1,'p_statements','parser.py',130),
+  ('statement -> declaration','statement',1,'p_statement','parser.py',134),
+  ('statement -> assignment','statement',1,'p_statement','parser.py',135),
+  ('statement -> block','statement',1,'p_statement','parser.py',136),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',137),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',138),
+  ('statement -> for_statement','statement',1,'p_statement','parser.py',139),
+  ('statement -> switch_statement','statement',1,'p_statement','parser.py',140),
+  ('statement -> return_statement','statement',1,'p_statement','parser.py',141),
+  ('statement -> break_statement','statement',1,'p_statement','parser.py',142),
+  ('statement -> expression_statement','statement',1,'p_statement','parser.py',143),
+  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser.py',147),
+  ('expression_statement -> SEMICOLON','expression_statement',1,'p_expression_statement','parser.py',148),
+  ('block -> LBRACE scope_enter statements RBRACE','block',4,'p_block','parser.py',154),
+  ('scope_enter -> <empty>','scope_enter',0,'p_scope_enter','parser.py',160),
+  ('declaration -> type ID_list SEMICOLON','declaration',3,'p_declaration','parser.py',167),
+  ('if_statement -> IF LPAREN expression RPAREN condition_marker statement','if_statement',6,'p_if_statement','parser.py',189),
+  ('if_statement -> IF LPAREN expression RPAREN condition_marker statement ELSE else_marker statement','if_statement',9,'p_if_statement','parser.py',190),
+  ('condition_marker -> <empty>','condition_marker',0,'p_condition_marker','parser.py',199),
+  ('else_marker -> <empty>','else_marker',0,'p_else_marker','parser.py',209),
+  ('while_statement -> WHILE loop_start LPAREN expression RPAREN condition_marker statement','while_statement',7,'p_while_statement','parser.py',218),
+  ('while_statement -> WHILE loop_start LPAREN expression RPAREN condition_marker compound_statement','while_statement',7,'p_while_statement','parser.py',219),
+  ('loop_start -> <empty>','loop_start',0,'p_loop_start','parser.py',230),
+  ('for_statement -> FOR LPAREN for_init SEMICOLON loop_start expression_opt SEMICOLON for_condition for_update RPAREN for_body statement','for_statement',12,'p_for_statement','parser.py',238),
+  ('for_statement -> FOR LPAREN for_init SEMICOLON loop_start expression_opt SEMICOLON for_condition for_update RPAREN for_body compound_statement','for_statement',12,'p_for_statement','parser.py',239),
+  ('for_condition -> <empty>','for_condition',0,'p_for_condition','parser.py',249),
+  ('for_body -> <empty>','for_body',0,'p_for_body','parser.py',260),
+  ('for_init -> assignment_expr','for_init',1,'p_for_init','parser.py',269),
+  ('for_init -> empty','for_init',1,'p_for_init','parser.py',270),
+  ('for_update -> assignment_expr','for_update',1,'p_for_update','parser.py',274),
+  ('for_update -> unary_expr','for_update',1,'p_for_update','parser.py',275),
+  ('for_update -> empty','for_update',1,'p_for_update','parser.py',276),
+  ('assignment_expr -> ID ASSIGN expression','assignment_expr',3,'p_assignment_expr','parser.py',280),
+  ('unary_expr -> ID PLUSPLUS','unary_expr',2,'p_unary_expr','parser.py',293),
+  ('unary_expr -> ID MINUSMINUS','unary_expr',2,'p_unary_expr','parser.py',294),
+  ('unary_expr -> PLUSPLUS ID','unary_expr',2,'p_unary_expr','parser.py',295),
+  ('unary_expr -> MINUSMINUS ID','unary_expr',2,'p_unary_expr','parser.py',296),
+  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','parser.py',303),
+  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','parser.py',304),
+  ('switch_statement -> SWITCH LPAREN expression RPAREN switch_start LBRACE case_list RBRACE','switch_statement',8,'p_switch_statement','parser.py',311),
+  ('switch_start -> <empty>','switch_start',0,'p_switch_start','parser.py',333),
+  ('case_list -> case_list case_clause','case_list',2,'p_case_list','parser.py',342),
+  ('case_list -> case_clause','case_list',1,'p_case_list','parser.py',343),
+  ('case_list -> empty','case_list',1,'p_case_list','parser.py',344),
+  ('case_clause -> CASE INT_LITERAL COLON case_start statements','case_clause',5,'p_case_clause','parser.py',348),
+  ('case_clause -> DEFAULT COLON case_start statements','case_clause',4,'p_case_clause','parser.py',349),
+  ('case_start -> <empty>','case_start',0,'p_case_start','parser.py',353),
+  ('return_statement -> RETURN expression SEMICOLON','return_statement',3,'p_return_statement','parser.py',363),
+  ('return_statement -> RETURN SEMICOLON','return_statement',2,'p_return_statement','parser.py',364),
+  ('break_statement -> BREAK SEMICOLON','break_statement',2,'p_break_statement','parser.py',369),
+  ('type -> INT','type',1,'p_type','parser.py',379),
+  ('type -> FLOAT','type',1,'p_type','parser.py',380),
+  ('type -> CHAR','type',1,'p_type','parser.py',381),
+  ('type -> BOOLEAN','type',1,'p_type','parser.py',382),
+  ('type -> VOID','type',1,'p_type','parser.py',383),
+  ('pointer_declarator -> TIMES pointer_declarator','pointer_declarator',2,'p_pointer_declarator','parser.py',387),
+  ('pointer_declarator -> TIMES','pointer_declarator',1,'p_pointer_declarator','parser.py',388),
+  ('ID_list -> ID_list COMMA declarator','ID_list',3,'p_ID_list','parser.py',396),
+  ('ID_list -> declarator','ID_list',1,'p_ID_list','parser.py',397),
+  ('declarator -> pointer_declarator ID ASSIGN expression','declarator',4,'p_declarator','parser.py',404),
+  ('declarator -> pointer_declarator ID','declarator',2,'p_declarator','parser.py',405),
+  ('declarator -> ID ASSIGN expression','declarator',3,'p_declarator','parser.py',406),
+  ('declarator -> ID','declarator',1,'p_declarator','parser.py',407),
+  ('assignment -> ID ASSIGN expression SEMICOLON','assignment',4,'p_assignment','parser.py',422),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','parser.py',443),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','parser.py',444),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','parser.py',445),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','parser.py',446),
+  ('expression -> expression LT expression','expression',3,'p_expression_binop','parser.py',447),
+  ('expression -> expression GT expression','expression',3,'p_expression_binop','parser.py',448),
+  ('expression -> expression LE expression','expression',3,'p_expression_binop','parser.py',449),
+  ('expression -> expression GE expression','expression',3,'p_expression_binop','parser.py',450),
+  ('expression -> expression EQ expression','expression',3,'p_expression_binop','parser.py',451),
+  ('expression -> expression NE expression','expression',3,'p_expression_binop','parser.py',452),
+  ('expression -> expression AND logical_marker expression','expression',4,'p_expression_logical','parser.py',481),
+  ('expression -> expression OR logical_marker expression','expression',4,'p_expression_logical','parser.py',482),
+  ('logical_marker -> <empty>','logical_marker',0,'p_logical_marker','parser.py',493),
+  ('expression -> MINUS expression','expression',2,'p_expression_unary','parser.py',507),
+  ('expression -> NOT expression','expression',2,'p_expression_unary','parser.py',508),
+  ('expression -> AMPERSAND ID','expression',2,'p_expression_unary','parser.py',509),
+  ('expression -> TIMES ID','expression',2,'p_expression_unary','parser.py',510),
+  ('expression -> PLUSPLUS ID','expression',2,'p_expression_unary','parser.py',511),
+  ('expression -> MINUSMINUS ID','expression',2,'p_expression_unary','parser.py',512),
+  ('expression -> ID PLUSPLUS','expression',2,'p_expression_unary','parser.py',513),
+  ('expression -> ID MINUSMINUS','expression',2,'p_expression_unary','parser.py',514),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',567),
+  ('expression -> factor','expression',1,'p_expression_factor','parser.py',571),
+  ('factor -> INT_LITERAL','factor',1,'p_factor_num','parser.py',576),
+  ('factor -> FLOAT_LITERAL','factor',1,'p_factor_num','parser.py',577),
+  ('factor -> CHAR_LITERAL','factor',1,'p_factor_num','parser.py',578),
+  ('factor -> STRING_LITERAL','factor',1,'p_factor_num','parser.py',579),
+  ('factor -> TRUE','factor',1,'p_factor_num','parser.py',580),
+  ('factor -> FALSE','factor',1,'p_factor_num','parser.py',581),
+  ('factor -> ID','factor',1,'p_factor_id','parser.py',595),
+  ('factor -> ID LPAREN argument_list RPAREN','factor',4,'p_factor_function_call','parser.py',606),
+  ('factor -> ID LPAREN RPAREN','factor',3,'p_factor_function_call','parser.py',607),
+  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','parser.py',621),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',622),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',630),
 ]
@@ -0,0 +1,518 @@
+"""
+Preprocesador a nivel de tokens, entre el lexer y el parser.
+
+Las directivas llegan del lexer como tokens (INCLUDE, DEFINE) y ocupan el
+resto de su línea:
+
+    #define LIMITE 100
+    #define MAX(a, b) a > b
+    #include "util.h"          (directorio del archivo y después include_path)
+    #include <util.h>          (solo include_path)
+    #include util.h
+
+Las macros se expanden sobre los tokens, con conjuntos de ocultación como en
+C: una macro no se vuelve a expandir dentro de su propia expansión, y los
+argumentos de una macro con parámetros se expanden antes de sustituirlos.
+Una macro con parámetros exige el '(' pegado al nombre en el #define.
+
+Cada cabecera se incluye una sola vez por unidad (no hay #ifndef para
+guardas). Sus tokens se guardan en HeaderCache por el hash de su contenido,
+así que una cabecera compartida por muchas unidades se tokeniza una vez por
+proceso. La caché está acotada (MAX_HEADERS, las menos usadas salen primero)
+y al cambiar una cabecera se descartan los tokens de su contenido anterior,
+para que un proceso de larga vida (daemon, modo vigilancia) no crezca con
+cada edición.
+"""
+import hashlib
+import os
+
+from ply.lex import LexToken
+
+from dfa_lexer import scan
+from source_map import token_end
+from diagnostics import DiagnosticSink
+
+NO_HIDE = frozenset()
+MAX_HEADERS = 512               # contenidos de cabecera distintos en la caché
+
+
+def spelling(tok):
+    """Texto fuente de un token (las cadenas y caracteres recuperan sus comillas)."""
+    if tok.type == 'STRING_LITERAL':
+        return f'"{tok.value}"'
+    if tok.type == 'CHAR_LITERAL':
+        return f"'{tok.value}'"
+    return str(tok.value)
+
+
+class Macro:
+    """Macro definida con #define; params es None en las macros sin parámetros."""
+    def __init__(self, name, params, body):
+        self.name = name
+        self.params = params
+        self.body = body        # tupla de (tipo, valor)
+        self.index = {param: i for i, param in enumerate(params or ())}
+
+    def same_as(self, other):
+        return self.params == other.params and self.body == other.body
+
+    def __repr__(self):
+        params = '' if self.params is None else '(' + ', '.join(self.params) + ')'
+        return f"Macro({self.name}{params}, {len(self.body)} tokens)"
+
+
+class HeaderCache:
+    """
+    Tokens de las cabeceras indexados por el hash de su contenido. Para no
+    releer un archivo sin cambios se recuerda el hash de cada ruta junto a su
+    mtime y tamaño. `streams` se mantiene en orden de uso: al superar
+    `max_headers` se descarta la entrada usada hace más tiempo.
+    """
+    def __init__(self, max_headers=MAX_HEADERS):
+        self.streams = {}       # hash -> (tokens, diagnósticos léxicos), en orden de uso
+        self.files = {}         # ruta -> (mtime_ns, tamaño, hash)
+        self.max_headers = max_headers
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def digest(self, path):
+        """Hash del contenido de `path`; solo se relee si cambió su mtime o tamaño."""
+        return self._digest(path)[0]
+
+    def _digest(self, path):
+        info = os.stat(path)
+        known = self.files.get(path)
+        if known is not None and known[:2] == (info.st_mtime_ns, info.st_size):
+            return known[2], None
+        with open(path, encoding='utf-8') as f:
+            data = f.read()
+        digest = hashlib.blake2b(data.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        self.files[path] = (info.st_mtime_ns, info.st_size, digest)
+        if known is not None and known[2] != digest:
+            self._forget(known[2])
+        return digest, data
+
+    def _forget(self, digest):
+        """Descarta los tokens de un contenido que ya no tiene ninguna ruta."""
+        if digest in self.streams and not any(entry[2] == digest for entry in self.files.values()):
+            del self.streams[digest]
+            self.evictions += 1
+
+    def load(self, path):
+        """
+        Devuelve (hash, tokens, diagnósticos) de la cabecera en `path`; los
+        tokens son tuplas (tipo, valor, línea, posición) ya decodificadas.
+        """
+        digest, data = self._digest(path)
+        entry = self.streams.pop(digest, None)
+        if entry is None:
+            if data is None:
+                with open(path, encoding='utf-8') as f:
+                    data = f.read()
+            self.misses += 1
+            sink = DiagnosticSink()
+            stream, _ = scan(data, sink)
+            tokens = tuple((stream.type_name(i), stream.value(i), stream.lines[i], stream.starts[i])
+                           for i in range(len(stream)))
+            entry = (tokens, list(sink))
+            while len(self.streams) >= self.max_headers:
+                del self.streams[next(iter(self.streams))]
+                self.evictions += 1
+        else:
+            self.hits += 1
+        # Al final del dict: el más reciente
+        self.streams[digest] = entry
+        return (digest,) + entry
+
+    def clear(self):
+        self.streams.clear()
+        self.files.clear()
+
+    def __repr__(self):
+        return (f"HeaderCache({len(self.streams)} cabeceras, {self.hits} aciertos, "
+                f"{self.misses} fallos, {self.evictions} descartes)")
+
+
+# Caché compartida por todas las sesiones del proceso
+header_cache = HeaderCache()
+
+
+class _LexerSource:
+    """Tokens del archivo principal, leídos del lexer de la sesión."""
+    def __init__(self, lexer, directory):
+        self.lexer = lexer
+        self.directory = directory
+        self.back = []
+
+    def next(self):
+        if self.back:
+            return self.back.pop()
+        return self.lexer.token()
+
+
+class _HeaderSource:
+    """Tokens de una cabecera ya escaneada (tuplas de HeaderCache)."""
+    def __init__(self, tokens, path, owner):
+        self.tokens = tokens
+        self.directory = os.path.dirname(path)
+        self.owner = owner
+        self.back = []
+        self._next = 0
+
+    def next(self):
+        if self.back:
+            return self.back.pop()
+        i = self._next
+        if i >= len(self.tokens):
+            return None
+        self._next = i + 1
+        tok = LexToken()
+        tok.type, tok.value, tok.lineno, tok.lexpos = self.tokens[i]
+        tok.endlexpos = -1          # fuera del texto principal (ver source_map.py)
+        tok.lexer = self.owner
+        return tok
+
+
+class _ListReader:
+    """Lectura de una lista de (token, ocultación); se usa al expandir argumentos."""
+    def __init__(self, items):
+        self.items = items[::-1]
+
+    def next(self):
+        return self.items.pop() if self.items else None
+
+    def push(self, items):
+        self.items.extend(reversed(items))
+
+
+class Preprocessor:
+    """
+    Lexer con la interfaz de PLY (input/token) que envuelve a otro lexer y
+    entrega al parser los tokens ya preprocesados. Las acciones semánticas
+    leen diagnostics/symbol_table/gen de este objeto, como de cualquier lexer.
+    """
+    def __init__(self, lexer, include_path=(), defines=None, origin=None, cache=None):
+        self.lexer = lexer
+        self.include_path = list(include_path)
+        self.cache = header_cache if cache is None else cache
+        self.diagnostics = getattr(lexer, 'diagnostics', None)
+        self.macros = {}
+        self.includes = []              # cabeceras incluidas, en orden
+        self.probes = []                # rutas probadas que no existían (la caché las vigila)
+        self.lineno = lexer.lineno
+        self.lexpos = 0
+        if origin and os.path.isfile(origin):
+            directory = os.path.dirname(os.path.abspath(origin))
+        else:
+            directory = os.getcwd()
+        self._sources = [_LexerSource(lexer, directory)]
+        self._pending = []
+        self._included = set()
+        for name, text in (defines or {}).items():
+            self.define(name, text)
+
+    def define(self, name, text='1'):
+        """Define una macro sin parámetros desde fuera del código (como -DNOMBRE=texto)."""
+        stream, _ = scan(str(text), DiagnosticSink())
+        body = tuple((stream.type_name(i), stream.value(i)) for i in range(len(stream)))
+        self.macros[name] = Macro(name, None, body)
+
+    # --- Interfaz de lexer ---
+    def input(self, data):
+        self.lexer.input(data)
+
+    def token(self):
+        item = self._expanded(self)
+        if item is None:
+            self.lineno = self.lexer.lineno
+            self.lexpos = self.lexer.lexpos
+            return None
+        tok = item[0]
+        self.lineno = tok.lineno
+        self.lexpos = tok.lexpos
+        return tok
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
+
+    # --- Lectura de tokens sin expandir ---
+    def next(self):
+        """Siguiente (token, ocultación) de la entrada; procesa las directivas."""
+        if self._pending:
+            return self._pending.pop()
+        sources = self._sources
+        while sources:
+            source = sources[-1]
+            tok = source.next()
+            if tok is None:
+                sources.pop()
+            elif tok.type == 'DEFINE' or tok.type == 'INCLUDE':
+                self._directive(tok, source)
+            else:
+                return tok, NO_HIDE
+        return None
+
+    def push(self, items):
+        self._pending.extend(reversed(items))
+
+    # --- Directivas ---
+    def _directive(self, tok, source):
+        args = []
+        while True:
+            following = source.next()
+            if following is None:
+                break
+            if following.lineno != tok.lineno:
+                source.back.append(following)
+                break
+            args.append(following)
+        if tok.type == 'DEFINE':
+            self._define(tok, args)
+        else:
+            self._include(tok, args, source)
+
+    def _define(self, tok, args):
+        if not args or args[0].type != 'ID':
+            self.diagnostics.error('D002', "#define sin nombre de macro", line=tok.lineno)
+            return
+        name = args[0]
+        params = None
+        body = args[1:]
+        if body and body[0].type == 'LPAREN' and body[0].lexpos == name.lexpos + len(name.value):
+            params = []
+            expect_name = True
+            i = 1
+            while i < len(body) and body[i].type != 'RPAREN':
+                if expect_name and body[i].type == 'ID':
+                    params.append(body[i].value)
+                elif not expect_name and body[i].type == 'COMMA':
+                    pass
+                else:
+                    break
+                expect_name = not expect_name
+                i += 1
+            if (i >= len(body) or body[i].type != 'RPAREN' or (expect_name and params)
+                    or len(set(params)) != len(params)):
+                self.diagnostics.error('D002', "Parámetros mal formados en la macro '%s'",
+                                       name.value, line=tok.lineno)
+                return
+            body = body[i + 1:]
+        macro = Macro(name.value, params, tuple((t.type, t.value) for t in body))
+        previous = self.macros.get(macro.name)
+        if previous is not None and not previous.same_as(macro):
+            self.diagnostics.warning('D003', "Macro '%s' redefinida", macro.name, line=tok.lineno)
+        self.macros[macro.name] = macro
+        self.diagnostics.trace("Macro definida: %s", macro.name, line=tok.lineno)
+
+    def _include(self, tok, args, source):
+        if len(args) == 1 and args[0].type == 'STRING_LITERAL':
+            name, quoted = args[0].value, True
+        elif len(args) > 2 and args[0].type == 'LT' and args[-1].type == 'GT':
+            name, quoted = ''.join(spelling(t) for t in args[1:-1]), False
+        elif args:
+            name, quoted = ''.join(spelling(t) for t in args), False
+        else:
+            self.diagnostics.error('D002', "#include sin archivo", line=tok.lineno)
+            return
+        path = self.find(name, source.directory if quoted else None)
+        if path is None:
+            if quoted:
+                self.diagnostics.error('D001', "No se encuentra el archivo incluido '%s'",
+                                       name, line=tok.lineno)
+            else:
+                self.diagnostics.warning('D001', "Cabecera '%s' no encontrada; se ignora",
+                                         name, line=tok.lineno)
+            return
+        if path in self._included:
+            return
+        self._included.add(path)
+        try:
+            _, tokens, errors = self.cache.load(path)
+        except (OSError, UnicodeDecodeError) as e:
+            self.diagnostics.error('D001', "No se puede leer '%s': %s", name, e, line=tok.lineno)
+            return
+        for diag in errors:
+            self.diagnostics.report(diag.severity, diag.code, diag.template, *diag.args,
+                                    line=diag.line, column=diag.column)
+        self.includes.append(path)
+        self.diagnostics.trace("Incluido: %s", path, line=tok.lineno)
+        self._sources.append(_HeaderSource(tokens, path, self))
+
+    def find(self, name, directory=None):
+        """Ruta real de la cabecera `name`, o None si no está en ningún directorio."""
+        directories = ([directory] if directory else []) + self.include_path
+        if os.path.isabs(name):
+            directories = ['']
+        for folder in directories:
+            candidate = os.path.join(folder, name)
+            if os.path.isfile(candidate):
+                return os.path.realpath(candidate)
+            # Si aparece más tarde, la unidad incluiría otro archivo (o uno que faltaba)
+            self.probes.append(os.path.abspath(candidate))
+        return None
+
+    # --- Expansión de macros ---
+    def _expanded(self, reader):
+        """Siguiente (token, ocultación) de `reader` que no es una macro expandible."""
+        macros = self.macros
+        while True:
+            item = reader.next()
+            if item is None:
+                return None
+            tok, hide = item
+            if tok.type == 'ID':
+                macro = macros.get(tok.value)
+                if macro is not None and tok.value not in hide and self._replace(reader, macro, tok, hide):
+                    continue
+            return item
+
+    def _expand_list(self, items):
+        reader = _ListReader(items)
+        out = []
+        while True:
+            item = self._expanded(reader)
+            if item is None:
+                return out
+            out.append(item)
+
+    def _replace(self, reader, macro, site, hide):
+        """Sustituye la macro en `reader`; False si es una macro con parámetros sin '('."""
+        hide = hide | {macro.name}
+        if macro.params is None:
+            reader.push([(self._make(kind, value, site), hide) for kind, value in macro.body])
+            return True
+        following = reader.next()
+        if following is None or following[0].type != 'LPAREN':
+            if following is not None:
+                reader.push([following])
+            return False
+        args = self._arguments(reader, site)
+        if args is None:
+            return True
+        if not macro.params and args == [[]]:
+            args = []
+        if len(args) != len(macro.params):
+            self.diagnostics.error('D004', "La macro '%s' espera %d argumentos y recibió %d",
+                                   macro.name, len(macro.params), len(args), line=site.lineno)
+            return True
+        expanded = [self._expand_list(arg) for arg in args]
+        out = []
+        for kind, value in macro.body:
+            position = macro.index.get(value) if kind == 'ID' else None
+            if position is None:
+                out.append((self._make(kind, value, site), hide))
+            else:
+                out.extend((self._make(tok.type, tok.value, tok), tok_hide | hide)
+                           for tok, tok_hide in expanded[position])
+        reader.push(out)
+        return True
+
+    def _arguments(self, reader, site):
+        """Argumentos de una llamada a macro, ya consumido el '('."""
+        args = [[]]
+        depth = 0
+        while True:
+            item = reader.next()
+            if item is None:
+                self.diagnostics.error('D005', "Llamada a la macro '%s' sin cerrar",
+                                       site.value, line=site.lineno)
+                return None
+            kind = item[0].type
+            if kind == 'LPAREN':
+                depth += 1
+            elif kind == 'RPAREN':
+                if depth == 0:
+                    return args
+                depth -= 1
+            elif kind == 'COMMA' and depth == 0:
+                args.append([])
+                continue
+            args[-1].append(item)
+
+    def _make(self, kind, value, site):
+        tok = LexToken()
+        tok.type = kind
+        tok.value = value
+        tok.lineno = site.lineno
+        tok.lexpos = site.lexpos
+        tok.endlexpos = token_end(site)     # la expansión ocupa el tramo del uso de la macro
+        tok.lexer = self
+        return tok
+
+
+def preprocess_text(tokens):
+    """Texto de una secuencia de tokens, una línea de salida por línea de origen."""
+    lines = []
+    current = None
+    for tok in tokens:
+        if tok.lineno != current:
+            lines.append([])
+            current = tok.lineno
+        lines[-1].append(spelling(tok))
+    return '\n'.join(' '.join(line) for line in lines)
+
+
+if __name__ == '__main__':
+    # Uso: python preprocessor.py [-I dir] [-D NOMBRE=valor] archivo.c
+    # Sin archivo: mide N unidades que incluyen la misma cabecera, con y sin caché
+    import shutil
+    import sys
+    import tempfile
+    import time
+    from dfa_lexer import make_lexer
+
+    args = sys.argv[1:]
+    include_path, defines, paths = [], {}, []
+    while args:
+        arg = args.pop(0)
+        if arg == '-I':
+            include_path.append(args.pop(0))
+        elif arg.startswith('-I'):
+            include_path.append(arg[2:])
+        elif arg == '-D' or arg.startswith('-D'):
+            name, _, text = (args.pop(0) if arg == '-D' else arg[2:]).partition('=')
+            defines[name] = text or '1'
+        else:
+            paths.append(arg)
+
+    def run(source, origin, cache):
+        lexer = make_lexer('dfa')
+        lexer.diagnostics = DiagnosticSink()
+        pre = Preprocessor(lexer, include_path, defines, origin, cache)
+        pre.input(source)
+        return list(pre), pre
+
+    if paths:
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                tokens, pre = run(f.read(), path, header_cache)
+            print(preprocess_text(tokens))
+            for diag in pre.diagnostics:
+                print(diag, file=sys.stderr)
+        sys.exit(0)
+
+    units = 1000
+    folder = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(folder, 'comun.h'), 'w', encoding='utf-8') as f:
+            f.write('#define N 100\n#define CUADRADO(x) (x) * (x)\n')
+            f.write(''.join(f'int g{i} = {i} * N;\nfloat h{i} = {i}.5;\n' for i in range(400)))
+        include_path.append(folder)
+        source = '#include <comun.h>\nint main() { int a; a = CUADRADO(N) + g1; return a; }\n'
+        for label, shared in (('sin caché', False), ('con caché', True)):
+            cache = HeaderCache()
+            start = time.perf_counter()
+            for _ in range(units):
+                tokens, _ = run(source, None, cache if shared else HeaderCache())
+            elapsed = time.perf_counter() - start
+            stats = repr(cache) if shared else ''
+            print(f"{label:<10} {units} unidades: {elapsed:7.3f} s  ({len(tokens)} tokens/unidad)  {stats}")
+    finally:
+        shutil.rmtree(folder)
@@ -0,0 +1,280 @@
+"""
+Instrumentación del compilador: tiempo por fase, reducciones y tiempo por
+producción, búsquedas en la tabla de símbolos y cuádruplos por función.
+
+Se activa con CompilationSession(profile=True). Una sesión sin perfilar usa
+el parser original y no comprueba nada por token ni por reducción; la sesión
+que perfila usa una copia del parser con cada acción envuelta (como el AST en
+syntax_tree.py) y, solo mientras dura el análisis, cronómetros en el lexer
+(input/token) y en la búsqueda de la tabla de símbolos.
+
+    session = CompilationSession(profile=True)
+    result = session.compile(source)
+    print(result.profile.report())
+    result.profile.write_collapsed('compilacion.folded')   # flamegraph.pl, speedscope
+
+El archivo de pilas colapsadas tiene una línea "compile;parse;p_factor_id;lookup 1234"
+por marco, en microsegundos de tiempo propio.
+"""
+import copy
+import time
+
+from cfg import split_functions
+from symbol_table import SemanticError
+
+
+class CompilerProfiler:
+    """Contadores de una compilación (o de varias, con merge)."""
+    def __init__(self, productions=()):
+        self.rules = [prod.str for prod in productions]
+        self.functions = [prod.func or '' for prod in productions]
+        self.reductions = [0] * len(self.rules)
+        self.seconds = [0.0] * len(self.rules)          # acción, incluidas sus búsquedas
+        self.lookup_seconds = [0.0] * len(self.rules)   # búsquedas dentro de la acción
+        self.phases = {}            # fase -> segundos ('parse' incluye lexer y acciones)
+        self.tokens = 0
+        self.lex_seconds = 0.0
+        self.lookups = 0
+        self.misses = 0
+        self.quads = {}             # función -> cuádruplos emitidos
+        # Con CompilationSession(spans=True): posición de inicio de cada reducción ->
+        # [reducciones, segundos], para atribuir el coste a líneas y columnas
+        self.spots = None
+        self.source_map = None
+        self.current = 0            # producción cuya acción se está ejecutando
+        self._saved = None
+
+    # --- Instalación durante el análisis ---
+    def watch(self, lexer, table):
+        """Cronometra el lexer y cuenta las búsquedas de la tabla hasta unwatch()."""
+        clock = time.perf_counter
+        scan, token, lookup = lexer.input, lexer.token, table.lookup
+
+        def timed_input(data):
+            start = clock()
+            scan(data)
+            self.lex_seconds += clock() - start
+
+        def timed_token():
+            start = clock()
+            tok = token()
+            self.lex_seconds += clock() - start
+            if tok is not None:
+                self.tokens += 1
+            return tok
+
+        def counted_lookup(name):
+            self.lookups += 1
+            start = clock()
+            try:
+                return lookup(name)
+            except SemanticError:
+                self.misses += 1
+                raise
+            finally:
+                self.lookup_seconds[self.current] += clock() - start
+
+        lexer.input, lexer.token, table.lookup = timed_input, timed_token, counted_lookup
+        self._saved = (lexer, table)
+
+    def unwatch(self):
+        if self._saved is not None:
+            lexer, table = self._saved
+            del lexer.input, lexer.token, table.lookup
+            self._saved = None
+
+    def count_quads(self, code):
+        for name, start, stop in split_functions(code):
+            self.quads[name] = self.quads.get(name, 0) + stop - start
+
+    def merge(self, other):
+        """
+        Suma los contadores de otra compilación con el mismo parser. Las
+        posiciones (spots) son de un texto concreto y no se suman.
+        """
+        for i in range(len(self.rules)):
+            self.reductions[i] += other.reductions[i]
+            self.seconds[i] += other.seconds[i]
+            self.lookup_seconds[i] += other.lookup_seconds[i]
+        for phase, seconds in other.phases.items():
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        for name, count in other.quads.items():
+            self.quads[name] = self.quads.get(name, 0) + count
+        self.tokens += other.tokens
+        self.lex_seconds += other.lex_seconds
+        self.lookups += other.lookups
+        self.misses += other.misses
+        return self
+
+    def __getstate__(self):
+        # Viaja entre procesos (compile_batch) sin lo instalado en el lexer
+        state = self.__dict__.copy()
+        state['_saved'] = None
+        return state
+
+    # --- Resultados ---
+    @property
+    def action_seconds(self):
+        return sum(self.seconds)
+
+    @property
+    def driver_seconds(self):
+        """Tiempo del autómata LR: el análisis sin el lexer ni las acciones."""
+        return max(self.phases.get('parse', 0.0) - self.lex_seconds - self.action_seconds, 0.0)
+
+    def by_function(self):
+        """{acción p_*: [reducciones, segundos, segundos en búsquedas]}."""
+        totals = {}
+        for i, name in enumerate(self.functions):
+            if self.reductions[i]:
+                entry = totals.setdefault(name, [0, 0.0, 0.0])
+                entry[0] += self.reductions[i]
+                entry[1] += self.seconds[i]
+                entry[2] += self.lookup_seconds[i]
+        return totals
+
+    def hot_spots(self, top=15):
+        """[(línea, columna, reducciones, segundos)] de las posiciones más costosas."""
+        if not self.spots or self.source_map is None:
+            return []
+        order = sorted(self.spots.items(), key=lambda item: -item[1][1])[:top]
+        return [self.source_map.location(offset) + tuple(entry) for offset, entry in order]
+
+    def report(self, top=15):
+        ms = 1000
+        total = sum(self.phases.values())
+        lines = ["--- PERFIL DE COMPILACION ---"]
+        rows = [('lexer', self.lex_seconds), ('autómata LR', self.driver_seconds),
+                ('acciones semánticas', self.action_seconds)]
+        rows += [(phase, seconds) for phase, seconds in self.phases.items() if phase != 'parse']
+        for label, seconds in rows:
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"  {label:<22} {seconds * ms:10.2f} ms {share:6.1f} %")
+        lines.append(f"  {'total':<22} {total * ms:10.2f} ms")
+        rate = self.tokens / self.lex_seconds if self.lex_seconds else 0.0
+        lines.append(f"Tokens: {self.tokens} ({rate:,.0f}/s)")
+        lookup_time = sum(self.lookup_seconds)
+        lines.append(f"Tabla de símbolos: {self.lookups} búsquedas, {self.misses} fallos, "
+                     f"{lookup_time * ms:.2f} ms")
+
+        lines.append(f"Producciones (top {top} por tiempo):")
+        lines.append(f"  {'reducciones':>11} {'ms':>9} {'búsq. ms':>9}  acción / regla")
+        order = sorted((i for i in range(len(self.rules)) if self.reductions[i]),
+                       key=lambda i: -self.seconds[i])
+        for i in order[:top]:
+            lines.append(f"  {self.reductions[i]:>11} {self.seconds[i] * ms:9.2f} "
+                         f"{self.lookup_seconds[i] * ms:9.2f}  {self.functions[i]}: {self.rules[i]}")
+
+        spots = self.hot_spots(top)
+        if spots:
+            lines.append(f"Posiciones en {self.source_map.name} (top {top} por tiempo):")
+            lines.append(f"  {'línea:col':>12} {'reducciones':>11} {'ms':>9}  texto")
+            for line, column, count, seconds in spots:
+                text = (self.source_map.line_text(line) or '')[column - 1:column + 39]
+                lines.append(f"  {f'{line}:{column}':>12} {count:>11} {seconds * ms:9.2f}  {text}")
+
+        functions = sorted(self.quads.items(), key=lambda item: -item[1])
+        lines.append(f"Cuádruplos emitidos: {sum(self.quads.values())} en {len(self.quads)} unidades")
+        for name, count in functions[:top]:
+            lines.append(f"  {count:>8}  {name}")
+        if len(functions) > top:
+            lines.append(f"  ... y {len(functions) - top} más")
+        return '\n'.join(lines)
+
+    def collapsed(self):
+        """Líneas 'marco;marco;... microsegundos' (tiempo propio de cada marco)."""
+        lines = []
+
+        def add(stack, seconds):
+            micros = round(seconds * 1e6)
+            if micros > 0:
+                lines.append(f"{';'.join(stack)} {micros}")
+
+        add(('compile', 'parse'), self.driver_seconds)
+        add(('compile', 'parse', 'lexer'), self.lex_seconds)
+        for i, rule in enumerate(self.rules):
+            if self.reductions[i]:
+                frame = ('compile', 'parse', self.functions[i], rule)
+                add(frame, self.seconds[i] - self.lookup_seconds[i])
+                add(frame + ('lookup',), self.lookup_seconds[i])
+        for phase, seconds in self.phases.items():
+            if phase != 'parse':
+                add(('compile', phase), seconds)
+        return lines
+
+    def write_collapsed(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in self.collapsed():
+                f.write(line + '\n')
+
+
+def _profiled_action(prodnum, func):
+    clock = time.perf_counter
+
+    def action(p):
+        profiler = p.lexer.profiler
+        profiler.current = prodnum
+        start = clock()
+        func(p)
+        elapsed = clock() - start
+        profiler.seconds[prodnum] += elapsed
+        profiler.reductions[prodnum] += 1
+        spots = profiler.spots
+        if spots is not None:
+            # source_map.py ya dejó el tramo de la reducción en p.slice[0]
+            entry = spots.get(p.slice[0].lexpos)
+            if entry is None:
+                entry = spots[p.slice[0].lexpos] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += elapsed
+    return action
+
+def instrument_parser(parser):
+    """Copia del parser cuyas acciones anotan reducciones y tiempo en p.lexer.profiler."""
+    twin = copy.copy(parser)
+    twin.productions = []
+    for prodnum, prod in enumerate(parser.productions):
+        prod = copy.copy(prod)
+        if prod.callable is not None:
+            prod.callable = _profiled_action(prodnum, prod.callable)
+        twin.productions.append(prod)
+    return twin
+
+
+if __name__ == '__main__':
+    # Uso: python profiler.py [-O2] [--engine dfa] [--spans] [--folded salida.folded] [archivo.c ...]
+    # Sin archivos perfila un programa sintético de bench.py; --spans añade las
+    # posiciones más costosas (solo con un archivo: no se suman entre textos)
+    import sys
+    from session import CompilationSession
+
+    args = sys.argv[1:]
+    engine, folded, level, spans = 'ply', None, 0, False
+    paths = []
+    while args:
+        arg = args.pop(0)
+        if arg == '--engine':
+            engine = args.pop(0)
+        elif arg == '--folded':
+            folded = args.pop(0)
+        elif arg == '--spans':
+            spans = True
+        elif arg.startswith('-O'):
+            level = int(arg[2:] or 1)
+        else:
+            paths.append(arg)
+
+    session = CompilationSession(engine=engine, opt_level=level, profile=True, spans=spans)
+    if paths:
+        sources = [(path, open(path, encoding='utf-8').read()) for path in paths]
+    else:
+        from bench import PRESETS, ProgramGenerator
+        sources = [('<bench medium>', ProgramGenerator(**PRESETS['medium']).generate())]
+    profile = None
+    for name, source in sources:
+        result = session.compile(source, name)
+        profile = result.profile if profile is None else profile.merge(result.profile)
+    print(profile.report())
+    if folded:
+        profile.write_collapsed(folded)
+        print(f"Pilas colapsadas en {folded}")
@@ -0,0 +1,798 @@
+"""
+Traducción del código de tres direcciones a funciones de Python.
+
+Cada función del 3AC se convierte en una función de Python y el conjunto se
+compila con compile(): las variables y temporales pasan a ser variables
+locales (LOAD_FAST/STORE_FAST) y el control de flujo se reconstruye sobre
+el grafo de flujo (cfg.py):
+  - los bloques vacíos que solo saltan se atraviesan (jump threading);
+  - `if c1 goto T; if c2 goto T` se une en `if c1 or c2` (cortocircuito);
+  - un bloque con un único salto hacia él se escribe dentro de la rama que
+    salta (if/else anidados);
+  - un bloque de unión se coloca después del if cuando todos los saltos
+    hacia él terminan en ese if;
+  - lo que queda (cabeceras de bucle, uniones cruzadas) se despacha con
+    `while True:` y una variable de estado. Con un solo estado es un bucle
+    normal y saltar a la cabecera es `continue`.
+Los temporales de un solo uso se sustituyen por su expresión.
+
+El código objeto resultante se guarda en caché por el hash del 3AC (en
+memoria y, con cache_dir, en disco con marshal), de modo que ejecutar otra
+vez el mismo programa no vuelve a traducir ni a compilar.
+
+    program = PythonProgram(result.code, result.globals)
+    program.run()                   # código global
+    program.call('fibonaci', 25)    # -> 75025
+"""
+import hashlib
+import marshal
+import os
+import sys
+
+from cfg import COND_JUMPS, GOTO, LABEL, RETURN, ControlFlowGraph, split_functions
+from dataflow import liveness
+from quad_store import Temp
+from vm import GLOBAL, VMError, literal
+
+VERSION = 1
+MAX_DEPTH = 60          # sangrías antes de pasar a despacho plano
+CACHE_SIZE = 128        # programas en la caché en memoria
+
+_cache = {}             # clave -> (fuente, código objeto)
+
+# Instrucciones sin efecto al traducir
+SKIP = {LABEL, 'func', 'endfunc', 'formal'}
+
+
+def _div(a, b):
+    if type(a) is int and type(b) is int:
+        q = abs(a) // abs(b)       # división entera de C: trunca hacia cero
+        return q if (a < 0) == (b < 0) else -q
+    return a / b
+
+def _undefined(name):
+    raise VMError(f"Función no definida: {name}")
+
+
+def ident(name):
+    """Identificador de Python para una variable, temporal o ranura del 3AC."""
+    if isinstance(name, Temp):
+        return '_' + name
+    if name[:1] == '$':
+        return '_' + name[1:]
+    if '.' in name:
+        # Local que oculta a otra variable: 'b.3' -> 'w_b_3' ('.' no cabe en
+        # un identificador del fuente, así que el prefijo no choca con 'v_')
+        return 'w_' + name.replace('.', '_')
+    return 'v_' + name
+
+
+class _TooDeep(Exception):
+    pass
+
+
+class _Block:
+    __slots__ = ('index', 'quads', 'kind', 'jump', 'succ')
+
+    def __init__(self, index, quads, kind, jump, succ):
+        self.index = index
+        self.quads = quads      # instrucciones sin etiquetas ni salto final
+        self.kind = kind        # 'return', 'goto', 'cond' o 'end'
+        self.jump = jump        # la instrucción final (return o salto)
+        self.succ = succ        # [destino] o [cierto, falso]
+
+
+class _FunctionTranslator:
+    """Traduce code[start:stop] (una función o el código global) a líneas de Python."""
+    def __init__(self, program, name, code, start, stop):
+        self.program = program
+        self.name = name
+        self.code = code
+        self.start, self.stop = start, stop
+        self.global_unit = name == GLOBAL
+        self.params = [quad[3] for quad in code[start:stop] if quad[0] == 'formal']
+        self.cfg = ControlFlowGraph(code, start, stop)
+        # Variables con & tomado: van en una lista de un elemento
+        self.boxed = set()
+        uses = {}
+        defs = {}
+        for quad in code[start:stop]:
+            for operand in quad[1:3]:
+                if isinstance(operand, str) and operand[:1] == '&':
+                    self.boxed.add(operand[1:])
+                if isinstance(operand, Temp):
+                    uses[operand] = uses.get(operand, 0) + 1
+            if isinstance(quad[3], Temp) and quad[0] not in SKIP:
+                defs[quad[3]] = defs.get(quad[3], 0) + 1
+        self.single_use = {t for t, n in uses.items() if n == 1 and defs.get(t) == 1}
+        self.scratch = 0
+
+    # --- Operandos ---
+    def is_global(self, name):
+        return (not self.global_unit and name in self.program.global_names
+                and name not in self.params)
+
+    def global_boxed(self, name):
+        return name in self.program.boxed_globals
+
+    def value(self, operand, pending):
+        """Expresión de Python para leer un operando."""
+        if operand is None:
+            return 'None'
+        if not isinstance(operand, str):
+            return repr(operand)
+        if isinstance(operand, Temp) and operand in pending:
+            return f"({pending.pop(operand)[0]})"
+        constant = literal(operand)
+        if constant is not None:
+            return f"({constant!r})" if isinstance(constant, (int, float)) and constant < 0 else repr(constant)
+        if operand[0] == '&':
+            return ident(operand[1:])
+        if operand[0] == '*':
+            return self.value(operand[1:], pending) + '[0]'
+        if self.boxed_name(operand):
+            return ident(operand) + '[0]'
+        return ident(operand)
+
+    def boxed_name(self, name):
+        if self.is_global(name) or (self.is_global_unit_name(name)):
+            return self.global_boxed(name)
+        return name in self.boxed
+
+    def is_global_unit_name(self, name):
+        return self.global_unit and name in self.program.global_names
+
+    def target(self, result, pending):
+        """Destino de una asignación."""
+        if result[:1] == '*':
+            return self.value(result[1:], pending) + '[0]'
+        if self.boxed_name(result):
+            return ident(result) + '[0]'
+        return ident(result)
+
+    @staticmethod
+    def _memory(name):
+        return name[:1] == '*'
+
+    def _reads(self, operand):
+        """Nombres de los que depende una expresión pendiente, y si toca memoria."""
+        if not isinstance(operand, str) or literal(operand) is not None:
+            return (), False
+        name = operand.lstrip('*&')
+        memory = (operand[:1] == '*' or self.boxed_name(name) or self.is_global(name)
+                  or self.is_global_unit_name(name))
+        return (name,), memory
+
+    # --- Bloques ---
+    def blocks(self):
+        code = self.code
+        cfg = self.cfg
+        blocks = []
+        for block in cfg.blocks:
+            quads = [q for q in code[block.start:block.end] if q[0] not in SKIP]
+            last = quads[-1] if quads else None
+            nxt = block.index + 1 if block.index + 1 < len(cfg.blocks) else None
+            if last is not None and last[0] == RETURN:
+                kind, jump, succ, quads = 'return', last, [], quads[:-1]
+            elif last is not None and last[0] == GOTO:
+                kind, jump, succ, quads = 'goto', last, [cfg.label_block[last[3]]], quads[:-1]
+            elif last is not None and last[0] in COND_JUMPS:
+                succ = [cfg.label_block[last[3]], nxt]
+                kind, jump, quads = 'cond', last, quads[:-1]
+            elif nxt is not None:
+                kind, jump, succ = 'goto', None, [nxt]
+            else:
+                kind, jump, succ = 'end', None, []
+            blocks.append(_Block(block.index, quads, kind, jump, succ))
+        return blocks
+
+    def translate(self, flat=False):
+        """Líneas de la función (sin la cabecera def)."""
+        blocks = self.blocks()
+        self.block_list = blocks
+
+        # Saltos a bloques vacíos que solo saltan: directos al destino final
+        def forward(b):
+            seen = set()
+            while b is not None and blocks[b].kind == 'goto' and not blocks[b].quads and b not in seen:
+                seen.add(b)
+                b = blocks[b].succ[0]
+            return b
+        for block in blocks:
+            block.succ = [forward(s) for s in block.succ]
+        entry = forward(0)
+
+        # Saltos que llegan a cada bloque alcanzable
+        self.sites = sites = {}
+        reached = [entry]
+        seen = {entry}
+        while reached:
+            b = reached.pop()
+            block = blocks[b]
+            succ = block.succ
+            if block.kind == 'cond' and succ[0] == succ[1]:
+                succ = block.succ = [succ[0]]
+                block.kind = 'goto'
+            for s in succ:
+                if s is None:
+                    continue
+                sites[s] = sites.get(s, 0) + 1
+                if s not in seen:
+                    seen.add(s)
+                    reached.append(s)
+
+        self.flat = flat
+        self.states = states = {entry} if sites.get(entry) or flat else set()
+        regions = {}
+        entry_nodes = None if entry in states else self.build(entry, root=True)
+        while True:
+            pending = [s for s in states if s not in regions]
+            if not pending:
+                break
+            for s in pending:
+                regions[s] = self.build(s, root=True)
+        if entry_nodes is not None and self._has_forced(entry_nodes):
+            # Un salto del código de entrada no está al final: la entrada también es un estado
+            states.add(entry)
+            regions[entry] = entry_nodes
+            entry_nodes = None
+
+        lines = []
+        self._emit_prologue(lines)
+        order = sorted(states)
+        self.state_id = {b: i for i, b in enumerate(order)}
+        self.single = len(order) == 1
+        if entry_nodes is not None:
+            self._render(entry_nodes, 1, lines, before_loop=True)
+        elif len(order) > 1:
+            lines.append(f"    _b = {self.state_id[entry]}")
+        if order:
+            lines.append("    while True:")
+            if self.single:
+                self._render(regions[order[0]], 2, lines)
+            else:
+                self._render_dispatch(order, regions, 2, lines)
+        return lines
+
+    def _emit_prologue(self, lines):
+        if self.global_unit:
+            names = self.program.global_names
+        else:
+            names = {n for n in self.program.global_names if self.is_global(n)}
+        written = set()
+        for quad in self.code[self.start:self.stop]:
+            res = quad[3]
+            if (quad[0] not in SKIP and isinstance(res, str) and res in names
+                    and not self.global_boxed(res) and quad[0] not in COND_JUMPS and quad[0] != GOTO):
+                written.add(res)
+        if written:
+            lines.append("    global " + ", ".join(ident(n) for n in sorted(written)))
+        if self.global_unit:
+            return
+        # Variables que se pueden leer antes de escribirse: empiezan en 0
+        live = liveness(self.cfg)
+        initial = [n for n in live.live_in(0)
+                   if literal(n) is None and not self.is_global(n) and n not in self.params]
+        for name in sorted(initial, key=str):
+            lines.append(f"    {ident(name)} = {'[0]' if name in self.boxed else '0'}")
+        for name in sorted(self.boxed - set(initial) - set(self.params)):
+            if not self.is_global(name):
+                lines.append(f"    {ident(name)} = [0]")
+        for name in self.params:
+            if name in self.boxed:
+                lines.append(f"    {ident(name)} = [{ident(name)}]")
+
+    # --- Construcción de regiones ---
+    def statements(self, block):
+        """(nodos, expresiones pendientes) de las instrucciones del bloque."""
+        nodes = []
+        pending = {}        # temporal -> (expresión, nombres leídos, toca memoria, llama)
+        params = []
+        touched = []        # algún parámetro leído ya toca memoria
+
+        def flush(predicate):
+            for temp in [t for t, entry in pending.items() if predicate(entry)]:
+                nodes.append(('s', f"{ident(temp)} = {pending.pop(temp)[0]}"))
+
+        def settle(operand):
+            # Una llamada pendiente se evaluaría después de lo que Python lee
+            # antes en la misma expresión: se calcula ya, en su orden del 3AC
+            if isinstance(operand, Temp) and operand in pending and pending[operand][3]:
+                flush(lambda entry: entry is pending[operand])
+
+        def flush_params():
+            for i, text in enumerate(params):
+                if not text.isidentifier():
+                    name = f"_p{self.scratch}"
+                    self.scratch += 1
+                    nodes.append(('s', f"{name} = {text}"))
+                    params[i] = name
+
+        for op, arg1, arg2, res in block.quads:
+            if params and op not in ('param', 'call'):
+                flush_params()
+            if op == 'param':
+                if touched:
+                    settle(arg1)
+                if self._touches(arg1, pending):
+                    touched.append(arg1)
+                params.append(self.value(arg1, pending))
+                continue
+            if op == 'call':
+                n = arg2 or 0
+                args = params[len(params) - n:] if n else []
+                del params[len(params) - n:]
+                del touched[:]
+                # Una llamada puede cambiar globales y memoria apuntada
+                flush(lambda entry: entry[2])
+                if arg1 in self.program.function_names:
+                    call = f"f_{arg1}({', '.join(args)})"
+                else:
+                    call = f"_undefined({arg1!r})"
+                self._assign(res, call, nodes, pending, flush, (), True, True)
+                continue
+            if self._touches(arg1, pending):
+                settle(arg2)
+            reads, memory, effect = [], False, False
+            for operand in (arg1, arg2):
+                names, touches = self._reads(operand)
+                reads.extend(names)
+                memory = memory or touches
+                if isinstance(operand, Temp) and operand in pending:
+                    reads.extend(pending[operand][1])
+                    memory = memory or pending[operand][2]
+                    effect = effect or pending[operand][3]
+            a = self.value(arg1, pending)
+            if op == '=':
+                text = a
+            elif arg2 is None:
+                text = f"-{a}" if op == '-' else f"not {a}"
+            else:
+                b = self.value(arg2, pending)
+                if op == '/':
+                    text = f"_div({a}, {b})"
+                    memory = True       # no se adelanta a una llamada
+                elif op == '&&':
+                    text = f"bool({a}) and bool({b})"
+                elif op == '||':
+                    text = f"bool({a}) or bool({b})"
+                else:
+                    text = f"{a} {op} {b}"
+            self._assign(res, text, nodes, pending, flush, reads, memory, effect)
+        if params:
+            flush_params()
+        if block.jump is not None and block.jump[2] is not None and self._touches(block.jump[1], pending):
+            settle(block.jump[2])
+        return nodes, pending, flush
+
+    def _touches(self, operand, pending):
+        """Si leer el operando depende de memoria o globales."""
+        if isinstance(operand, Temp) and operand in pending:
+            return pending[operand][2]
+        return self._reads(operand)[1]
+
+    def _assign(self, res, text, nodes, pending, flush, reads, memory, effect=False):
+        if res[:1] == '*' or self.boxed_name(res.lstrip('*')):
+            # Escritura en memoria: lo pendiente que lee memoria va antes
+            flush(lambda entry: entry[2])
+        else:
+            # Una llamada pendiente puede leer la global que se escribe
+            shared = self.is_global(res) or self.is_global_unit_name(res)
+            flush(lambda entry: res in entry[1] or (shared and entry[3]))
+        if isinstance(res, Temp) and res in self.single_use:
+            pending[res] = (text, list(reads), memory, effect)
+        else:
+            if memory:
+                flush(lambda entry: entry[3])
+            nodes.append(('s', f"{self.target(res, pending)} = {text}"))
+
+    def condition(self, block, pending):
+        op, arg1, arg2, _ = block.jump
+        a = self.value(arg1, pending)
+        if op == 'if':
+            return a
+        if op == 'iffalse':
+            return f"not {a}"
+        return f"{a} {op[2:]} {self.value(arg2, pending)}"
+
+    def build(self, b, root=False):
+        block = self.block_list[b]
+        nodes, pending, flush = self.statements(block)
+        if block.kind == 'return':
+            value = None if block.jump[1] is None else self.value(block.jump[1], pending)
+            flush(lambda entry: True)
+            nodes.append(('ret', value))
+        elif block.kind == 'cond':
+            cond = self.condition(block, pending)
+            flush(lambda entry: True)
+            true, false = block.succ
+            cond, true, false = self._merge(cond, true, false)
+            if true == false:
+                nodes.extend(self.branch(true))
+            else:
+                nodes.append(('if', cond, self.branch(true), self.branch(false)))
+        elif block.kind == 'goto':
+            flush(lambda entry: True)
+            nodes.extend(self.branch(block.succ[0]))
+        else:
+            flush(lambda entry: True)
+            nodes.append(('ret', None))
+        self._resolve(nodes, root)
+        return nodes
+
+    def _merge(self, cond, true, false):
+        """Une condiciones encadenadas (&& / || en forma de saltos) en una sola."""
+        blocks, sites = self.block_list, self.sites
+        changed = True
+        while changed and not self.flat:
+            changed = False
+            for side in (false, true):
+                if side is None or sites.get(side) != 1 or side in self.states:
+                    continue
+                other = blocks[side]
+                if other.kind != 'cond' or len(other.succ) != 2:
+                    continue
+                nodes, pending, _ = self.statements(other)
+                if nodes:
+                    continue
+                cond2 = self.condition(other, pending)
+                if pending:
+                    continue
+                t2, f2 = other.succ
+                # Dos saltos al mismo destino pasan a ser uno
+                shared = true if side == false else false
+                if side == false:
+                    # if c1 goto T; [false:] if c2 goto T2 else F2
+                    if t2 == true:
+                        cond, false = f"({cond}) or ({cond2})", f2
+                    elif f2 == true:
+                        cond, false = f"({cond}) or not ({cond2})", t2
+                    else:
+                        continue
+                else:
+                    # if c1 goto [true:] (if c2 goto T2 else F2); else F
+                    if f2 == false:
+                        cond, true = f"({cond}) and ({cond2})", t2
+                    elif t2 == false:
+                        cond, true = f"({cond}) and not ({cond2})", f2
+                    else:
+                        continue
+                sites[shared] -= 1
+                sites[side] = 0
+                changed = True
+                break
+        return cond, true, false
+
+    def branch(self, target):
+        if target is None:
+            return [('ret', None)]
+        if not self.flat and self.sites.get(target) == 1 and target not in self.states:
+            return self.build(target)
+        return [['goto', target, None]]
+
+    def _tail_gotos(self, nodes, out):
+        if not nodes:
+            return out
+        last = nodes[-1]
+        if isinstance(last, list) and last[2] is None:
+            out.append(last)
+        elif last[0] == 'if':
+            self._tail_gotos(last[2], out)
+            self._tail_gotos(last[3], out)
+        return out
+
+    def _resolve(self, nodes, root):
+        while True:
+            gotos = self._tail_gotos(nodes, [])
+            if not gotos:
+                return
+            counts = {}
+            for g in gotos:
+                counts[g[1]] = counts.get(g[1], 0) + 1
+            complete = [t for t, n in counts.items()
+                        if n == self.sites.get(t) and t not in self.states]
+            if not complete:
+                break
+            follow = max(complete, key=lambda t: (counts[t], t))
+            for g in gotos:
+                if g[1] == follow:
+                    g[2] = 'fall'
+                else:
+                    # Ya no está al final: salta por el despachador
+                    g[2] = 'forced'
+                    self.states.add(g[1])
+            nodes.extend(self.build(follow))
+        if root:
+            for g in self._tail_gotos(nodes, []):
+                g[2] = 'tail'
+                self.states.add(g[1])
+
+    def _has_forced(self, nodes):
+        for node in nodes:
+            if isinstance(node, list) and node[2] == 'forced':
+                return True
+            if node[0] == 'if' and (self._has_forced(node[2]) or self._has_forced(node[3])):
+                return True
+        return False
+
+    # --- Escritura ---
+    def _terminal(self, nodes):
+        if not nodes:
+            return False
+        last = nodes[-1]
+        if isinstance(last, list):
+            return last[2] in ('tail', 'forced')
+        if last[0] == 'ret':
+            return True
+        if last[0] == 'if':
+            return self._terminal(last[2]) and self._terminal(last[3])
+        return False
+
+    def _empty(self, nodes):
+        return all(isinstance(node, list) and node[2] == 'fall' for node in nodes)
+
+    def _render(self, nodes, depth, lines, before_loop=False):
+        if depth > MAX_DEPTH:
+            raise _TooDeep()
+        pad = '    ' * depth
+        start = len(lines)
+        for node in nodes:
+            if isinstance(node, list):
+                if node[2] == 'fall':
+                    continue
+                state = self.state_id[node[1]]
+                if before_loop:
+                    if not self.single:
+                        lines.append(f"{pad}_b = {state}")
+                else:
+                    if not self.single:
+                        lines.append(f"{pad}_b = {state}")
+                    lines.append(f"{pad}continue")
+            elif node[0] == 's':
+                lines.append(pad + node[1])
+            elif node[0] == 'ret':
+                lines.append(pad + ('return' if node[1] is None else f"return {node[1]}"))
+            else:
+                _, cond, then, other = node
+                if self._empty(other):
+                    lines.append(f"{pad}if {cond}:")
+                    self._render_block(then, depth + 1, lines, before_loop)
+                elif self._empty(then):
+                    lines.append(f"{pad}if not ({cond}):")
+                    self._render_block(other, depth + 1, lines, before_loop)
+                elif self._terminal(then) and not before_loop:
+                    lines.append(f"{pad}if {cond}:")
+                    self._render_block(then, depth + 1, lines, before_loop)
+                    self._render(other, depth, lines, before_loop)
+                elif self._terminal(other) and not before_loop:
+                    lines.append(f"{pad}if not ({cond}):")
+                    self._render_block(other, depth + 1, lines, before_loop)
+                    self._render(then, depth, lines, before_loop)
+                else:
+                    lines.append(f"{pad}if {cond}:")
+                    self._render_block(then, depth + 1, lines, before_loop)
+                    lines.append(f"{pad}else:")
+                    self._render_block(other, depth + 1, lines, before_loop)
+        return len(lines) > start
+
+    def _render_block(self, nodes, depth, lines, before_loop):
+        if not self._render(nodes, depth, lines, before_loop):
+            lines.append('    ' * depth + 'pass')
+
+    def _render_dispatch(self, order, regions, depth, lines):
+        """Árbol de comparaciones sobre _b: log2(n) comprobaciones por salto."""
+        pad = '    ' * depth
+        if len(order) == 1:
+            self._render_block(regions[order[0]], depth, lines, False)
+            return
+        if len(order) <= 4:
+            # Pocas: cadena, empezando por la última (el bucle más interno suele ir detrás)
+            chain = order[::-1]
+            for i, b in enumerate(chain):
+                if i == len(chain) - 1:
+                    lines.append(f"{pad}else:")
+                else:
+                    lines.append(f"{pad}{'if' if i == 0 else 'elif'} _b == {self.state_id[b]}:")
+                self._render_block(regions[b], depth + 1, lines, False)
+            return
+        mid = len(order) // 2
+        lines.append(f"{pad}if _b < {self.state_id[order[mid]]}:")
+        self._render_dispatch(order[:mid], regions, depth + 1, lines)
+        lines.append(f"{pad}else:")
+        self._render_dispatch(order[mid:], regions, depth + 1, lines)
+
+
+def _translate(code, globals):
+    """Fuente de Python del programa completo."""
+    program = _ProgramInfo(code, globals)
+    out = ["# Generado por py_backend a partir del código de tres direcciones"]
+    for name in sorted(program.global_names):
+        out.append(f"{ident(name)} = {'[0]' if name in program.boxed_globals else '0'}")
+    for name, start, stop in program.units:
+        if name == GLOBAL:
+            continue
+        header = f"def f_{name}({', '.join(ident(p) for p in _params(code, start, stop))}):"
+        out.append('')
+        out.append(header)
+        out.extend(_function_lines(program, name, code, start, stop))
+    # El código global en una función _init
+    out.append('')
+    out.append('def _init():')
+    # Los tramos globales entre funciones forman una sola unidad
+    init = [quad for name, start, stop in program.units if name == GLOBAL
+            for quad in code[start:stop]]
+    out.extend(_function_lines(program, GLOBAL, init, 0, len(init)) if init else ['    pass'])
+    return '\n'.join(out) + '\n'
+
+def _params(code, start, stop):
+    return [quad[3] for quad in code[start:stop] if quad[0] == 'formal']
+
+def _function_lines(program, name, code, start, stop):
+    translator = _FunctionTranslator(program, name, code, start, stop)
+    try:
+        return translator.translate()
+    except (_TooDeep, RecursionError):
+        # Demasiado anidado para Python: cada bloque es un estado del despachador
+        translator = _FunctionTranslator(program, name, code, start, stop)
+        return translator.translate(flat=True)
+
+
+class _ProgramInfo:
+    """Datos del programa completo que necesita cada función."""
+    def __init__(self, code, globals):
+        self.units = split_functions(code)
+        self.function_names = {name for name, _, _ in self.units if name != GLOBAL}
+        self.global_names = set(globals)
+        for name, start, stop in self.units:
+            if name == GLOBAL:
+                for quad in code[start:stop]:
+                    if quad[0] in SKIP or quad[0] in COND_JUMPS or quad[0] == GOTO:
+                        continue
+                    for operand in (quad[1], quad[2], quad[3]):
+                        if (isinstance(operand, str) and not isinstance(operand, Temp)
+                                and literal(operand.lstrip('*&')) is None
+                                and not (quad[0] == 'call' and operand is quad[1])):
+                            self.global_names.add(operand.lstrip('*&'))
+        # Globales con & tomado en cualquier parte
+        self.boxed_globals = set()
+        for name, start, stop in self.units:
+            params = set(_params(code, start, stop))
+            for quad in code[start:stop]:
+                for operand in quad[1:3]:
+                    if isinstance(operand, str) and operand[:1] == '&':
+                        target = operand[1:]
+                        if target in self.global_names and target not in params:
+                            self.boxed_globals.add(target)
+
+
+def cache_key(code, globals=()):
+    """Hash del 3AC (distingue temporales de variables con el mismo nombre)."""
+    data = repr([tuple(('T', x) if isinstance(x, Temp) else x for x in quad) for quad in code])
+    return hashlib.blake2b(f"{VERSION}|{sorted(globals)}|{data}".encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+def compile_code(code, globals=(), cache_dir=None):
+    """(fuente, código objeto) del programa, usando la caché si ya se tradujo."""
+    code = list(code)
+    key = cache_key(code, globals)
+    entry = _cache.get(key)
+    if entry is not None:
+        return entry
+    path = os.path.join(cache_dir, key + '.pycode') if cache_dir else None
+    if path and os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                entry = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            entry = None
+    if entry is None:
+        source = _translate(code, globals)
+        entry = (source, compile(source, f"<3ac {key[:8]}>", 'exec'))
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                marshal.dump(entry, f)
+            os.replace(tmp, path)       # escritura atómica
+    if len(_cache) >= CACHE_SIZE:
+        del _cache[next(iter(_cache))]
+    _cache[key] = entry
+    return entry
+
+
+class PythonProgram:
+    """Misma interfaz que vm.VirtualMachine, ejecutando funciones de Python generadas."""
+    def __init__(self, code, globals=(), cache_dir=None):
+        self.source, self.code_object = compile_code(code, globals, cache_dir)
+        self.namespace = {'_div': _div, '_undefined': _undefined, '__name__': '__3ac__'}
+        exec(self.code_object, self.namespace)
+        # Antes de ejecutar nada, solo las globales con & tomado son listas
+        self.boxed = {key for key, value in self.namespace.items()
+                      if key[:2] in ('v_', 'w_') and isinstance(value, list)}
+
+    def run(self):
+        """Ejecuta el código global."""
+        return self._guard(self.namespace['_init'])
+
+    def call(self, name, *args):
+        function = self.namespace.get('f_' + name)
+        if function is None:
+            raise VMError(f"Función no definida: {name}")
+        return self._guard(function, *args)
+
+    def function(self, name):
+        """La función de Python generada, para llamarla sin intermediarios."""
+        return self.namespace['f_' + name]
+
+    def global_values(self):
+        values = {}
+        for key, value in self.namespace.items():
+            if key.startswith('v_'):
+                values[key[2:]] = value[0] if key in self.boxed else value
+            elif key.startswith('w_'):
+                # Locales de bloques del código global, como en la VM: 'w_b_1' -> 'b.1'
+                name, _, depth = key[2:].rpartition('_')
+                values[f"{name}.{depth}"] = value[0] if key in self.boxed else value
+        return values
+
+    @staticmethod
+    def _guard(function, *args):
+        try:
+            return function(*args)
+        except ZeroDivisionError:
+            raise VMError("División por cero") from None
+        except RecursionError:
+            raise VMError(f"Recursión demasiado profunda (límite {sys.getrecursionlimit()})") from None
+
+
+if __name__ == '__main__':
+    # Uso: python py_backend.py [archivo.c]   (sin archivo: VM frente a Python generado)
+    import time
+    from session import CompilationSession
+    from test_codigo_profesor import codigo_profesor
+    from vm import VirtualMachine
+
+    session = CompilationSession(engine='dfa')
+    if len(sys.argv) > 1:
+        result = session.compile_file(sys.argv[1])
+        print(compile_code(result.code, result.globals)[0])
+        sys.exit(0)
+
+    loop = """
+        int suma(int n) {
+            int s, i;
+            s = 0;
+            for (i = 0; i < n; i++) {
+                if (i / 3 * 3 == i || i > n - 10) s = s + i * 2;
+                else s = s - 1;
+            }
+            return s;
+        }"""
+    cases = [('fibonaci(24)', codigo_profesor, 'fibonaci', (24,)),
+             ('evaluar(1,0,3.5)', codigo_profesor, 'evaluar', (1, 0, 3.5)),
+             ('suma(1000000)', loop, 'suma', (1000000,))]
+    print(f"{'programa':<18} {'resultado':>14} {'VM (s)':>9} {'Python (s)':>11} {'aceleración':>11}")
+    for label, source, name, args in cases:
+        result = session.compile(source)
+        vm = VirtualMachine(result.code, result.globals)
+        t0 = time.perf_counter()
+        expected = vm.call(name, *args)
+        t1 = time.perf_counter()
+        program = PythonProgram(result.code, result.globals)
+        t2 = time.perf_counter()
+        value = program.call(name, *args)
+        t3 = time.perf_counter()
+        assert value == expected, (value, expected)
+        print(f"{label:<18} {str(value):>14} {t1 - t0:9.3f} {t3 - t2:11.3f} {(t1 - t0) / (t3 - t2):10.1f}x")
+
+    result = session.compile(codigo_profesor)
+    _cache.clear()
+    t0 = time.perf_counter()
+    PythonProgram(result.code)
+    t1 = time.perf_counter()
+    PythonProgram(result.code)
+    t2 = time.perf_counter()
+    print(f"\ntraducir + compilar: {(t1 - t0) * 1000:.2f} ms; desde la caché: {(t2 - t1) * 1000:.3f} ms")
+    print("\n--- fibonaci generado ---")
+    source = compile_code(result.code)[0]
+    print(source[source.index('def f_fibonaci'):source.index('def _init')])
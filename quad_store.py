@@ -0,0 +1,227 @@
+"""
+Almacén columnar de cuádruplos.
+
+En lugar de una tupla de cadenas por instrucción se guardan cuatro columnas
+de enteros (operador, operando1, operando2, resultado). Los operadores y los
+operandos se internan en tablas; los temporales no ocupan entrada en la
+tabla, se codifican directamente por su número:
+
+    código par   2*i     -> operands[i]   (operands[0] es None)
+    código impar 2*k + 1 -> temporal t{k}
+
+Iterar el almacén devuelve las tuplas de siempre, así que print_code() y
+cualquier consumidor de gen.code siguen funcionando. save()/load() usan un
+formato binario compacto; as_numpy() expone las columnas sin copiarlas si
+NumPy está instalado.
+"""
+import struct
+import sys
+from array import array
+
+MAGIC = b'QUAD'
+VERSION = 1
+
+
+class Temp(str):
+    """Nombre de temporal ('t5') que el almacén reconoce sin parsear cadenas."""
+    __slots__ = ()
+
+
+class QuadStore:
+    def __init__(self):
+        self.ops = array('H')
+        self.arg1 = array('I')
+        self.arg2 = array('I')
+        self.result = array('I')
+        self.opcodes = []           # índice -> operador
+        self._opcode_index = {}
+        self.operands = [None]      # índice -> operando
+        self._operand_index = {(type(None), None): 0}
+
+    # --- Internado ---
+    def _opcode(self, op):
+        code = self._opcode_index.get(op)
+        if code is None:
+            code = self._opcode_index[op] = len(self.opcodes)
+            self.opcodes.append(op)
+        return code
+
+    def _operand(self, value):
+        if type(value) is Temp:
+            return (int(value[1:]) << 1) | 1
+        key = (type(value), value)
+        index = self._operand_index.get(key)
+        if index is None:
+            index = self._operand_index[key] = len(self.operands)
+            self.operands.append(value)
+        return index << 1
+
+    def _decode(self, code):
+        if code & 1:
+            return Temp(f"t{code >> 1}")
+        return self.operands[code >> 1]
+
+    # --- Interfaz de lista de tuplas ---
+    def emit(self, op, arg1, arg2, result):
+        self.ops.append(self._opcode(op))
+        self.arg1.append(self._operand(arg1))
+        self.arg2.append(self._operand(arg2))
+        self.result.append(self._operand(result))
+
+    def append(self, quad):
+        self.emit(*quad)
+
+    def extend(self, quads):
+        for quad in quads:
+            self.emit(*quad)
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.ops)))]
+        decode = self._decode
+        return (self.opcodes[self.ops[index]], decode(self.arg1[index]),
+                decode(self.arg2[index]), decode(self.result[index]))
+
+    def __setitem__(self, index, quad):
+        """Reescribe una instrucción (lo usa el backpatching de saltos)."""
+        op, arg1, arg2, result = quad
+        self.ops[index] = self._opcode(op)
+        self.arg1[index] = self._operand(arg1)
+        self.arg2[index] = self._operand(arg2)
+        self.result[index] = self._operand(result)
+
+    def __delitem__(self, index):
+        for col in (self.ops, self.arg1, self.arg2, self.result):
+            del col[index]
+
+    def __iter__(self):
+        opcodes, decode = self.opcodes, self._decode
+        for op, a1, a2, res in zip(self.ops, self.arg1, self.arg2, self.result):
+            yield opcodes[op], decode(a1), decode(a2), decode(res)
+
+    def __eq__(self, other):
+        if isinstance(other, (QuadStore, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    # --- Vistas para análisis vectorizados ---
+    def columns(self):
+        return {'op': self.ops, 'arg1': self.arg1, 'arg2': self.arg2, 'result': self.result}
+
+    def as_numpy(self):
+        """Columnas como arreglos de NumPy que comparten memoria con el almacén."""
+        import numpy as np
+        return {name: np.frombuffer(col, dtype=np.dtype(col.typecode))
+                for name, col in self.columns().items()}
+
+    def nbytes(self):
+        return sum(col.itemsize * len(col) for col in self.columns().values())
+
+    # --- Formato binario ---
+    # cabecera: MAGIC, versión, nº de instrucciones, nº de operadores, nº de operandos
+    # tablas: por entrada un byte de tipo (0 None, 1 str, 2 int, 3 float) y el valor
+    # columnas: ops (u16), arg1, arg2, result (u32), little-endian
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<HIII', VERSION, len(self.ops), len(self.opcodes), len(self.operands)))
+            for value in self.opcodes:
+                _write_value(f, value)
+            for value in self.operands:
+                _write_value(f, value)
+            for col in (self.ops, self.arg1, self.arg2, self.result):
+                if sys.byteorder == 'big':
+                    col = array(col.typecode, col)
+                    col.byteswap()
+                col.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        store = cls()
+        with open(path, 'rb') as f:
+            if f.read(4) != MAGIC:
+                raise ValueError(f"{path}: no es un archivo de cuádruplos")
+            version, count, n_opcodes, n_operands = struct.unpack('<HIII', f.read(14))
+            if version != VERSION:
+                raise ValueError(f"{path}: versión {version} no soportada")
+            store.opcodes = [_read_value(f) for _ in range(n_opcodes)]
+            store.operands = [_read_value(f) for _ in range(n_operands)]
+            for col in (store.ops, store.arg1, store.arg2, store.result):
+                col.fromfile(f, count)
+                if sys.byteorder == 'big':
+                    col.byteswap()
+        store._opcode_index = {op: i for i, op in enumerate(store.opcodes)}
+        store._operand_index = {(type(v), v): i for i, v in enumerate(store.operands)}
+        return store
+
+
+def _write_value(f, value):
+    if value is None:
+        f.write(b'\x00')
+    elif isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"Operando no serializable: {value!r}")
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        f.write(b'\x01' + struct.pack('<I', len(data)) + data)
+    elif isinstance(value, int):
+        f.write(b'\x02' + struct.pack('<q', value))
+    else:
+        f.write(b'\x03' + struct.pack('<d', value))
+
+def _read_value(f):
+    tag = f.read(1)
+    if tag == b'\x00':
+        return None
+    if tag == b'\x01':
+        (size,) = struct.unpack('<I', f.read(4))
+        return f.read(size).decode('utf-8')
+    if tag == b'\x02':
+        return struct.unpack('<q', f.read(8))[0]
+    if tag == b'\x03':
+        return struct.unpack('<d', f.read(8))[0]
+    raise ValueError(f"Etiqueta de operando desconocida: {tag!r}")
+
+
+if __name__ == '__main__':
+    # Memoria retenida por el código intermedio: lista de tuplas frente a columnas
+    import gc
+    import os
+    import tempfile
+    import time
+    import tracemalloc
+    import quad_store
+    from session import CompilationSession
+    from test_codigo_profesor import codigo_profesor
+
+    source = codigo_profesor * (int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
+
+    results = {}
+    for ir in ('list', 'columnar'):
+        session = CompilationSession(engine='dfa', ir=ir)
+        start = time.perf_counter()
+        session.compile(source)
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        tracemalloc.start()
+        code = session.compile(source).code
+        del session
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[ir] = code
+        print(f"{ir:<9} {len(code)} instrucciones  {size / len(code):6.1f} bytes/instrucción  "
+              f"compilación {elapsed:.2f} s")
+
+    store = results['columnar']
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'code.quad')
+        start = time.perf_counter()
+        store.save(path)
+        loaded = quad_store.QuadStore.load(path)
+        elapsed = time.perf_counter() - start
+        print(f"binario   {os.path.getsize(path) / len(store):6.1f} bytes/instrucción  "
+              f"guardar+cargar {elapsed * 1000:.1f} ms")
+    print("Equivalente a la lista de tuplas:", store == results['list'] and loaded == store)
@@ -0,0 +1,202 @@
+"""
+Reciclado de temporales y asignación de registros por barrido lineal.
+
+Para cada función se calculan los intervalos de vida de los temporales
+(posición de la primera y la última instrucción en que están vivos, con la
+vitalidad entre bloques de dataflow.liveness) y se recorren en orden de
+inicio (Poletto y Sarkar):
+
+  - registers=None: reciclado. Cada temporal toma el número libre más bajo,
+    así que la función usa tantos temporales como su presión máxima.
+  - registers=k: como mucho k registros virtuales (t0..t{k-1}). Si no queda
+    ninguno se derrama el intervalo que termina más tarde. Un temporal
+    derramado pasa a una ranura de pila ($s0, $s1, ...); en 3AC un operando
+    puede estar en memoria, así que no hacen falta cargas ni almacenamientos.
+    Las ranuras también se reciclan entre sí.
+
+Las variables del usuario no se tocan: ya son posiciones de memoria.
+"""
+import heapq
+import time
+from bisect import insort
+
+from cfg import ControlFlowGraph, split_functions
+from dataflow import liveness
+from quad_store import QuadStore, Temp
+
+
+def live_intervals(cfg):
+    """{temporal: [inicio, fin]}; fin termina en .5 si el temporal sigue vivo tras esa instrucción."""
+    code = cfg.code
+    live = liveness(cfg)
+    universe = live.universe
+    temp_mask = universe.mask(name for name in universe.items if isinstance(name, Temp))
+    members = universe.members
+    intervals = {}
+
+    def extend(temp, position):
+        interval = intervals.get(temp)
+        if interval is None:
+            intervals[temp] = [position, position]
+        elif position < interval[0]:
+            interval[0] = position
+        elif position > interval[1]:
+            interval[1] = position
+
+    for block in cfg.blocks:
+        for i in range(block.start, block.end):
+            for operand in code[i][1:]:
+                if isinstance(operand, Temp):
+                    extend(operand, i)
+        if block.start < block.end:
+            for temp in members(live.IN[block.index] & temp_mask):
+                extend(temp, block.start)
+            for temp in members(live.OUT[block.index] & temp_mask):
+                extend(temp, block.end - 0.5)
+    return intervals
+
+
+def linear_scan(intervals, registers=None):
+    """
+    Asigna un número de registro a cada temporal. Devuelve
+    (asignación, derramados, presión máxima), con asignación temporal -> número
+    y derramados la lista de temporales sin registro.
+    """
+    order = sorted(intervals.items(), key=lambda item: (item[1][0], item[1][1]))
+    assignment = {}
+    spilled = []
+    active = []         # [(fin, temporal)] ordenada por fin
+    free = []           # montículo de registros libres
+    next_register = 0
+    peak = 0
+    for temp, (start, end) in order:
+        # Un registro cuyo último uso es esta instrucción se puede reutilizar aquí mismo
+        while active and active[0][0] <= start:
+            _, old = active.pop(0)
+            heapq.heappush(free, assignment[old])
+        peak = max(peak, len(active) + 1)
+        if free:
+            register = heapq.heappop(free)
+        elif registers is None or next_register < registers:
+            register = next_register
+            next_register += 1
+        else:
+            last_end, victim = active[-1]
+            if last_end > end:
+                # Se derrama el que vive más tiempo y su registro pasa al actual
+                active.pop()
+                register = assignment.pop(victim)
+                spilled.append(victim)
+            else:
+                spilled.append(temp)
+                continue
+        assignment[temp] = register
+        insort(active, (end, temp))
+    return assignment, spilled, peak
+
+
+class FunctionAllocation:
+    """Resultado de una función."""
+    __slots__ = ('name', 'instructions', 'temps', 'peak', 'registers', 'spilled',
+                 'spill_slots', 'seconds')
+
+    def __init__(self, name, instructions):
+        self.name = name
+        self.instructions = instructions
+        self.temps = 0          # temporales distintos antes de asignar
+        self.peak = 0           # máximo de temporales vivos a la vez
+        self.registers = 0      # registros (o temporales reciclados) usados
+        self.spilled = 0        # temporales derramados
+        self.spill_slots = 0    # ranuras de pila tras reciclarlas
+        self.seconds = 0.0
+
+    @property
+    def slots(self):
+        """Nombres que necesita ahora la función (registros + ranuras)."""
+        return self.registers + self.spill_slots
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['slots'] = self.slots
+        return data
+
+
+class AllocationReport:
+    def __init__(self, registers):
+        self.registers = registers
+        self.functions = []
+
+    def __str__(self):
+        mode = 'reciclado' if self.registers is None else f"{self.registers} registros"
+        before = sum(f.temps for f in self.functions)
+        after = sum(f.slots for f in self.functions)
+        lines = [f"Asignación ({mode}): {before} -> {after} temporales"]
+        for f in self.functions:
+            lines.append(f"  {f.name:<16} {f.temps:>7} -> {f.slots:<6} pico {f.peak:<5} "
+                         f"derramados {f.spilled:<5} {f.seconds * 1000:8.2f} ms")
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {'registers': self.registers, 'functions': [f.to_dict() for f in self.functions]}
+
+
+def allocate(code, registers=None):
+    """
+    Renombra los temporales de cada función. Devuelve (código, AllocationReport);
+    acepta una lista de tuplas o un QuadStore y devuelve el mismo tipo.
+    """
+    columnar = isinstance(code, QuadStore)
+    code = list(code)
+    report = AllocationReport(registers)
+    out = []
+    for name, start, stop in split_functions(code):
+        began = time.perf_counter()
+        stats = FunctionAllocation(name, stop - start)
+        intervals = live_intervals(ControlFlowGraph(code, start, stop))
+        assignment, spilled, peak = linear_scan(intervals, registers)
+        rename = {temp: Temp(f"t{register}") for temp, register in assignment.items()}
+        if spilled:
+            slots, _, _ = linear_scan({temp: intervals[temp] for temp in spilled})
+            for temp, slot in slots.items():
+                rename[temp] = f"$s{slot}"
+            stats.spill_slots = len(set(slots.values()))
+        for quad in code[start:stop]:
+            op, arg1, arg2, res = quad
+            out.append((op, rename.get(arg1, arg1) if isinstance(arg1, Temp) else arg1,
+                        rename.get(arg2, arg2) if isinstance(arg2, Temp) else arg2,
+                        rename.get(res, res) if isinstance(res, Temp) else res))
+        stats.temps = len(intervals)
+        stats.peak = peak
+        stats.registers = len(set(assignment.values()))
+        stats.spilled = len(spilled)
+        stats.seconds = time.perf_counter() - began
+        report.functions.append(stats)
+    if columnar:
+        store = QuadStore()
+        store.extend(out)
+        out = store
+    return out, report
+
+
+if __name__ == '__main__':
+    # Uso: python regalloc.py [-r K] [archivo.c]   (sin archivo: funciones sintéticas)
+    import sys
+    from session import CompilationSession
+    from test_codigo_profesor import codigo_profesor
+
+    args = sys.argv[1:]
+    registers = None
+    if '-r' in args:
+        k = args.index('-r')
+        registers = int(args[k + 1])
+        del args[k:k + 2]
+    session = CompilationSession(engine='dfa')
+    if args:
+        code = session.compile_file(args[0]).code
+    else:
+        # Muchas funciones con cuerpos largos de expresiones
+        body = "int a, b, c, d;\n" + "a = (a + b) * (c - d) + (a * 2 - b / 3) * (c + d * 4);\n" * 2000
+        source = codigo_profesor + "".join(f"int f{i}(int x){{\n{body}}}\n" for i in range(4))
+        code = session.compile(source).code
+    code, report = allocate(code, registers)
+    print(report)
@@ -0,0 +1,288 @@
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import parser as c_parser
+from dfa_lexer import make_lexer
+from stream_lexer import StreamLexer
+from syntax_tree import SyntaxTree, instrument_parser
+from symbol_table import ChainedSymbolTable
+from code_gen import Codegenerator, ColumnarCodegenerator
+from diagnostics import DiagnosticSink
+from optimizer import optimize
+from regalloc import allocate
+from profiler import CompilerProfiler, instrument_parser as profile_parser
+from preprocessor import Preprocessor
+from compile_cache import CompileCache
+from source_map import SourceMap, instrument_parser as span_parser
+
+
+class CompilationResult:
+    """Resultado de compilar una unidad: cuádruplos y diagnósticos."""
+    def __init__(self, name, code, diagnostics, ok=True, tree=None, optimization=None,
+                 allocation=None, globals=(), profile=None, includes=(), symbols=(),
+                 externals=(), spans=None, source_map=None, probes=()):
+        # diagnostics: lista de objetos diagnostics.Diagnostic
+        self.name = name
+        self.code = code
+        self.diagnostics = diagnostics
+        self.ok = ok
+        self.tree = tree    # syntax_tree.SyntaxTree si la sesión construye el AST
+        self.optimization = optimization    # optimizer.OptimizationReport con opt_level > 0
+        self.allocation = allocation        # regalloc.AllocationReport si se asignan temporales
+        self.globals = list(globals)        # variables declaradas en el ámbito global
+        self.profile = profile              # profiler.CompilerProfiler si la sesión perfila
+        self.includes = list(includes)      # cabeceras incluidas por el preprocesador
+        self.probes = list(probes)          # rutas de #include probadas que no existían
+        self.symbols = list(symbols)        # (nombre, tipo, línea) de variables y funciones globales
+        self.externals = list(externals)    # (nombre, firma supuesta, línea) de funciones no declaradas
+        self.spans = spans                  # source_map.QuadSpans paralelo a code (sesión con spans=True)
+        self.source_map = source_map        # source_map.SourceMap de la entrada (con spans)
+        self.cached = False                 # True si viene de compile_cache.CompileCache
+
+    def __repr__(self):
+        return (f"CompilationResult({self.name!r}, {len(self.code)} quads, "
+                f"{len(self.diagnostics)} diagnostics, ok={self.ok})")
+
+
+# 'list': lista de tuplas; 'columnar': quad_store.QuadStore
+IR_FORMATS = {'list': Codegenerator, 'columnar': ColumnarCodegenerator}
+
+
+class CompilationSession:
+    """
+    Estado aislado de una compilación: clon del lexer, tabla de símbolos y
+    generador de código propios. Dos sesiones nunca comparten estado, por lo
+    que se pueden compilar varias unidades seguidas (o en paralelo, una
+    sesión por proceso) sin reiniciar el intérprete.
+    """
+    def __init__(self, tracing=False, echo=False, engine='ply', build_ast=False, ir='list',
+                 opt_level=0, recycle_temps=False, registers=None, profile=False,
+                 preprocess=False, include_path=(), defines=None, cache=None, spans=False):
+        if ir not in IR_FORMATS:
+            raise ValueError(f"Formato de código intermedio desconocido: {ir!r}")
+        self.tracing = tracing
+        self.echo = echo
+        self.engine = engine
+        self.build_ast = build_ast
+        self.ir = ir
+        self.opt_level = opt_level
+        # registers=k: barrido lineal con k registros; recycle_temps: sin límite
+        self.recycle_temps = recycle_temps
+        self.registers = registers
+        self.profile = profile
+        # preprocess: #define/#include se resuelven antes del parser (preprocessor.py)
+        self.preprocess = preprocess
+        self.include_path = list(include_path)
+        self.defines = dict(defines or {})
+        # cache: compile_cache.CompileCache; no se usa al perfilar
+        self.cache = cache
+        # spans: cada cuádruplo guarda su tramo de fuente (source_map.py)
+        self.spans = spans
+        self.source_map = None
+        self.lexer = make_lexer(engine)
+        self.active_lexer = self.lexer
+        if build_ast:
+            self.parser = instrument_parser(c_parser.parser)
+        else:
+            self.parser = copy.copy(c_parser.parser)
+        if spans:
+            self.parser = span_parser(self.parser)
+        if profile:
+            self.parser = profile_parser(self.parser)
+        # p_error no recibe el lexer al final del archivo
+        self.parser.errorfunc = lambda tok: c_parser.report_syntax_error(self.active_lexer, tok)
+        self.reset()
+
+    def reset(self):
+        """Descarta el estado de la unidad anterior."""
+        self.diagnostics = DiagnosticSink(tracing=self.tracing, echo=self.echo)
+        self.symbol_table = ChainedSymbolTable(self.diagnostics)
+        self.gen = IR_FORMATS[self.ir]()
+        if self.spans:
+            self.gen.track_spans()
+        self.tree = SyntaxTree() if self.build_ast else None
+        self.source_map = None
+        self.profiler = CompilerProfiler(self.parser.productions) if self.profile else None
+        if self.profiler is not None and self.spans:
+            self.profiler.spots = {}
+        self._attach(self.lexer)
+        self.lexer.lineno = 1
+
+    def _attach(self, lexer):
+        """Conecta el estado de la sesión al lexer que usará el parser."""
+        lexer.diagnostics = self.diagnostics
+        lexer.symbol_table = self.symbol_table
+        lexer.gen = self.gen
+        lexer.ast = self.tree
+        lexer.profiler = self.profiler
+        lexer.source_map = self.source_map
+        self.active_lexer = lexer
+
+    def compile(self, source, name='<string>'):
+        """Compila `source` y devuelve un CompilationResult."""
+        key = None
+        if self.cache is not None and not self.profile:
+            key = self.cache.key(source, self._cache_options(name))
+            result = self.cache.load(key, name)
+            if result is not None:
+                if self.echo:
+                    for diag in result.diagnostics:
+                        print(diag)
+                return result
+        self.reset()
+        # El índice de líneas se construye en la primera consulta (un error, un tramo)
+        self.source_map = SourceMap(source, name)
+        self._attach(self.lexer)
+        result = self._run(source, self.lexer, name)
+        if key is not None:
+            self.cache.store(key, result)
+        return result
+
+    def _cache_options(self, name):
+        """Opciones que cambian el resultado de compilar (parte de la clave de caché)."""
+        options = (self.ir, self.opt_level, self.recycle_temps, self.registers, self.build_ast,
+                   self.tracing, self.preprocess, self.spans)
+        if self.preprocess:
+            # Las inclusiones con comillas dependen del directorio del archivo
+            folder = os.path.dirname(os.path.abspath(name)) if os.path.isfile(name) else os.getcwd()
+            options += (folder, tuple(self.include_path), sorted(self.defines.items()))
+        return options
+
+    def compile_stream(self, source, name=None, chunk_size=None):
+        """
+        Compila desde una ruta (mmap) o un objeto archivo sin cargar la
+        entrada completa en memoria (ver stream_lexer.py).
+        """
+        self.reset()
+        if name is None:
+            name = source if isinstance(source, (str, os.PathLike)) else getattr(source, 'name', '<stream>')
+        lexer = StreamLexer(source) if chunk_size is None else StreamLexer(source, chunk_size)
+        # Sin el texto completo, el índice se alimenta fragmento a fragmento
+        self.source_map = SourceMap(name=name)
+        self._attach(lexer)
+        return self._run(None, lexer, name)
+
+    def _phase(self, name, function, *args):
+        """function(*args), cronometrada como fase `name` si la sesión perfila."""
+        if self.profiler is None:
+            return function(*args)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.profiler.phases[name] = time.perf_counter() - start
+
+    def _run(self, source, lexer, name):
+        if self.preprocess:
+            lexer = Preprocessor(lexer, self.include_path, self.defines, name)
+            self._attach(lexer)
+        if self.profiler is not None:
+            if self.spans:
+                self.profiler.source_map = self.source_map
+            self.profiler.watch(lexer, self.symbol_table)
+        try:
+            self._phase('parse', self.parser.parse, source, lexer)
+        except Exception as e:
+            self.diagnostics.error('I001', "%s", str(e), line=lexer.lineno)
+        finally:
+            if self.profiler is not None:
+                self.profiler.unwatch()
+        # El QuadStore es propio de cada reset(), no hace falta copiarlo
+        code = self.gen.code if self.ir == 'columnar' else list(self.gen.code)
+        if self.profiler is not None:
+            self.profiler.count_quads(code)
+        report = None
+        if self.opt_level:
+            code, report = self._phase('optimize', optimize, code, self.opt_level)
+        allocation = None
+        if self.recycle_temps or self.registers is not None:
+            code, allocation = self._phase('regalloc', allocate, code, self.registers)
+        symbols = [(symbol.name, symbol.type, symbol.line)
+                   for symbol in self.symbol_table.global_symbols()]
+        spans = source_map = None
+        if self.spans:
+            source_map = self.source_map
+            # El optimizador mueve y borra instrucciones; la asignación de registros solo renombra
+            spans = self.gen.spans if not self.opt_level else None
+        return CompilationResult(name, code, list(self.diagnostics),
+                                 not self.diagnostics.has_errors(), self.tree, report, allocation,
+                                 self.gen.globals, self.profiler,
+                                 lexer.includes if self.preprocess else (),
+                                 symbols, self.gen.externals, spans, source_map,
+                                 lexer.probes if self.preprocess else ())
+
+    def compile_file(self, path):
+        with open(path, encoding='utf-8') as f:
+            return self.compile(f.read(), name=path)
+
+
+# Una sesión por proceso trabajador, reutilizada entre archivos.
+_worker_session = None
+_worker_options = None
+
+def _compile_in_worker(path, engine='ply', opt_level=0, profile=False, preprocess=None,
+                       cache_dir=None):
+    # preprocess: None, o (include_path, defines) para preprocesar
+    global _worker_session, _worker_options
+    options = (engine, profile, preprocess, cache_dir)
+    if _worker_session is None or _worker_options != options:
+        include_path, defines = preprocess or ((), None)
+        _worker_session = CompilationSession(engine=engine, profile=profile,
+                                             preprocess=preprocess is not None,
+                                             include_path=include_path, defines=defines,
+                                             cache=CompileCache(cache_dir) if cache_dir else None)
+        _worker_options = options
+    _worker_session.opt_level = opt_level
+    try:
+        return _worker_session.compile_file(path)
+    except (OSError, UnicodeDecodeError) as e:
+        diagnostics = DiagnosticSink()
+        diagnostics.error('I001', "%s", str(e))
+        return CompilationResult(path, [], list(diagnostics), ok=False)
+
+def compile_batch(paths, workers=None, chunksize=8, engine='ply', opt_level=0, profile=False,
+                  preprocess=False, include_path=(), defines=None, cache_dir=None):
+    """
+    Compila muchos archivos repartiéndolos en un pool de procesos.
+    Devuelve una lista de CompilationResult en el mismo orden que `paths`;
+    con profile=True cada resultado trae su perfil (se suman con merge).
+    Cada proceso guarda los tokens de las cabeceras en su propia HeaderCache;
+    con cache_dir todos comparten la caché de resultados en disco.
+    """
+    paths = list(paths)
+    options = (tuple(include_path), dict(defines or {})) if preprocess else None
+    if workers == 1 or len(paths) <= 1:
+        return [_compile_in_worker(path, engine, opt_level, profile, options, cache_dir)
+                for path in paths]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_compile_in_worker, paths, [engine] * len(paths),
+                             [opt_level] * len(paths), [profile] * len(paths),
+                             [options] * len(paths), [cache_dir] * len(paths),
+                             chunksize=chunksize))
+
+
+if __name__ == '__main__':
+    # Uso: python session.py [-O0|-O1|-O2] [-P] [-Idir] [-DNOMBRE=valor] [--cache=dir] archivo.c ...
+    # -P activa el preprocesador (también -I y -D)
+    import sys
+
+    args = sys.argv[1:]
+    paths = [arg for arg in args if not arg.startswith('-')]
+    levels = [int(arg[2:] or 1) for arg in args if arg.startswith('-O')]
+    include_path = [arg[2:] for arg in args if arg.startswith('-I')]
+    defines = dict(arg[2:].partition('=')[::2] for arg in args if arg.startswith('-D'))
+    defines = {name: text or '1' for name, text in defines.items()}
+    preprocess = '-P' in args or bool(include_path) or bool(defines)
+    caches = [arg.partition('=')[2] for arg in args if arg.startswith('--cache=')]
+    results = compile_batch(paths, opt_level=levels[-1] if levels else 0, preprocess=preprocess,
+                            include_path=include_path, defines=defines,
+                            cache_dir=caches[-1] if caches else None)
+    for result in results:
+        print(result)
+        if result.optimization:
+            print("  " + str(result.optimization).replace("\n", "\n  "))
+        for diag in result.diagnostics:
+            print(f"  {diag}")
@@ -0,0 +1,249 @@
+"""
+Mapa de fuente: posición (lexpos) -> (línea, columna) y tramos de cada
+cuádruplo.
+
+Los tokens solo traen lineno y lexpos. El mapa guarda, una vez por entrada,
+el desplazamiento donde empieza cada línea en un array('i'); convertir una
+posición en (línea, columna) es una búsqueda binaria, sin volver a recorrer
+el texto. Con la línea ya conocida (la del token) la columna sale en O(1).
+El índice se construye en la primera consulta, así que una compilación sin
+errores ni tramos no paga nada; en flujo (stream_lexer.py) se alimenta con
+feed() a medida que llegan los fragmentos.
+
+Con CompilationSession(spans=True) el parser se envuelve (como el AST en
+syntax_tree.py) para que cada símbolo reducido sepa su tramo [inicio, fin)
+en el texto, y Codegenerator anota el tramo de la producción que emitió cada
+instrucción (ver Codegenerator.track_spans):
+
+    session = CompilationSession(spans=True)
+    result = session.compile(source, 'main.c')
+    for quad, (start, end) in zip(result.code, result.spans):
+        line, column = result.source_map.location(start)
+
+Los tokens que vienen de una cabecera (#include) no pertenecen al texto del
+mapa: llevan endlexpos = -1 y sus tramos son (-1, -1).
+"""
+import copy
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, count
+
+from ply.lex import LexToken
+
+# Tipos de token cuyo valor no incluye las comillas del texto
+_QUOTED = ('STRING_LITERAL', 'CHAR_LITERAL')
+
+
+def _line_starts(text, base=0):
+    """Desplazamientos (desde `base`) donde empieza cada línea tras un '\\n' de `text`."""
+    if '\n' not in text:
+        return ()
+    # base + len(l0) + 1, base + len(l0) + len(l1) + 2, ... sin bucle en Python
+    parts = text.split('\n')
+    parts.pop()
+    return map(int.__add__, accumulate(map(len, parts)), count(base + 1))
+
+
+class SourceMap:
+    """Índice de inicios de línea de una entrada."""
+    def __init__(self, text=None, name='<string>'):
+        self.name = name
+        self.text = text
+        self.size = 0
+        self._starts = None if text is not None else array('i', [0])
+
+    @property
+    def starts(self):
+        if self._starts is None:
+            self._starts = array('i', [0])
+            self._starts.extend(_line_starts(self.text))
+            self.size = len(self.text)
+        return self._starts
+
+    def feed(self, chunk):
+        """Añade el siguiente fragmento de una entrada leída por partes."""
+        starts = self.starts
+        starts.extend(_line_starts(chunk, self.size))
+        self.size += len(chunk)
+
+    def __len__(self):
+        """Número de líneas."""
+        return len(self.starts)
+
+    def location(self, offset):
+        """(línea, columna) de una posición, ambas desde 1."""
+        starts = self.starts
+        line = bisect_right(starts, offset)
+        return line, offset - starts[line - 1] + 1
+
+    def column(self, line, offset):
+        """Columna (desde 1) de `offset`, que está en la línea `line`."""
+        starts = self.starts
+        if 0 < line <= len(starts) and starts[line - 1] <= offset and \
+                (line == len(starts) or offset < starts[line]):
+            return offset - starts[line - 1] + 1
+        # La línea del token no coincide con el texto (p.ej. un '\n' dentro de una cadena)
+        return self.location(offset)[1]
+
+    def line_text(self, line):
+        """Texto de la línea `line` sin el salto final (None si no se guardó el texto)."""
+        if self.text is None or not 0 < line <= len(self.starts):
+            return None
+        starts = self.starts
+        end = starts[line] - 1 if line < len(starts) else len(self.text)
+        return self.text[starts[line - 1]:end]
+
+    def describe(self, start, end=None):
+        """'nombre:línea:columna' de un tramo, con la línea y un subrayado si hay texto."""
+        if start < 0:
+            return f"{self.name}: (cabecera)"
+        line, column = self.location(start)
+        where = f"{self.name}:{line}:{column}"
+        text = self.line_text(line)
+        if text is None:
+            return where
+        line_end = start - column + 1 + len(text)
+        width = max(1, min(end if end is not None else start + 1, line_end) - start)
+        return f"{where}\n    {text}\n    {' ' * (column - 1)}{'^' * width}"
+
+    def __getstate__(self):
+        # Entre procesos y en la caché viaja el índice, no el texto
+        state = self.__dict__.copy()
+        state['_starts'] = self.starts
+        state['text'] = None
+        return state
+
+    def __repr__(self):
+        return f"SourceMap({self.name!r}, {len(self)} líneas)"
+
+
+class QuadSpans:
+    """Tramo (inicio, fin) de cada cuádruplo, en dos arreglos paralelos (8 bytes por cuádruplo)."""
+    def __init__(self):
+        self.starts = array('i')
+        self.ends = array('i')
+
+    def append(self, span):
+        start, end = span
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def delete(self, start, stop):
+        """Quita los tramos [start, stop), como `del code[start:stop]`."""
+        del self.starts[start:stop]
+        del self.ends[start:stop]
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        return self.starts[i], self.ends[i]
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def nbytes(self):
+        return self.starts.itemsize * len(self.starts) * 2
+
+
+def token_end(tok):
+    """Fin (exclusivo) del token en el texto; -1 si viene de una cabecera."""
+    end = getattr(tok, 'endlexpos', None)
+    if end is not None:
+        return end
+    # Los literales numéricos se reescriben con str(); su longitud es aproximada
+    length = len(str(tok.value))
+    return tok.lexpos + (length + 2 if tok.type in _QUOTED else length)
+
+
+def symbol_span(sym):
+    """(inicio, fin) de un símbolo de la pila del parser; (-1, -1) si no se conoce."""
+    if type(sym) is LexToken:
+        return sym.lexpos, token_end(sym)
+    return getattr(sym, 'lexpos', -1), getattr(sym, 'endlexpos', -1)
+
+
+def _spanned_action(func):
+    def action(p):
+        pslice = p.slice
+        start = end = -1
+        for sym in pslice[1:]:
+            if type(sym) is LexToken:
+                first, last = sym.lexpos, token_end(sym)
+            else:
+                first, last = getattr(sym, 'lexpos', -1), getattr(sym, 'endlexpos', -1)
+            if first < 0 or last < 0:
+                continue
+            if start < 0:
+                start = first
+            end = last
+        if start < 0 and len(pslice) == 1:
+            # Marcador (producción vacía): tramo vacío tras el símbolo anterior. Lo
+            # que emite apunta a su parte de la regla (ver marker_span en parser.py)
+            prev = p.stack[-1]
+            if type(prev) is LexToken:
+                end = token_end(prev)
+            else:
+                end = getattr(prev, 'endlexpos', -1)
+            start = end
+        target = pslice[0]
+        target.lexpos, target.endlexpos = start, end
+        p.lexer.gen.span = (start, end)
+        func(p)
+    return action
+
+def instrument_parser(parser):
+    """Copia del parser cuyas acciones fijan el tramo de cada reducción en gen.span."""
+    twin = copy.copy(parser)
+    twin.productions = []
+    for prod in parser.productions:
+        prod = copy.copy(prod)
+        if prod.callable is not None:
+            prod.callable = _spanned_action(prod.callable)
+        twin.productions.append(prod)
+    return twin
+
+
+if __name__ == '__main__':
+    # Uso: python source_map.py [archivo.c]  -> cuádruplos con su posición de origen
+    # Sin archivo: benchmark de búsquedas en un texto de una sola línea de varios MB
+    import sys
+    import time
+
+    if len(sys.argv) > 1:
+        from code_gen import format_quad
+        from session import CompilationSession
+
+        path = sys.argv[1]
+        result = CompilationSession(spans=True).compile_file(path)
+        source_map = result.source_map
+        for diag in result.diagnostics:
+            print(diag)
+        for quad, (start, end) in zip(result.code, result.spans):
+            where = '-' if start < 0 else '%d:%d' % source_map.location(start)
+            print(f"{where:>10}  {format_quad(quad)}")
+        sys.exit()
+
+    from test_codigo_profesor import codigo_profesor
+    one_line = codigo_profesor.replace('\n', ' ') * 20000
+    many_lines = codigo_profesor * 20000
+    for label, text in (('una línea', one_line), ('muchas líneas', many_lines)):
+        start = time.perf_counter()
+        source_map = SourceMap(text)
+        lines = len(source_map)
+        built = time.perf_counter() - start
+        offsets = range(0, len(text), max(1, len(text) // 100000))
+        start = time.perf_counter()
+        for offset in offsets:
+            source_map.location(offset)
+        lookup = (time.perf_counter() - start) / len(offsets)
+        # Sin índice: contar los saltos de línea anteriores y buscar el último
+        sample = offsets[::len(offsets) // 200]
+        start = time.perf_counter()
+        for offset in sample:
+            text.count('\n', 0, offset)
+            text.rfind('\n', 0, offset)
+        rescan = (time.perf_counter() - start) / len(sample)
+        print(f"{label:<14} {len(text) / 1e6:6.1f} MB, {lines:>8} líneas: índice en "
+              f"{built * 1000:7.1f} ms, búsqueda {lookup * 1e6:6.2f} us "
+              f"(reescaneo {rescan * 1e6:9.1f} us)")
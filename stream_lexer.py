@@ -0,0 +1,133 @@
+"""
+Front end léxico en streaming para archivos muy grandes.
+
+Lee la entrada por fragmentos (mmap sobre una ruta, o read() sobre un objeto
+archivo), la decodifica de forma incremental y la tokeniza con el motor DFA
+de dfa_lexer.py. Solo se conserva el texto pendiente desde el último token
+completo, así que la memoria depende del tamaño del fragmento y del token
+más largo (un comentario /* ... */ enorme, por ejemplo), no del archivo.
+"""
+import codecs
+import mmap
+import os
+
+from dfa_lexer import scan
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _mmap_chunks(path, chunk_size):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        # madvise exige desplazamientos alineados a página
+        chunk_size = max(mmap.PAGESIZE, chunk_size - chunk_size % mmap.PAGESIZE)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for pos in range(0, len(mm), chunk_size):
+                yield mm[pos:pos + chunk_size]
+                # Las páginas ya copiadas no deben seguir contando en el RSS
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_DONTNEED, pos, min(chunk_size, len(mm) - pos))
+
+def _file_chunks(fileobj, chunk_size):
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class StreamLexer:
+    """
+    Lexer con la interfaz de PLY (token()) que lee de una ruta o de un
+    objeto archivo. Se pasa a parser.parse(lexer=...) sin texto de entrada.
+    Las acciones semánticas leen diagnostics/symbol_table/gen de este objeto.
+    """
+    def __init__(self, source, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.lineno = 1
+        self.lexpos = 0
+        self._tokens = None
+
+    def _chunks(self):
+        """Fragmentos de texto decodificado."""
+        if isinstance(self.source, (str, os.PathLike)):
+            raw = _mmap_chunks(self.source, self.chunk_size)
+        else:
+            raw = _file_chunks(self.source, self.chunk_size)
+        decoder = None
+        for chunk in raw:
+            if isinstance(chunk, str):
+                yield chunk
+                continue
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(self.encoding)()
+            yield decoder.decode(chunk)
+        if decoder is not None:
+            yield decoder.decode(b'', final=True)
+
+    def tokens(self):
+        """Generador de LexTokens sobre toda la entrada."""
+        diagnostics = getattr(self, 'diagnostics', None)
+        source_map = getattr(self, 'source_map', None)
+        pending = ''
+        base = 0            # posición absoluta de pending[0]
+        line = self.lineno
+        line_start = 0      # inicio de la línea actual, relativo a pending[0]
+        chunks = self._chunks()
+        final = False
+        while not final:
+            chunk = next(chunks, None)
+            if chunk is None:
+                final = True
+            elif not chunk:
+                continue
+            else:
+                if source_map is not None:
+                    source_map.feed(chunk)
+                pending += chunk
+                if len(pending) < self.chunk_size // 2:
+                    continue    # acumular hasta tener un fragmento útil
+            stream, end_line = scan(pending, diagnostics, line, final, line_start=line_start)
+            for i in range(len(stream)):
+                tok = stream.token(i)
+                tok.lexpos += base
+                tok.lexer = self
+                self.lineno = tok.lineno
+                self.lexpos = tok.lexpos
+                yield tok
+            # Los saltos de línea consumidos tras el último token también cuentan
+            line = end_line
+            line_start = stream.line_start - stream.end
+            base += stream.end
+            pending = pending[stream.end:]
+        self.lineno = line
+        self.lexpos = base
+
+    def input(self, data):
+        raise TypeError("StreamLexer lee de su fuente; use parser.parse(lexer=...) sin texto")
+
+    def token(self):
+        if self._tokens is None:
+            self._tokens = self.tokens()
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self.tokens()
+
+
+if __name__ == '__main__':
+    # Uso: python stream_lexer.py archivo.c  -> tokens/s y memoria máxima (RSS)
+    import resource
+    import sys
+    import time
+
+    start = time.perf_counter()
+    count = sum(1 for _ in StreamLexer(sys.argv[1]))
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    size = os.path.getsize(sys.argv[1])
+    print(f"{count} tokens, {size / 1e6:.1f} MB en {elapsed:.2f} s "
+          f"({count / elapsed:,.0f} tokens/s), RSS máximo {peak:.1f} MB")
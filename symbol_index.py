@@ -0,0 +1,586 @@
+"""
+Índice persistente de los símbolos globales de todo un proyecto.
+
+Cada unidad compilada aporta sus definiciones globales (variables y
+funciones, con su tipo o firma y la línea; CompilationResult.symbols) y sus
+referencias externas (llamadas a funciones que no declara, con la firma que
+se supuso; CompilationResult.externals). El índice vive en un directorio
+con dos archivos:
+
+    base.idx      tabla compacta de solo lectura que se abre con mmap: una
+                  consulta lee solo los registros que necesita
+    journal.log   actualizaciones por unidad desde la última compactación
+                  (solo se añade al final; se carga en memoria al abrir)
+
+Formato de base.idx (little endian, registros de tamaño fijo):
+    cabecera      MAGIC, contadores y desplazamiento de cada sección
+    unidades      ordenadas por ruta (búsqueda binaria): ruta, hash del
+                  fuente y rango de sus símbolos y de sus referencias
+    símbolos      agrupados por unidad: nombre, tipo, unidad, línea y el
+                  siguiente símbolo con el mismo nombre
+    externas      agrupadas por unidad: nombre, firma supuesta y línea
+    cubetas       tabla hash abierta (crc32 del nombre) con el primer
+                  símbolo de cada nombre
+    cadenas       nombres, tipos y rutas en UTF-8, cada uno una sola vez
+
+Actualizar una unidad añade una entrada al diario (longitud, crc32 y la
+entrada serializada, así que una escritura cortada se descarta al abrir).
+Cuando el diario cubre más de una cuarta parte de las unidades de la base
+(y al menos COMPACT_MIN) se reescribe la base con todo y se vacía el
+diario. La base nueva se publica con os.replace: un lector que tenga la
+anterior abierta sigue viendo un archivo completo. Se admite un solo
+escritor por índice.
+
+    index = SymbolIndex('.symbols')
+    index.update_results(compile_batch(paths))
+    report = index.resolve()        # referencias sin definición o con otra firma
+"""
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from array import array
+
+from type_system import FunctionType, compatible, parse_type
+
+MAGIC = b'SYMIDX01'
+BASE_FILE = 'base.idx'
+JOURNAL_FILE = 'journal.log'
+COMPACT_MIN = 256               # unidades en el diario antes de compactar
+
+HEADER = struct.Struct('<8s9I')
+UNIT = struct.Struct('<II16s4I')        # ruta, hash, primer símbolo, símbolos, primera externa, externas
+SYMBOL = struct.Struct('<7I')           # nombre, tipo, unidad, línea, siguiente (NO_NEXT: fin)
+EXTERN = struct.Struct('<6I')           # nombre, firma, unidad, línea
+ENTRY = struct.Struct('<II')            # longitud y crc32 de una entrada del diario
+NO_NEXT = 0xFFFFFFFF
+
+
+def source_digest(source):
+    """Hash del texto de una unidad (para saber si hay que volver a indexarla)."""
+    return hashlib.blake2b(source.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+def _encode(text):
+    return text.encode('utf-8', 'surrogatepass')
+
+
+class Definition:
+    """Definición global de `name` en `unit`."""
+    __slots__ = ('name', 'type', 'unit', 'line')
+
+    def __init__(self, name, type, unit, line):
+        self.name = name
+        self.type = type            # escritura del tipo o de la firma ('int(int,char*)')
+        self.unit = unit
+        self.line = line
+
+    @property
+    def is_function(self):
+        return self.type.endswith(')')
+
+    def __repr__(self):
+        return f"Definition({self.name!r}, {self.type!r}, {self.unit!r}, line={self.line})"
+
+
+class LinkReport:
+    """Resultado de resolve(): qué referencias externas quedan sin resolver."""
+    def __init__(self):
+        self.resolved = 0
+        self.unresolved = []        # (unidad, nombre, línea)
+        self.mismatched = []        # (unidad, nombre, línea, Definition)
+        self.duplicates = {}        # nombre -> [Definition] en varias unidades
+
+    @property
+    def ok(self):
+        return not (self.unresolved or self.mismatched or self.duplicates)
+
+    def __str__(self):
+        lines = [f"{self.resolved} referencias resueltas, {len(self.unresolved)} sin definición, "
+                 f"{len(self.mismatched)} con otra firma, {len(self.duplicates)} definiciones duplicadas"]
+        for unit, name, line in self.unresolved:
+            lines.append(f"  {unit}:{line}: '{name}' no está definida en ninguna unidad")
+        for unit, name, line, definition in self.mismatched:
+            lines.append(f"  {unit}:{line}: la llamada a '{name}' no coincide con {definition.type} "
+                         f"({definition.unit}:{definition.line})")
+        for name, definitions in sorted(self.duplicates.items()):
+            where = ', '.join(f"{d.unit}:{d.line}" for d in definitions)
+            lines.append(f"  '{name}' definida en {where}")
+        return '\n'.join(lines)
+
+
+class SymbolIndex:
+    """Índice de símbolos globales en disco: base con mmap más diario en memoria."""
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.base_path = os.path.join(directory, BASE_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.compactions = 0
+        self._file = None
+        self._map = None
+        self._open_base()
+        self._load_journal()
+
+    # --- Base (mmap) ---
+    def _open_base(self):
+        self._close_base()
+        self._counts = (0, 0, 0, 0)
+        self._shadowed = set()          # unidades de la base sustituidas en el diario
+        try:
+            f = open(self.base_path, 'rb')
+        except FileNotFoundError:
+            return
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            f.close()
+            return
+        self._file = f
+        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, units, symbols, externs, buckets, self._units_off, self._symbols_off,
+         self._externs_off, self._buckets_off, self._strings_off) = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self._close_base()
+            raise ValueError(f"{self.base_path} no es un índice de símbolos")
+        self._counts = (units, symbols, externs, buckets)
+
+    def _close_base(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._map = self._file = None
+
+    def _string(self, offset, length):
+        start = self._strings_off + offset
+        return self._map[start:start + length].decode('utf-8', 'surrogatepass')
+
+    def _base_unit(self, path):
+        """Índice de la unidad `path` en la base (búsqueda binaria), o None."""
+        key = _encode(path)
+        lo, hi = 0, self._counts[0]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset, length = UNIT.unpack_from(self._map, self._units_off + mid * UNIT.size)[:2]
+            start = self._strings_off + offset
+            current = self._map[start:start + length]
+            if current == key:
+                return mid
+            if current < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _base_record(self, index):
+        path_off, path_len, digest, sym_first, sym_count, ext_first, ext_count = \
+            UNIT.unpack_from(self._map, self._units_off + index * UNIT.size)
+        return self._string(path_off, path_len), digest, sym_first, sym_count, ext_first, ext_count
+
+    def _base_symbol(self, index):
+        name_off, name_len, type_off, type_len, unit, line, _ = \
+            SYMBOL.unpack_from(self._map, self._symbols_off + index * SYMBOL.size)
+        return self._string(name_off, name_len), self._string(type_off, type_len), unit, line
+
+    def _base_externs(self, first, count):
+        for i in range(first, first + count):
+            name_off, name_len, type_off, type_len, _, line = \
+                EXTERN.unpack_from(self._map, self._externs_off + i * EXTERN.size)
+            yield self._string(name_off, name_len), self._string(type_off, type_len), line
+
+    def _base_entry(self, index):
+        """(ruta, hash, símbolos, externas) de una unidad de la base."""
+        path, digest, sym_first, sym_count, ext_first, ext_count = self._base_record(index)
+        symbols = []
+        for i in range(sym_first, sym_first + sym_count):
+            name, type, _, line = self._base_symbol(i)
+            symbols.append((name, type, line))
+        return path, digest, symbols, list(self._base_externs(ext_first, ext_count))
+
+    def _base_lookup(self, name):
+        """Definiciones de `name` en la base: una sonda en las cubetas y su cadena."""
+        buckets = self._counts[3]
+        if not buckets:
+            return []
+        key = _encode(name)
+        mask = buckets - 1
+        slot = zlib.crc32(key) & mask
+        found = []
+        while True:
+            head = struct.unpack_from('<I', self._map, self._buckets_off + slot * 4)[0]
+            if not head:
+                return found
+            record = SYMBOL.unpack_from(self._map, self._symbols_off + (head - 1) * SYMBOL.size)
+            start = self._strings_off + record[0]
+            if self._map[start:start + record[1]] == key:
+                break
+            slot = (slot + 1) & mask
+        index = head - 1
+        while index != NO_NEXT:
+            name_off, name_len, type_off, type_len, unit, line, index = \
+                SYMBOL.unpack_from(self._map, self._symbols_off + index * SYMBOL.size)
+            if unit not in self._shadowed:
+                path = self._base_record(unit)[0]
+                found.append(Definition(name, self._string(type_off, type_len), path, line or None))
+        return found
+
+    # --- Diario ---
+    def _load_journal(self):
+        self.units = {}                 # ruta -> (hash, símbolos, externas); None si se borró
+        self._names = {}                # nombre -> {ruta: [Definition]} de las unidades del diario
+        try:
+            with open(self.journal_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        pos = 0
+        while pos + ENTRY.size <= len(data):
+            length, crc = ENTRY.unpack_from(data, pos)
+            payload = data[pos + ENTRY.size:pos + ENTRY.size + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            self._apply(*pickle.loads(payload))
+            pos += ENTRY.size + length
+        if pos < len(data):
+            # Escritura interrumpida: se descarta el final para seguir añadiendo
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(pos)
+
+    def _apply(self, path, entry):
+        old = self.units.get(path)
+        if old is not None:
+            for name, _, _ in old[1]:
+                users = self._names.get(name)
+                if users is not None:
+                    users.pop(path, None)
+                    if not users:
+                        del self._names[name]
+        self.units[path] = entry
+        if self._map is not None:
+            index = self._base_unit(path)
+            if index is not None:
+                self._shadowed.add(index)
+        if entry is not None:
+            for name, type, line in entry[1]:
+                self._names.setdefault(name, {}).setdefault(path, []).append(
+                    Definition(name, type, path, line))
+
+    def _append(self, records):
+        data = bytearray()
+        for record in records:
+            payload = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+            data += ENTRY.pack(len(payload), zlib.crc32(payload))
+            data += payload
+        with open(self.journal_path, 'ab') as f:
+            f.write(data)
+
+    # --- Actualización ---
+    def update(self, unit, symbols, externals=(), digest=b''):
+        """Sustituye lo que el índice sabe de `unit` (símbolos: (nombre, tipo, línea))."""
+        self.update_many([(unit, symbols, externals, digest)])
+
+    def update_many(self, entries):
+        """Varias unidades con una sola escritura del diario y, a lo sumo, una compactación."""
+        records = []
+        for unit, symbols, externals, digest in entries:
+            entry = (bytes(digest),
+                     [(name, str(type), line or 0) for name, type, line in symbols],
+                     [(name, str(type), line or 0) for name, type, line in externals])
+            records.append((unit, entry))
+        self._append(records)
+        for record in records:
+            self._apply(*record)
+        self._maybe_compact()
+
+    def update_results(self, results, digests=None):
+        """Indexa CompilationResults (digests: {nombre: hash del fuente}, opcional)."""
+        digests = digests or {}
+        self.update_many([(result.name, result.symbols, result.externals,
+                           digests.get(result.name, b'')) for result in results])
+
+    def remove(self, unit):
+        self._append([(unit, None)])
+        self._apply(unit, None)
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        if len(self.units) >= max(COMPACT_MIN, self._counts[0] // 4):
+            self.compact()
+
+    def compact(self):
+        """Reescribe la base con todas las unidades vivas y vacía el diario."""
+        merged = {}
+        for index in range(self._counts[0]):
+            if index not in self._shadowed:
+                path, digest, symbols, externals = self._base_entry(index)
+                merged[path] = (digest, symbols, externals)
+        for path, entry in self.units.items():
+            if entry is None:
+                merged.pop(path, None)
+            else:
+                merged[path] = entry
+        data = _build_base(merged)
+        tmp = f"{self.base_path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        self._close_base()
+        os.replace(tmp, self.base_path)
+        with open(self.journal_path, 'wb'):
+            pass
+        self.compactions += 1
+        self._open_base()
+        self._load_journal()
+
+    # --- Consultas ---
+    def lookup(self, name):
+        """Definiciones globales de `name` en todo el proyecto."""
+        found = self._base_lookup(name)
+        for definitions in self._names.get(name, {}).values():
+            found.extend(definitions)
+        return found
+
+    def digest(self, unit):
+        """Hash del fuente con el que se indexó `unit`, o None si no está."""
+        if unit in self.units:
+            entry = self.units[unit]
+            return None if entry is None else entry[0]
+        index = self._base_unit(unit) if self._map is not None else None
+        if index is None:
+            return None
+        digest = self._base_record(index)[1]
+        return digest if digest.strip(b'\0') else b''      # sin hash: 16 ceros en la base
+
+    def unit_symbols(self, unit):
+        """[(nombre, tipo, línea)] que define `unit` ([] si no está indexada)."""
+        if unit in self.units:
+            entry = self.units[unit]
+            return [] if entry is None else list(entry[1])
+        index = self._base_unit(unit) if self._map is not None else None
+        return [] if index is None else self._base_entry(index)[2]
+
+    def unit_names(self):
+        """Rutas de todas las unidades indexadas."""
+        names = [self._base_record(index)[0] for index in range(self._counts[0])
+                 if index not in self._shadowed]
+        names.extend(path for path, entry in self.units.items() if entry is not None)
+        return sorted(names)
+
+    def _externals(self):
+        """(unidad, nombre, firma, línea) de todas las referencias externas."""
+        for index in range(self._counts[0]):
+            if index not in self._shadowed:
+                path, _, _, _, ext_first, ext_count = self._base_record(index)
+                for name, type, line in self._base_externs(ext_first, ext_count):
+                    yield path, name, type, line
+        for path, entry in self.units.items():
+            if entry is not None:
+                for name, type, line in entry[2]:
+                    yield path, name, type, line
+
+    def resolve(self, duplicates=True):
+        """
+        Enlazado: busca la definición de cada referencia externa (una sola
+        búsqueda por nombre) y comprueba su firma contra la llamada. Con
+        duplicates=True informa también de funciones definidas en más de una
+        unidad y de variables globales declaradas con tipos distintos.
+        """
+        report = LinkReport()
+        by_name = {}
+        for unit, name, type, line in self._externals():
+            by_name.setdefault(name, []).append((unit, type, line))
+        for name, uses in by_name.items():
+            functions = [d for d in self.lookup(name) if d.is_function]
+            if not functions:
+                report.unresolved.extend((unit, name, line or None) for unit, _, line in uses)
+                continue
+            definition = functions[0]
+            signature = parse_type(definition.type)
+            for unit, type, line in uses:
+                if _call_matches(signature, parse_type(type)):
+                    report.resolved += 1
+                else:
+                    report.mismatched.append((unit, name, line or None, definition))
+        if duplicates:
+            report.duplicates = self._duplicates()
+        return report
+
+    def _duplicates(self):
+        seen = {}
+        for index in range(self._counts[0]):
+            if index not in self._shadowed:
+                path, _, sym_first, sym_count, _, _ = self._base_record(index)
+                for i in range(sym_first, sym_first + sym_count):
+                    name, type, _, line = self._base_symbol(i)
+                    seen.setdefault(name, []).append(Definition(name, type, path, line or None))
+        for name, users in self._names.items():
+            for definitions in users.values():
+                seen.setdefault(name, []).extend(definitions)
+        return {name: definitions for name, definitions in seen.items()
+                if len({d.unit for d in definitions}) > 1
+                and (any(d.is_function for d in definitions) or len({d.type for d in definitions}) > 1)}
+
+    def stats(self):
+        size = os.path.getsize(self.base_path) if os.path.exists(self.base_path) else 0
+        journal = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+        return {'units': len(self.unit_names()), 'base_units': self._counts[0],
+                'base_symbols': self._counts[1], 'journal_units': len(self.units),
+                'base_bytes': size, 'journal_bytes': journal, 'compactions': self.compactions}
+
+    def close(self):
+        self._close_base()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _call_matches(signature, call):
+    """True si una llamada con la firma supuesta `call` es válida contra `signature`."""
+    if not isinstance(signature, FunctionType) or len(signature.params) != len(call.params):
+        return False
+    return all(compatible(param, arg) for param, arg in zip(signature.params, call.params))
+
+def _build_base(units):
+    """Bytes de base.idx para {ruta: (hash, símbolos, externas)}."""
+    strings = bytearray()
+    offsets = {}
+
+    def ref(text):
+        found = offsets.get(text)
+        if found is None:
+            data = _encode(text)
+            found = offsets[text] = (len(strings), len(data))
+            strings.extend(data)
+        return found
+
+    unit_records, symbols, externs = [], [], []
+    heads, tails = {}, {}
+    for index, path in enumerate(sorted(units, key=_encode)):
+        digest, unit_symbols, unit_externals = units[path]
+        unit_records.append(ref(path) + (bytes(digest)[:16], len(symbols), len(unit_symbols),
+                                         len(externs), len(unit_externals)))
+        for name, type, line in unit_symbols:
+            position = len(symbols)
+            symbols.append(list(ref(name) + ref(type) + (index, line or 0, NO_NEXT)))
+            if name in tails:
+                symbols[tails[name]][6] = position
+            else:
+                heads[name] = position
+            tails[name] = position
+        for name, type, line in unit_externals:
+            externs.append(ref(name) + ref(type) + (index, line or 0))
+
+    bucket_count = 8
+    while bucket_count < 2 * len(heads):
+        bucket_count *= 2
+    buckets = array('I', [0]) * bucket_count
+    mask = bucket_count - 1
+    for name, position in heads.items():
+        slot = zlib.crc32(_encode(name)) & mask
+        while buckets[slot]:
+            slot = (slot + 1) & mask
+        buckets[slot] = position + 1
+    if buckets.itemsize != 4:
+        raise RuntimeError("array('I') no tiene 4 bytes en esta plataforma")
+    if struct.pack('=I', 1) != struct.pack('<I', 1):
+        buckets.byteswap()
+
+    units_off = HEADER.size
+    symbols_off = units_off + len(unit_records) * UNIT.size
+    externs_off = symbols_off + len(symbols) * SYMBOL.size
+    buckets_off = externs_off + len(externs) * EXTERN.size
+    strings_off = buckets_off + bucket_count * 4
+    parts = [HEADER.pack(MAGIC, len(unit_records), len(symbols), len(externs), bucket_count,
+                         units_off, symbols_off, externs_off, buckets_off, strings_off)]
+    parts.extend(UNIT.pack(*record) for record in unit_records)
+    parts.extend(SYMBOL.pack(*record) for record in symbols)
+    parts.extend(EXTERN.pack(*record) for record in externs)
+    parts.append(buckets.tobytes())
+    parts.append(bytes(strings))
+    return b''.join(parts)
+
+
+if __name__ == '__main__':
+    # Uso: python symbol_index.py índice [-P] [-Idir] [-DNOMBRE=valor] [--force] archivo.c ...
+    #      python symbol_index.py índice --lookup=nombre | --resolve | --compact
+    #      python symbol_index.py                      benchmark con un proyecto sintético
+    import shutil
+    import sys
+    import tempfile
+    import time
+
+    args = sys.argv[1:]
+    if args:
+        index = SymbolIndex(args[0])
+        options = dict(arg.partition('=')[::2] for arg in args[1:] if arg.startswith('--'))
+        paths = [os.path.abspath(arg) for arg in args[1:] if not arg.startswith('-')]
+        if paths:
+            from session import compile_batch
+            include_path = [arg[2:] for arg in args if arg.startswith('-I')]
+            defines = {arg[2:].partition('=')[0]: arg[2:].partition('=')[2] or '1'
+                       for arg in args if arg.startswith('-D')}
+            digests = {}
+            for path in paths:
+                with open(path, encoding='utf-8') as f:
+                    digests[path] = source_digest(f.read())
+            # El hash es el del fuente: con -P, --force vuelve a indexar tras cambiar cabeceras
+            stale = [path for path in paths
+                     if '--force' in options or index.digest(path) != digests[path]]
+            start = time.perf_counter()
+            results = compile_batch(stale, preprocess='-P' in args or bool(include_path or defines),
+                                    include_path=include_path, defines=defines)
+            index.update_results(results, digests)
+            print(f"{len(stale)} de {len(paths)} unidades indexadas en "
+                  f"{time.perf_counter() - start:.2f} s")
+        if '--compact' in options:
+            index.compact()
+        if options.get('--lookup'):
+            for definition in index.lookup(options['--lookup']):
+                print(f"{definition.unit}:{definition.line}: {definition.name} {definition.type}")
+        if '--resolve' in options:
+            report = index.resolve()
+            print(report)
+            sys.exit(0 if report.ok else 1)
+        print(index.stats())
+        sys.exit(0)
+
+    # Proyecto sintético: cada unidad define 8 funciones y 4 globales y llama a funciones de otras
+    units, folder = 20000, tempfile.mkdtemp()
+    try:
+        def unit(i, version=0):
+            symbols = [(f"g{i}_{k}", 'int', k + 1) for k in range(4)]
+            symbols += [(f"f{i}_{k}", 'int(int,int*)' if k % 2 else 'float()', 10 * k + 5)
+                        for k in range(8)]
+            externals = [(f"f{(i * 7 + k) % units}_1", 'int(int,int*)', 90 + k) for k in range(3)]
+            return f"src/u{i}.c", symbols, externals, source_digest(f"{i}.{version}")
+
+        index = SymbolIndex(os.path.join(folder, 'index'))
+        start = time.perf_counter()
+        index.update_many([unit(i) for i in range(units)])
+        print(f"{units} unidades indexadas en {time.perf_counter() - start:.2f} s: {index.stats()}")
+
+        index.close()
+        start = time.perf_counter()
+        index = SymbolIndex(os.path.join(folder, 'index'))
+        opened = time.perf_counter() - start
+        names = [f"f{i * 37 % units}_{i % 8}" for i in range(20000)]
+        start = time.perf_counter()
+        for name in names:
+            index.lookup(name)
+        print(f"abrir {opened * 1e6:.0f} us; {len(names)} búsquedas en "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        for i in range(0, 200):
+            index.update(*unit(i * 97 % units, 1))
+        print(f"200 actualizaciones por unidad en {(time.perf_counter() - start) * 1000:.1f} ms "
+              f"(diario {index.stats()['journal_bytes']:,} bytes)")
+
+        start = time.perf_counter()
+        report = index.resolve()
+        print(f"resolve(): {time.perf_counter() - start:.2f} s, {report.resolved} referencias, "
+              f"ok={report.ok}")
+    finally:
+        index.close()
+        shutil.rmtree(folder)
@@ -1,13 +1,29 @@
+import sys
+
+
 class Symbol:
-    def __init__(self, name, type):
+    __slots__ = ('name', 'type', 'depth', 'shadowed', 'line', 'place')
+
+    def __init__(self, name, type, line=None, place=None):
         self.name = name
         self.type = type
+        self.depth = 0          # profundidad del ámbito donde se declaró
+        self.shadowed = None    # símbolo externo con el mismo nombre (ChainedSymbolTable)
+        self.line = line        # línea de la declaración
+        self.place = name if place is None else place   # nombre en el código de 3 direcciones
 
 class ScopedSymbolTable:
-    def __init__(self):
+    def __init__(self, diagnostics=None):
         # Pila de ambitos. El primer elemento es el ambito global
         self.scopes = [{}]
-        print("Symbol table initialized with global scope.")
+        self.diagnostics = diagnostics
+        if diagnostics is not None:
+            diagnostics.trace("Symbol table initialized with global scope.")
+
+    @property
+    def depth(self):
+        """Current nesting depth (0 is the global scope)."""
+        return len(self.scopes) - 1
 
     def push_scope(self):
         """Push a new scope onto the stack."""
@@ -18,15 +34,17 @@ class ScopedSymbolTable:
         if len(self.scopes) > 1:
             self.scopes.pop()
         else:
-            raise SemanticError("Cannot pop the global scope.")
+            raise SemanticError("Cannot pop the global scope.", code='S004')
         
     def add(self, symbol):
         """Add a symbol to the current scope."""
         current_scope = self.scopes[-1]
         if symbol.name in current_scope:
-            raise SemanticError(f"Semantic Error: Symbol '{symbol.name}' already declared in the current scope.")
+            raise SemanticError(f"Semantic Error: Symbol '{symbol.name}' already declared in the current scope.", code='S001')
+        symbol.depth = len(self.scopes) - 1
         current_scope[symbol.name] = symbol
-        print(f"Added symbol: {symbol.name} of type {symbol.type} to current scope.")
+        if self.diagnostics is not None:
+            self.diagnostics.trace("Added symbol: %s of type %s to current scope.", symbol.name, symbol.type)
     
     def lookup(self, name):
         """Look up a symbol by name, searching from the current scope to the global scope."""
@@ -34,8 +52,186 @@ class ScopedSymbolTable:
             symbol = scope.get(name)
             if symbol:
                 return symbol
-        raise SemanticError(f"Semantic Error: the Variable '{name}' is not declared.")
+        raise SemanticError(f"Semantic Error: the Variable '{name}' is not declared.", code='S002')
+
+    def add_global(self, symbol):
+        """Add a symbol to the global scope, whatever the current depth."""
+        global_scope = self.scopes[0]
+        if symbol.name in global_scope:
+            raise SemanticError(f"Semantic Error: Symbol '{symbol.name}' already declared in the global scope.", code='S001')
+        symbol.depth = 0
+        global_scope[symbol.name] = symbol
+
+class ChainedSymbolTable:
+    """
+    Same interface as ScopedSymbolTable, with O(1) lookup at any depth.
+
+    A single dict maps each (interned) name to its innermost visible symbol;
+    each symbol links to the one it shadows. Every add is recorded in an undo
+    log, and pop_scope unwinds the log back to the mark left by push_scope,
+    so no dict is allocated per scope.
+    """
+    def __init__(self, diagnostics=None):
+        self.table = {}
+        self.undo = []      # names added, in order
+        self.marks = []     # len(self.undo) at each push_scope
+        self.diagnostics = diagnostics
+        if diagnostics is not None:
+            diagnostics.trace("Symbol table initialized with global scope.")
+
+    @property
+    def depth(self):
+        """Current nesting depth (0 is the global scope)."""
+        return len(self.marks)
+
+    @property
+    def scopes(self):
+        """The scopes as a list of dicts, outermost first (for inspection only)."""
+        scopes = [{} for _ in range(len(self.marks) + 1)]
+        for symbol in self.table.values():
+            while symbol is not None:
+                scopes[symbol.depth][symbol.name] = symbol
+                symbol = symbol.shadowed
+        return scopes
+
+    def push_scope(self):
+        """Push a new scope onto the stack."""
+        self.marks.append(len(self.undo))
+
+    def pop_scope(self):
+        """Finalize the current scope."""
+        if not self.marks:
+            raise SemanticError("Cannot pop the global scope.", code='S004')
+        mark = self.marks.pop()
+        table = self.table
+        undo = self.undo
+        for i in range(len(undo) - 1, mark - 1, -1):
+            name = undo[i]
+            outer = table[name].shadowed
+            if outer is None:
+                del table[name]
+            else:
+                table[name] = outer
+        del undo[mark:]
+
+    def add(self, symbol):
+        """Add a symbol to the current scope."""
+        name = symbol.name = sys.intern(symbol.name)
+        depth = len(self.marks)
+        current = self.table.get(name)
+        if current is not None and current.depth == depth:
+            raise SemanticError(f"Semantic Error: Symbol '{name}' already declared in the current scope.", code='S001')
+        symbol.depth = depth
+        symbol.shadowed = current
+        self.table[name] = symbol
+        self.undo.append(name)
+        if self.diagnostics is not None:
+            self.diagnostics.trace("Added symbol: %s of type %s to current scope.", name, symbol.type)
+
+    def lookup(self, name):
+        """Look up the innermost visible symbol for name."""
+        symbol = self.table.get(name)
+        if symbol is None:
+            raise SemanticError(f"Semantic Error: the Variable '{name}' is not declared.", code='S002')
+        return symbol
+
+    def global_lookup(self, name):
+        """The symbol declared for name in the global scope, or None."""
+        symbol = self.table.get(name)
+        while symbol is not None and symbol.depth:
+            symbol = symbol.shadowed
+        return symbol
+
+    def add_global(self, symbol):
+        """
+        Add a symbol to the global scope, whatever the current depth (a
+        function is declared from its header, inside the parameter scope).
+        The symbol goes to the end of the shadow chain and its undo entry
+        before the first mark, so pop_scope never removes it.
+        """
+        name = symbol.name = sys.intern(symbol.name)
+        if self.global_lookup(name) is not None:
+            raise SemanticError(f"Semantic Error: Symbol '{name}' already declared in the global scope.", code='S001')
+        symbol.depth = 0
+        symbol.shadowed = None
+        inner = self.table.get(name)
+        if inner is None:
+            self.table[name] = symbol
+        else:
+            while inner.shadowed is not None:
+                inner = inner.shadowed
+            inner.shadowed = symbol
+        if self.marks:
+            self.undo.insert(self.marks[0], name)
+            self.marks = [mark + 1 for mark in self.marks]
+        else:
+            self.undo.append(name)
+        if self.diagnostics is not None:
+            self.diagnostics.trace("Added symbol: %s of type %s to global scope.", name, symbol.type)
+
+    def global_symbols(self):
+        """The symbols of the global scope, in declaration order (by line)."""
+        symbols = []
+        for symbol in self.table.values():
+            while symbol is not None and symbol.depth:
+                symbol = symbol.shadowed
+            if symbol is not None:
+                symbols.append(symbol)
+        # The dict keeps the first insertion of each name, which may be a local
+        symbols.sort(key=lambda symbol: symbol.line or 0)
+        return symbols
+
+    def reset_to_global(self):
+        """Pop every scope except the global one."""
+        while self.marks:
+            self.pop_scope()
+
+    def define_global(self, symbol):
+        """Insert or replace a global symbol (only valid at depth 0)."""
+        if self.marks:
+            raise SemanticError("Globals can only be defined at the global scope.", code='S000')
+        if symbol.name not in self.table:
+            self.undo.append(symbol.name)
+        symbol.depth = 0
+        symbol.shadowed = None
+        self.table[symbol.name] = symbol
     
 #Class for our semantic errors
 class SemanticError(Exception):
-    pass
\ No newline at end of file
+    def __init__(self, message, code='S000'):
+        super().__init__(message)
+        self.code = code
+
+
+if __name__ == '__main__':
+    # Microbenchmark: bloques muy anidados y ámbitos anchos
+    import time
+
+    def run(table_class, depth, width, lookups):
+        table = table_class()
+        for i in range(width):
+            table.add(Symbol(f"g{i}", 'int'))
+        start = time.perf_counter()
+        for level in range(depth):
+            table.push_scope()
+            for i in range(width):
+                table.add(Symbol(f"v{level}_{i}", 'int'))
+        build = time.perf_counter() - start
+        names = [f"g{i % width}" for i in range(lookups)] + \
+                [f"v{depth - 1}_{i % width}" for i in range(lookups)]
+        start = time.perf_counter()
+        for name in names:
+            table.lookup(name)
+        search = time.perf_counter() - start
+        start = time.perf_counter()
+        for level in range(depth):
+            table.pop_scope()
+        unwind = time.perf_counter() - start
+        return build, search, unwind
+
+    for depth, width in ((5, 100), (50, 1000), (200, 50)):
+        print(f"profundidad {depth}, {width} símbolos por ámbito")
+        for cls in (ScopedSymbolTable, ChainedSymbolTable):
+            build, search, unwind = run(cls, depth, width, 100000)
+            print(f"  {cls.__name__:<18} declarar {build * 1000:7.1f} ms   "
+                  f"200k lookups {search * 1000:7.1f} ms   cerrar ámbitos {unwind * 1000:6.1f} ms")
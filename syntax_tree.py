@@ -0,0 +1,228 @@
+"""
+Árbol sintáctico compacto, construido en paralelo a las acciones semánticas.
+
+Cuando el modo AST está activo (CompilationSession(build_ast=True)) cada
+acción de la gramática se envuelve: primero se ejecuta la acción original
+(tipos, tabla de símbolos, gen.emit) y después se registra un nodo para la
+producción reducida. Así todas las producciones quedan cubiertas sin tocar
+parser.py.
+
+Los nodos viven en una arena de arreglos paralelos:
+    kind[i]        número de producción (>= 0) u hoja: -1 - código de token
+    first[i]       índice del primer hijo en `children` (hojas: índice del valor)
+    count[i]       número de hijos
+    line[i]        línea (hojas) o línea del primer token del nodo
+Los valores de las hojas se internan en una lista compartida. Node es una
+vista de dos campos con __slots__ para recorrer el árbol cómodamente.
+"""
+import copy
+from array import array
+
+from ply.lex import LexToken
+
+import parser as c_parser
+from dfa_lexer import TOKEN_CODES, TOKEN_NAMES
+
+# (nonterminal, función p_*, longitud, texto) por número de producción
+PRODUCTIONS = [(p.name, p.func, p.len, p.str) for p in c_parser.parser.productions]
+
+
+class SyntaxTree:
+    """Arena de nodos del árbol sintáctico."""
+    def __init__(self):
+        self.kind = array('h')
+        self.first = array('i')
+        self.count = array('B')
+        self.line = array('i')
+        self.children = array('i')
+        self.values = []
+        self._value_index = {}
+        self.root = -1
+
+    def __len__(self):
+        return len(self.kind)
+
+    def add_leaf(self, tok):
+        key = (type(tok.value), tok.value)
+        index = self._value_index.get(key)
+        if index is None:
+            index = self._value_index[key] = len(self.values)
+            self.values.append(tok.value)
+        self.kind.append(-1 - TOKEN_CODES[tok.type])
+        self.first.append(index)
+        self.count.append(0)
+        self.line.append(tok.lineno)
+        return len(self.kind) - 1
+
+    def add_node(self, prodnum, pslice):
+        children = self.children
+        start = len(children)
+        line = 0
+        for sym in pslice[1:]:
+            if type(sym) is LexToken:
+                child = self.add_leaf(sym)
+            else:
+                child = getattr(sym, 'ast', -1)
+            children.append(child)
+            if not line and child >= 0:
+                line = self.line[child]
+        self.kind.append(prodnum)
+        self.first.append(start)
+        self.count.append(len(children) - start)
+        self.line.append(line)
+        node = len(self.kind) - 1
+        if PRODUCTIONS[prodnum][0] == 'program':
+            self.root = node
+        return node
+
+    def node(self, i):
+        return Node(self, i)
+
+    def root_node(self):
+        return Node(self, self.root) if self.root >= 0 else None
+
+    def nbytes(self):
+        """Memoria de los arreglos de la arena (sin contar los valores internados)."""
+        return sum(a.itemsize * len(a) for a in
+                   (self.kind, self.first, self.count, self.line, self.children))
+
+
+class Node:
+    """Vista ligera sobre un nodo de la arena."""
+    __slots__ = ('tree', 'index')
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def is_leaf(self):
+        return self.tree.kind[self.index] < 0
+
+    @property
+    def production(self):
+        """Número de producción (None en las hojas)."""
+        kind = self.tree.kind[self.index]
+        return kind if kind >= 0 else None
+
+    @property
+    def type(self):
+        """Nombre del no terminal, o del token en las hojas."""
+        kind = self.tree.kind[self.index]
+        return PRODUCTIONS[kind][0] if kind >= 0 else TOKEN_NAMES[-1 - kind]
+
+    @property
+    def rule(self):
+        """Nombre de la acción sin el prefijo p_ (p.ej. 'expression_binop')."""
+        kind = self.tree.kind[self.index]
+        return PRODUCTIONS[kind][1][2:] if kind >= 0 else None
+
+    @property
+    def value(self):
+        return self.tree.values[self.tree.first[self.index]] if self.is_leaf else None
+
+    @property
+    def line(self):
+        return self.tree.line[self.index]
+
+    @property
+    def children(self):
+        tree = self.tree
+        if tree.kind[self.index] < 0:
+            return []
+        start = tree.first[self.index]
+        ids = tree.children[start:start + tree.count[self.index]]
+        return [Node(tree, i) if i >= 0 else None for i in ids]
+
+    def __repr__(self):
+        if self.is_leaf:
+            return f"{self.type}({self.value!r})"
+        return f"<{PRODUCTIONS[self.production][3]}>"
+
+
+class TreeVisitor:
+    """
+    Recorrido del árbol. Para cada nodo se busca visit_<regla> (p.ej.
+    visit_expression_binop), luego visit_<no terminal> (visit_expression) y
+    por último generic_visit, que visita los hijos. Las hojas usan
+    visit_<TOKEN> (visit_ID) o visit_token.
+    """
+    def visit(self, node):
+        if node is None:
+            return None
+        if node.is_leaf:
+            method = getattr(self, 'visit_' + node.type, self.visit_token)
+            return method(node)
+        method = getattr(self, 'visit_' + node.rule, None) or \
+            getattr(self, 'visit_' + node.type, self.generic_visit)
+        return method(node)
+
+    def generic_visit(self, node):
+        for child in node.children:
+            self.visit(child)
+
+    def visit_token(self, node):
+        return None
+
+
+def _tree_action(prodnum, func):
+    def action(p):
+        func(p)
+        p.slice[0].ast = p.lexer.ast.add_node(prodnum, p.slice)
+    return action
+
+def instrument_parser(parser):
+    """Devuelve una copia del parser cuyas acciones también construyen el AST."""
+    twin = copy.copy(parser)
+    twin.productions = []
+    for prodnum, prod in enumerate(parser.productions):
+        prod = copy.copy(prod)
+        if prod.callable is not None:
+            prod.callable = _tree_action(prodnum, prod.callable)
+        twin.productions.append(prod)
+    return twin
+
+
+if __name__ == '__main__':
+    # Benchmark de memoria: arena frente a un nodo-objeto por producción
+    import sys
+    import time
+    import tracemalloc
+    from session import CompilationSession
+    from test_codigo_profesor import codigo_profesor
+
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    per_copy = codigo_profesor.count('\n')
+    source = codigo_profesor * max(1, lines // per_copy)
+    lines = source.count('\n')
+
+    plain = CompilationSession(engine='dfa')
+    start = time.perf_counter()
+    plain.compile(source)
+    t_plain = time.perf_counter() - start
+
+    session = CompilationSession(engine='dfa', build_ast=True)
+    start = time.perf_counter()
+    result = session.compile(source)
+    t_ast = time.perf_counter() - start
+    tree = result.tree
+
+    class ObjectNode:
+        __slots__ = ('type', 'children', 'value', 'line')
+
+    tracemalloc.start()
+    objects = []
+    for i in range(len(tree)):
+        n = ObjectNode()
+        n.type, n.children, n.value, n.line = tree.kind[i], [0] * tree.count[i], None, tree.line[i]
+        objects.append(n)
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    scale = 10000 / lines
+    print(f"{lines} líneas, {len(tree)} nodos")
+    print(f"arena:           {tree.nbytes() * scale / 1e6:6.2f} MB / 10k líneas  "
+          f"({tree.nbytes() / len(tree):.1f} bytes/nodo)")
+    print(f"nodos objeto:    {object_bytes * scale / 1e6:6.2f} MB / 10k líneas  "
+          f"({object_bytes / len(tree):.1f} bytes/nodo)")
+    print(f"tiempo de parse: {t_plain:.3f} s sin AST, {t_ast:.3f} s con AST")
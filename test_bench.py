@@ -0,0 +1,44 @@
+"""
+Banco de pruebas (bench.py): el generador es reproducible y sus programas
+compilan sin errores en cualquier tamaño; compare marca solo las regresiones.
+"""
+import pytest
+
+from bench import PRESETS, ProgramGenerator, compare, measure, run_suite
+from session import CompilationSession
+
+
+def test_reproducible_por_semilla():
+    assert ProgramGenerator(seed=3).generate() == ProgramGenerator(seed=3).generate()
+    assert ProgramGenerator(seed=3).generate() != ProgramGenerator(seed=4).generate()
+    generator = ProgramGenerator(seed=3)
+    assert generator.generate() == generator.generate()
+
+
+@pytest.mark.parametrize('engine', ['ply', 'dfa'])
+@pytest.mark.parametrize('preset', sorted(PRESETS))
+def test_compila_sin_errores(preset, engine):
+    for seed in range(2):
+        source = ProgramGenerator(seed=seed, **PRESETS[preset]).generate()
+        result = CompilationSession(engine=engine).compile(source)
+        assert result.ok and not result.diagnostics
+
+
+def test_tamano_ajustable():
+    sizes = [len(ProgramGenerator(functions=n, seed=1).generate()) for n in (2, 8, 32)]
+    assert sizes == sorted(sizes) and sizes[-1] > 4 * sizes[0]
+    source = ProgramGenerator(functions=5, seed=1).generate()
+    assert all(f"f{i}(" in source for i in range(5)) and 'f5(' not in source
+
+
+def test_informe_y_comparacion():
+    report = run_suite({'small': PRESETS['small']}, repeat=1)
+    entry = report['cases']['small']
+    assert entry['tokens'] > 0 and entry['quads'] > 0 and entry['peak_memory'] > 0
+    assert entry['params'] == PRESETS['small']
+    assert set(measure(ProgramGenerator(functions=2).generate(), repeat=1)) >= {'lex', 'parse', 'total'}
+    base = {'cases': {'small': {'total': 0.010, 'lex': 0.0001, 'tokens_per_sec': 1000}}}
+    slower = {'cases': {'small': {'total': 0.020, 'lex': 0.0005, 'tokens_per_sec': 1000}}}
+    flagged = {(name, metric) for name, metric, *_, bad in compare(slower, base) if bad}
+    # lex también empeora, pero por debajo de 1 ms es ruido
+    assert flagged == {('small', 'total')}
@@ -0,0 +1,43 @@
+"""
+Arranque rápido (build_tables.py): los artefactos corresponden a la gramática,
+y con COMPILER_FAST_STARTUP=1 el compilador los carga sin escribir nada y
+genera el mismo código.
+"""
+import os
+import subprocess
+import sys
+
+import build_tables
+from lexer import TABLES_DIR
+from session import CompilationSession
+from test_codigo_profesor import codigo_profesor
+
+COMPILAR = """
+import sys
+from code_gen import format_quad
+from session import CompilationSession
+result = CompilationSession().compile(sys.stdin.read())
+sys.stdout.write('---\\n' + ''.join(format_quad(quad) + '\\n' for quad in result.code))
+"""
+
+
+def estado(directory):
+    return {entry.name: entry.stat().st_mtime_ns for entry in os.scandir(directory)}
+
+
+def test_tablas_al_dia(capsys):
+    assert build_tables.check()
+    assert capsys.readouterr().out.strip() == "Tablas al día"
+
+
+def test_arranque_rapido_no_escribe():
+    from code_gen import format_quad
+    before = estado(TABLES_DIR)
+    env = dict(os.environ, COMPILER_FAST_STARTUP='1', PYTHONDONTWRITEBYTECODE='1')
+    run = subprocess.run([sys.executable, '-c', COMPILAR], cwd=TABLES_DIR, env=env,
+                         input=codigo_profesor, capture_output=True, text=True, check=True)
+    assert estado(TABLES_DIR) == before
+    assert run.stderr == ''
+    expected = CompilationSession().compile(codigo_profesor).code
+    # Lo que se imprima al importar (la traza del parser global) queda antes de la marca
+    assert run.stdout.split('---\n', 1)[1] == ''.join(format_quad(quad) + '\n' for quad in expected)
@@ -0,0 +1,110 @@
+"""
+CompileCache (compile_cache.py): un acierto devuelve lo mismo que compilar, y
+cualquier cambio en lo que vio el preprocesador invalida la entrada. Al
+superar max_bytes se borran primero las entradas usadas hace más tiempo.
+"""
+import os
+
+from compile_cache import CompileCache
+from session import CompilationSession
+
+UNIDAD = '#include "defs.h"\nint main() { int a; a = N + 1; return a; }\n'
+
+
+def sesion(tmp_path, *include_path):
+    return CompilationSession(preprocess=True, include_path=[str(p) for p in include_path],
+                              cache=CompileCache(str(tmp_path / 'cache')))
+
+
+def codigos(result):
+    return [d.code for d in result.diagnostics]
+
+
+def test_acierto_igual_que_compilar(tmp_path):
+    (tmp_path / 'defs.h').write_text('#define N 4\n')
+    unit = tmp_path / 'main.c'
+    unit.write_text(UNIDAD)
+    first = sesion(tmp_path).compile_file(str(unit))
+    second = sesion(tmp_path).compile_file(str(unit))
+    assert not first.cached and second.cached
+    assert second.code == first.code and codigos(second) == codigos(first)
+    # Cambiar la cabecera invalida la entrada
+    (tmp_path / 'defs.h').write_text('#define N 40\n')
+    third = sesion(tmp_path).compile_file(str(unit))
+    assert not third.cached and third.code != first.code
+
+
+def test_cabecera_que_faltaba(tmp_path):
+    unit = tmp_path / 'main.c'
+    unit.write_text(UNIDAD)
+    first = sesion(tmp_path).compile_file(str(unit))
+    assert 'D001' in codigos(first)
+    assert sesion(tmp_path).compile_file(str(unit)).cached
+    (tmp_path / 'defs.h').write_text('#define N 4\n')
+    second = sesion(tmp_path).compile_file(str(unit))
+    assert not second.cached
+    assert 'D001' not in codigos(second) and second.ok
+
+
+def test_cabecera_que_aparece_antes_en_include_path(tmp_path):
+    early, late = tmp_path / 'early', tmp_path / 'late'
+    early.mkdir()
+    late.mkdir()
+    (late / 'defs.h').write_text('#define N 4\n')
+    unit = tmp_path / 'src' / 'main.c'
+    unit.parent.mkdir()
+    unit.write_text(UNIDAD.replace('"defs.h"', '<defs.h>'))
+    first = sesion(tmp_path, early, late).compile_file(str(unit))
+    assert first.ok and first.includes == [str((late / 'defs.h').resolve())]
+    assert sesion(tmp_path, early, late).compile_file(str(unit)).cached
+    (early / 'defs.h').write_text('#define N 40\n')
+    second = sesion(tmp_path, early, late).compile_file(str(unit))
+    assert not second.cached
+    assert second.includes == [str((early / 'defs.h').resolve())]
+    assert second.code[1][:3] == ('+', '40', '1')
+
+
+def entradas(cache):
+    return {os.path.basename(path): size for _, size, path in cache._entries()}
+
+
+def test_desalojo_lru(tmp_path):
+    cache = CompileCache(str(tmp_path / 'cache'))
+    compiler = CompilationSession(cache=cache)
+    sources = {name: f"int {name}() {{ return 1; }}\n" for name in ('fa', 'fb', 'fc', 'fd')}
+    keys = {}
+    for name in ('fa', 'fb', 'fc'):
+        compiler.compile(sources[name], name)
+        [keys[name]] = set(entradas(cache)) - set(keys.values())
+    # Antigüedad explícita: fa la más vieja, pero un acierto la renueva
+    for age, name in enumerate(('fa', 'fb', 'fc')):
+        os.utime(os.path.join(cache.directory, keys[name]), (1000 + age, 1000 + age))
+    assert compiler.compile(sources['fa'], 'fa').cached
+    sizes = entradas(cache)
+    cache.max_bytes = sum(sizes.values()) + min(sizes.values()) // 2
+    compiler.compile(sources['fd'], 'fd')
+    remaining = set(entradas(cache))
+    assert keys['fb'] not in remaining and {keys['fa'], keys['fc']} <= remaining
+    assert len(remaining) == 3 and cache.evictions == 1
+    assert cache.disk_usage()[1] <= cache.max_bytes
+    cache.clear()
+    assert cache.disk_usage() == (0, 0)
+
+
+def test_estadisticas(tmp_path):
+    cache = CompileCache(str(tmp_path / 'cache'), max_bytes=1 << 20)
+    compiler = CompilationSession(cache=cache)
+    compiler.compile("int a;\n")
+    compiler.compile("int a;\n")
+    compiler.compile("int a;\n")
+    compiler.compile("int b;\n")
+    # Una entrada ilegible cuenta como error y como fallo, y se vuelve a escribir
+    key = cache.key("int a;\n", compiler._cache_options('<string>'))
+    with open(os.path.join(cache.directory, key + '.unit'), 'wb') as f:
+        f.write(b'no es pickle')
+    assert not compiler.compile("int a;\n").cached
+    stats = cache.stats()
+    entries, size = cache.disk_usage()
+    assert stats == {'hits': 2, 'misses': 3, 'hit_rate': 0.4, 'stores': 3, 'evictions': 0,
+                     'errors': 1, 'entries': entries, 'bytes': size, 'max_bytes': 1 << 20}
+    assert entries == 2
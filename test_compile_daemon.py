@@ -0,0 +1,71 @@
+"""
+Daemon de compilación (compile_daemon.py) en un proceso aparte, de ida y
+vuelta por el socket: las peticiones malas reciben un error y la conexión
+sigue sirviendo.
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from compile_client import CompileClient, DaemonError
+from lexer import TABLES_DIR
+
+FUENTE = "int doble(int x) { return x * 2; }\nint g = 3;\n"
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = str(tmp_path / 'daemon.sock')
+    process = subprocess.Popen([sys.executable, 'compile_daemon.py', f'--socket={path}',
+                                '--workers=1'], cwd=TABLES_DIR, stdout=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while not os.path.exists(path):
+        assert process.poll() is None and time.time() < deadline, "el daemon no arrancó"
+        time.sleep(0.05)
+    yield path
+    if process.poll() is None:
+        process.terminate()
+    process.wait(timeout=30)
+
+
+def test_ida_y_vuelta(daemon, tmp_path):
+    unit = tmp_path / 'main.c'
+    unit.write_text(FUENTE)
+    with CompileClient(daemon, timeout=30) as client:
+        assert client.request('ping')['pong']
+        reply = client.compile(str(unit), opt_level=2)
+        assert reply['ok'] and 'func doble' in reply['code']
+        reply = client.compile(source="int a; a = b;\n")
+        assert not reply['ok'] and [d['code'] for d in reply['diagnostics']] == ['S002']
+        stats = client.request('stats')
+        assert stats['compiles'] == 2 and stats['failures'] == 0
+        client.request('shutdown')
+
+
+@pytest.mark.parametrize('options, message', [
+    ({'opt_level': 7}, 'opt_level'),
+    ({'opt_level': True}, 'opt_level'),
+    ({'registers': 0}, 'registers'),
+    ({'engine': 'otro'}, 'engine'),
+    ({'include_path': 'inc'}, 'include_path'),
+    ({'nivel': 1}, 'desconocidas'),
+])
+def test_opciones_no_validas(daemon, options, message):
+    with CompileClient(daemon, timeout=30) as client:
+        with pytest.raises(DaemonError, match=message):
+            client.compile(source=FUENTE, **options)
+        # La conexión sigue sirviendo
+        assert client.compile(source=FUENTE)['ok']
+        assert client.request('stats')['failures'] == 1
+
+
+def test_excepcion_del_trabajador(daemon):
+    with CompileClient(daemon, timeout=30) as client:
+        with pytest.raises(DaemonError, match='Error al compilar'):
+            client.request('compile', path=['main.c'], options={})
+        assert client.compile(source=FUENTE)['ok']
+        stats = client.request('stats')
+        assert stats['failures'] == 1 and stats['compiles'] == 1
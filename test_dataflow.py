@@ -0,0 +1,71 @@
+"""
+Flujo de datos (dataflow.py) sobre un CFG pequeño construido a mano:
+
+    0  s = 0                 B0
+    1  i = 0
+    2  L1:                   B1
+    3  if i >= n goto L2
+    4  t0 = s + i            B2
+    5  s = t0
+    6  i = i + 1
+    7  goto L1
+    8  L2:                   B3
+    9  return s
+"""
+from cfg import ControlFlowGraph, build_cfgs
+from dataflow import available_expressions, liveness, reaching_definitions
+from quad_store import Temp
+from test_vm import compilar, programa
+
+BUCLE = [('=', '0', None, 's'), ('=', '0', None, 'i'),
+         ('label', None, None, 'L1'), ('if>=', 'i', 'n', 'L2'),
+         ('+', 's', 'i', Temp('t0')), ('=', Temp('t0'), None, 's'), ('+', 'i', '1', 'i'),
+         ('goto', None, None, 'L1'),
+         ('label', None, None, 'L2'), ('return', 's', None, None)]
+
+
+def test_bloques():
+    cfg = ControlFlowGraph(BUCLE)
+    assert [(b.start, b.end) for b in cfg.blocks] == [(0, 2), (2, 4), (4, 8), (8, 10)]
+    assert [sorted(b.succ) for b in cfg.blocks] == [[1], [2, 3], [1], []]
+    assert cfg.label_block == {'L1': 1, 'L2': 3}
+
+
+def test_liveness():
+    result = liveness(ControlFlowGraph(BUCLE))
+    assert [result.live_in(b) for b in range(4)] == [{'n'}, {'s', 'i', 'n'}, {'s', 'i', 'n'}, {'s'}]
+    assert [result.live_out(b) for b in range(4)] == [{'s', 'i', 'n'}, {'s', 'i', 'n'},
+                                                      {'s', 'i', 'n'}, set()]
+
+
+def test_reaching_definitions():
+    result = reaching_definitions(ControlFlowGraph(BUCLE))
+    # Los elementos del universo son índices de instrucción
+    assert [result.live_in(b) for b in range(4)] == [set(), {0, 1, 4, 5, 6}, {0, 1, 4, 5, 6},
+                                                     {0, 1, 4, 5, 6}]
+    assert [result.live_out(b) for b in range(4)] == [{0, 1}, {0, 1, 4, 5, 6}, {4, 5, 6},
+                                                      {0, 1, 4, 5, 6}]
+
+
+def test_available_expressions():
+    result = available_expressions(ControlFlowGraph(BUCLE))
+    # s + i se calcula en B2, pero en B1 también se llega desde B0
+    assert result.live_in(1) == set()
+    assert result.live_out(2) == set()      # s e i cambian tras calcularla
+
+
+def test_punteros_mantienen_vivas_las_variables():
+    code = [('=', '&x', None, 'p'), ('=', '1', None, 'x'), ('goto', None, None, 'L1'),
+            ('label', None, None, 'L1'), ('=', '*p', None, 'y'), ('return', 'y', None, None)]
+    result = liveness(ControlFlowGraph(code))
+    # x = 1 no es una asignación muerta: *p la lee
+    assert result.live_in(1) == {'p', 'x'}
+    assert result.live_out(0) == {'p', 'x'}
+
+
+def test_funciones_compiladas():
+    cfgs = build_cfgs(compilar(programa).code)
+    assert set(cfgs) == {'<global>', 'cuadrado', 'fib', 'suma', 'clasifica', 'punteros', 'mezcla'}
+    # Los parámetros se definen con 'formal': solo entran vivas las globales leídas
+    assert liveness(cfgs['fib']).live_in(0) == set()
+    assert liveness(cfgs['mezcla']).live_in(0) == {'escala'}
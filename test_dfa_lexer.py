@@ -0,0 +1,59 @@
+"""
+Equivalencia del escáner DFA (dfa_lexer.py) con el lexer de PLY: mismos
+tokens (tipo, valor, línea, posición) y mismos errores léxicos.
+"""
+import pytest
+
+from bench import ProgramGenerator
+from dfa_lexer import make_lexer
+from diagnostics import DiagnosticSink
+from source_map import SourceMap
+from test_codigo_profesor import codigo_profesor
+
+FUENTES = {
+    'profesor': codigo_profesor,
+    'generado': ProgramGenerator(functions=6, depth=3, seed=1).generate(),
+    'literales': "float f = 1.5; char c = 'x'; char *s = \"hola\\n\";\n int a = 07;\n",
+    'operadores': "++ -- <= >= == != && || ! & * / % + - = ;\n",
+    'comentarios': "/* a\n b */ x // c\n y\n\n  z",
+    'ilegales': "int a = 3;\n a @ b $\n",
+    'cadena_abierta': '"sin cerrar\nint a;',
+    'comentario_abierto': "/* nunca se cierra\n int b;",
+}
+
+
+def tokens(engine, source):
+    """Tokens y diagnósticos (código, línea, columna) de un motor de lexer."""
+    lexer = make_lexer(engine)
+    sink = DiagnosticSink()
+    lexer.diagnostics = sink
+    lexer.source_map = SourceMap(source)
+    lexer.lineno = 1
+    lexer.input(source)
+    found = []
+    while True:
+        tok = lexer.token()
+        if tok is None:
+            break
+        found.append((tok.type, tok.value, type(tok.value), tok.lineno, tok.lexpos))
+    return found, [(d.code, d.line, d.column) for d in sink]
+
+
+@pytest.mark.parametrize('name', sorted(FUENTES))
+def test_dfa_igual_a_ply(name):
+    assert tokens('dfa', FUENTES[name]) == tokens('ply', FUENTES[name])
+
+
+def test_errores_lexicos():
+    _, diagnostics = tokens('dfa', FUENTES['ilegales'])
+    assert [code for code, _, _ in diagnostics] == ['L001', 'L001']
+    assert [line for _, line, _ in diagnostics] == [2, 2]
+
+
+def test_sin_sumidero_no_imprime(capsys):
+    # Un ArrayLexer recién creado ya tiene su sumidero: el error no va a stdout
+    lexer = make_lexer('dfa')
+    lexer.input(FUENTES['ilegales'])
+    assert [tok.type for tok in iter(lexer.token, None)][-1] == 'ID'
+    assert capsys.readouterr().out == ''
+    assert [(d.code, d.line, d.column) for d in lexer.diagnostics] == [('L001', 2, 4), ('L001', 2, 8)]
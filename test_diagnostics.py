@@ -0,0 +1,49 @@
+"""
+DiagnosticSink (diagnostics.py): los diagnósticos de una compilación llegan
+al buffer con su código y línea, sin imprimir nada, y se exportan en JSON.
+"""
+import io
+import json
+
+from diagnostics import ERROR, TRACE, WARNING, DiagnosticSink
+from session import CompilationSession
+
+ERRONEO = "int f(int a) {\n  int c; int c;\n  return b;\n}\n"
+
+
+def test_sin_traza_no_se_formatea():
+    sink = DiagnosticSink()
+    sink.trace("%s", object())
+    assert len(sink) == 0
+    sink = DiagnosticSink(tracing=True)
+    sink.trace("regla %s", 'expresion', line=3)
+    [diag] = sink
+    assert diag.severity == TRACE and diag.code == 'T000' and str(diag) == 'regla expresion'
+
+
+def test_filtros_y_exportacion():
+    stream = io.StringIO()
+    sink = DiagnosticSink(echo=True, stream=stream)
+    sink.warning('D003', "Macro '%s' redefinida", 'N', line=2)
+    sink.error('S002', "Variable '%s' no declarada", 'x', line=5, column=9)
+    assert sink.has_errors() and [d.code for d in sink.errors()] == ['S002']
+    assert [d.code for d in sink.filter(WARNING)] == ['D003', 'S002']
+    assert stream.getvalue().splitlines()[1] == "Error [S002] line 5, column 9: Variable 'x' no declarada"
+    records = [json.loads(line) for line in sink.to_jsonl().splitlines()]
+    assert records[1] == {'severity': 'error', 'code': 'S002', 'line': 5, 'column': 9,
+                          'message': "Variable 'x' no declarada"}
+    out = io.StringIO()
+    sink.write_jsonl(out)
+    assert out.getvalue() == sink.to_jsonl()
+
+
+def test_compilacion_no_imprime(capsys):
+    result = CompilationSession().compile(ERRONEO)
+    assert capsys.readouterr().out == ''
+    errors = [(d.code, d.line) for d in result.diagnostics if d.severity == ERROR]
+    assert errors == [('S001', 2), ('S002', 3)]
+    assert not result.ok
+    # Con traza, las acciones semánticas se registran pero los errores no cambian
+    traced = CompilationSession(tracing=True).compile(ERRONEO)
+    assert any(d.severity == TRACE for d in traced.diagnostics)
+    assert [(d.code, d.line) for d in traced.diagnostics if d.severity == ERROR] == errors
@@ -0,0 +1,72 @@
+"""
+IncrementalCompiler (incremental.py) frente a la compilación completa: tras
+cada edición el resultado debe ser el mismo, también con errores de sintaxis.
+"""
+import random
+
+import pytest
+
+from bench import ProgramGenerator
+from incremental import IncrementalCompiler
+from session import CompilationSession
+from test_codigo_profesor import codigo_profesor
+
+EXTRA = "\nint tarde;\nint k(int a) { return no_declarada(a, 2.5) + tarde; }\n"
+
+
+def resumen(result):
+    return (list(result.code),
+            [(d.code, d.line, d.column, d.message) for d in result.diagnostics],
+            result.symbols, result.externals, result.globals,
+            list(result.spans) if result.spans is not None else None)
+
+
+def comparar(compiler, full, source):
+    assert resumen(compiler.update(source)) == resumen(full.compile(source))
+
+
+def test_edicion_de_una_linea():
+    compiler = IncrementalCompiler()
+    full = CompilationSession(engine='dfa')
+    comparar(compiler, full, codigo_profesor)
+    comparar(compiler, full, codigo_profesor.replace('a=b;', 'a=b+1;', 1))
+    assert compiler.stats['reused'] > 0
+    assert not compiler.stats['fallback']
+
+
+def test_lineas_insertadas_antes():
+    # Las unidades reutilizadas se desplazan: líneas de símbolos y diagnósticos
+    compiler = IncrementalCompiler()
+    full = CompilationSession(engine='dfa')
+    source = codigo_profesor + EXTRA
+    comparar(compiler, full, source)
+    comparar(compiler, full, "int nueva;\n\n\n" + source)
+    assert compiler.stats['reused'] > 0
+
+
+def test_error_de_sintaxis():
+    compiler = IncrementalCompiler()
+    full = CompilationSession(engine='dfa')
+    comparar(compiler, full, codigo_profesor)
+    broken = codigo_profesor.replace('a=b;', 'a=b', 1)
+    comparar(compiler, full, broken)
+    assert compiler.stats['fallback']
+    assert any(d.code == 'P001' for d in full.compile(broken).diagnostics)
+    comparar(compiler, full, codigo_profesor)
+    assert not compiler.stats['fallback']
+
+
+@pytest.mark.parametrize('spans', [False, True])
+@pytest.mark.parametrize('seed', range(3))
+def test_ediciones_aleatorias(seed, spans):
+    rng = random.Random(seed)
+    source = ProgramGenerator(functions=4, depth=2, expr_depth=2, seed=seed).generate() + EXTRA
+    compiler = IncrementalCompiler(spans=spans)
+    full = CompilationSession(engine='dfa', spans=spans)
+    for _ in range(60):
+        k = rng.randrange(len(source) + 1)
+        if rng.random() < 0.5:
+            source = source[:k] + rng.choice(['a', '1', ' ', ';', '{', '}', '\n', 'int x;\n', '+']) + source[k:]
+        else:
+            source = source[:k] + source[k + rng.randrange(1, 4):]
+        comparar(compiler, full, source)
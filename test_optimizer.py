@@ -0,0 +1,66 @@
+"""
+Optimizador (optimizer.py): -O0, -O1 y -O2 ejecutan igual en la VM.
+"""
+import pytest
+
+from bench import ProgramGenerator
+from optimizer import optimize
+from quad_store import QuadStore, Temp
+from test_vm import compilar, ejecutar, programa
+from vm import VirtualMachine
+
+NIVELES = [0, 1, 2]
+
+
+def valores(values):
+    """Globales con los punteros (marco, posición) sustituidos por el valor apuntado."""
+    return {name: ('*', value[0][value[1]]) if isinstance(value, tuple) else value
+            for name, value in values.items()}
+
+
+@pytest.mark.parametrize('level', NIVELES)
+def test_programa(level):
+    reference = compilar(programa)
+    optimized = compilar(programa, opt_level=level)
+    assert (ejecutar(VirtualMachine(optimized.code, optimized.globals)) ==
+            ejecutar(VirtualMachine(reference.code, reference.globals)))
+    assert len(optimized.code) <= len(reference.code)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_programas_generados(seed):
+    source = ProgramGenerator(functions=6, depth=2, seed=seed).generate()
+    results = []
+    for level in NIVELES:
+        result = compilar(source, opt_level=level)
+        vm = VirtualMachine(result.code, result.globals, max_steps=10 ** 6)
+        vm.run()
+        results.append(valores(vm.global_values()))
+    assert results[1] == results[0]
+    assert results[2] == results[0]
+
+
+def test_pases():
+    code = [('+', '2', '3', Temp('t0')), ('=', Temp('t0'), None, 'x'),
+            ('+', 'a', 'b', Temp('t1')), ('=', Temp('t1'), None, 'y'),
+            ('+', 'a', 'b', Temp('t2')), ('=', Temp('t2'), None, 'z')]
+    optimized, report = optimize(code, 2)
+    assert optimized == [('=', '5', None, 'x'), ('+', 'a', 'b', 'y'), ('=', 'y', None, 'z')]
+    assert (report.size_in, report.size_out) == (6, 3)
+    assert optimize(code, 0)[0] == code
+
+
+def test_variable_llamada_como_temporal():
+    # 't1' sin Temp es una variable del usuario: no se elimina
+    code = [('+', 'a', 'b', 't1'), ('=', 't1', None, 'x')]
+    assert optimize(code, 2)[0] == code
+
+
+def test_mismo_tipo_de_codigo():
+    store = QuadStore()
+    store.extend([('+', '2', '3', Temp('t0')), ('=', Temp('t0'), None, 'x')])
+    optimized, _ = optimize(store, 1)
+    assert isinstance(optimized, QuadStore)
+    assert list(optimized) == [('=', '5', None, 'x')]
+    with pytest.raises(ValueError):
+        optimize([], 3)
@@ -0,0 +1,56 @@
+"""
+ParallelCompiler (parallel_compile.py) frente a la compilación secuencial:
+con cualquier número de trabajadores el resultado debe ser el mismo, también
+con errores semánticos y de sintaxis.
+"""
+import pytest
+
+from bench import ProgramGenerator
+from parallel_compile import ParallelCompiler
+from session import CompilationSession
+from test_incremental import EXTRA
+
+
+def resumen(result):
+    return (list(result.code),
+            [(d.code, d.line, d.column, d.message) for d in result.diagnostics],
+            result.ok, result.symbols, result.externals, result.globals)
+
+
+@pytest.fixture(scope='module', params=[1, 2, 4])
+def paralelo(request):
+    with ParallelCompiler(workers=request.param, min_functions=2) as compiler:
+        yield compiler
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_igual_que_secuencial(paralelo, seed):
+    source = ProgramGenerator(functions=12, depth=2, seed=seed).generate() + EXTRA
+    assert resumen(paralelo.compile(source)) == resumen(CompilationSession(engine='dfa').compile(source))
+    assert paralelo.stats['chunks'] > (paralelo.workers > 1)
+    assert not paralelo.stats.get('fallback')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_optimizado(workers):
+    source = ProgramGenerator(functions=10, depth=2, seed=7).generate()
+    with ParallelCompiler(workers=workers, opt_level=2, registers=4, min_functions=2) as compiler:
+        result = compiler.compile(source)
+    sequential = CompilationSession(engine='dfa', opt_level=2, registers=4).compile(source)
+    assert resumen(result) == resumen(sequential)
+
+
+def test_error_de_sintaxis(paralelo):
+    source = ProgramGenerator(functions=10, depth=2, seed=1).generate()
+    broken = source.replace('return', 'return return', 1)
+    result = paralelo.compile(broken)
+    assert resumen(result) == resumen(CompilationSession(engine='dfa').compile(broken))
+    assert any(d.code == 'P001' for d in result.diagnostics)
+
+
+def test_pocas_funciones_secuencial():
+    source = ProgramGenerator(functions=3, seed=0).generate()
+    with ParallelCompiler(workers=2) as compiler:
+        result = compiler.compile(source)
+        assert compiler.stats['chunks'] == 0 and compiler.pool is None
+    assert resumen(result) == resumen(CompilationSession(engine='dfa').compile(source))
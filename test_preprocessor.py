@@ -0,0 +1,67 @@
+"""
+Preprocesador (preprocessor.py): expansión de macros con ocultación, como en
+C, y #include con búsqueda, una sola inclusión por unidad y caché de tokens.
+"""
+from dfa_lexer import make_lexer
+from diagnostics import DiagnosticSink
+from preprocessor import HeaderCache, Preprocessor, preprocess_text
+
+
+def preprocesar(source, origin=None, include_path=(), defines=None, cache=None):
+    lexer = make_lexer('dfa')
+    lexer.diagnostics = DiagnosticSink()
+    pre = Preprocessor(lexer, include_path, defines, origin, cache or HeaderCache())
+    pre.input(source)
+    return preprocess_text(list(pre)), pre
+
+
+def codigos(pre):
+    return [d.code for d in pre.diagnostics]
+
+
+def test_macro_sin_parametros():
+    text, pre = preprocesar('#define N 4\n#define M N * N\nint a = M;\n', defines={'K': '2'})
+    assert text == 'int a = 4 * 4 ;' and not codigos(pre)
+    assert preprocesar('int b = K;\n', defines={'K': '2'})[0] == 'int b = 2 ;'
+
+
+def test_macro_con_parametros():
+    text, _ = preprocesar('#define MAX(a, b) a > b\nx = MAX(MAX(1, 2), (y, z));\n')
+    assert text == 'x = 1 > 2 > ( y , z ) ;'
+    # Sin '(' tras el nombre no es una llamada; con espacio en el #define no tiene parámetros
+    assert preprocesar('#define F(a) a\nF;\n')[0] == 'F ;'
+    assert preprocesar('#define G (a) a\nG(1);\n')[0] == '( a ) a ( 1 ) ;'
+
+
+def test_macros_recursivas():
+    assert preprocesar('#define x x + 1\ny = x;\n')[0] == 'y = x + 1 ;'
+    assert preprocesar('#define A B\n#define B A\nA;\n')[0] == 'A ;'
+    assert preprocesar('#define f(a) a + f(a)\nf(f(1));\n')[0] == '1 + f ( 1 ) + f ( 1 + f ( 1 ) ) ;'
+
+
+def test_diagnosticos_de_macros():
+    _, pre = preprocesar('#define N 1\n#define N 2\n#define N 2\n#define P(a, b) a\nP(1);\nP(1, 2\n')
+    assert [(d.code, d.line) for d in pre.diagnostics] == [('D003', 2), ('D004', 5), ('D005', 6)]
+    assert codigos(preprocesar('#define\n#define M(a,) a\n')[1]) == ['D002', 'D002']
+
+
+def test_includes(tmp_path):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'inc').mkdir()
+    (tmp_path / 'src' / 'local.h').write_text('#define L 1\nint local;\n')
+    (tmp_path / 'inc' / 'sistema.h').write_text('#include <sistema.h>\nint sistema = L;\n')
+    origin = tmp_path / 'src' / 'main.c'
+    source = '#include "local.h"\n#include <sistema.h>\n#include "sistema.h"\nint main;\n'
+    origin.write_text(source)
+    cache = HeaderCache()
+    text, pre = preprocesar(source, str(origin), [str(tmp_path / 'inc')], cache=cache)
+    # Cada cabecera una sola vez, aunque se incluya a sí misma o se pida de otra forma
+    assert text.split() == 'int local ; int sistema = 1 ; int main ;'.split()
+    assert pre.includes == [str((tmp_path / 'src' / 'local.h').resolve()),
+                            str((tmp_path / 'inc' / 'sistema.h').resolve())]
+    assert not codigos(pre) and (cache.hits, cache.misses) == (0, 2)
+    preprocesar(source, str(origin), [str(tmp_path / 'inc')], cache=cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+    # <...> no busca en el directorio del archivo
+    _, pre = preprocesar('#include <local.h>\n#include "falta.h"\n', str(origin), cache=cache)
+    assert [(d.code, d.severity) for d in pre.diagnostics] == [('D001', 2), ('D001', 3)]
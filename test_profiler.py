@@ -0,0 +1,61 @@
+"""
+CompilerProfiler (profiler.py): perfilar no cambia el resultado y los
+contadores (reducciones, tokens, búsquedas, cuádruplos) son exactos.
+"""
+import re
+
+from dfa_lexer import scan
+from diagnostics import DiagnosticSink
+from session import CompilationSession, compile_batch
+from test_codigo_profesor import codigo_profesor
+
+PROGRAMA = "int f(int a) { return a + a * a; }\nint g() { return f(2) + h; }\n"
+
+
+def test_mismo_resultado():
+    profiled = CompilationSession(profile=True).compile(codigo_profesor)
+    plain = CompilationSession().compile(codigo_profesor)
+    assert profiled.code == plain.code
+    assert [d.code for d in profiled.diagnostics] == [d.code for d in plain.diagnostics]
+
+
+def test_contadores():
+    session = CompilationSession(profile=True, engine='dfa')
+    profile = session.compile(PROGRAMA).profile
+    stream, _ = scan(PROGRAMA, DiagnosticSink())
+    assert profile.tokens == len(stream)
+    functions = profile.by_function()
+    assert functions['p_function_definition'][0] == 2
+    assert functions['p_factor_id'][0] == 4 and functions['p_factor_function_call'][0] == 1
+    # a, a, a, h (falla) y la función f
+    assert (profile.lookups, profile.misses) == (5, 1)
+    assert set(profile.phases) >= {'parse'} and profile.quads.keys() == {'f', 'g'}
+    # Terminado el análisis, el lexer y la tabla vuelven a ser los de siempre
+    assert 'token' not in vars(session.lexer) and 'lookup' not in vars(session.symbol_table)
+
+
+def test_pilas_colapsadas(tmp_path):
+    profile = CompilationSession(profile=True).compile(codigo_profesor).profile
+    path = tmp_path / 'perfil.folded'
+    profile.write_collapsed(str(path))
+    lines = path.read_text().splitlines()
+    assert lines == profile.collapsed() and lines
+    assert all(re.fullmatch(r"compile(;[^;]+)+ \d+", line) for line in lines)
+    assert any(line.startswith('compile;parse;p_declaration;') for line in lines)
+    assert 'PERFIL DE COMPILACION' in profile.report()
+
+
+def test_merge(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'u{i}.c'
+        path.write_text(PROGRAMA)
+        paths.append(str(path))
+    results = compile_batch(paths, workers=2, profile=True)
+    total = results[0].profile
+    for result in results[1:]:
+        total.merge(result.profile)
+    single = CompilationSession(profile=True).compile(PROGRAMA).profile
+    assert total.reductions == [3 * count for count in single.reductions]
+    assert total.lookups == 3 * single.lookups and total.quads == {'f': 3 * single.quads['f'],
+                                                                    'g': 3 * single.quads['g']}
@@ -0,0 +1,102 @@
+"""
+Backend de Python (py_backend.py): mismos resultados que la VM con el mismo
+código, con o sin optimizar y con registros.
+"""
+import pytest
+
+import py_backend
+from bench import ProgramGenerator
+from py_backend import PythonProgram
+from test_vm import compilar, ejecutar, programa
+from vm import VirtualMachine, VMError
+
+OPCIONES = [dict(), dict(opt_level=1), dict(opt_level=2), dict(recycle_temps=True),
+            dict(registers=2, opt_level=2), dict(ir='columnar')]
+
+
+def valores(values):
+    """Globales con los punteros sustituidos por el valor apuntado: en la VM son
+    pares (marco, posición) y en Python listas de un elemento."""
+    result = {}
+    for name, value in values.items():
+        if isinstance(value, tuple):
+            value = ('*', value[0][value[1]])
+        elif isinstance(value, list):
+            value = ('*', value[0])
+        result[name] = value
+    return result
+
+
+def llamar_en_vm(result, name, *args):
+    vm = VirtualMachine(result.code, result.globals)
+    vm.run()
+    return vm.call(name, *args)
+
+
+@pytest.mark.parametrize('options', OPCIONES, ids=str)
+def test_programa(options):
+    result = compilar(programa, **options)
+    assert (ejecutar(PythonProgram(result.code, result.globals)) ==
+            ejecutar(VirtualMachine(result.code, result.globals)))
+
+
+# Locales que ocultan una global o a otra local: en el 3AC llevan otro nombre
+SOMBRAS = """
+int x = 5, b = 1;
+int f(int a) { int x; x = a; return x; }
+int g() { f(9); return x; }
+int h(int a) { int b = a * 2; { int b = 3; a = a + b; { int x = b; a = a + x; } } return a + b; }
+{ int x = 7; b = b + x; }
+"""
+
+
+@pytest.mark.parametrize('options', OPCIONES, ids=str)
+def test_locales_que_ocultan(options):
+    result = compilar(SOMBRAS, **options)
+    program = PythonProgram(result.code, result.globals)
+    vm = VirtualMachine(result.code, result.globals)
+    for runner in (program, vm):
+        runner.run()
+        assert [runner.call('f', 9), runner.call('g'), runner.call('h', 1)] == [9, 5, 9]
+    assert valores(program.global_values()) == valores(vm.global_values())
+    assert {name: value for name, value in vm.global_values().items() if '.' not in name} == \
+        {'x': 5, 'b': 8}
+
+
+@pytest.mark.parametrize('options', OPCIONES, ids=str)
+@pytest.mark.parametrize('seed', range(4))
+def test_programas_generados(seed, options):
+    source = ProgramGenerator(functions=6, depth=2, seed=seed).generate()
+    result = compilar(source, **options)
+    vm = VirtualMachine(result.code, result.globals, max_steps=10 ** 6)
+    vm.run()
+    program = PythonProgram(result.code, result.globals)
+    program.run()
+    assert valores(program.global_values()) == valores(vm.global_values())
+
+
+def test_cache_en_disco(tmp_path, monkeypatch):
+    result = compilar(programa + "int solo_aqui() { return 1; }\n")
+    first = PythonProgram(result.code, result.globals, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.glob('*.pycode'))) == 1
+    # Sin la caché en memoria se carga el código objeto del disco
+    monkeypatch.setattr(py_backend, '_cache', {})
+    second = PythonProgram(result.code, result.globals, cache_dir=str(tmp_path))
+    assert second.source == first.source
+    assert ejecutar(second) == ejecutar(VirtualMachine(result.code, result.globals))
+
+
+def test_errores_como_la_vm():
+    result = compilar("int divide(int a) { return -7 / a; }\n"
+                      "int baja(int n) { if (n == 0) { return 0; } return baja(n - 1) + 1; }\n")
+    program = PythonProgram(result.code, result.globals)
+    program.run()
+    assert program.call('divide', 2) == llamar_en_vm(result, 'divide', 2)
+    with pytest.raises(VMError, match='División por cero'):
+        program.call('divide', 0)
+    with pytest.raises(VMError, match='Función no definida'):
+        program.call('no_existe')
+    # La recursión usa la pila de Python: más allá del límite es un VMError
+    assert program.call('baja', 500) == 500
+    with pytest.raises(VMError):
+        program.call('baja', 100000)
@@ -0,0 +1,62 @@
+"""
+Código intermedio columnar (quad_store.py): mismas instrucciones que la lista
+de tuplas y el formato binario conserva operandos y tipos.
+"""
+import pytest
+
+from bench import ProgramGenerator
+from quad_store import QuadStore, Temp
+from session import CompilationSession
+from test_codigo_profesor import codigo_profesor
+
+FUENTES = {
+    'profesor': codigo_profesor,
+    'generado': ProgramGenerator(functions=8, depth=3, seed=3).generate(),
+}
+
+
+@pytest.mark.parametrize('opt_level', [0, 2])
+@pytest.mark.parametrize('name', sorted(FUENTES))
+def test_columnar_igual_a_lista(name, opt_level):
+    source = FUENTES[name]
+    listed = CompilationSession(engine='dfa', opt_level=opt_level).compile(source)
+    stored = CompilationSession(engine='dfa', opt_level=opt_level, ir='columnar').compile(source)
+    assert isinstance(stored.code, QuadStore)
+    assert stored.code == listed.code
+    assert list(stored.code) == list(listed.code)
+    assert ([(d.code, d.line) for d in stored.diagnostics] ==
+            [(d.code, d.line) for d in listed.diagnostics])
+
+
+@pytest.mark.parametrize('name', sorted(FUENTES))
+def test_guardar_y_cargar(tmp_path, name):
+    store = CompilationSession(engine='dfa', ir='columnar').compile(FUENTES[name]).code
+    path = tmp_path / 'code.quad'
+    store.save(str(path))
+    loaded = QuadStore.load(str(path))
+    assert loaded == store
+    # Tras cargar se puede seguir emitiendo con las mismas tablas
+    loaded.emit('+', 'a', 1, Temp('t0'))
+    store.emit('+', 'a', 1, Temp('t0'))
+    assert loaded == store
+    assert len(loaded.operands) == len(store.operands)
+
+
+def test_tipos_de_operandos(tmp_path):
+    store = QuadStore()
+    quads = [('=', 3, None, 'x'), ('=', 2.5, None, 'y'), ('+', 'x', 'y', Temp('t1')),
+             ('=', '"hola"', None, 'z'), ('=', 'ñ', None, 'w')]
+    store.extend(quads)
+    path = tmp_path / 'tipos.quad'
+    store.save(str(path))
+    loaded = QuadStore.load(str(path))
+    assert list(loaded) == quads
+    assert [type(v) for q in loaded for v in q] == [type(v) for q in quads for v in q]
+    assert isinstance(loaded[2][3], Temp)
+
+
+def test_archivo_ajeno(tmp_path):
+    path = tmp_path / 'otro.quad'
+    path.write_bytes(b'NOPE' + bytes(20))
+    with pytest.raises(ValueError):
+        QuadStore.load(str(path))
@@ -0,0 +1,65 @@
+"""
+Reciclado de temporales y registros (regalloc.py): el código renombrado
+ejecuta igual en la VM y respeta el número de registros.
+"""
+import pytest
+
+from bench import ProgramGenerator
+from quad_store import Temp
+from regalloc import allocate
+from test_optimizer import valores
+from test_vm import compilar, ejecutar, programa
+from vm import VirtualMachine
+
+OPCIONES = [dict(recycle_temps=True), dict(registers=1), dict(registers=2), dict(registers=4),
+            dict(registers=2, opt_level=2), dict(recycle_temps=True, opt_level=2)]
+
+
+def nombres(code, kind):
+    return {operand for quad in code for operand in quad[1:] if isinstance(operand, kind)}
+
+
+def spills(code):
+    return {operand for quad in code for operand in quad[1:]
+            if isinstance(operand, str) and operand.startswith('$s')}
+
+
+@pytest.mark.parametrize('options', OPCIONES, ids=str)
+def test_programa(options):
+    reference = compilar(programa, opt_level=options.get('opt_level', 0))
+    allocated = compilar(programa, **options)
+    assert (ejecutar(VirtualMachine(allocated.code, allocated.globals)) ==
+            ejecutar(VirtualMachine(reference.code, reference.globals)))
+    temps = nombres(allocated.code, Temp)
+    assert len(temps) <= len(nombres(reference.code, Temp))
+    if 'registers' in options:
+        assert temps <= {f"t{k}" for k in range(options['registers'])}
+
+
+@pytest.mark.parametrize('options', OPCIONES, ids=str)
+@pytest.mark.parametrize('seed', range(3))
+def test_programas_generados(seed, options):
+    source = ProgramGenerator(functions=6, depth=2, seed=seed).generate()
+    results = []
+    for result in (compilar(source, opt_level=options.get('opt_level', 0)), compilar(source, **options)):
+        vm = VirtualMachine(result.code, result.globals, max_steps=10 ** 6)
+        vm.run()
+        results.append(valores(vm.global_values()))
+    assert results[1] == results[0]
+
+
+def test_derrames():
+    code = [('func', 'f', None, None),
+            ('+', 'a', 'b', Temp('t0')), ('+', 'c', 'd', Temp('t1')), ('+', 'e', 'g', Temp('t2')),
+            ('+', Temp('t0'), Temp('t1'), Temp('t3')), ('+', Temp('t3'), Temp('t2'), Temp('t4')),
+            ('return', None, None, Temp('t4')), ('endfunc', 'f', None, None)]
+    allocated, report = allocate(code, registers=2)
+    assert nombres(allocated, Temp) <= {'t0', 't1'}
+    assert spills(allocated)
+    stats = report.functions[0]
+    assert (stats.temps, stats.peak) == (5, 3)
+    assert stats.spilled >= 1
+    assert stats.spill_slots == len(spills(allocated))
+    recycled, report = allocate(code)
+    assert len(nombres(recycled, Temp)) == 3
+    assert not spills(recycled)
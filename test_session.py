@@ -0,0 +1,54 @@
+"""
+CompilationSession y compile_batch (session.py): las sesiones no comparten
+estado, y compilar por lotes (en serie o en un pool) da lo mismo que compilar
+cada archivo por separado.
+"""
+import pytest
+
+from session import CompilationSession, compile_batch
+from test_codigo_profesor import codigo_profesor
+
+ERRONEO = "int f(int a) { return a + no_declarada; }\nint g() { int a; int a; return 0; }\n"
+
+
+def resumen(result):
+    return (list(result.code), [(d.code, d.line, d.column) for d in result.diagnostics],
+            result.ok, result.globals, result.symbols)
+
+
+def test_sesiones_independientes():
+    solo_ok = CompilationSession().compile(codigo_profesor)
+    solo_mal = CompilationSession().compile(ERRONEO)
+    first, second = CompilationSession(), CompilationSession()
+    # Alternadas: ni la tabla de símbolos, ni los temporales, ni los diagnósticos pasan de una a otra
+    for _ in range(2):
+        assert resumen(first.compile(codigo_profesor)) == resumen(solo_ok)
+        assert resumen(second.compile(ERRONEO)) == resumen(solo_mal)
+    assert second.symbol_table is not first.symbol_table
+    assert not solo_mal.ok and solo_ok.code
+
+
+def test_sesion_reutilizada():
+    # La misma sesión tras una unidad con errores compila la siguiente desde cero
+    compiled = CompilationSession()
+    compiled.compile(ERRONEO)
+    assert resumen(compiled.compile(codigo_profesor)) == resumen(CompilationSession().compile(codigo_profesor))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_compile_batch(tmp_path, workers):
+    sources = [codigo_profesor, ERRONEO, "int h() { return 7; }\n"] * 2
+    paths = []
+    for i, source in enumerate(sources):
+        path = tmp_path / f'u{i}.c'
+        path.write_text(source)
+        paths.append(str(path))
+    (tmp_path / 'latin1.c').write_bytes(b'int x; /* \xf1 */\n')
+    paths += [str(tmp_path / 'latin1.c'), str(tmp_path / 'no_existe.c')]
+    results = compile_batch(paths, workers=workers, chunksize=2, opt_level=1)
+    assert [result.name for result in results] == paths
+    for result, source in zip(results, sources):
+        assert resumen(result) == resumen(CompilationSession(opt_level=1).compile(source, result.name))
+    # Los archivos ilegibles son un diagnóstico de su unidad, no un fallo del lote
+    for result in results[len(sources):]:
+        assert not result.ok and [d.code for d in result.diagnostics] == ['I001']
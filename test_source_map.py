@@ -0,0 +1,58 @@
+"""
+Mapa de fuente (source_map.py): posiciones a (línea, columna), columnas de
+los diagnósticos y el tramo de fuente de cada cuádruplo.
+"""
+import pickle
+import random
+
+from session import CompilationSession
+from source_map import SourceMap
+from test_codigo_profesor import codigo_profesor
+
+PROGRAMA = "int f(int a) {\n    int c;\n    c = a * 2;\n    return c + b;\n}\n"
+
+
+def ingenua(text, offset):
+    line = text.count('\n', 0, offset) + 1
+    return line, offset - (text.rfind('\n', 0, offset) + 1) + 1
+
+
+def test_location_frente_a_recorrer_el_texto():
+    source_map = SourceMap(codigo_profesor)
+    assert len(source_map) == codigo_profesor.count('\n') + 1
+    for offset in range(len(codigo_profesor)):
+        line, column = ingenua(codigo_profesor, offset)
+        assert source_map.location(offset) == (line, column)
+        assert source_map.column(line, offset) == column
+
+
+def test_por_fragmentos_igual_que_entero():
+    rng = random.Random(0)
+    fed = SourceMap()
+    position = 0
+    while position < len(codigo_profesor):
+        size = rng.randint(1, 40)
+        fed.feed(codigo_profesor[position:position + size])
+        position += size
+    assert fed.starts == SourceMap(codigo_profesor).starts
+    # Entre procesos viaja el índice, no el texto
+    copy = pickle.loads(pickle.dumps(SourceMap(codigo_profesor)))
+    assert copy.text is None and copy.starts == fed.starts
+
+
+def test_columna_de_los_diagnosticos():
+    result = CompilationSession().compile(PROGRAMA)
+    [diag] = result.diagnostics
+    assert (diag.code, diag.line, diag.column) == ('S002', 4, PROGRAMA.split('\n')[3].index('b') + 1)
+
+
+def test_tramos_de_los_cuadruplos():
+    result = CompilationSession(spans=True).compile(PROGRAMA.replace(' + b', ''), 'f.c')
+    assert len(result.spans) == len(result.code)
+    text = PROGRAMA.replace(' + b', '')
+    spanned = {quad[0]: text[start:end] for quad, (start, end) in zip(result.code, result.spans)}
+    assert spanned['*'] == 'a * 2'
+    assert spanned['='] == 'c = a * 2;'     # la sentencia de asignación
+    start, end = result.spans[[quad[0] for quad in result.code].index('*')]
+    assert result.source_map.describe(start, end).splitlines() == [
+        'f.c:3:9', '        c = a * 2;', '            ^^^^^']
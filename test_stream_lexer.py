@@ -0,0 +1,72 @@
+"""
+StreamLexer (stream_lexer.py) con fragmentos pequeños: los tokens cortados
+entre fragmentos deben salir iguales que al escanear la entrada completa.
+"""
+import io
+
+import pytest
+
+from bench import ProgramGenerator
+from dfa_lexer import make_lexer
+from diagnostics import DiagnosticSink
+from session import CompilationSession
+from stream_lexer import StreamLexer
+from test_codigo_profesor import codigo_profesor
+
+FUENTES = {
+    'profesor': codigo_profesor,
+    'generado': ProgramGenerator(functions=6, depth=3, seed=2).generate(),
+    'cortes': "/* comentario\n largo */ float abc = 12.75; // fin\n"
+              "char *s = \"cadena que cruza fragmentos\"; a <= b && c != d;\n a @ b\n",
+    'ñandú': "int año = 1; /* ñandú */ año = año + 1;\n",
+}
+TAMAÑOS = [1, 2, 7, 64]
+
+
+def completo(source):
+    lexer = make_lexer('dfa')
+    sink = DiagnosticSink()
+    lexer.diagnostics = sink
+    lexer.lineno = 1
+    lexer.input(source)
+    found = []
+    while True:
+        tok = lexer.token()
+        if tok is None:
+            break
+        found.append((tok.type, tok.value, tok.lineno, tok.lexpos))
+    return found, [(d.code, d.line) for d in sink]
+
+
+def por_fragmentos(source, chunk_size, binary=False):
+    data = io.BytesIO(source.encode('utf-8')) if binary else io.StringIO(source)
+    lexer = StreamLexer(data, chunk_size)
+    sink = DiagnosticSink()
+    lexer.diagnostics = sink
+    found = [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lexer]
+    return found, [(d.code, d.line) for d in sink]
+
+
+@pytest.mark.parametrize('chunk_size', TAMAÑOS)
+@pytest.mark.parametrize('name', sorted(FUENTES))
+def test_fragmentos_igual_a_completo(name, chunk_size):
+    source = FUENTES[name]
+    assert por_fragmentos(source, chunk_size) == completo(source)
+
+
+@pytest.mark.parametrize('chunk_size', TAMAÑOS)
+def test_utf8_partido(chunk_size):
+    # Con bytes, los caracteres multibyte pueden quedar partidos entre fragmentos
+    source = FUENTES['ñandú']
+    assert por_fragmentos(source, chunk_size, binary=True) == completo(source)
+
+
+@pytest.mark.parametrize('chunk_size', TAMAÑOS)
+def test_compile_stream_igual_a_compile(tmp_path, chunk_size):
+    path = tmp_path / 'profesor.c'
+    path.write_text(codigo_profesor, encoding='utf-8')
+    full = CompilationSession().compile(codigo_profesor)
+    streamed = CompilationSession().compile_stream(str(path), chunk_size=chunk_size)
+    assert streamed.code == full.code
+    assert ([(d.code, d.line, d.message) for d in streamed.diagnostics] ==
+            [(d.code, d.line, d.message) for d in full.diagnostics])
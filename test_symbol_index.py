@@ -0,0 +1,109 @@
+"""
+SymbolIndex (symbol_index.py): lo que se indexa se lee igual desde el diario,
+tras reabrir y tras compactar; resolve enlaza las referencias entre unidades.
+"""
+import os
+import random
+
+import symbol_index
+from session import CompilationSession
+from symbol_index import SymbolIndex, source_digest
+
+UNIDADES = {
+    'a.c': "int total;\nint suma(int a, int b) { return a + b; }\n",
+    'b.c': "float total;\nint main() { int x; x = suma(1, 2) + falta(3); return resta(2.5) + x; }\n",
+    'c.c': "int resta(int *p) { return 0; }\n",
+}
+NOMBRES = ['total', 'suma', 'main', 'resta', 'falta']
+
+
+def contenido(index):
+    return ({name: sorted((d.unit, d.type, d.line) for d in index.lookup(name)) for name in NOMBRES},
+            index.unit_names(), {unit: index.unit_symbols(unit) for unit in index.unit_names()})
+
+
+def indexar(directory):
+    results = [CompilationSession().compile(source, name) for name, source in UNIDADES.items()]
+    index = SymbolIndex(str(directory))
+    index.update_results(results, {name: source_digest(source) for name, source in UNIDADES.items()})
+    return index
+
+
+def test_resolve(tmp_path):
+    with indexar(tmp_path) as index:
+        report = index.resolve()
+        assert report.resolved == 1
+        assert report.unresolved == [('b.c', 'falta', 2)]
+        [(unit, name, line, definition)] = report.mismatched
+        assert (unit, name, definition.unit, definition.type) == ('b.c', 'resta', 'c.c', 'int(int*)')
+        # Variable global con tipos distintos en dos unidades
+        assert {d.unit for d in report.duplicates['total']} == {'a.c', 'b.c'}
+        assert not report.ok and 'falta' in str(report)
+        index.update('c.c', [('resta', 'int(float)', 1), ('falta', 'int(int)', 2)])
+        assert index.resolve(duplicates=False).ok
+        # Una función definida en dos unidades es un duplicado aunque tenga la misma firma
+        index.update('d.c', [('suma', 'int(int,int)', 1)])
+        assert set(index.resolve().duplicates) == {'total', 'suma'}
+
+
+def test_diario_reabrir_y_compactar(tmp_path):
+    with indexar(tmp_path) as index:
+        expected = contenido(index)
+        assert index.digest('a.c') == source_digest(UNIDADES['a.c']) and index.digest('z.c') is None
+    with SymbolIndex(str(tmp_path)) as index:
+        assert contenido(index) == expected and index.stats()['base_units'] == 0
+        index.compact()
+        assert contenido(index) == expected
+        assert index.stats()['journal_units'] == 0 and index.stats()['base_units'] == 3
+        index.remove('c.c')
+        index.update('a.c', [('suma', 'int(int,int)', 5)])
+        changed = contenido(index)
+        assert changed[1] == ['a.c', 'b.c']
+    with SymbolIndex(str(tmp_path)) as index:
+        assert contenido(index) == changed
+        assert index.digest('a.c') == b''
+
+
+def test_escritura_cortada(tmp_path):
+    with indexar(tmp_path) as index:
+        expected = contenido(index)
+    journal = os.path.join(str(tmp_path), symbol_index.JOURNAL_FILE)
+    size = os.path.getsize(journal)
+    with open(journal, 'ab') as f:
+        f.write(b'\x40\0\0\0\x01\x02\x03\x04 incompleto')
+    with SymbolIndex(str(tmp_path)) as index:
+        assert contenido(index) == expected
+        assert os.path.getsize(journal) == size
+        index.update('e.c', [('nueva', 'int', 1)])
+    with SymbolIndex(str(tmp_path)) as index:
+        assert [d.unit for d in index.lookup('nueva')] == ['e.c']
+
+
+def test_frente_a_un_dict(tmp_path, monkeypatch):
+    # Compactaciones automáticas frecuentes, con reaperturas en medio
+    monkeypatch.setattr(symbol_index, 'COMPACT_MIN', 4)
+    rng = random.Random(0)
+    model = {}
+    compactions = 0
+    index = SymbolIndex(str(tmp_path))
+    for step in range(300):
+        unit = f"u{rng.randrange(12)}.c"
+        if rng.random() < 0.2:
+            index.remove(unit)
+            model.pop(unit, None)
+        else:
+            symbols = [(f"s{rng.randrange(20)}", rng.choice(['int', 'float', 'int(int)']), line)
+                       for line in range(1, rng.randrange(1, 5))]
+            index.update(unit, symbols)
+            model[unit] = symbols
+        if step % 50 == 49:
+            compactions += index.compactions
+            index.close()
+            index = SymbolIndex(str(tmp_path))
+        assert index.unit_names() == sorted(model)
+        name = f"s{rng.randrange(20)}"
+        assert sorted((d.unit, d.type, d.line) for d in index.lookup(name)) == \
+            sorted((unit, type, line) for unit, symbols in model.items()
+                   for symbol, type, line in symbols if symbol == name)
+    assert compactions > 0
+    index.close()
@@ -0,0 +1,84 @@
+"""
+ChainedSymbolTable (symbol_table.py) frente a ScopedSymbolTable: la misma
+secuencia de operaciones da los mismos símbolos visibles y los mismos errores.
+"""
+import random
+import sys
+
+import pytest
+
+from symbol_table import ChainedSymbolTable, ScopedSymbolTable, SemanticError, Symbol
+
+NOMBRES = ['a', 'b', 'c', 'd']
+
+
+def visibles(table):
+    result = {}
+    for name in NOMBRES:
+        try:
+            symbol = table.lookup(name)
+        except SemanticError as e:
+            result[name] = e.code
+        else:
+            result[name] = (symbol.type, symbol.depth)
+    return result
+
+
+def tipos(scopes):
+    return [{name: symbol.type for name, symbol in scope.items()} for scope in scopes]
+
+
+def aplicar(table, op, arg):
+    try:
+        if op == 'push':
+            table.push_scope()
+        elif op == 'pop':
+            table.pop_scope()
+        elif op == 'add':
+            table.add(Symbol(arg[0], arg[1]))
+        else:
+            table.add_global(Symbol(arg[0], arg[1]))
+    except SemanticError as e:
+        return e.code
+    return None
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_misma_visibilidad(seed):
+    rng = random.Random(seed)
+    scoped, chained = ScopedSymbolTable(), ChainedSymbolTable()
+    for step in range(400):
+        op = rng.choice(['push', 'pop', 'add', 'add', 'add', 'global'])
+        arg = (rng.choice(NOMBRES), f't{step}')
+        assert aplicar(chained, op, arg) == aplicar(scoped, op, arg)
+        assert chained.depth == scoped.depth
+        assert visibles(chained) == visibles(scoped)
+    assert tipos(chained.scopes) == tipos(scoped.scopes)
+
+
+def test_sombra_y_deshacer():
+    table = ChainedSymbolTable()
+    table.add(Symbol('x', 'int'))
+    table.push_scope()
+    table.add(Symbol('x', 'float'))
+    table.push_scope()
+    # Una función declarada desde su cabecera va al ámbito global aunque haya locales
+    table.add_global(Symbol('f', 'int(int)'))
+    table.add(Symbol('x', 'char'))
+    assert table.lookup('x').type == 'char' and table.global_lookup('x').type == 'int'
+    table.pop_scope()
+    assert table.lookup('x').type == 'float'
+    table.pop_scope()
+    assert table.lookup('x').type == 'int' and table.lookup('f').depth == 0
+    assert [symbol.name for symbol in table.global_symbols()] == ['x', 'f']
+    assert table.undo == ['x', 'f']
+    with pytest.raises(SemanticError) as e:
+        table.pop_scope()
+    assert e.value.code == 'S004'
+
+
+def test_nombres_internados():
+    table = ChainedSymbolTable()
+    name = ''.join(['con', 'tador'])
+    table.add(Symbol(name, 'int'))
+    assert table.lookup('contador').name is sys.intern('contador')
@@ -0,0 +1,84 @@
+"""
+Árbol sintáctico (syntax_tree.py): un nodo por reducción, hojas con su valor
+y línea, y el orden de despacho de TreeVisitor.
+"""
+from collections import Counter
+
+from session import CompilationSession
+from syntax_tree import TreeVisitor
+from test_codigo_profesor import codigo_profesor
+
+PROGRAMA = "int x;\nint f(int a) {\n    x = a + 2;\n    return x * a;\n}\n"
+
+
+class Registro(TreeVisitor):
+    """Anota qué método atendió cada nodo."""
+    def __init__(self):
+        self.calls = []
+
+    def visit_expression_binop(self, node):
+        self.calls.append(('rule', node.children[1].value))
+        TreeVisitor.generic_visit(self, node)
+
+    def visit_expression(self, node):
+        self.calls.append(('nonterminal', node.rule))
+        TreeVisitor.generic_visit(self, node)
+
+    def generic_visit(self, node):
+        self.calls.append(('generic', node.type))
+        super().generic_visit(node)
+
+    def visit_ID(self, node):
+        self.calls.append(('ID', node.value, node.line))
+
+
+def test_un_nodo_por_reduccion():
+    tree = CompilationSession(build_ast=True).compile(codigo_profesor).tree
+    profile = CompilationSession(profile=True).compile(codigo_profesor).profile
+    nodes = Counter(kind for kind in tree.kind if kind >= 0)
+    assert nodes == Counter({prod: count for prod, count in enumerate(profile.reductions) if count})
+    # La raíz es la última reducción
+    assert tree.root == len(tree) - 1 and tree.root_node().type == 'program'
+    # Construir el árbol no cambia el código
+    assert CompilationSession(build_ast=True).compile(codigo_profesor).code == \
+        CompilationSession().compile(codigo_profesor).code
+
+
+def test_despacho_del_visitante():
+    visitor = Registro()
+    visitor.visit(CompilationSession(build_ast=True).compile(PROGRAMA).tree.root_node())
+    calls = visitor.calls
+    assert calls[0] == ('generic', 'program')
+    # visit_<regla> antes que visit_<no terminal>, y este antes que generic_visit
+    assert [call[1] for call in calls if call[0] == 'rule'] == ['+', '*']
+    assert [call[1] for call in calls if call[0] == 'nonterminal'] == ['expression_factor'] * 4
+    assert ('generic', 'expression') not in calls and ('generic', 'statement') in calls
+    assert [call for call in calls if call[0] == 'ID'] == [
+        ('ID', 'x', 1), ('ID', 'f', 2), ('ID', 'a', 2), ('ID', 'x', 3), ('ID', 'a', 3),
+        ('ID', 'x', 4), ('ID', 'a', 4)]
+
+
+def test_hojas():
+    tree = CompilationSession(build_ast=True).compile(PROGRAMA).tree
+    leaves = [tree.node(i) for i in range(len(tree)) if tree.kind[i] < 0]
+    assert [(leaf.type, leaf.value, leaf.line) for leaf in leaves if leaf.type == 'INT_LITERAL'] == \
+        [('INT_LITERAL', 2, 3)]
+    assert all(leaf.children == [] and leaf.production is None for leaf in leaves)
+    # Los valores se internan: 'x' aparece tres veces y se guarda una
+    assert tree.values.count('x') == 1
+    # La línea de un nodo es la de su primer token
+    returns = [tree.node(i) for i in range(len(tree)) if tree.kind[i] >= 0
+               and tree.node(i).rule == 'return_statement']
+    assert [node.line for node in returns] == [4]
+
+
+def test_error_de_sintaxis():
+    result = CompilationSession(build_ast=True).compile(PROGRAMA.replace('x = a + 2;', 'x = a + ;'))
+    assert any(d.code == 'P001' for d in result.diagnostics)
+    tree = result.tree
+    assert len(tree) > 0
+    # Los hijos que la recuperación descartó quedan como None, sin romper el recorrido
+    for i in range(len(tree)):
+        for child in tree.node(i).children:
+            assert child is None or 0 <= child.index < len(tree)
+    TreeVisitor().visit(tree.root_node())
@@ -0,0 +1,65 @@
+"""
+Sistema de tipos (type_system.py): la aritmética de punteros depende del
+operador, tanto en las tablas como en los diagnósticos del análisis.
+"""
+from itertools import product
+
+import pytest
+
+from session import CompilationSession
+from type_system import (COMPATIBLE, ERROR, FLOAT, INT, PROMOTION, compatible, function_type,
+                         parse_type, pointer_to, promote)
+
+P = INT.pointer()
+
+
+def test_tipos_internados():
+    assert pointer_to(INT, 2) is P.pointer() is parse_type('int**')
+    assert function_type(INT, [P, FLOAT]) is parse_type('int(int*,float)')
+    assert COMPATIBLE[FLOAT][INT] and not COMPATIBLE[INT][FLOAT]
+
+
+@pytest.mark.parametrize('op, a, b, result', [
+    ('+', P, INT, P), ('+', INT, P, P), ('-', P, INT, P), ('-', P, P, INT),
+    ('-', INT, P, ERROR), ('+', P, P, ERROR), ('*', P, INT, ERROR), ('/', P, INT, ERROR),
+    ('*', P, P, ERROR), ('-', P, FLOAT, ERROR), ('-', P, P.pointer(), ERROR),
+    ('*', INT, FLOAT, FLOAT), ('/', INT, INT, INT),
+])
+def test_promocion_por_operador(op, a, b, result):
+    assert PROMOTION[op][a][b] is result
+
+
+def diagnosticos(body):
+    source = f"int f(int *p, int *q, int n) {{\n    int *r;\n    {body}\n    return n;\n}}\n"
+    return [(d.code, d.line) for d in CompilationSession(engine='dfa').compile(source).diagnostics]
+
+
+@pytest.mark.parametrize('body', ['r = p + 2;', 'r = 2 + p;', 'r = p - 2;', 'n = p - q;'])
+def test_aritmetica_de_punteros_valida(body):
+    assert diagnosticos(body) == []
+
+
+@pytest.mark.parametrize('body', ['r = p * 2;', 'r = p / 2;', 'n = p + q;', 'n = p * q;',
+                                  'r = 2 - p;'])
+def test_aritmetica_de_punteros_no_valida(body):
+    assert diagnosticos(body) == [('S009', 3)]
+
+
+def test_firmas_fuera_de_las_tablas():
+    # Internar muchas firmas distintas no añade filas ni columnas a las tablas
+    basic = [INT, FLOAT, P]
+    sizes = (len(COMPATIBLE), len(PROMOTION['+']), len(COMPATIBLE[INT]))
+    # Todas las listas de parámetros de 1 a 7 tipos que ya existen: 3279 firmas
+    signatures = [function_type(INT, params) for n in range(1, 8) for params in product(basic, repeat=n)]
+    assert len(set(signatures)) == 3279
+    assert (len(COMPATIBLE), len(PROMOTION['+']), len(COMPATIBLE[INT])) == sizes
+    f, g = signatures[:2]
+    assert compatible(f, f) and not compatible(f, g) and not compatible(INT, f)
+    assert compatible(ERROR, f) and compatible(f, ERROR)
+    assert promote('+', f, INT) is ERROR and promote('-', P, f) is ERROR
+
+
+def test_funcion_usada_como_valor():
+    source = "int f(int a) { return a; }\nint g() { int n; n = f; n = f + 1; f = 2; return n; }\n"
+    result = CompilationSession().compile(source)
+    assert [(d.code, d.line) for d in result.diagnostics] == [('S003', 2), ('S009', 2), ('S003', 2)]
@@ -0,0 +1,154 @@
+"""
+Máquina virtual (vm.py): resultados conocidos de programas pequeños.
+
+`programa` también lo usan las pruebas del optimizador, de regalloc y del
+backend de Python para comparar caminos de compilación.
+"""
+import pytest
+
+from session import CompilationSession
+from test_codigo_profesor import codigo_profesor
+from vm import VirtualMachine, VMError, run_function
+
+programa = """
+int total = 0, veces;
+float escala = 2.5;
+
+int cuadrado(int x) {
+    return x * x;
+}
+
+int fib(int n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+int suma(int n) {
+    int i, s, a, b;
+    s = 0;
+    a = 2 + 3 * 4;
+    for (i = 0; i < n; i++) {
+        b = i * a + 0;
+        s = s + b * 1 + i * a;
+        if (s > 1000 && i != 3 || n == 0) {
+            s = s - 1000;
+        }
+    }
+    return s;
+}
+
+int clasifica(int v) {
+    int r;
+    r = 0;
+    switch (v) {
+        case 1: r = 10;
+                break;
+        case 2: r = 20;
+        case 3: r = r + 30;
+                break;
+        default: r = -1;
+                 break;
+    }
+    while (r > 25) {
+        r = r / 2;
+    }
+    return r;
+}
+
+int punteros(int v) {
+    int x, *p;
+    p = &x;
+    x = v + 1;
+    return *p * 2;
+}
+
+float mezcla(int a, float f) {
+    return a * f + escala;
+}
+
+total = suma(10) + cuadrado(7);
+veces = fib(10);
+"""
+
+# (función, argumentos) que se comparan entre caminos de compilación
+LLAMADAS = [('cuadrado', (-6,)), ('fib', (15,)), ('suma', (0,)), ('suma', (40,)),
+            ('punteros', (4,)), ('mezcla', (3, 1.5))] + [('clasifica', (v,)) for v in range(5)]
+
+
+def compilar(source, **options):
+    result = CompilationSession(engine='dfa', **options).compile(source)
+    assert result.ok, [str(d) for d in result.diagnostics]
+    return result
+
+
+def ejecutar(runner):
+    """Globales tras el código global y resultados de LLAMADAS."""
+    runner.run()
+    values = runner.global_values()
+    return values, [runner.call(name, *args) for name, args in LLAMADAS]
+
+
+def suma(n):
+    s = 0
+    for i in range(n):
+        s += 28 * i
+        if s > 1000 and i != 3:
+            s -= 1000
+    return s
+
+
+def test_resultados_conocidos():
+    result = compilar(programa)
+    values, calls = ejecutar(VirtualMachine(result.code, result.globals))
+    assert values == {'total': suma(10) + 49, 'veces': 55, 'escala': 2.5}
+    assert calls == [36, 610, 0, suma(40), 10, 7.0, -1, 10, 25, 15, -1]
+
+
+def test_fibonaci_del_profesor():
+    result = CompilationSession(engine='dfa').compile(codigo_profesor)
+    assert run_function(result.code, 'fibonaci', 20, globals=result.globals) == 6765
+
+
+def test_recursion_sin_limite_de_python():
+    result = compilar("int baja(int n) { if (n == 0) { return 0; } return baja(n - 1) + 1; }")
+    assert run_function(result.code, 'baja', 5000) == 5000
+
+
+def test_globales_sin_asignar():
+    result = compilar("int sin_valor, b = 2;\nfloat f;\nchar letra;\nletra = 'b';\n")
+    vm = VirtualMachine(result.code, result.globals)
+    vm.run()
+    assert vm.global_values() == {'sin_valor': 0, 'b': 2, 'f': 0, 'letra': ord('b')}
+
+
+def test_errores_de_ejecucion():
+    result = compilar("int bucle() { int i; i = 0; while (i < 1) { i = 0; } return i; }\n"
+                      "int divide(int a) { return 1 / a; }\n")
+    vm = VirtualMachine(result.code, result.globals, max_steps=1000)
+    vm.run()
+    with pytest.raises(VMError, match='Límite'):
+        vm.call('bucle')
+    with pytest.raises(VMError, match='División por cero'):
+        vm.call('divide', 0)
+    with pytest.raises(VMError, match='Función no definida'):
+        vm.call('no_existe')
+    assert vm.call('divide', 1) == 1
+
+
+def test_bloque_anidado_oculta_variable():
+    # El b del bloque interior no pisa al de fuera
+    result = compilar("int f(int a) { int b = a * 2; { int b = 3; a = a + b; } return a + b; }")
+    assert run_function(result.code, 'f', 1) == 6
+    assert ('=', '3', None, 'b.3') in result.code
+
+
+def test_local_oculta_global():
+    result = compilar("int x = 5;\nint f(int a) { int x; x = a; return x; }\n"
+                      "int g() { f(9); return x; }\n")
+    vm = VirtualMachine(result.code, result.globals)
+    vm.run()
+    assert vm.call('f', 9) == 9
+    assert vm.call('g') == 5
+    assert vm.global_values() == {'x': 5}
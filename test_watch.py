@@ -0,0 +1,67 @@
+"""
+Modo vigilancia (watch.py) sin vigilante: WatchBuild.build y affected sobre
+un árbol temporal. Una unidad ilegible es un diagnóstico, no el fin del bucle.
+"""
+import io
+
+from watch import WatchBuild
+
+
+def arbol(tmp_path):
+    (tmp_path / 'defs.h').write_text('#define N 4\n')
+    (tmp_path / 'a.c').write_text('#include "defs.h"\nint a() { return N; }\n')
+    (tmp_path / 'b.c').write_text('int b() { return 1; }\n')
+    return WatchBuild(str(tmp_path), stream=io.StringIO())
+
+
+def test_solo_lo_afectado(tmp_path):
+    build = arbol(tmp_path)
+    assert all(result.ok for result in build.build(build.units()))
+    header = str((tmp_path / 'defs.h').resolve())
+    assert build.affected({header}) == {str((tmp_path / 'a.c').resolve())}
+
+
+def test_unidad_que_no_es_utf8(tmp_path):
+    build = arbol(tmp_path)
+    (tmp_path / 'c.c').write_bytes(b'int c() { return 1; } /* \xff\xfe */\n')
+    results = {result.name: result for result in build.build(build.units())}
+    bad = results[str((tmp_path / 'c.c').resolve())]
+    assert not bad.ok and [d.code for d in bad.diagnostics] == ['I001']
+    assert sum(result.ok for result in results.values()) == 2
+    # Corregida, se vuelve a compilar con normalidad
+    (tmp_path / 'c.c').write_text('int c() { return 1; }\n')
+    [result] = build.build(build.affected({bad.name}))
+    assert result.ok
+
+
+def test_unidad_borrada_al_leerla(tmp_path, monkeypatch):
+    build = arbol(tmp_path)
+    build.build(build.units())
+    unit = str((tmp_path / 'b.c').resolve())
+
+    def borrada(path):
+        raise FileNotFoundError(2, 'No such file or directory', path)
+    monkeypatch.setattr(build.session, 'compile_file', borrada)
+    assert build.build({unit}) == []
+    assert unit not in build.results
+
+
+def test_cabecera_que_oculta_a_la_de_include_path(tmp_path):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'inc').mkdir()
+    (tmp_path / 'inc' / 'defs.h').write_text('#define N 4\n')
+    (tmp_path / 'src' / 'a.c').write_text('#include "defs.h"\nint a() { return N; }\n')
+    (tmp_path / 'src' / 'b.c').write_text('int b() { return 1; }\n')
+    build = WatchBuild(str(tmp_path / 'src'), include_path=[str(tmp_path / 'inc')],
+                       stream=io.StringIO())
+    build.build(build.units())
+    unit = str((tmp_path / 'src' / 'a.c').resolve())
+    shadow = str((tmp_path / 'src').resolve() / 'defs.h')
+    assert build.results[unit].probes == [shadow]
+    # Aparece una cabecera junto a la unidad: "defs.h" ya no es la de include_path
+    (tmp_path / 'src' / 'defs.h').write_text('#define N 40\n')
+    assert build.affected({shadow}) == {unit}
+    [result] = build.build({unit})
+    assert result.includes == [shadow] and ('return', '40', None, None) in result.code
+    # Ya no se prueba esa ruta: la entrada se retira
+    assert shadow not in build.probed
@@ -0,0 +1,203 @@
+"""
+Núcleo del sistema de tipos: tipos internados y tablas precalculadas.
+
+Cada tipo existe una sola vez: INT.pointer() devuelve siempre el mismo
+objeto, así que dos tipos son iguales si y solo si son el mismo objeto. Los
+tipos son además str con su escritura en C ('int', 'float*', 'int(int,char*)'),
+de modo que las trazas, los mensajes y el código que ya comparaba cadenas
+siguen funcionando igual.
+
+Al internar un tipo nuevo se rellenan sus filas de dos tablas:
+    PROMOTION[op][a][b]  tipo del resultado de a op b (op en + - * /); ERROR si
+                       no es válida. La aritmética de punteros depende del
+                       operador: p + n, n + p y p - n dan el puntero, p - q
+                       (mismo tipo) da int, y nada más admite punteros
+    COMPATIBLE[a][b]   True si un valor de tipo b se puede asignar a (o pasar
+                       como argumento de) tipo a
+así que el análisis semántico solo consulta diccionarios (promote y
+compatible). Las tablas son de filas (un dict por tipo) y no de pares:
+indexar con una tupla obliga a construirla y a calcular su hash en cada
+consulta. Solo tienen filas los tipos de valor (los básicos y sus punteros),
+que son pocos, así que son pequeñas.
+
+Las firmas de función son tipos más (FunctionType): la tabla de símbolos
+guarda cada función como símbolo global cuyo tipo es su firma, y una llamada
+se comprueba con una búsqueda del nombre y una consulta a COMPATIBLE por
+argumento. Las firmas no entran en las tablas: un programa puede tener miles
+distintas, y con filas cada una costaría O(tipos) al internarla y las tablas
+crecerían con el cuadrado. Una firma solo es compatible consigo misma y no
+admite aritmética, y eso lo resuelven promote y compatible sin tabla.
+"""
+import sys
+
+_types = {}         # escritura -> tipo
+_values = []        # tipos con filas en las tablas (todos menos las firmas)
+ARITHMETIC_OPS = ('+', '-', '*', '/')
+PROMOTION = {op: {} for op in ARITHMETIC_OPS}   # op -> a -> {b: tipo de a op b}
+COMPATIBLE = {}     # destino -> {origen: se puede asignar}
+
+
+class CType(str):
+    """Tipo básico o puntero. base: nombre del tipo básico; level: número de '*'."""
+    __slots__ = ('base', 'level', 'target', '_pointer')
+
+    def pointer(self):
+        """El tipo puntero a este."""
+        if self._pointer is None:
+            spelling = self + '*'
+            self._pointer = _types.get(spelling) or _register(CType._make(spelling, self.base, self.level + 1, self))
+        return self._pointer
+
+    @property
+    def is_arithmetic(self):
+        return self.level == 0 and self.base in ARITHMETIC
+
+    @property
+    def is_integral(self):
+        return self.level == 0 and self.base in ARITHMETIC and self.base != 'float'
+
+    @classmethod
+    def _make(cls, spelling, base, level, target):
+        t = str.__new__(cls, sys.intern(spelling))
+        t.base = base
+        t.level = level
+        t.target = target       # tipo apuntado (None si no es puntero)
+        t._pointer = None
+        return t
+
+    def __reduce__(self):
+        # Al deserializar (caché en disco, pool de procesos) se vuelve al tipo internado
+        return (parse_type, (str(self),))
+
+    def __repr__(self):
+        return f"<tipo {str(self)}>"
+
+
+class FunctionType(CType):
+    """Firma de una función: tipo de retorno y tipos de los parámetros."""
+    __slots__ = ('result', 'params')
+
+    def __reduce__(self):
+        return (function_type, (self.result, self.params))
+
+
+def _register(t):
+    _types[str(t)] = t
+    if isinstance(t, FunctionType):
+        return t
+    _values.append(t)
+    for op, table in PROMOTION.items():
+        table[t] = {}
+        for other in _values:
+            table[t][other] = _promote(op, t, other)
+            table[other][t] = _promote(op, other, t)
+    COMPATIBLE[t] = {}
+    for other in _values:
+        COMPATIBLE[t][other] = _compatible(t, other)
+        COMPATIBLE[other][t] = _compatible(other, t)
+    return t
+
+def _promote(op, a, b):
+    if a is ERROR or b is ERROR:
+        return ERROR
+    if a.is_arithmetic and b.is_arithmetic:
+        return FLOAT if a is FLOAT or b is FLOAT else INT
+    # Aritmética de punteros: p + n y p - n, n + p, p - q
+    if op == '+' or op == '-':
+        if a.level and b.is_integral:
+            return a
+        if op == '+' and b.level and a.is_integral:
+            return b
+        if op == '-' and a.level and a is b:
+            return INT
+    return ERROR
+
+def _compatible(target, source):
+    if target is ERROR or source is ERROR:
+        return True             # el error ya se informó donde se produjo
+    if target is VOID or source is VOID:
+        return False
+    if target.is_arithmetic:
+        if source.is_arithmetic:
+            return source is not FLOAT or target is FLOAT
+        return target.is_integral       # entero <- puntero, como lo aceptaba el parser
+    if source.level:
+        # Punteros del mismo tipo, o void* con cualquier puntero
+        return target is source or (target.base == 'void' and target.level == 1) \
+            or (source.base == 'void' and source.level == 1)
+    return source.is_integral           # puntero <- entero (p = 0)
+
+
+def promote(op, a, b):
+    """Tipo de a op b (op en + - * /): PROMOTION, o ERROR si interviene una firma."""
+    row = PROMOTION[op].get(a)
+    if row is None:
+        return ERROR
+    return row.get(b, ERROR)
+
+def compatible(target, source):
+    """COMPATIBLE[target][source]; una firma solo es compatible consigo misma."""
+    row = COMPATIBLE.get(target)
+    if row is None:
+        return target is source or source is ERROR
+    return row.get(source, target is ERROR)
+
+
+ARITHMETIC = ('boolean', 'char', 'int', 'float')
+ERROR, INT, FLOAT, CHAR, BOOLEAN, VOID = (CType._make(name, name, 0, None) for name in
+                                          ('error', 'int', 'float', 'char', 'boolean', 'void'))
+for _basic in (ERROR, INT, FLOAT, CHAR, BOOLEAN, VOID):
+    _register(_basic)
+STRING = CHAR.pointer()
+
+# Palabra clave del tipo -> tipo
+BASIC_TYPES = {'int': INT, 'float': FLOAT, 'char': CHAR, 'boolean': BOOLEAN, 'void': VOID}
+
+
+def pointer_to(t, levels=1):
+    """t con `levels` asteriscos más."""
+    for _ in range(levels):
+        t = t.pointer()
+    return t
+
+def parse_type(spelling):
+    """Tipo internado para una escritura como 'int', 'char**' o 'int(int,float*)'."""
+    t = _types.get(spelling)
+    if t is not None:
+        return t
+    if spelling.endswith(')') and '(' in spelling:
+        result, _, params = spelling[:-1].partition('(')
+        return function_type(parse_type(result), [parse_type(param) for param in params.split(',') if param])
+    base = spelling.rstrip('*')
+    if base not in BASIC_TYPES:
+        raise ValueError(f"Tipo desconocido: {spelling!r}")
+    return pointer_to(BASIC_TYPES[base], len(spelling) - len(base))
+
+def function_type(result, params):
+    """Firma internada de una función que devuelve `result` y recibe `params`."""
+    params = tuple(params)
+    spelling = f"{result}({','.join(params)})"
+    t = _types.get(spelling)
+    if t is None:
+        t = FunctionType._make(spelling, 'function', 0, None)
+        t.result = result
+        t.params = params
+        _register(t)
+    return t
+
+
+if __name__ == '__main__':
+    # Muestra las tablas para los tipos básicos y un puntero
+    shown = [INT, FLOAT, CHAR, BOOLEAN, VOID, INT.pointer(), STRING]
+    width = max(len(t) for t in shown) + 2
+    print("COMPATIBLE[destino][origen]")
+    print(" " * width + "".join(t.ljust(width) for t in shown))
+    for target in shown:
+        print(target.ljust(width) + "".join(('si' if COMPATIBLE[target][source] else '-').ljust(width)
+                                                for source in shown))
+    for op in ARITHMETIC_OPS:
+        print()
+        print(f"PROMOTION[{op!r}][a][b]")
+        print(" " * width + "".join(t.ljust(width) for t in shown))
+        for a in shown:
+            print(a.ljust(width) + "".join(PROMOTION[op][a][b].ljust(width) for b in shown))
@@ -0,0 +1,493 @@
+"""
+Máquina virtual para el código de tres direcciones.
+
+El código se decodifica una sola vez a una lista de instrucciones
+(opcode, a, b, c) de enteros:
+  - cada función tiene un marco (lista) con una posición por variable,
+    temporal y constante; las constantes ya vienen escritas en la plantilla
+    del marco, así que todo operando es un índice y `t = x + 1` se ejecuta
+    como r[c] = r[a] + r[b], sin buscar nombres en diccionarios;
+  - las etiquetas desaparecen y los saltos llevan el índice de destino;
+  - las variables globales viven en su propio marco; dentro de una función
+    se leen y escriben con LOADG / STOREG alrededor de la instrucción;
+  - '&x' y '*p' se traducen a ADDR / LOAD / STORE; un puntero es el par
+    (marco, posición).
+
+Las llamadas (param / call / return) usan una pila explícita de marcos, así
+que la recursión no depende del límite de recursión de Python.
+
+    vm = VirtualMachine(result.code, result.globals)
+    vm.run()                        # código global (inicializaciones)
+    vm.call('fibonaci', 20)         # -> 6765
+"""
+import codecs
+import time
+
+from cfg import reads, split_functions, writes
+from optimizer import constant_value
+from quad_store import Temp
+
+# Códigos de operación, de más a menos frecuentes (orden del despacho)
+(MOVE, ADD, SUB, MUL, IFLT, IFGE, IFGT, IFLE, IFEQ, IFNE, GOTO, PARAM, CALL, RETURN,
+ DIV, LT, GT, LE, GE, EQ, NE, AND, OR, NEG, NOT, IF, IFFALSE,
+ LOADG, STOREG, ADDR, ADDRG, LOAD, STORE) = range(33)
+
+BINARY = {'+': ADD, '-': SUB, '*': MUL, '/': DIV, '<': LT, '>': GT, '<=': LE, '>=': GE,
+          '==': EQ, '!=': NE, '&&': AND, '||': OR}
+UNARY = {'-': NEG, '!': NOT}
+JUMPS = {'if<': IFLT, 'if>=': IFGE, 'if>': IFGT, 'if<=': IFLE, 'if==': IFEQ, 'if!=': IFNE,
+         'if': IF, 'iffalse': IFFALSE, 'goto': GOTO}
+# Instrucciones sin efecto en ejecución
+SKIP = {'label', 'func', 'endfunc', 'formal'}
+
+GLOBAL = '<global>'
+
+
+class VMError(Exception):
+    """Error en tiempo de ejecución (división por cero, función no definida...)."""
+
+
+def literal(operand):
+    """Valor de un operando constante ('3', 'true', "'a'", '"hola"'), o None."""
+    value = constant_value(operand)
+    if value is not None:
+        return value
+    if operand[:1] == "'":
+        text = codecs.decode(operand[1:-1], 'unicode_escape')
+        return ord(text) if len(text) == 1 else 0
+    if operand[:1] == '"':
+        return codecs.decode(operand[1:-1], 'unicode_escape')
+    return None
+
+
+class _Frame:
+    """Distribución de un marco mientras se decodifica una unidad."""
+    def __init__(self, template=None):
+        self.slots = {}         # nombre -> posición
+        self.consts = {}        # (tipo, valor) -> posición
+        self.template = [] if template is None else template
+
+    def slot(self, name):
+        i = self.slots.get(name)
+        if i is None:
+            i = self.slots[name] = len(self.template)
+            self.template.append(0)
+        return i
+
+    def const(self, value):
+        key = (type(value), value)
+        i = self.consts.get(key)
+        if i is None:
+            i = self.consts[key] = len(self.template)
+            self.template.append(value)
+        return i
+
+    def scratch(self):
+        self.template.append(0)
+        return len(self.template) - 1
+
+
+class Program:
+    """Código decodificado: instrucciones, funciones y marco global."""
+    def __init__(self, code, globals=()):
+        self.instructions = []
+        self.functions = {}     # nombre -> (entrada, plantilla, posiciones de los parámetros)
+        self.labels = {}
+        self.global_frame = _Frame()
+        self.global_names = set(globals)
+        units = split_functions(list(code))
+        # Las variables que aparecen en el código global también son globales
+        # (no los temporales ni las ranuras de derrame $sN de regalloc)
+        for name, start, stop in units:
+            if name == GLOBAL:
+                for quad in code[start:stop]:
+                    for operand in (*reads(quad), writes(quad)):
+                        if (operand is not None and not isinstance(operand, Temp)
+                                and operand[:1] != '$' and literal(operand) is None):
+                            self.global_names.add(operand)
+        # Las globales declaradas y nunca asignadas también tienen su posición (valor 0)
+        for name in sorted(self.global_names):
+            self.global_frame.slot(name)
+        # Código global primero, terminado en return
+        self.global_entry = 0
+        for name, start, stop in units:
+            if name == GLOBAL:
+                self._decode(code[start:stop], self.global_frame, set())
+        self._emit(RETURN, self.global_frame.const(None), 0, 0)
+        for name, start, stop in units:
+            if name != GLOBAL:
+                self._function(name, code[start:stop])
+        self._resolve()
+
+    def _emit(self, op, a, b, c):
+        self.instructions.append((op, a, b, c))
+
+    def _function(self, name, quads):
+        frame = _Frame()
+        params = {}
+        for quad in quads:
+            if quad[0] == 'formal':
+                params[quad[1]] = quad[3]
+        param_slots = [frame.slot(params[i]) for i in sorted(params)]
+        entry = len(self.instructions)
+        self._decode(quads, frame, set(params.values()))
+        # Por si el código no termina en return
+        self._emit(RETURN, frame.const(None), 0, 0)
+        self.functions[name] = (entry, frame.template, param_slots)
+
+    def _decode(self, quads, frame, local_names):
+        gframe = self.global_frame
+        in_function = frame is not gframe
+        emit = self._emit
+
+        def read(operand):
+            """Posición con el valor del operando, emitiendo las cargas necesarias."""
+            if operand is None:
+                return frame.const(None)
+            if not isinstance(operand, str):
+                return frame.const(operand)
+            value = literal(operand)
+            if value is not None:
+                return frame.const(value)
+            prefix = operand[0]
+            if prefix == '&':
+                name = operand[1:]
+                s = frame.scratch()
+                if self._global(name, in_function, local_names):
+                    emit(ADDRG, gframe.slot(name), 0, s)
+                else:
+                    emit(ADDR, frame.slot(name), 0, s)
+                return s
+            if prefix == '*':
+                s = frame.scratch()
+                emit(LOAD, read(operand[1:]), 0, s)
+                return s
+            if self._global(operand, in_function, local_names):
+                s = frame.scratch()
+                emit(LOADG, gframe.slot(operand), 0, s)
+                return s
+            return frame.slot(operand)
+
+        def write(result):
+            """(posición destino, instrucción a emitir después o None)."""
+            if result[:1] == '*':
+                s = frame.scratch()
+                return s, (STORE, read(result[1:]), 0, s)
+            if self._global(result, in_function, local_names):
+                s = frame.scratch()
+                return s, (STOREG, s, 0, gframe.slot(result))
+            return frame.slot(result), None
+
+        for op, arg1, arg2, res in quads:
+            if op in SKIP:
+                if op == 'label':
+                    self.labels[res] = len(self.instructions)
+                continue
+            if op in JUMPS:
+                if op == 'goto':
+                    emit(GOTO, 0, 0, res)
+                else:
+                    a = read(arg1)
+                    b = read(arg2) if arg2 is not None else 0
+                    emit(JUMPS[op], a, b, res)
+                continue
+            if op == 'param':
+                emit(PARAM, read(arg1), 0, 0)
+                continue
+            if op == 'return':
+                emit(RETURN, read(arg1), 0, 0)
+                continue
+            if op == 'call':
+                dest, after = write(res)
+                emit(CALL, arg1, arg2, dest)
+            elif op == '=':
+                a = read(arg1)
+                dest, after = write(res)
+                emit(MOVE, a, 0, dest)
+            elif arg2 is None and op in UNARY:
+                a = read(arg1)
+                dest, after = write(res)
+                emit(UNARY[op], a, 0, dest)
+            elif op in BINARY:
+                a, b = read(arg1), read(arg2)
+                dest, after = write(res)
+                emit(BINARY[op], a, b, dest)
+            else:
+                raise VMError(f"Instrucción desconocida: {(op, arg1, arg2, res)}")
+            if after is not None:
+                emit(*after)
+
+    def _global(self, name, in_function, local_names):
+        return in_function and name in self.global_names and name not in local_names
+
+    def _resolve(self):
+        """Sustituye etiquetas y nombres de función por índices."""
+        code = self.instructions
+        for i, (op, a, b, c) in enumerate(code):
+            if op in (GOTO, IF, IFFALSE) or IFLT <= op <= IFNE:
+                if c not in self.labels:
+                    raise VMError(f"Etiqueta no definida: {c}")
+                code[i] = (op, a, b, self.labels[c])
+            elif op == CALL:
+                # Una función inexistente solo falla si se llega a llamar
+                code[i] = (op, self.functions.get(a, a), b, c)
+
+
+class VirtualMachine:
+    """
+    Ejecuta un Program (o código 3AC, que se decodifica). `max_steps` limita
+    las instrucciones ejecutadas por llamada a run()/call(), para que un bucle
+    infinito no bloquee la integración continua.
+    """
+    def __init__(self, code, globals=(), max_steps=None):
+        self.program = code if isinstance(code, Program) else Program(code, globals)
+        self.memory = list(self.program.global_frame.template)
+        self.max_steps = max_steps
+        self.steps = 0          # instrucciones ejecutadas en total
+
+    def run(self):
+        """Ejecuta el código global."""
+        return self._execute(self.program.global_entry, self.memory)
+
+    def call(self, name, *args):
+        """Llama a una función y devuelve su valor de retorno."""
+        function = self.program.functions.get(name)
+        if function is None:
+            raise VMError(f"Función no definida: {name}")
+        entry, template, params = function
+        frame = list(template)
+        for slot, value in zip(params, args):
+            frame[slot] = value
+        return self._execute(entry, frame)
+
+    def global_values(self):
+        """{nombre: valor} de las variables globales."""
+        return {name: self.memory[i] for name, i in self.program.global_frame.slots.items()
+                if name in self.program.global_names}
+
+    def _execute(self, pc, r):
+        code = self.program.instructions
+        G = self.memory
+        stack = []          # (pc de vuelta, marco, destino)
+        pending = []        # argumentos de la próxima llamada
+        limit = self.max_steps
+        steps = 0
+        try:
+            while True:
+                op, a, b, c = code[pc]
+                pc += 1
+                steps += 1
+                if op == MOVE:
+                    r[c] = r[a]
+                elif op == ADD:
+                    r[c] = r[a] + r[b]
+                elif op == SUB:
+                    r[c] = r[a] - r[b]
+                elif op == MUL:
+                    r[c] = r[a] * r[b]
+                elif op <= IFNE:
+                    if op == IFLT:
+                        taken = r[a] < r[b]
+                    elif op == IFGE:
+                        taken = r[a] >= r[b]
+                    elif op == IFGT:
+                        taken = r[a] > r[b]
+                    elif op == IFLE:
+                        taken = r[a] <= r[b]
+                    elif op == IFEQ:
+                        taken = r[a] == r[b]
+                    else:
+                        taken = r[a] != r[b]
+                    if taken:
+                        pc = c
+                        if limit is not None and steps > limit:
+                            break
+                elif op == GOTO:
+                    pc = c
+                    if limit is not None and steps > limit:
+                        break
+                elif op == PARAM:
+                    pending.append(r[a])
+                elif op == CALL:
+                    if not isinstance(a, tuple):
+                        raise VMError(f"Función no definida: {a}")
+                    entry, template, params = a
+                    frame = list(template)
+                    if b:
+                        args = pending[-b:]
+                        del pending[-b:]
+                        for slot, value in zip(params, args):
+                            frame[slot] = value
+                    stack.append((pc, r, c))
+                    pc, r = entry, frame
+                    if limit is not None and steps > limit:
+                        break
+                elif op == RETURN:
+                    value = r[a]
+                    if not stack:
+                        return value
+                    pc, r, dest = stack.pop()
+                    r[dest] = value
+                elif op == DIV:
+                    x, y = r[a], r[b]
+                    if type(x) is int and type(y) is int:
+                        q = abs(x) // abs(y)    # división entera de C: trunca hacia cero
+                        r[c] = q if (x < 0) == (y < 0) else -q
+                    else:
+                        r[c] = x / y
+                elif op == LT:
+                    r[c] = r[a] < r[b]
+                elif op == GT:
+                    r[c] = r[a] > r[b]
+                elif op == LE:
+                    r[c] = r[a] <= r[b]
+                elif op == GE:
+                    r[c] = r[a] >= r[b]
+                elif op == EQ:
+                    r[c] = r[a] == r[b]
+                elif op == NE:
+                    r[c] = r[a] != r[b]
+                elif op == AND:
+                    r[c] = bool(r[a]) and bool(r[b])
+                elif op == OR:
+                    r[c] = bool(r[a]) or bool(r[b])
+                elif op == NEG:
+                    r[c] = -r[a]
+                elif op == NOT:
+                    r[c] = not r[a]
+                elif op == IF:
+                    if r[a]:
+                        pc = c
+                elif op == IFFALSE:
+                    if not r[a]:
+                        pc = c
+                elif op == LOADG:
+                    r[c] = G[a]
+                elif op == STOREG:
+                    G[c] = r[a]
+                elif op == ADDR:
+                    r[c] = (r, a)
+                elif op == ADDRG:
+                    r[c] = (G, a)
+                elif op == LOAD:
+                    frame, i = r[a]
+                    r[c] = frame[i]
+                else:   # STORE
+                    frame, i = r[a]
+                    frame[i] = r[c]
+            raise VMError(f"Límite de {limit} instrucciones superado")
+        except ZeroDivisionError:
+            raise VMError("División por cero") from None
+        except (TypeError, ValueError) as e:
+            raise VMError(f"Operación no válida en la instrucción {pc - 1}: {e}") from None
+        finally:
+            self.steps += steps
+
+
+def run_function(code, name, *args, globals=()):
+    """Atajo: decodifica, ejecuta el código global y llama a `name`."""
+    vm = VirtualMachine(code, globals)
+    vm.run()
+    return vm.call(name, *args)
+
+
+if __name__ == '__main__':
+    # Uso: python vm.py archivo.c función [args...]   (sin argumentos: benchmark)
+    import sys
+    from optimizer import evaluate
+    from session import CompilationSession
+    from test_codigo_profesor import codigo_profesor
+
+    session = CompilationSession(engine='dfa')
+    if len(sys.argv) > 2:
+        result = session.compile_file(sys.argv[1])
+        if not result.ok:
+            for diag in result.diagnostics:
+                print(diag)
+            sys.exit(1)
+        args = [literal(a) for a in sys.argv[3:]]
+        print(run_function(result.code, sys.argv[2], *args, globals=result.globals))
+        sys.exit(0)
+
+    def naive_call(code, name, *args):
+        """Intérprete de referencia: entornos como dicts de nombres y tuplas sin decodificar."""
+        labels = {q[3]: i for i, q in enumerate(code) if q[0] == 'label'}
+        starts = {q[1]: i for i, q in enumerate(code) if q[0] == 'func'}
+        count = [0]
+
+        def call(fname, values):
+            env = {}
+            pending = []
+            pc = starts[fname] + 1
+            def val(x):
+                v = literal(x) if isinstance(x, str) else None
+                return v if v is not None else env.get(x, 0)
+            while True:
+                op, a1, a2, res = code[pc]
+                pc += 1
+                count[0] += 1
+                if op == 'formal':
+                    env[res] = values[a1]
+                elif op == 'label':
+                    pass
+                elif op == 'goto':
+                    pc = labels[res]
+                elif op == 'return':
+                    return val(a1) if a1 is not None else None
+                elif op == 'param':
+                    pending.append(val(a1))
+                elif op == 'call':
+                    env[res] = call(a1, pending[len(pending) - a2:])
+                    del pending[len(pending) - a2:]
+                elif op in ('if', 'iffalse'):
+                    if bool(val(a1)) == (op == 'if'):
+                        pc = labels[res]
+                elif op.startswith('if'):
+                    if evaluate(op[2:], val(a1), val(a2)):
+                        pc = labels[res]
+                elif op == '=':
+                    env[res] = val(a1)
+                else:
+                    env[res] = evaluate(op, val(a1), None if a2 is None else val(a2))
+        return call(name, list(args)), count[0]
+
+    programs = [
+        ('fibonaci(22)', codigo_profesor, 'fibonaci', (22,)),
+        ('evaluar(1,0,3.5)', codigo_profesor, 'evaluar', (1, 0, 3.5)),
+        ('suma(200000)', """
+            int suma(int n) {
+                int s, i;
+                s = 0;
+                for (i = 0; i < n; i++) {
+                    if (i / 3 * 3 == i || i > n - 10) s = s + i * 2;
+                    else s = s - 1;
+                }
+                return s;
+            }""", 'suma', (200000,)),
+    ]
+    print(f"{'programa':<18} {'resultado':>10} {'instr.':>10} {'VM (IPS)':>12} "
+          f"{'dicts (IPS)':>12} {'aceleración':>11}")
+    for label, source, name, args in programs:
+        code = session.compile(source).code
+        vm = VirtualMachine(code)
+        t0 = time.perf_counter()
+        value = vm.call(name, *args)
+        t1 = time.perf_counter()
+        expected, naive_steps = naive_call(code, name, *args)
+        t2 = time.perf_counter()
+        assert value == expected, (value, expected)
+        ips, naive_ips = vm.steps / (t1 - t0), naive_steps / (t2 - t1)
+        print(f"{label:<18} {str(value):>10} {vm.steps:>10} {ips:12,.0f} {naive_ips:12,.0f} "
+              f"{ips / naive_ips:10.1f}x")
+
+    # Programa ya compilado ejecutado muchas veces, como en la integración continua
+    code = session.compile(codigo_profesor).code
+    program = Program(code)
+    runs = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < 1.0:
+        vm = VirtualMachine(program)
+        vm.call('evaluar', 1, 0, 3.5)
+        vm.call('fibonaci', 10)
+        runs += 1
+    print(f"\ncodigo_profesor (evaluar + fibonaci(10)): {runs * 60 / (time.perf_counter() - t0):,.0f} ejecuciones/min")
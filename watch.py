@@ -0,0 +1,345 @@
+"""
+Modo vigilancia: compila un árbol de fuentes y vuelve a compilar solo lo
+afectado cada vez que se guarda un archivo.
+
+    python watch.py [directorio] [-O2] [-Idir] [-DNOMBRE=valor] [--out=dir]
+                    [--poll] [--debounce=0.1] [--once]
+
+Las unidades son los archivos .c del árbol y se compilan con el
+preprocesador activo y una sola CompilationSession (lexer y parser en
+caliente). De cada resultado se anotan las cabeceras que incluyó
+(CompilationResult.includes, también las anidadas), así que al cambiar una
+cabecera se recompilan exactamente las unidades que dependen de ella. También
+se anotan las rutas que el preprocesador probó sin encontrar nada
+(CompilationResult.probes): si aparece un archivo en una de ellas, la unidad
+incluiría otro (una cabecera que oculta a la de include_path) y se
+recompila. Al crear una cabecera se reintentan además las unidades que no
+encontraron alguna.
+
+Los cambios se detectan con inotify (por ctypes, sin dependencias) y, si no
+está disponible, comparando mtime y tamaño en un recorrido periódico. Las
+ráfagas de eventos (un editor que guarda varios archivos, o escribe y
+renombra) se agrupan: se compila cuando pasan `debounce` segundos sin
+cambios.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+from code_gen import format_quad
+from diagnostics import DiagnosticSink
+from session import CompilationResult, CompilationSession
+
+UNIT_SUFFIX = '.c'
+HEADER_SUFFIX = '.h'
+DEFAULT_DEBOUNCE = 0.1
+POLL_INTERVAL = 0.5
+
+# Constantes de <sys/inotify.h>
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_source(path):
+    return path.endswith(UNIT_SUFFIX) or path.endswith(HEADER_SUFFIX)
+
+def _directories(root):
+    for folder, subfolders, _ in os.walk(root):
+        subfolders[:] = [name for name in subfolders if not name.startswith('.')]
+        yield folder
+
+def scan_tree(roots):
+    """{ruta real: (mtime_ns, tamaño)} de los .c y .h bajo `roots`."""
+    found = {}
+    for root in roots:
+        for folder in _directories(root):
+            try:
+                entries = os.scandir(folder)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if is_source(entry.name) and entry.is_file():
+                        try:
+                            info = entry.stat()
+                        except OSError:
+                            continue
+                        found[os.path.realpath(entry.path)] = (info.st_mtime_ns, info.st_size)
+    return found
+
+
+class PollingWatcher:
+    """Detecta cambios comparando mtime y tamaño en recorridos periódicos."""
+    def __init__(self, roots, interval=POLL_INTERVAL):
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = scan_tree(roots)
+
+    def wait(self, timeout):
+        """Rutas que cambiaron; espera como mucho `timeout` segundos (None: sin límite)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = scan_tree(self.roots)
+            changed = {path for path in current.keys() | self.snapshot.keys()
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed:
+                return changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Detecta cambios con inotify; vigila cada directorio del árbol."""
+    def __init__(self, roots):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self.roots = roots
+        self.folders = {}           # descriptor de vigilancia -> directorio
+        for root in roots:
+            for folder in _directories(root):
+                self._watch(folder)
+
+    def _watch(self, folder):
+        wd = self._add_watch(self.fd, os.fsencode(folder), WATCH_MASK)
+        if wd >= 0:
+            self.folders[wd] = folder
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, pos)
+            pos += EVENT_HEADER.size
+            name = os.fsdecode(data[pos:pos + length].rstrip(b'\0'))
+            pos += length
+            if mask & IN_Q_OVERFLOW:
+                # Se perdieron eventos: todo el árbol cuenta como cambiado
+                changed.update(scan_tree(self.roots))
+                continue
+            folder = self.folders.get(wd)
+            if folder is None:
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF):
+                del self.folders[wd]
+                continue
+            path = os.path.join(folder, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not name.startswith('.'):
+                    # Los archivos creados antes de vigilar el directorio nuevo
+                    for sub in _directories(path):
+                        self._watch(sub)
+                    changed.update(scan_tree([path]))
+                continue
+            if is_source(name):
+                changed.add(os.path.realpath(path))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def make_watcher(roots, poll=False):
+    """InotifyWatcher si el sistema lo permite; si no, PollingWatcher."""
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots)
+
+
+def _discard(users_of, path, unit):
+    """Quita `unit` de users_of[path] y la entrada si queda vacía."""
+    users = users_of.get(path)
+    if users is not None:
+        users.discard(unit)
+        if not users:
+            del users_of[path]
+
+
+class WatchBuild:
+    """Estado del árbol: unidades, cabeceras de cada una y resultados."""
+    def __init__(self, root, include_path=(), defines=None, opt_level=0, out_dir=None,
+                 cache=None, stream=None):
+        self.root = os.path.realpath(root)
+        self.include_path = [os.path.realpath(folder) for folder in include_path]
+        self.out_dir = out_dir
+        self.stream = stream or sys.stdout
+        self.session = CompilationSession(opt_level=opt_level, preprocess=True,
+                                          include_path=self.include_path, defines=defines,
+                                          cache=cache)
+        self.results = {}           # unidad -> CompilationResult
+        self.dependents = {}        # cabecera -> {unidades que la incluyen}
+        self.probed = {}            # ruta probada sin éxito -> {unidades que la probaron}
+        self.missing = set()        # unidades con alguna cabecera no encontrada
+        self.headers = {path for path in scan_tree(self.roots) if path.endswith(HEADER_SUFFIX)}
+
+    @property
+    def roots(self):
+        return [self.root] + [folder for folder in self.include_path
+                              if not folder.startswith(self.root + os.sep)]
+
+    def units(self):
+        return sorted(path for path in scan_tree([self.root]) if path.endswith(UNIT_SUFFIX))
+
+    def affected(self, changed):
+        """Unidades que hay que recompilar (o retirar) tras cambiar `changed`."""
+        units = set()
+        for path in changed:
+            if path.endswith(UNIT_SUFFIX):
+                if path.startswith(self.root + os.sep):
+                    units.add(path)
+            else:
+                units.update(self.dependents.get(path, ()))
+                units.update(self.probed.get(path, ()))
+                if not os.path.exists(path):
+                    self.headers.discard(path)
+                elif path not in self.headers:
+                    self.headers.add(path)
+                    units.update(self.missing)
+        return units
+
+    def build(self, units):
+        """Compila `units`; las que ya no existen se retiran. Devuelve los resultados."""
+        results = []
+        for unit in sorted(units):
+            self._forget(unit)
+            if not os.path.exists(unit):
+                self._write_output(unit, None)
+                continue
+            try:
+                result = self.session.compile_file(unit)
+            except FileNotFoundError:
+                # Borrada entre el evento y la lectura: se retira como arriba
+                self._write_output(unit, None)
+                continue
+            except (OSError, UnicodeDecodeError) as e:
+                # Ilegible (permisos, no es UTF-8...): un error de la unidad, no del bucle
+                diagnostics = DiagnosticSink()
+                diagnostics.error('I001', "%s", str(e))
+                result = CompilationResult(unit, [], list(diagnostics), ok=False)
+            self.results[unit] = result
+            for header in result.includes:
+                self.dependents.setdefault(header, set()).add(unit)
+            for probe in result.probes:
+                self.probed.setdefault(os.path.realpath(probe), set()).add(unit)
+            if any(diag.code == 'D001' for diag in result.diagnostics):
+                self.missing.add(unit)
+            self._write_output(unit, result)
+            results.append(result)
+        return results
+
+    def _forget(self, unit):
+        previous = self.results.pop(unit, None)
+        self.missing.discard(unit)
+        if previous is not None:
+            for header in previous.includes:
+                _discard(self.dependents, header, unit)
+            for probe in previous.probes:
+                _discard(self.probed, os.path.realpath(probe), unit)
+
+    def _output_path(self, unit):
+        return os.path.join(self.out_dir, os.path.relpath(unit, self.root)[:-len(UNIT_SUFFIX)] + '.3ac')
+
+    def _write_output(self, unit, result):
+        if self.out_dir is None:
+            return
+        path = self._output_path(unit)
+        if result is None:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(format_quad(quad) + '\n' for quad in result.code)
+
+    def report(self, results, elapsed, changed=()):
+        out = self.stream
+        shown = ', '.join(os.path.relpath(path, self.root) for path in sorted(changed)[:3])
+        more = f" y {len(changed) - 3} más" if len(changed) > 3 else ''
+        if changed:
+            out.write(f"Cambios: {shown}{more}\n")
+        for result in results:
+            errors = sum(diag.severity >= 3 for diag in result.diagnostics)
+            out.write(f"  {os.path.relpath(result.name, self.root)}: {len(result.code)} quads"
+                      f"{', %d errores' % errors if errors else ''}\n")
+            for diag in result.diagnostics:
+                out.write(f"    {diag}\n")
+        out.write(f"Recompiladas {len(results)} de {len(self.results)} unidades "
+                  f"en {elapsed * 1000:.1f} ms\n")
+        out.flush()
+
+    def run(self, watcher, debounce=DEFAULT_DEBOUNCE, once=False):
+        start = time.perf_counter()
+        self.report(self.build(self.units()), time.perf_counter() - start)
+        if once:
+            return
+        while True:
+            changed = watcher.wait(None)
+            # Ráfaga: se sigue acumulando hasta `debounce` segundos sin eventos
+            while True:
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed |= more
+            start = time.perf_counter()
+            results = self.build(self.affected(changed))
+            self.report(results, time.perf_counter() - start, changed)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    folders = [arg for arg in args if not arg.startswith('-')]
+    options = dict(arg.partition('=')[::2] for arg in args if arg.startswith('--'))
+    include_path = [arg[2:] for arg in args if arg.startswith('-I')]
+    defines = {arg[2:].partition('=')[0]: arg[2:].partition('=')[2] or '1'
+               for arg in args if arg.startswith('-D')}
+    levels = [int(arg[2:] or 1) for arg in args if arg.startswith('-O')]
+    cache = None
+    if options.get('--cache'):
+        from compile_cache import CompileCache
+        cache = CompileCache(options['--cache'])
+    build = WatchBuild(folders[0] if folders else '.', include_path, defines,
+                       levels[-1] if levels else 0, options.get('--out') or None, cache)
+    watcher = None if '--once' in options else make_watcher(build.roots, '--poll' in options)
+    if watcher is not None:
+        print(f"Vigilando {build.root} con {type(watcher).__name__}")
+    try:
+        build.run(watcher, float(options.get('--debounce') or DEFAULT_DEBOUNCE), watcher is None)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.close()